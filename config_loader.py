@@ -24,6 +24,7 @@ class APIConfig:
     host: str = "localhost"
     port: int = 8060
     timeout: int = 3600
+    endpoints: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -67,6 +68,11 @@ class GeneticAlgorithmConfig:
     mutation: MutationConfig = field(default_factory=MutationConfig)
     convergence_threshold: int = 20
     target_fitness: Optional[float] = None
+    fidelity_levels: Optional[List[int]] = None
+    promotion_fraction: float = 1 / 3
+    early_stop: bool = False
+    evaluation_backend: str = "sequential"
+    evaluation_workers: int = 1
     random_seed: Optional[int] = None
     verbose: bool = True
     track_statistics: bool = True
@@ -209,7 +215,8 @@ def load_config(config_path: Optional[str] = None) -> RAGSmithConfig:
     api = APIConfig(
         host=api_raw.get('host', 'localhost'),
         port=api_raw.get('port', 8060),
-        timeout=api_raw.get('timeout', 3600)
+        timeout=api_raw.get('timeout', 3600),
+        endpoints=api_raw.get('endpoints') or []
     )
     
     # Parse genetic algorithm config
@@ -251,6 +258,11 @@ def load_config(config_path: Optional[str] = None) -> RAGSmithConfig:
         mutation=mutation,
         convergence_threshold=ga_raw.get('convergence_threshold', 20),
         target_fitness=ga_raw.get('target_fitness'),
+        fidelity_levels=ga_raw.get('fidelity_levels'),
+        promotion_fraction=ga_raw.get('promotion_fraction', 1 / 3),
+        early_stop=ga_raw.get('early_stop', False),
+        evaluation_backend=ga_raw.get('evaluation_backend', 'sequential'),
+        evaluation_workers=ga_raw.get('evaluation_workers', 1),
         random_seed=ga_raw.get('random_seed'),
         verbose=ga_raw.get('verbose', True),
         track_statistics=ga_raw.get('track_statistics', True),
@@ -338,6 +350,19 @@ def get_api_endpoint(config: RAGSmithConfig) -> str:
     return f"http://{config.api.host}:{config.api.port}/api/evaluate"
 
 
+def get_api_endpoints(config: RAGSmithConfig) -> List[str]:
+    """
+    Get the API endpoint URLs of all RAG evaluation services.
+    
+    Args:
+        config: RAGSmithConfig object
+        
+    Returns:
+        The endpoints listed under api.endpoints, or the host/port endpoint if none are listed
+    """
+    return list(config.api.endpoints) or [get_api_endpoint(config)]
+
+
 def get_category_sizes(config: RAGSmithConfig) -> List[int]:
     """
     Get category sizes for genetic algorithm.
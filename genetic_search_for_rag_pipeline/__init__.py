@@ -8,6 +8,7 @@ each of several categories to maximize overall performance.
 
 Key Features:
 - Modular design with pluggable selection, crossover, and mutation methods
+- Parallel, deduplicated evaluation of each generation (thread, process or asyncio)
 - Comprehensive configuration system with sensible defaults
 - Professional code structure with extensive documentation
 - Ready-to-run examples and demonstrations
@@ -82,6 +83,15 @@ from .mutation import (
     CompositeMutation
 )
 
+# Evaluation executors
+from .evaluation import (
+    EvaluationExecutor,
+    SequentialEvaluation,
+    ThreadPoolEvaluation,
+    ProcessPoolEvaluation,
+    AsyncioEvaluation
+)
+
 # Version information
 __version__ = "1.0.0"
 __author__ = "Generated for Component Combination Search"
@@ -118,7 +128,14 @@ __all__ = [
     "CategoricalMutation",
     "SwapMutation",
     "InversionMutation",
-    "CompositeMutation"
+    "CompositeMutation",
+    
+    # Evaluation executors
+    "EvaluationExecutor",
+    "SequentialEvaluation",
+    "ThreadPoolEvaluation",
+    "ProcessPoolEvaluation",
+    "AsyncioEvaluation"
 ]
 
 # Convenience functions for quick setup
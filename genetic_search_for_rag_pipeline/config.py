@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from selection import SelectionMethod, TournamentSelection
 from crossover import CrossoverMethod, SinglePointCrossover
 from mutation import MutationMethod, RandomMutation
+from evaluation import EvaluationExecutor, SequentialEvaluation
 
 
 @dataclass
@@ -31,10 +32,13 @@ class GAConfig:
         selection_method: Method for selecting parents for reproduction
         crossover_method: Method for creating offspring from parents
         mutation_method: Method for introducing random variations
+        evaluation_executor: Executor that evaluates the individuals of a generation as one batch
         random_seed: Seed for random number generation (for reproducibility)
         verbose: Whether to print progress information
         convergence_threshold: Stop if best fitness doesn't improve for this many generations
         target_fitness: Stop if this fitness is reached
+        fidelity_levels: Increasing test case counts for successive halving (None evaluates everyone fully)
+        promotion_fraction: Fraction of candidates promoted to the next fidelity level
     """
     
     # Problem-specific parameters
@@ -54,6 +58,9 @@ class GAConfig:
     crossover_method: Optional[CrossoverMethod] = None
     mutation_method: Optional[MutationMethod] = None
     
+    # Evaluation executor (sequential if None)
+    evaluation_executor: Optional[EvaluationExecutor] = None
+    
     # Runtime parameters
     random_seed: Optional[int] = None
     verbose: bool = True
@@ -62,6 +69,12 @@ class GAConfig:
     convergence_threshold: int = 20  # Stop if no improvement for 20 generations
     target_fitness: Optional[float] = None  # Stop if this fitness is reached
     
+    # Multi-fidelity evaluation (successive halving): candidates are first evaluated on
+    # fidelity_levels[0] test cases, the best promotion_fraction move on to the next level,
+    # and the survivors of the last level get a full evaluation
+    fidelity_levels: Optional[List[int]] = None
+    promotion_fraction: float = 1 / 3
+    
     # Tracking and statistics
     track_statistics: bool = True
     statistics_interval: int = 1  # Record statistics every N generations
@@ -78,6 +91,9 @@ class GAConfig:
         
         if self.mutation_method is None:
             self.mutation_method = RandomMutation(mutation_rate=self.mutation_rate)
+        
+        if self.evaluation_executor is None:
+            self.evaluation_executor = SequentialEvaluation()
     
     def _validate_parameters(self) -> None:
         """
@@ -121,6 +137,16 @@ class GAConfig:
         if self.target_fitness is not None and self.target_fitness < 0:
             raise ValueError("Target fitness cannot be negative")
         
+        # Validate multi-fidelity parameters
+        if self.fidelity_levels:
+            if any(level < 1 for level in self.fidelity_levels):
+                raise ValueError("Fidelity levels must be at least 1 test case")
+            if any(a >= b for a, b in zip(self.fidelity_levels, self.fidelity_levels[1:])):
+                raise ValueError("Fidelity levels must be strictly increasing")
+        
+        if not (0.0 < self.promotion_fraction <= 1.0):
+            raise ValueError("Promotion fraction must be in (0.0, 1.0]")
+        
         # Validate statistics parameters
         if self.statistics_interval < 1:
             raise ValueError("Statistics interval must be at least 1")
@@ -170,10 +196,13 @@ class GAConfig:
             'selection_method': str(self.selection_method),
             'crossover_method': str(self.crossover_method),
             'mutation_method': str(self.mutation_method),
+            'evaluation_executor': str(self.evaluation_executor),
             'random_seed': self.random_seed,
             'verbose': self.verbose,
             'convergence_threshold': self.convergence_threshold,
             'target_fitness': self.target_fitness,
+            'fidelity_levels': self.fidelity_levels,
+            'promotion_fraction': self.promotion_fraction,
             'track_statistics': self.track_statistics,
             'statistics_interval': self.statistics_interval,
             'num_categories': self.get_num_categories(),
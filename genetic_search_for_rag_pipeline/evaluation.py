@@ -0,0 +1,219 @@
+"""
+Evaluation module for genetic algorithm.
+
+This module contains the evaluation executors that score a batch of individuals.
+An executor submits every individual that still needs a fitness at once, evaluates
+each distinct genome only once and folds the fitness back into all its copies.
+"""
+
+import asyncio
+import inspect
+import concurrent.futures
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+from individual import Individual
+
+
+def _evaluate_genes(evaluate_func: Callable, genes: List[int], fidelity: Optional[int]) -> float:
+    """Call the evaluation function (with a fidelity keyword for reduced-fidelity evaluations)."""
+    if fidelity is None:
+        return evaluate_func(genes)
+    return evaluate_func(genes, fidelity=fidelity)
+
+
+class EvaluationExecutor(ABC):
+    """
+    Abstract base class for evaluation executors.
+
+    All executors should inherit from this class and implement the map method;
+    deduplication and bookkeeping are handled by evaluate.
+    """
+
+    def evaluate(self, individuals: List[Individual], evaluate_func: Callable,
+                 fidelity: Optional[int] = None) -> int:
+        """
+        Evaluate every individual that has no fitness yet, or only a lower-fidelity one.
+
+        Individuals with identical genes are evaluated once and share the result.
+
+        Args:
+            individuals: Individuals to evaluate
+            evaluate_func: Function that takes a candidate and returns a fitness score
+            fidelity: Number of test cases to evaluate on (None for a full evaluation)
+
+        Returns:
+            Number of distinct genomes that were evaluated
+        """
+        groups: Dict[Tuple[int, ...], List[Individual]] = {}
+        for individual in individuals:
+            if individual.fitness is None or individual.needs_higher_fidelity(fidelity):
+                groups.setdefault(tuple(individual.genes), []).append(individual)
+
+        if not groups:
+            return 0
+
+        genomes = list(groups)
+        fitnesses = self.map(evaluate_func, [list(genome) for genome in genomes], fidelity)
+
+        for genome, fitness in zip(genomes, fitnesses):
+            for individual in groups[genome]:
+                individual.fitness = fitness
+                individual.fidelity = fidelity
+        return len(genomes)
+
+    @abstractmethod
+    def map(self, evaluate_func: Callable, candidates: List[List[int]],
+            fidelity: Optional[int] = None) -> List[float]:
+        """
+        Evaluate candidates and return their fitness scores.
+
+        Args:
+            evaluate_func: Function that takes a candidate and returns a fitness score
+            candidates: Distinct candidates to evaluate
+            fidelity: Number of test cases to evaluate on (None for a full evaluation)
+
+        Returns:
+            Fitness score of each candidate, in order
+        """
+        pass
+
+
+class SequentialEvaluation(EvaluationExecutor):
+    """
+    Sequential evaluation.
+
+    Evaluates the candidates one after another in the calling thread.
+    """
+
+    def map(self, evaluate_func: Callable, candidates: List[List[int]],
+            fidelity: Optional[int] = None) -> List[float]:
+        """Evaluate the candidates one by one."""
+        return [_evaluate_genes(evaluate_func, candidate, fidelity) for candidate in candidates]
+
+    def __str__(self) -> str:
+        """String representation of sequential evaluation."""
+        return "SequentialEvaluation()"
+
+
+class ThreadPoolEvaluation(EvaluationExecutor):
+    """
+    Thread pool evaluation.
+
+    Suited to evaluation functions that wait on I/O, such as requests to
+    RAG evaluation services; the evaluation function must be thread-safe.
+
+    Attributes:
+        max_workers (int): Number of candidates evaluated concurrently
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize thread pool evaluation.
+
+        Args:
+            max_workers: Number of candidates evaluated concurrently
+        """
+        if max_workers < 1:
+            raise ValueError("Number of workers must be at least 1")
+
+        self.max_workers = max_workers
+
+    def map(self, evaluate_func: Callable, candidates: List[List[int]],
+            fidelity: Optional[int] = None) -> List[float]:
+        """Evaluate the candidates on a pool of threads."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(candidates))) as pool:
+            return list(pool.map(lambda candidate: _evaluate_genes(evaluate_func, candidate, fidelity), candidates))
+
+    def __str__(self) -> str:
+        """String representation of thread pool evaluation."""
+        return f"ThreadPoolEvaluation(max_workers={self.max_workers})"
+
+
+class ProcessPoolEvaluation(EvaluationExecutor):
+    """
+    Process pool evaluation.
+
+    Suited to CPU-bound, stateless evaluation functions. The evaluation function
+    must be picklable, and state it changes in the worker processes (e.g. caches)
+    is not seen by the main process, so RAGPipelineEvaluator is not supported;
+    use ThreadPoolEvaluation or AsyncioEvaluation for it.
+
+    Attributes:
+        max_workers (int): Number of candidates evaluated concurrently
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize process pool evaluation.
+
+        Args:
+            max_workers: Number of candidates evaluated concurrently
+        """
+        if max_workers < 1:
+            raise ValueError("Number of workers must be at least 1")
+
+        self.max_workers = max_workers
+
+    def map(self, evaluate_func: Callable, candidates: List[List[int]],
+            fidelity: Optional[int] = None) -> List[float]:
+        """Evaluate the candidates on a pool of processes."""
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(self.max_workers, len(candidates))) as pool:
+            return list(pool.map(_evaluate_genes, [evaluate_func] * len(candidates),
+                                 candidates, [fidelity] * len(candidates)))
+
+    def __str__(self) -> str:
+        """String representation of process pool evaluation."""
+        return f"ProcessPoolEvaluation(max_workers={self.max_workers})"
+
+
+class AsyncioEvaluation(EvaluationExecutor):
+    """
+    Asyncio evaluation.
+
+    Coroutine evaluation functions are awaited directly; regular functions run
+    in threads. A semaphore bounds the number of concurrent evaluations.
+
+    Attributes:
+        max_concurrency (int): Number of candidates evaluated concurrently
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        """
+        Initialize asyncio evaluation.
+
+        Args:
+            max_concurrency: Number of candidates evaluated concurrently
+        """
+        if max_concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+
+    def map(self, evaluate_func: Callable, candidates: List[List[int]],
+            fidelity: Optional[int] = None) -> List[float]:
+        """Evaluate the candidates concurrently on an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._gather(evaluate_func, candidates, fidelity))
+
+        # Called from a running event loop (e.g. the optimization API): use a fresh loop in a helper thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self._gather(evaluate_func, candidates, fidelity)).result()
+
+    async def _gather(self, evaluate_func: Callable, candidates: List[List[int]],
+                      fidelity: Optional[int]) -> List[float]:
+        """Evaluate all candidates, at most max_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def evaluate_one(candidate: List[int]) -> float:
+            async with semaphore:
+                if inspect.iscoroutinefunction(evaluate_func):
+                    return await _evaluate_genes(evaluate_func, candidate, fidelity)
+                return await asyncio.to_thread(_evaluate_genes, evaluate_func, candidate, fidelity)
+
+        return list(await asyncio.gather(*(evaluate_one(candidate) for candidate in candidates)))
+
+    def __str__(self) -> str:
+        """String representation of asyncio evaluation."""
+        return f"AsyncioEvaluation(max_concurrency={self.max_concurrency})"
@@ -5,6 +5,7 @@ This module contains the GeneticAlgorithm class that orchestrates the entire
 genetic algorithm process for component combination search.
 """
 
+import math
 import random
 import time
 from typing import List, Dict, Any, Callable, Optional, Tuple
@@ -52,7 +53,8 @@ class GeneticAlgorithm:
         
         Args:
             config: Configuration object with GA parameters
-            evaluate_func: Function that evaluates a candidate and returns fitness (0-100)
+            evaluate_func: Function that evaluates a candidate and returns fitness (0-100);
+                           with config.fidelity_levels it must also accept a fidelity keyword
         """
         self.config = config
         self.evaluate_func = evaluate_func
@@ -81,9 +83,7 @@ class GeneticAlgorithm:
             print(f"Initializing population of {self.config.population_size} individuals...")
         
         # Evaluate all individuals in the population and track global best
-        for individual in self.population.individuals:
-            individual.evaluate(self.evaluate_func)
-            
+        for individual in self.evaluate_individuals(self.population.individuals):
             # Track the best individual from initial population
             if individual.fitness is not None and (self.best_ever_individual is None or 
                                                  individual.fitness > self.best_ever_individual.fitness):
@@ -93,6 +93,34 @@ class GeneticAlgorithm:
             best_fitness = self.best_ever_individual.fitness if self.best_ever_individual else 0
             print(f"Initial population created. Best fitness: {best_fitness:.4f}")
     
+    def evaluate_individuals(self, individuals: List[Individual]) -> List[Individual]:
+        """
+        Evaluate individuals, with successive halving if fidelity levels are configured.
+        
+        Every individual is evaluated on the first fidelity level; only the best
+        promotion_fraction of each level is promoted to the next one, and the survivors
+        of the last level get a full evaluation. The others keep their low-fidelity fitness.
+        Each level is submitted to the configured evaluation executor as one batch.
+        
+        Args:
+            individuals: Individuals to evaluate
+            
+        Returns:
+            The individuals that got a full evaluation
+        """
+        candidates = list(individuals)
+        for level in self.config.fidelity_levels or []:
+            self.config.evaluation_executor.evaluate(candidates, self.evaluate_func, fidelity=level)
+            
+            promoted_count = max(1, math.ceil(len(candidates) * self.config.promotion_fraction))
+            candidates.sort(key=lambda x: x.ranking_key(), reverse=True)
+            candidates = candidates[:promoted_count]
+            if self.config.verbose:
+                print(f"Promoting {len(candidates)} individuals past fidelity level {level}")
+        
+        self.config.evaluation_executor.evaluate(candidates, self.evaluate_func)
+        return candidates
+    
     def select_parents(self, num_parents: int) -> List[Individual]:
         """
         Select parents for reproduction.
@@ -141,6 +169,9 @@ class GeneticAlgorithm:
         """
         Apply elitism by preserving the best individuals.
         
+        Only fully evaluated individuals can be elites: a reduced-fidelity fitness is not
+        comparable with full evaluations and is never refined once the individual is kept.
+        
         Args:
             new_population: List of new individuals
             
@@ -150,14 +181,17 @@ class GeneticAlgorithm:
         if self.config.elitism_count == 0:
             return new_population
         
-        # Get the best individuals from current population
-        elite_individuals = self.population.get_top_individuals(self.config.elitism_count)
+        # Get the best fully evaluated individuals from current population
+        elite_individuals = [
+            ind for ind in self.population.get_top_individuals(self.config.elitism_count)
+            if ind.fitness is not None and ind.fidelity is None
+        ]
         
         # Replace worst individuals in new population with elite individuals
-        new_population.sort(key=lambda x: x.fitness if x.fitness is not None else -1, reverse=True)
+        new_population.sort(key=lambda x: x.ranking_key(), reverse=True)
         
         # Replace the worst individuals with elite ones
-        final_population = new_population[:-self.config.elitism_count] + elite_individuals
+        final_population = new_population[:len(new_population) - len(elite_individuals)] + elite_individuals
         
         return final_population
     
@@ -177,10 +211,8 @@ class GeneticAlgorithm:
         # Ensure we have the right number of offspring
         offspring = offspring[:offspring_count]
         
-        # Evaluate offspring and track best individual from ALL evaluations
-        for individual in offspring:
-            individual.evaluate(self.evaluate_func)
-            
+        # Evaluate offspring and track best individual from ALL full evaluations
+        for individual in self.evaluate_individuals(offspring):
             # Check if this individual is the best ever seen
             if individual.fitness is not None and (self.best_ever_individual is None or 
                                                  individual.fitness > self.best_ever_individual.fitness):
@@ -202,9 +234,10 @@ class GeneticAlgorithm:
         current_best = self.population.get_best_individual()
         print("!!!current_best_in_population!!!", current_best)
         
-        # Also check if anyone in the current population is better (shouldn't happen, but safety check)
-        if current_best and current_best.fitness is not None and (self.best_ever_individual is None or 
-                           current_best.fitness > self.best_ever_individual.fitness):
+        # Also check if anyone in the current population is better (shouldn't happen, but safety check);
+        # low-fidelity fitness values are not comparable with full evaluations
+        if current_best and current_best.fitness is not None and current_best.fidelity is None and (
+                self.best_ever_individual is None or current_best.fitness > self.best_ever_individual.fitness):
             self.best_ever_individual = current_best.copy()
             self.generations_without_improvement = 0
         else:
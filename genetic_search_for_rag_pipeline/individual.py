@@ -19,6 +19,7 @@ class Individual:
     Attributes:
         genes (List[int]): List of selected box indices for each category
         fitness (Optional[float]): Fitness score of this individual (0-100)
+        fidelity (Optional[int]): Number of test cases the fitness was measured on (None for a full evaluation)
         category_sizes (List[int]): Number of boxes available in each category
     """
     
@@ -32,6 +33,7 @@ class Individual:
         """
         self.category_sizes = category_sizes
         self.fitness: Optional[float] = None
+        self.fidelity: Optional[int] = None
         
         if genes is not None:
             self.genes = genes.copy()
@@ -96,20 +98,45 @@ class Individual:
         
         return Individual(self.category_sizes, new_genes)
     
-    def evaluate(self, evaluate_func) -> float:
+    def evaluate(self, evaluate_func, fidelity: Optional[int] = None) -> float:
         """
         Evaluate this individual using the provided evaluation function.
         
+        An individual whose fitness was measured at a lower fidelity is re-evaluated.
+        
         Args:
             evaluate_func: Function that takes a candidate and returns a fitness score
+                           (called with a fidelity keyword for reduced-fidelity evaluations)
+            fidelity: Number of test cases to evaluate on (None for a full evaluation)
             
         Returns:
             Fitness score (0-100)
         """
-        if self.fitness is None:
-            self.fitness = evaluate_func(self.genes)
+        if self.fitness is None or self.needs_higher_fidelity(fidelity):
+            if fidelity is None:
+                self.fitness = evaluate_func(self.genes)
+            else:
+                self.fitness = evaluate_func(self.genes, fidelity=fidelity)
+            self.fidelity = fidelity
         return self.fitness
     
+    def needs_higher_fidelity(self, fidelity: Optional[int]) -> bool:
+        """Check whether the fitness was measured on fewer test cases than fidelity (None for a full evaluation)"""
+        if self.fitness is None or self.fidelity is None:
+            return False
+        return fidelity is None or self.fidelity < fidelity
+    
+    def ranking_key(self) -> tuple:
+        """
+        Sort key for ranking individuals (higher is better).
+        
+        Fully evaluated individuals rank above reduced-fidelity ones, whose fitness was
+        measured on a test case subset and is not comparable; unevaluated ones rank last.
+        """
+        if self.fitness is None:
+            return (False, False, 0.0)
+        return (True, self.fidelity is None, self.fitness)
+    
     def copy(self) -> 'Individual':
         """
         Create a deep copy of this individual.
@@ -119,6 +146,7 @@ class Individual:
         """
         new_individual = Individual(self.category_sizes, self.genes)
         new_individual.fitness = self.fitness
+        new_individual.fidelity = self.fidelity
         return new_individual
     
     def __str__(self) -> str:
@@ -8,6 +8,7 @@ and provides methods for population-level operations.
 import random
 from typing import List, Callable, Optional
 from individual import Individual
+from evaluation import EvaluationExecutor, SequentialEvaluation
 
 
 class Population:
@@ -40,15 +41,15 @@ class Population:
             individual = Individual(category_sizes)
             self.individuals.append(individual)
     
-    def evaluate_all(self, evaluate_func: Callable) -> None:
+    def evaluate_all(self, evaluate_func: Callable, executor: Optional[EvaluationExecutor] = None) -> None:
         """
         Evaluate all individuals in the population using the provided function.
         
         Args:
             evaluate_func: Function that takes a candidate and returns a fitness score
+            executor: Executor that evaluates the individuals as one batch (sequential if None)
         """
-        for individual in self.individuals:
-            individual.evaluate(evaluate_func)
+        (executor or SequentialEvaluation()).evaluate(self.individuals, evaluate_func)
     
     def get_best_individual(self) -> Optional[Individual]:
         """
@@ -64,7 +65,7 @@ class Population:
         if not evaluated_individuals:
             return None
         
-        return max(evaluated_individuals, key=lambda x: x.fitness)
+        return max(evaluated_individuals, key=lambda x: x.ranking_key())
     
     def get_worst_individual(self) -> Optional[Individual]:
         """
@@ -107,8 +108,8 @@ class Population:
         evaluated_individuals = [ind for ind in self.individuals if ind.fitness is not None]
         unevaluated_individuals = [ind for ind in self.individuals if ind.fitness is None]
         
-        # Sort evaluated individuals
-        evaluated_individuals.sort(key=lambda x: x.fitness, reverse=descending)
+        # Sort evaluated individuals; reduced-fidelity fitness ranks below full evaluations
+        evaluated_individuals.sort(key=lambda x: x.ranking_key(), reverse=descending)
         
         # Combine sorted evaluated individuals with unevaluated ones at the end
         self.individuals = evaluated_individuals + unevaluated_individuals
@@ -29,7 +29,8 @@ import json
 import time
 import sys
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Callable
 import logging
 
 # Add parent directory to path for config_loader import
@@ -57,7 +58,10 @@ class RAGPipelineEvaluator:
                  cache_file_path: str = "/app/results/rag_evaluation_cache.json",
                  auto_save_cache: bool = True,
                  config_path: str = None,
-                 use_yaml_config: bool = True):
+                 use_yaml_config: bool = True,
+                 early_stop: bool = False,
+                 fidelity_seed: int = 0,
+                 api_endpoints: Optional[List[str]] = None):
         """
         Initialize the RAG pipeline evaluator.
         
@@ -70,24 +74,36 @@ class RAGPipelineEvaluator:
             auto_save_cache: Whether to automatically save cache after each evaluation
             config_path: Path to gen_search_config.yml file
             use_yaml_config: Whether to load search space from YAML config
+            early_stop: Whether to let the API stop evaluating candidates that cannot beat
+                        the best score seen so far (racing); such scores are partial
+            fidelity_seed: Seed of the test case subsets used for reduced-fidelity evaluations
+            api_endpoints: URLs of several RAG evaluation APIs, used in round-robin order
+                           (overrides api_endpoint and YAML config)
+        
+        evaluate is thread-safe, so candidates can be evaluated concurrently
+        (e.g. with a ThreadPoolEvaluation executor), one request per endpoint or more.
         """
         # Try to load config from YAML
         self._yaml_config = None
         if use_yaml_config:
             try:
-                from config_loader import load_config, get_search_space_as_component_options, get_api_endpoint
+                from config_loader import load_config, get_search_space_as_component_options, get_api_endpoints
                 self._yaml_config = load_config(config_path)
                 logger.info(f"✅ Loaded configuration from gen_search_config.yml")
             except Exception as e:
                 logger.warning(f"⚠️ Could not load YAML config: {e}. Using defaults.")
         
-        # Set API endpoint (parameter overrides YAML config)
-        if api_endpoint is not None:
-            self.api_endpoint = api_endpoint
+        # Set API endpoints (parameters override YAML config)
+        if api_endpoints:
+            self.api_endpoints = list(api_endpoints)
+        elif api_endpoint is not None:
+            self.api_endpoints = [api_endpoint]
         elif self._yaml_config is not None:
-            self.api_endpoint = get_api_endpoint(self._yaml_config)
+            self.api_endpoints = get_api_endpoints(self._yaml_config)
         else:
-            self.api_endpoint = "http://example.com/api/evaluate"
+            self.api_endpoints = ["http://example.com/api/evaluate"]
+        self.api_endpoint = self.api_endpoints[0]
+        self._endpoint_index = 0
         
         # Set timeout (parameter overrides YAML config)
         if timeout is not None:
@@ -101,12 +117,23 @@ class RAGPipelineEvaluator:
         self.enable_cache = enable_cache
         self.cache_file_path = cache_file_path
         self.auto_save_cache = auto_save_cache
+        self.early_stop = early_stop
+        self.fidelity_seed = fidelity_seed
         
-        # Evaluation cache and statistics
+        # Evaluation cache and statistics; evaluation_fidelity holds the number of test
+        # cases of every reduced-fidelity score (candidates missing from it were fully evaluated);
+        # evaluation_truncated holds the early-stop threshold of every partial score
         self.evaluation_cache: Dict[tuple, float] = {}
+        self.evaluation_fidelity: Dict[tuple, int] = {}
+        self.evaluation_truncated: Dict[tuple, float] = {}
         self.cache_hits = 0
         self.total_evaluations = 0
         self.api_calls = 0
+        self.truncated_evaluations = 0
+        self.best_score: Optional[float] = None
+        
+        # Guards the cache, the statistics and the cache file when evaluating concurrently
+        self._lock = threading.RLock()
         
         # Load existing cache if available
         if self.enable_cache:
@@ -231,9 +258,13 @@ class RAGPipelineEvaluator:
             # Load statistics if available
             stats = cache_data.get("statistics", {})
             self.evaluation_cache = loaded_cache
+            self.evaluation_fidelity = self._parse_cache_section(cache_data, "fidelity", loaded_cache, int)
+            self.evaluation_truncated = self._parse_cache_section(cache_data, "truncated", loaded_cache, float)
             self.cache_hits = stats.get("cache_hits", 0)
             self.total_evaluations = stats.get("total_evaluations", 0)
             self.api_calls = stats.get("api_calls", 0)
+            self.truncated_evaluations = stats.get("truncated_evaluations", 0)
+            self.best_score = self._best_full_score()
             
             logger.info(f"✅ Loaded cache from {self.cache_file_path}: "
                        f"{len(loaded_cache)} entries, "
@@ -244,6 +275,29 @@ class RAGPipelineEvaluator:
             logger.error(f"Failed to load cache from {self.cache_file_path}: {e}")
             logger.info("Starting with empty cache")
     
+    @staticmethod
+    def _parse_cache_section(cache_data: Dict[str, Any], section: str, loaded_cache: Dict[tuple, float],
+                             convert: Callable[[Any], Any]) -> Dict[tuple, Any]:
+        """Read the per-entry markers ("fidelity" or "truncated") of a cache file (older files have none)"""
+        entries = {}
+        for key_str, value in cache_data.get(section, {}).items():
+            try:
+                key = tuple(json.loads(key_str))
+                if key in loaded_cache:
+                    entries[key] = convert(value)
+            except (json.JSONDecodeError, ValueError, TypeError) as e:
+                logger.warning(f"Skipping invalid cache {section} entry {key_str}: {e}")
+        return entries
+    
+    def _is_complete(self, key: tuple) -> bool:
+        """Whether the cached score of a candidate comes from a full, untruncated evaluation"""
+        return key not in self.evaluation_fidelity and key not in self.evaluation_truncated
+    
+    def _best_full_score(self) -> Optional[float]:
+        """Best cached score of a full evaluation (reduced-fidelity and partial scores are not comparable)"""
+        full_scores = [v for k, v in self.evaluation_cache.items() if self._is_complete(k)]
+        return max(full_scores) if full_scores else None
+    
     def _auto_save_cache(self) -> None:
         """Automatically save cache to file if auto_save_cache is enabled."""
         if not self.auto_save_cache or not self.enable_cache:
@@ -256,6 +310,8 @@ class RAGPipelineEvaluator:
             # Prepare cache data
             cache_data = {
                 "cache": {json.dumps(list(k)): v for k, v in self.evaluation_cache.items()},
+                "fidelity": {json.dumps(list(k)): v for k, v in self.evaluation_fidelity.items()},
+                "truncated": {json.dumps(list(k)): v for k, v in self.evaluation_truncated.items()},
                 "statistics": self.get_cache_statistics(),
                 "metadata": {
                     "last_updated": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -309,12 +365,13 @@ class RAGPipelineEvaluator:
         
         return configuration
     
-    def prepare_evaluation_request(self, configuration: Dict[str, str]) -> Dict[str, Any]:
+    def prepare_evaluation_request(self, configuration: Dict[str, str], fidelity: Optional[int] = None) -> Dict[str, Any]:
         """
         Prepare the request payload for the RAG evaluation API.
         
         Args:
             configuration: RAG pipeline configuration
+            fidelity: Number of test cases of a reduced-fidelity evaluation (None for a full evaluation)
             
         Returns:
             Request payload dictionary
@@ -326,6 +383,18 @@ class RAGPipelineEvaluator:
             }
         }
         
+        if fidelity is not None:
+            # Seeded subset, so every candidate is compared on the same test cases and the
+            # subsets of growing fidelity levels are nested
+            request_payload["evaluation_request"].update({
+                "max_test_cases": fidelity,
+                "test_case_offset": 0,
+                "test_case_seed": self.fidelity_seed
+            })
+        elif self.early_stop and self.best_score is not None:
+            # Racing: the API may stop early once the candidate cannot beat the best score so far
+            request_payload["evaluation_request"]["early_stop_threshold"] = self.best_score
+        
         return request_payload
     
     def send_evaluation_request(self, request_payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -348,10 +417,12 @@ class RAGPipelineEvaluator:
         
         for attempt in range(self.max_retries):
             try:
-                logger.info(f"Sending evaluation request (attempt {attempt + 1}/{self.max_retries})")
+                # Spread requests (and retries) over the available endpoints
+                api_endpoint = self._next_endpoint()
+                logger.info(f"Sending evaluation request to {api_endpoint} (attempt {attempt + 1}/{self.max_retries})")
                 
                 response = requests.post(
-                    self.api_endpoint,
+                    api_endpoint,
                     json=request_payload,
                     headers=headers,
                     timeout=self.timeout
@@ -377,6 +448,13 @@ class RAGPipelineEvaluator:
                 logger.info(f"Waiting {wait_time} seconds before retry...")
                 time.sleep(wait_time)
     
+    def _next_endpoint(self) -> str:
+        """Get the next API endpoint in round-robin order."""
+        with self._lock:
+            api_endpoint = self.api_endpoints[self._endpoint_index % len(self.api_endpoints)]
+            self._endpoint_index += 1
+        return api_endpoint
+    
     def extract_score_from_response(self, response_data: Dict[str, Any]) -> float:
         """
         Extract the evaluation score from the API response.
@@ -412,17 +490,21 @@ class RAGPipelineEvaluator:
             # Return a default low score if extraction fails
             return 0.0
     
-    def evaluate(self, candidate: List[int]) -> float:
+    def evaluate(self, candidate: List[int], fidelity: Optional[int] = None) -> float:
         """
         Main evaluation function for the genetic algorithm.
         
         This function takes a candidate solution (list of component selections)
         and returns a fitness score by calling the external RAG evaluation API.
-        Implements caching to avoid redundant API calls.
+        Implements caching to avoid redundant API calls; a cached score answers
+        any request of the same or a lower fidelity. A score that was stopped early
+        only answers a full request that would race against the same or a higher
+        threshold.
         
         Args:
             candidate: List of integers representing selected components
                       [preprocessor_idx, embedding_idx, vector_db_idx, ...]
+            fidelity: Evaluate on a seeded subset of this many test cases (None for a full evaluation)
             
         Returns:
             Fitness score as float (0-100 range)
@@ -430,43 +512,72 @@ class RAGPipelineEvaluator:
         
         candidate_key = tuple(candidate)
         
-        # Check cache first (if enabled)
-        if self.enable_cache and candidate_key in self.evaluation_cache:
-            self.cache_hits += 1
-            cached_score = self.evaluation_cache[candidate_key]
-            hit_rate = (self.cache_hits / self.total_evaluations) * 100
-            logger.info(f"Cache HIT for candidate {candidate}: {cached_score:.4f} "
-                       f"(hit rate: {hit_rate:.1f}%, {self.cache_hits}/{self.total_evaluations})")
-            return cached_score
-        else:
-            self.total_evaluations += 1
+        with self._lock:
+            cached_fidelity = self.evaluation_fidelity.get(candidate_key)
+            reusable = cached_fidelity is None or (fidelity is not None and cached_fidelity >= fidelity)
+            
+            truncated_at = self.evaluation_truncated.get(candidate_key)
+            if truncated_at is not None:
+                # A partial score would be stopped again only below the same or a higher best score
+                reusable = (fidelity is None and self.early_stop and
+                            self.best_score is not None and self.best_score >= truncated_at)
+            
+            # Check cache first (if enabled)
+            if self.enable_cache and candidate_key in self.evaluation_cache and reusable:
+                self.cache_hits += 1
+                cached_score = self.evaluation_cache[candidate_key]
+                hit_rate = (self.cache_hits / self.total_evaluations) * 100
+                logger.info(f"Cache HIT for candidate {candidate}: {cached_score:.4f} "
+                           f"(hit rate: {hit_rate:.1f}%, {self.cache_hits}/{self.total_evaluations})")
+                return cached_score
+            else:
+                self.total_evaluations += 1
+                self.api_calls += 1
 
         # Cache miss - evaluate via API
         try:
-            logger.info(f"Cache MISS - Evaluating candidate: {candidate}")
+            fidelity_str = f"{fidelity} test cases" if fidelity is not None else "full"
+            logger.info(f"Cache MISS - Evaluating candidate: {candidate} ({fidelity_str})")
             
             # Step 1: Convert candidate to structured configuration
             configuration = self.candidate_to_configuration(candidate)
             logger.info(f"Configuration: {configuration}")
             
             # Step 2: Prepare API request
-            request_payload = self.prepare_evaluation_request(configuration)
+            request_payload = self.prepare_evaluation_request(configuration, fidelity)
             
             # Step 3: Send request to external API
-            self.api_calls += 1
             response_data = self.send_evaluation_request(request_payload)
             
             # Step 4: Extract score from response
             score = self.extract_score_from_response(response_data)
             
-            # Step 5: Cache the result (if enabled)
-            if self.enable_cache:
-                self.evaluation_cache[candidate_key] = score
-                logger.info(f"Cached result for candidate {candidate}: {score:.4f} "
-                           f"(cache size: {len(self.evaluation_cache)})")
+            threshold = request_payload["evaluation_request"].get("early_stop_threshold")
+            truncated = response_data.get("evaluation", {}).get("truncated", False) and threshold is not None
+            
+            with self._lock:
+                if truncated:
+                    self.truncated_evaluations += 1
+                    logger.info(f"Evaluation of candidate {candidate} was stopped early with partial score {score:.4f}")
+                elif fidelity is None and (self.best_score is None or score > self.best_score):
+                    self.best_score = score
                 
-                # Auto-save cache after new evaluation
-                self._auto_save_cache()
+                # Step 5: Cache the result (if enabled)
+                if self.enable_cache:
+                    self.evaluation_cache[candidate_key] = score
+                    if fidelity is None:
+                        self.evaluation_fidelity.pop(candidate_key, None)
+                    else:
+                        self.evaluation_fidelity[candidate_key] = fidelity
+                    if truncated:
+                        self.evaluation_truncated[candidate_key] = threshold
+                    else:
+                        self.evaluation_truncated.pop(candidate_key, None)
+                    logger.info(f"Cached result for candidate {candidate}: {score:.4f} "
+                               f"(cache size: {len(self.evaluation_cache)})")
+                    
+                    # Auto-save cache after new evaluation
+                    self._auto_save_cache()
             
             logger.info(f"Final score for candidate {candidate}: {score}")
             return score
@@ -497,6 +608,7 @@ class RAGPipelineEvaluator:
             "cache_hits": self.cache_hits,
             "cache_misses": self.total_evaluations - self.cache_hits,
             "api_calls": self.api_calls,
+            "truncated_evaluations": self.truncated_evaluations,
             "cache_size": len(self.evaluation_cache),
             "hit_rate_percent": hit_rate,
             "efficiency_percent": efficiency,
@@ -506,9 +618,13 @@ class RAGPipelineEvaluator:
     def clear_cache(self) -> None:
         """Clear the evaluation cache and reset statistics."""
         self.evaluation_cache.clear()
+        self.evaluation_fidelity.clear()
+        self.evaluation_truncated.clear()
         self.cache_hits = 0
         self.total_evaluations = 0
         self.api_calls = 0
+        self.truncated_evaluations = 0
+        self.best_score = None
         logger.info("Evaluation cache cleared")
     
     def get_cache_size(self) -> int:
@@ -519,15 +635,18 @@ class RAGPipelineEvaluator:
         """
         Get the best individual and score from cache.
         
+        Only fully evaluated candidates that were not stopped early are considered.
+        
         Returns:
             Tuple of (candidate_genes, fitness_score) for the best cached individual,
             or (None, 0.0) if cache is empty
         """
-        if not self.evaluation_cache:
+        full_keys = [k for k in self.evaluation_cache if self._is_complete(k)]
+        if not full_keys:
             return None, 0.0
         
         # Find the candidate with the highest score
-        best_candidate_key = max(self.evaluation_cache.keys(), 
+        best_candidate_key = max(full_keys, 
                                key=lambda k: self.evaluation_cache[k])
         best_score = self.evaluation_cache[best_candidate_key]
         best_candidate = list(best_candidate_key)
@@ -551,6 +670,8 @@ class RAGPipelineEvaluator:
             
             cache_data = {
                 "cache": {json.dumps(list(k)): v for k, v in self.evaluation_cache.items()},
+                "fidelity": {json.dumps(list(k)): v for k, v in self.evaluation_fidelity.items()},
+                "truncated": {json.dumps(list(k)): v for k, v in self.evaluation_truncated.items()},
                 "statistics": self.get_cache_statistics(),
                 "metadata": {
                     "last_updated": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -600,11 +721,18 @@ class RAGPipelineEvaluator:
             stats = cache_data.get("statistics", {})
             old_size = len(self.evaluation_cache)
             self.evaluation_cache.update(loaded_cache)
+            for key in loaded_cache:
+                self.evaluation_fidelity.pop(key, None)
+                self.evaluation_truncated.pop(key, None)
+            self.evaluation_fidelity.update(self._parse_cache_section(cache_data, "fidelity", loaded_cache, int))
+            self.evaluation_truncated.update(self._parse_cache_section(cache_data, "truncated", loaded_cache, float))
             
             # Update statistics (merge with existing)
             self.cache_hits = max(self.cache_hits, stats.get("cache_hits", 0))
             self.total_evaluations = max(self.total_evaluations, stats.get("total_evaluations", 0))
             self.api_calls = max(self.api_calls, stats.get("api_calls", 0))
+            self.truncated_evaluations = max(self.truncated_evaluations, stats.get("truncated_evaluations", 0))
+            self.best_score = self._best_full_score()
             
             logger.info(f"📂 Cache loaded from {filepath}: "
                        f"{len(loaded_cache)} entries loaded, "
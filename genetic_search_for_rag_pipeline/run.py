@@ -24,6 +24,7 @@ from rag_evaluator import RAGPipelineEvaluator
 from selection import TournamentSelection, RouletteWheelSelection, RankSelection, EliteSelection
 from crossover import UniformCrossover, SinglePointCrossover, MultiPointCrossover, SegmentCrossover
 from mutation import AdaptiveMutation, RandomMutation, CategoricalMutation, SwapMutation, InversionMutation
+from evaluation import SequentialEvaluation, ThreadPoolEvaluation, AsyncioEvaluation
 
 # Configure logging
 logging.basicConfig(
@@ -119,6 +120,25 @@ def create_mutation_method(config):
         return AdaptiveMutation(base_mutation_rate=0.1)
 
 
+def create_evaluation_executor(config):
+    """Create evaluation executor from YAML config."""
+    if config is None:
+        return SequentialEvaluation()
+    
+    ga_config = config.genetic_algorithm
+    backend = ga_config.evaluation_backend.lower()
+    
+    if backend == "sequential":
+        return SequentialEvaluation()
+    elif backend == "thread":
+        return ThreadPoolEvaluation(max_workers=ga_config.evaluation_workers)
+    elif backend == "asyncio":
+        return AsyncioEvaluation(max_concurrency=ga_config.evaluation_workers)
+    else:
+        logger.warning(f"Unknown evaluation backend: {backend}. Using sequential.")
+        return SequentialEvaluation()
+
+
 def create_rag_evaluator(api_endpoint: str = None, yaml_config = None) -> RAGPipelineEvaluator:
     """
     Create and configure the RAG pipeline evaluator with real API endpoint and persistent caching.
@@ -133,34 +153,40 @@ def create_rag_evaluator(api_endpoint: str = None, yaml_config = None) -> RAGPip
     # Get cache file path from environment or use default
     cache_file_path = os.environ.get("CACHE_FILE_PATH", "/app/results/rag_evaluation_cache.json")
     
-    # Determine API endpoint
-    if api_endpoint is None and yaml_config is not None:
-        from config_loader import get_api_endpoint
-        api_endpoint = get_api_endpoint(yaml_config)
-    elif api_endpoint is None:
-        api_endpoint = "http://rag_pipeline:8060/api/evaluate"
+    # Determine API endpoints
+    if api_endpoint is not None:
+        api_endpoints = [api_endpoint]
+    elif yaml_config is not None:
+        from config_loader import get_api_endpoints
+        api_endpoints = get_api_endpoints(yaml_config)
+    else:
+        api_endpoints = ["http://rag_pipeline:8060/api/evaluate"]
     
     # Get timeout from YAML config
     timeout = 12000
+    early_stop = False
     if yaml_config is not None:
         timeout = yaml_config.api.timeout
+        early_stop = yaml_config.genetic_algorithm.early_stop
     
     # Create evaluator with real API endpoint and persistent caching enabled
     # Search space will be loaded from YAML config automatically
     evaluator = RAGPipelineEvaluator(
-        api_endpoint=api_endpoint,
+        api_endpoints=api_endpoints,
         timeout=timeout,
         max_retries=5,   # Increased retries for robustness
         enable_cache=True,  # Enable caching for efficiency
         cache_file_path=cache_file_path,  # Persistent cache file
         auto_save_cache=True,  # Auto-save cache after each evaluation
-        use_yaml_config=True  # Load search space from YAML
+        use_yaml_config=True,  # Load search space from YAML
+        early_stop=early_stop  # Race candidates against the current best score
     )
     
     logger.info(f"🔧 RAG Evaluator configured:")
-    logger.info(f"   API Endpoint: {api_endpoint}")
+    logger.info(f"   API Endpoints: {', '.join(api_endpoints)}")
     logger.info(f"   Timeout: {timeout}s")
     logger.info(f"   Cache File: {cache_file_path}")
+    logger.info(f"   Early Stop: {early_stop}")
     
     return evaluator
 
@@ -388,6 +414,7 @@ def run_rag_optimization_basic(api_endpoint: str = None) -> Dict[str, Any]:
             selection_method=create_selection_method(yaml_config),
             crossover_method=create_crossover_method(yaml_config),
             mutation_method=create_mutation_method(yaml_config),
+            evaluation_executor=create_evaluation_executor(yaml_config),
             convergence_threshold=min(5, ga_cfg.convergence_threshold),
             target_fitness=0.95,
             verbose=ga_cfg.verbose,
@@ -416,6 +443,7 @@ def run_rag_optimization_basic(api_endpoint: str = None) -> Dict[str, Any]:
     logger.info(f"Configuration:")
     logger.info(f"  Population size: {config.population_size}")
     logger.info(f"  Generations: {config.generations}")
+    logger.info(f"  Evaluation: {config.evaluation_executor}")
     logger.info(f"  Crossover rate: {config.crossover_rate}")
     logger.info(f"  Mutation rate: {config.mutation_rate}")
     logger.info(f"  API endpoint: {api_endpoint}")
@@ -539,8 +567,11 @@ def run_rag_optimization_comprehensive(api_endpoint: str = None) -> Dict[str, An
             selection_method=create_selection_method(yaml_config),
             crossover_method=create_crossover_method(yaml_config),
             mutation_method=create_mutation_method(yaml_config),
+            evaluation_executor=create_evaluation_executor(yaml_config),
             convergence_threshold=ga_cfg.convergence_threshold,
             target_fitness=ga_cfg.target_fitness,
+            fidelity_levels=ga_cfg.fidelity_levels,
+            promotion_fraction=ga_cfg.promotion_fraction,
             verbose=ga_cfg.verbose,
             track_statistics=ga_cfg.track_statistics,
             random_seed=ga_cfg.random_seed
@@ -571,6 +602,7 @@ def run_rag_optimization_comprehensive(api_endpoint: str = None) -> Dict[str, An
     logger.info(f"Configuration:")
     logger.info(f"  Population size: {config.population_size}")
     logger.info(f"  Generations: {config.generations}")
+    logger.info(f"  Evaluation: {config.evaluation_executor}")
     logger.info(f"  Expected evaluations: ~{config.population_size * config.generations}")
     logger.info(f"  Estimated time: ~{config.population_size * config.generations * 2 / 60:.1f} minutes")
     logger.info(f"  API endpoint: {api_endpoint}")
@@ -88,7 +88,7 @@ class TournamentSelection(SelectionMethod):
             tournament_contestants = random.sample(evaluated_individuals, self.tournament_size)
             
             # Select the best individual from the tournament
-            winner = max(tournament_contestants, key=lambda x: x.fitness)
+            winner = max(tournament_contestants, key=lambda x: x.ranking_key())
             selected.append(winner.copy())  # Return a copy to avoid modifying original
         
         return selected
@@ -132,12 +132,21 @@ class RouletteWheelSelection(SelectionMethod):
         if not evaluated_individuals:
             raise ValueError("No evaluated individuals in population")
         
+        # Reduced-fidelity fitness is capped at the lowest full evaluation, so these
+        # individuals are never favoured over fully evaluated ones
+        fitness_values = [ind.fitness for ind in evaluated_individuals]
+        full_fitness = [ind.fitness for ind in evaluated_individuals if ind.fidelity is None]
+        if full_fitness:
+            fitness_cap = min(full_fitness)
+            fitness_values = [fitness if ind.fidelity is None else min(fitness, fitness_cap)
+                              for ind, fitness in zip(evaluated_individuals, fitness_values)]
+        
         # Handle negative fitness values by shifting to positive values
-        min_fitness = min(ind.fitness for ind in evaluated_individuals)
+        min_fitness = min(fitness_values)
         if min_fitness < 0:
-            shifted_fitness = [ind.fitness - min_fitness + 1 for ind in evaluated_individuals]
+            shifted_fitness = [fitness - min_fitness + 1 for fitness in fitness_values]
         else:
-            shifted_fitness = [ind.fitness for ind in evaluated_individuals]
+            shifted_fitness = fitness_values
         
         # Calculate total fitness for probability computation
         total_fitness = sum(shifted_fitness)
@@ -224,8 +233,9 @@ class RankSelection(SelectionMethod):
         if not evaluated_individuals:
             raise ValueError("No evaluated individuals in population")
         
-        # Sort individuals by fitness (ascending order for rank calculation)
-        sorted_individuals = sorted(evaluated_individuals, key=lambda x: x.fitness)
+        # Sort individuals by fitness (ascending order for rank calculation);
+        # reduced-fidelity individuals rank below fully evaluated ones
+        sorted_individuals = sorted(evaluated_individuals, key=lambda x: x.ranking_key())
         
         # Calculate rank-based probabilities
         n = len(sorted_individuals)
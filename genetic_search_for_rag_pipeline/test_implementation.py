@@ -6,6 +6,8 @@ This script thoroughly tests ALL features of the genetic algorithm implementatio
 - All crossover methods (Single-point, Multi-point, Uniform, Order, Segment)
 - All mutation methods (Random, Adaptive, Categorical, Swap, Inversion, Composite)
 - Configuration variations and scaling
+- Multi-fidelity (successive halving) evaluation
+- Parallel, deduplicated population evaluation
 - API integration and containerized service
 - RAG pipeline optimization workflows
 """
@@ -34,6 +36,7 @@ from mutation import (
 )
 from individual import Individual
 from population import Population
+from evaluation import SequentialEvaluation, ThreadPoolEvaluation, AsyncioEvaluation
 
 
 class ComprehensiveDummyEvaluator:
@@ -578,6 +581,141 @@ def test_config_variations():
     return results
 
 
+def test_multi_fidelity_evaluation():
+    """Test 5b: Successive halving over fidelity levels."""
+    print("\n" + "=" * 70)
+    print("TEST 5b: Multi-Fidelity Evaluation")
+    print("=" * 70)
+    
+    base_evaluator = ComprehensiveDummyEvaluator("pattern", track_details=False)
+    calls_by_fidelity: Dict[Any, int] = {}
+    
+    def evaluate(candidate: List[int], fidelity: int = None) -> float:
+        calls_by_fidelity[fidelity] = calls_by_fidelity.get(fidelity, 0) + 1
+        # Low fidelity: same signal with a bit of subset noise
+        noise = random.uniform(-0.05, 0.05) if fidelity is not None else 0.0
+        return max(0.0, base_evaluator.evaluate(candidate) + noise)
+    
+    config = GAConfig(
+        category_sizes=[4, 5, 3, 6, 4],
+        population_size=12,
+        generations=4,
+        elitism_count=2,
+        fidelity_levels=[3, 9],
+        promotion_fraction=0.34,
+        random_seed=42,
+        verbose=False
+    )
+    ga = GeneticAlgorithm(config, evaluate)
+    results = ga.run()
+    
+    low, mid, full = calls_by_fidelity.get(3, 0), calls_by_fidelity.get(9, 0), calls_by_fidelity.get(None, 0)
+    print(f"Evaluations: {low} at 3 cases, {mid} at 9 cases, {full} full")
+    print(f"Best fitness: {results['best_fitness']:.4f} (fidelity: {ga.best_ever_individual.fidelity})")
+    
+    assert low > mid > 0 and mid >= full > 0, "Each fidelity level should promote fewer candidates"
+    assert ga.best_ever_individual.fidelity is None, "The best individual must come from a full evaluation"
+    
+    # Promotion re-evaluates at the higher fidelity; a full score answers lower fidelities
+    individual = Individual(config.category_sizes)
+    individual.evaluate(evaluate, fidelity=3)
+    assert individual.needs_higher_fidelity(9) and individual.needs_higher_fidelity(None)
+    individual.evaluate(evaluate)
+    assert individual.fidelity is None and not individual.needs_higher_fidelity(3)
+    print("✅ Successive halving promotes the best candidates to full evaluations")
+    
+    # Subset scores that look better than every full evaluation must neither become
+    # elites nor win selection against fully evaluated individuals
+    def optimistic_evaluate(candidate: List[int], fidelity: int = None) -> float:
+        return 90.0 if fidelity is not None else 40.0 + sum(candidate)
+    
+    config = GAConfig(
+        category_sizes=[2, 2, 2, 2, 2],
+        population_size=8,
+        generations=3,
+        elitism_count=2,
+        fidelity_levels=[5],
+        promotion_fraction=0.25,
+        random_seed=7,
+        verbose=False
+    )
+    ga = GeneticAlgorithm(config, optimistic_evaluate)
+    ga.run()
+    elites = ga.population.get_top_individuals(config.elitism_count)
+    assert all(ind.fidelity is None for ind in elites), f"Low-fidelity elites: {elites}"
+    assert ga.population.get_best_individual().fitness <= ga.best_ever_individual.fitness
+    
+    low_fidelity, fully_evaluated = Individual(config.category_sizes), Individual(config.category_sizes)
+    low_fidelity.evaluate(optimistic_evaluate, fidelity=5)
+    fully_evaluated.evaluate(optimistic_evaluate)
+    population = Population(2, config.category_sizes)
+    population.individuals = [low_fidelity, fully_evaluated]
+    for method in (TournamentSelection(tournament_size=2), RankSelection(selection_pressure=2.0), EliteSelection()):
+        assert method.select(population, 1)[0].fidelity is None, f"{method} preferred a low-fidelity individual"
+    print("✅ Low-fidelity fitness ranks below full evaluations in elitism and selection")
+    
+    return {'low': low, 'mid': mid, 'full': full, 'best_fitness': results['best_fitness']}
+
+
+def test_parallel_evaluation():
+    """Test 5c: Batched evaluation with thread and asyncio executors."""
+    print("\n" + "=" * 70)
+    print("TEST 5c: Parallel Evaluation")
+    print("=" * 70)
+    
+    base_evaluator = ComprehensiveDummyEvaluator("pattern", track_details=False)
+    category_sizes = [4, 5, 3, 6, 4]
+    results = {}
+    
+    for executor in [SequentialEvaluation(), ThreadPoolEvaluation(max_workers=8), AsyncioEvaluation(max_concurrency=8)]:
+        evaluated = []
+        
+        def evaluate(candidate: List[int]) -> float:
+            evaluated.append(tuple(candidate))
+            time.sleep(0.02)  # Simulate a slow evaluation request
+            return base_evaluator.evaluate(candidate)
+        
+        # 16 individuals, but only 8 distinct genomes
+        random.seed(7)
+        population = Population(8, category_sizes)
+        population.individuals += [individual.copy() for individual in population.individuals]
+        
+        start_time = time.time()
+        population.evaluate_all(evaluate, executor)
+        elapsed = time.time() - start_time
+        
+        distinct = {tuple(individual.genes) for individual in population.individuals}
+        print(f"{str(executor):<40} {len(evaluated)} evaluations, {elapsed:.3f}s")
+        
+        assert len(evaluated) == len(distinct), "Each distinct genome should be evaluated once"
+        fitness_by_genome = {}
+        for individual in population.individuals:
+            fitness_by_genome.setdefault(tuple(individual.genes), set()).add(individual.fitness)
+        assert all(None not in f and len(f) == 1 for f in fitness_by_genome.values()), \
+            "Fitness should be folded back into every copy"
+        results[str(executor)] = elapsed
+    
+    # The same seed gives the same evolution whatever the executor (noise-free fitness)
+    def deterministic_evaluate(candidate: List[int]) -> float:
+        return float(sum((gene + 1) * (i + 1) for i, gene in enumerate(candidate)))
+    
+    fitnesses = []
+    for executor in [SequentialEvaluation(), ThreadPoolEvaluation(max_workers=4)]:
+        config = GAConfig(
+            category_sizes=category_sizes,
+            population_size=12,
+            generations=5,
+            evaluation_executor=executor,
+            random_seed=42,
+            verbose=False
+        )
+        fitnesses.append(GeneticAlgorithm(config, deterministic_evaluate).run()['best_fitness'])
+    assert fitnesses[0] == fitnesses[1], "Parallel evaluation should not change the search"
+    print("✅ Parallel executors match sequential evaluation")
+    
+    return results
+
+
 def test_scaling_performance():
     """Test 6: Test performance across different problem scales."""
     print("\n" + "=" * 70)
@@ -907,6 +1045,8 @@ def run_comprehensive_tests():
         all_results['mutation'] = test_all_mutation_methods()
         all_results['individual_population'] = test_individual_and_population_operations()
         all_results['configurations'] = test_config_variations()
+        all_results['multi_fidelity'] = test_multi_fidelity_evaluation()
+        all_results['parallel_evaluation'] = test_parallel_evaluation()
         all_results['scaling'] = test_scaling_performance()
         all_results['api_integration'] = test_api_integration()
         all_results['edge_cases'] = test_edge_cases_and_robustness()
@@ -939,6 +1079,10 @@ def run_comprehensive_tests():
         total_tests += len(all_results['configurations'])
         successful_tests += len(all_results['configurations'])
         
+        # Multi-fidelity and parallel evaluation
+        total_tests += 2
+        successful_tests += 2
+        
         # Scaling tests
         total_tests += len(all_results['scaling'])
         successful_tests += len(all_results['scaling'])
@@ -970,6 +1114,8 @@ def run_comprehensive_tests():
         print(f"✅ Mutation Methods: {len(all_results['mutation'])} variants")
         print(f"✅ Individual & Population Operations")
         print(f"✅ Configuration Variations: {len(all_results['configurations'])} configs")
+        print(f"✅ Multi-Fidelity Evaluation (successive halving)")
+        print(f"✅ Parallel Evaluation: {len(all_results['parallel_evaluation'])} executors")
         print(f"✅ Scaling Performance: {len(all_results['scaling'])} scales")
         print(f"✅ API Integration & Pipeline Functions")
         print(f"✅ Edge Cases & Robustness: {len(all_results['edge_cases'])} cases")
@@ -4,6 +4,7 @@ import os
 import sys
 import json
 import ast
+import random
 from typing import List, Optional, Dict
 from pathlib import Path
 
@@ -178,14 +179,26 @@ class RAGDataset:
             logger.error(f"Failed to load documents from {folder_path}: {e}")
             return []
     
-    def get_test_cases(self, max_cases: Optional[int] = None, case_offset: Optional[int] = 0) -> List[RAGTestCase]:
-        """Get test cases, optionally limited by max_cases"""
+    def get_test_cases(self, max_cases: Optional[int] = None, case_offset: Optional[int] = 0,
+                       seed: Optional[int] = None) -> List[RAGTestCase]:
+        """
+        Get test cases, optionally limited by max_cases
+        
+        With a seed the test cases are shuffled deterministically before case_offset and
+        max_cases are applied, so growing max_cases yields nested random subsets.
+        """
         if not self.test_cases:
             self.load_test_cases()
         
+        test_cases = self.test_cases
+        if seed is not None:
+            test_cases = list(test_cases)
+            random.Random(seed).shuffle(test_cases)
+        
         if max_cases and max_cases > 0:
-            return self.test_cases[case_offset:case_offset+max_cases]
-        return self.test_cases
+            case_offset = case_offset or 0
+            return test_cases[case_offset:case_offset+max_cases]
+        return test_cases
     
     def get_documents(self) -> List[RAGDocument]:
         """Get all documents"""
@@ -1,7 +1,10 @@
 import logging
 import json
 import time
-from typing import List, Dict, Any, Optional
+import asyncio
+import math
+import statistics
+from typing import List, Dict, Any, Optional, Tuple
 import os
 
 from .models import (
@@ -11,6 +14,9 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the judge prompt changes so cached verdicts of the old prompt are not reused
+JUDGE_PROMPT_VERSION = "v1"
+
 class RAGEvaluator:
     """Evaluates both retrieval and generation components of RAG pipeline"""
     
@@ -30,17 +36,105 @@ class RAGEvaluator:
             else:
                 eval_embedding_model = "mxbai-embed-large"
             self.semantic_evaluator = SemanticComparison(eval_embedding_model)
+            
+            # Verdicts are reused for byte-identical (answer, ground truth) pairs
+            from rag_pipeline.util.cache.judge_cache import get_judge_cache
+            self.judge_cache = get_judge_cache()
         except Exception as e:
             logger.error(f"Failed to setup evaluators: {e}")
             raise
     
+    def prepare_ground_truths(self, test_cases: List[RAGTestCase]) -> Optional[str]:
+        """
+        Embed the ground truth answers of a dataset once, ahead of generation scoring
+        
+        Returns:
+            Hash of the ground truth set, or None if the embeddings could not be prepared
+        """
+        try:
+            return self.semantic_evaluator.prepare_references([tc.ground_truth_answer for tc in test_cases])
+        except Exception as e:
+            logger.warning(f"Failed to prepare ground truth embeddings: {e}")
+            return None
+    
+    def compute_semantic_scores(self, generated_answers: List[str], ground_truth_answers: List[str]) -> List[Optional[float]]:
+        """
+        Score the semantic similarity of a batch of answers with one batched embedding call
+        
+        Returns:
+            One score per answer (None for empty answers, or for all answers if scoring failed)
+        """
+        scores: List[Optional[float]] = [None] * len(generated_answers)
+        indices = [i for i, answer in enumerate(generated_answers) if answer]
+        if not indices:
+            return scores
+        try:
+            batch_scores = self.semantic_evaluator.get_similarity_scores(
+                [generated_answers[i] for i in indices],
+                [ground_truth_answers[i] for i in indices]
+            )
+            for i, score in zip(indices, batch_scores):
+                scores[i] = score
+        except Exception as e:
+            logger.warning(f"Batched semantic scoring failed, falling back to per-case scoring: {e}")
+        return scores
+    
+    async def compute_llm_scores(self, generated_answers: List[str], ground_truth_answers: List[str]) -> List[Optional[float]]:
+        """
+        Judge a batch of answers, reusing cached verdicts and judging the misses concurrently
+        
+        Returns:
+            One score per answer (None for empty answers, when eval cases are only saved, or for all answers if judging failed)
+        """
+        scores: List[Optional[float]] = [None] * len(generated_answers)
+        indices = [i for i, answer in enumerate(generated_answers) if answer]
+        if not indices or getattr(self.global_config, 'save_eval_cases', False):
+            return scores
+        try:
+            batch_scores = await self.judge_batch(
+                [generated_answers[i] for i in indices],
+                [ground_truth_answers[i] for i in indices]
+            )
+            for i, score in zip(indices, batch_scores):
+                scores[i] = score
+        except Exception as e:
+            logger.warning(f"Batched LLM judging failed, falling back to per-case judging: {e}")
+        return scores
+    
+    def overall_score_upper_bound(self, results: List[RAGEvaluationResult], total_cases: int,
+                                  confidence: float = 0.95) -> Optional[float]:
+        """
+        Upper confidence bound on the overall_score of the full test set given the results so far
+        
+        Uses the normal approximation of the mean of the successful cases with a finite
+        population correction, so the bound tightens to the mean as the set is exhausted.
+        
+        Returns:
+            The bound, or None with fewer than two successful results
+        """
+        scores = [r.metrics.overall_score for r in results if not r.error]
+        n = len(scores)
+        if n < 2:
+            return None
+        mean = statistics.fmean(scores)
+        fpc = math.sqrt(max(0, total_cases - n) / (total_cases - 1)) if total_cases > 1 else 0.0
+        z = statistics.NormalDist().inv_cdf(confidence)
+        return mean + z * statistics.stdev(scores) / math.sqrt(n) * fpc
+    
     async def evaluate_single_case(
         self, 
         test_case: RAGTestCase,
         retrieval_result: RetrievalResult,
-        generation_result: GenerationResult
+        generation_result: GenerationResult,
+        semantic_score: Optional[float] = None,
+        llm_score: Optional[float] = None
     ) -> RAGEvaluationResult:
-        """Evaluate a single test case with both retrieval and generation results"""
+        """
+        Evaluate a single test case with both retrieval and generation results
+        
+        semantic_score and llm_score can be precomputed for a whole batch with
+        compute_semantic_scores and compute_llm_scores.
+        """
         
         total_eval_start = time.time()
         
@@ -52,7 +146,10 @@ class RAGEvaluator:
             
             # Evaluate generation with timing
             generation_eval_start = time.time()
-            generation_metrics = self._evaluate_generation(generation_result.generated_answer, test_case.ground_truth_answer, generation_result.combo_name)
+            generation_metrics = await self._evaluate_generation(
+                generation_result.generated_answer, test_case.ground_truth_answer, generation_result.combo_name,
+                semantic_score, llm_score
+            )
             generation_eval_time = time.time() - generation_eval_start
             
             # Calculate component scores
@@ -241,17 +338,19 @@ class RAGEvaluator:
         except Exception as e:
             logger.error(f"Failed to save generation/ground truth sample: {e}")
 
-    def _evaluate_generation(self, generated_answer: str, ground_truth_answer: str, combo_name: str) -> Dict[str, float]:
+    async def _evaluate_generation(self, generated_answer: str, ground_truth_answer: str, combo_name: str,
+                                   semantic_score: Optional[float] = None, llm_score: Optional[float] = None) -> Dict[str, float]:
         """Evaluate generation performance"""
         if not generated_answer:
             return {'llm_score': 0.0, 'semantic_similarity': 0.0}
         
         try:
-            # Semantic similarity evaluation
-            semantic_score = self.semantic_evaluator.get_similarity_score(
-                generated_answer,
-                ground_truth_answer
-            )
+            # Semantic similarity evaluation (unless precomputed for the whole batch)
+            if semantic_score is None:
+                semantic_score = self.semantic_evaluator.get_similarity_score(
+                    generated_answer,
+                    ground_truth_answer
+                )
 
             if self.global_config.save_eval_cases:
                 self._save_generation_eval_sample(
@@ -261,9 +360,9 @@ class RAGEvaluator:
                     semantic_score=semantic_score
                 )
                 llm_score = -1.0
-            else:
+            elif llm_score is None:
                 # LLM-based evaluation
-                llm_score = self._llm_evaluate(
+                llm_score = await self._llm_evaluate(
                     generated_answer, 
                     ground_truth_answer
                 )
@@ -276,8 +375,56 @@ class RAGEvaluator:
             logger.error(f"Generation evaluation failed: {e}")
             return {'llm_score': 0.0, 'semantic_similarity': 0.0}
     
-    def _llm_evaluate(self, generated_answer: str, ground_truth: str) -> float:
+    def _judge_model(self) -> str:
+        """Model used as the LLM judge"""
+        return getattr(self.global_config, 'llm_eval_model', None) or getattr(self.config_dict.get('generator', None), 'model', 'alibayram/Qwen3-30B-A3B-Instruct-2507:latest')
+    
+    async def judge_batch(self, generated_answers: List[str], ground_truths: List[str],
+                          max_concurrency: Optional[int] = None) -> List[float]:
+        """
+        Judge several answers against their ground truths
+        
+        Verdicts are looked up in the judge cache by (judge model, prompt version, answer,
+        ground truth); each distinct miss is judged once, with at most max_concurrency
+        (default judge_max_concurrency) judge calls in flight. Only parsed verdicts are cached.
+        """
+        model = self._judge_model()
+        pairs = list(zip(generated_answers, ground_truths))
+        scores = self.judge_cache.get_many(model, JUDGE_PROMPT_VERSION, pairs)
+        
+        missing = list(dict.fromkeys(pair for pair, score in zip(pairs, scores) if score is None))
+        if missing:
+            if max_concurrency is None:
+                max_concurrency = getattr(self.global_config, 'judge_max_concurrency', 4)
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+            
+            async def _judge_bounded(pair: Tuple[str, str]) -> Tuple[float, bool]:
+                async with semaphore:
+                    return await self._judge(*pair)
+            
+            verdicts = await asyncio.gather(*[_judge_bounded(pair) for pair in missing])
+            self.judge_cache.put_many(
+                model, JUDGE_PROMPT_VERSION,
+                [pair for pair, (_, parsed) in zip(missing, verdicts) if parsed],
+                [score for score, parsed in verdicts if parsed]
+            )
+            judged = {pair: score for pair, (score, _) in zip(missing, verdicts)}
+            scores = [score if score is not None else judged[pair] for pair, score in zip(pairs, scores)]
+            logger.debug(f"Judged {len(missing)} of {len(pairs)} answers, {len(pairs) - len(missing)} from the judge cache")
+        
+        return scores
+    
+    async def _llm_evaluate(self, generated_answer: str, ground_truth: str) -> float:
         """Use LLM to evaluate generated answer quality"""
+        return (await self.judge_batch([generated_answer], [ground_truth]))[0]
+    
+    async def _judge(self, generated_answer: str, ground_truth: str) -> Tuple[float, bool]:
+        """
+        Ask the judge model for a score
+        
+        Returns:
+            The score and whether it was parsed from the judge response (defaults are not cached)
+        """
         try:
             eval_prompt = f"""Evaluate the following LLM response against the ground truth and return a score between 0 and 1. 
 Consider accuracy, completeness, and relevance. Return ONLY a JSON response with the score. DO NOT GIVE ANY ADDITIONAL INFORMATION ONLY SCORE.
@@ -291,11 +438,12 @@ Return format: {{"score": 0.85}}"""
             # Patch: Use Gemini or Ollama based on model name
             from rag_pipeline.util.api.gemini_client import GeminiUtil
             from rag_pipeline.util.api.ollama_client import OllamaUtil
-            model = getattr(self.global_config, 'llm_eval_model', None) or getattr(self.config_dict.get('generator', None), 'model', 'alibayram/Qwen3-30B-A3B-Instruct-2507:latest')
+            model = self._judge_model()
             if model.lower().startswith("gemini"):
-                response = GeminiUtil.get_gemini_response(model, eval_prompt)
+                # Blocking client, so concurrent verdicts run in worker threads
+                response = await asyncio.to_thread(GeminiUtil.get_gemini_response, model, eval_prompt)
             else:
-                response = OllamaUtil.get_ollama_response(model, eval_prompt, is_eval=True)
+                response = await OllamaUtil.aget_ollama_response(model, eval_prompt, is_eval=True)
             
             if isinstance(response, dict):
                 response_text = response.get('response', '')
@@ -312,15 +460,15 @@ Return format: {{"score": 0.85}}"""
                 
                 result = json.loads(json_str)
                 score = float(result.get('score', 0.0))
-                return max(0.0, min(1.0, score))  # Clamp between 0 and 1
+                return max(0.0, min(1.0, score)), True  # Clamp between 0 and 1
                 
             except (json.JSONDecodeError, ValueError, KeyError) as e:
                 logger.warning(f"Failed to parse LLM evaluation response: {e}")
-                return 0.5  # Default score if parsing fails
+                return 0.5, False  # Default score if parsing fails
                 
         except Exception as e:
             logger.error(f"LLM evaluation failed: {e}")
-            return 0.0
+            return 0.0, False
     
     def _calculate_retrieval_score(self, retrieval_metrics: Dict[str, float]) -> float:
         """Calculate average retrieval score"""
@@ -150,6 +150,8 @@ class RAGBenchmarkResult(BaseModel):
     best_retrieval_combo: Optional[str] = None
     best_generation_combo: Optional[str] = None
     best_overall_combo: Optional[str] = None
+    # Set when a combination was stopped early by racing (early_stop_threshold)
+    truncated: bool = False
 
 class RAGDocument(BaseModel):
     """Document in the RAG knowledge base"""
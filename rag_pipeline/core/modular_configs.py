@@ -55,6 +55,7 @@ class QueryExpansionConfig(BaseModel):
     combination_method: str = "none"  # Options: "none", "convex_combination", "reciprocal_rank_fusion", "borda_count"
     normalization_method: str = "minmax"  # Options: "minmax", "zscore" # Only used for convex combination
     excessive_k: int = 60 # Only used for all combination methods
+    retrieval_concurrency: int = 4 # Max number of expanded-query retrievals in flight
 
     # Simple Multi-Query settings
     num_expanded_queries: int = 3
@@ -100,6 +101,8 @@ class RetrievalConfig(BaseModel):
     # Simple VectorRAG settings
     embedding_model: str = "mxbai-embed-large"
     similarity_metric: str = "cosine"  # Options: "cosine", "euclidean", "dot_product"
+    embedding_batch_size: Optional[int] = None  # Texts per /api/embed call while indexing (None: EMBEDDING_BATCH_SIZE env or 64)
+    embedding_max_inflight_batches: Optional[int] = None  # Concurrent embedding calls while indexing (None: EMBEDDING_MAX_INFLIGHT_BATCHES env or 4)
     
     # Keyword Search (BM25) settings
     bm25_k1: float = 1.2
@@ -114,6 +117,8 @@ class RetrievalConfig(BaseModel):
     weights: List[float] = None
     retrieval_methods: List[str] = None
     normalization_method: str = "minmax"  # Options: "minmax", "zscore" # Only used for convex combination
+    retriever_timeout: Optional[float] = 30.0  # Seconds a hybrid sub-retriever may take before the others are fused without it (None: no limit)
+    retriever_timeouts: Optional[Dict[str, float]] = None  # Per-method overrides, e.g. {"graph": 60.0}
 
     # Graph RAG settings
     graph_rag_retrieval_method: str = "basic"  # Options: "basic", "traversal"
@@ -121,9 +126,16 @@ class RetrievalConfig(BaseModel):
     graph_rag_max_depth: int = 2
     graph_rag_vector_index_name: str = "entity_embeddings"
     graph_rag_embedding_dimension: int = 1024 #TODO make this dynamic
+    graph_rag_vector_candidates: int = 50  # Entities fetched from the Neo4j vector index before the threshold is applied
+    graph_rag_write_batch_size: int = 500  # Relations written per Neo4j transaction
+    graph_rag_embedding_batch_size: int = 64  # Entities embedded per request
+    graph_rag_extraction_concurrency: int = 8  # Concurrent LLM relation extraction calls while indexing
+    graph_rag_store: str = "neo4j"  # "neo4j" or "embedded" (in-process CSR graph persisted to graph_rag_store_path)
+    graph_rag_store_path: str = "rag_pipeline/graph_store/knowledge_graph"
     graph_rag_neo4j_uri: str = "bolt://neo4j:7687"
     graph_rag_neo4j_user: str = "neo4j"
     graph_rag_neo4j_password: str = "admin123"
+    graph_rag_neo4j_max_pool_size: Optional[int] = None  # Pool size of the shared driver (default: NEO4J_MAX_CONNECTION_POOL_SIZE or 50)
     graph_rag_ollama_embedding_url: str = "http://ollama-gpu-3:11435/api/embeddings"
     graph_rag_embedding_model: str = "mxbai-embed-large"
     graph_rag_ollama_model: str = "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"
@@ -137,10 +149,16 @@ class RetrievalConfig(BaseModel):
     hypergraph_neo4j_uri: str = "bolt://neo4j:7687"
     hypergraph_neo4j_user: str = "neo4j"
     hypergraph_neo4j_password: str = "admin123"
+    hypergraph_neo4j_max_pool_size: Optional[int] = None  # Pool size of the shared driver (default: NEO4J_MAX_CONNECTION_POOL_SIZE or 50)
     hypergraph_ollama_embedding_url: str = "http://ollama-gpu-3:11435/api/embeddings"
     hypergraph_ollama_model: str = "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"
     hypergraph_embedding_model: str = "mxbai-embed-large"
     hypergraph_min_entities: int = 2
+    hypergraph_write_batch_size: int = 500  # Hyperedges written per Neo4j transaction
+    hypergraph_embedding_batch_size: int = 64  # Hyperedges embedded per request
+    hypergraph_extraction_concurrency: int = 8  # Concurrent LLM hyperedge extraction calls while indexing
+    hypergraph_store: str = "neo4j"  # "neo4j" or "embedded" (in-process CSR hypergraph persisted to hypergraph_store_path)
+    hypergraph_store_path: str = "rag_pipeline/graph_store/hypergraph"
 
 
 
@@ -323,19 +341,29 @@ class ModularRAGConfig(BaseModel):
     evaluation_metrics: List[str] = ["recall", "precision", "f1", "semantic_similarity", "llm_score"]
     llm_eval_model: str = "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"
     save_eval_cases: bool = False
+    judge_max_concurrency: int = 4  # Judge calls in flight per evaluation batch (verdicts are cached in rag_pipeline/judge_cache)
+    # Racing: evaluate in growing stages and stop a combination once the upper confidence
+    # bound of its overall_score falls below early_stop_threshold (None disables racing)
+    early_stop_threshold: Optional[float] = None
+    early_stop_min_cases: int = 10  # Test cases in the first stage
+    early_stop_growth: float = 2.0  # Each stage ends after growth times as many test cases as the previous one
+    early_stop_confidence: float = 0.95  # One-sided confidence level of the bound
     
     # Dataset settings
     dataset_path: Optional[str] = None
     qdrant_collection_hash: Optional[str] = None
     max_test_cases: Optional[int] = None
     test_case_offset: Optional[int] = 0
+    test_case_seed: Optional[int] = None  # Shuffle the test cases with this seed before applying offset/max (seeded subsets)
     eval_batch_size: int = 10
     
     # Performance settings
     parallel_execution: bool = True
     max_workers: int = 4
-    cache_enabled: bool = True
-    cache_dir: Optional[str] = None
+    batch_execution: bool = False  # Push every eval batch through the pipeline stage by stage (execute_pipeline_batch)
+    cache_enabled: bool = True  # Memoize stage outputs shared between combinations
+    cache_dir: Optional[str] = None  # Opt-in on-disk stage cache (e.g. rag_pipeline/stage_cache); None keeps it in memory
+    stage_cache_max_entries: int = 4096  # Size of the in-memory stage cache tier
     
     # Evaluation settings
     retrieval_weights: Dict[str, float] = {
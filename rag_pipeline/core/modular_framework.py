@@ -21,6 +21,7 @@ Categories:
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
+import asyncio
 import time
 import logging
 
@@ -61,6 +62,15 @@ class Context:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class IndexHandle:
+    """Represents a retrieval component whose index has been built for a given corpus"""
+    dataset_hash: str
+    config_fingerprint: str
+    component: Any
+    indexed: bool = False
+
+
 # ==================== CATEGORY 1: PRE-EMBEDDING ====================
 
 class PreEmbeddingComponent(ABC):
@@ -153,6 +163,35 @@ class RetrievalComponent(ABC):
         """
         pass
 
+    async def retrieve_batch(self, queries: List[Query], k: Optional[int] = None, max_concurrency: int = 4) -> List[Any]:
+        """
+        Retrieve documents for several queries at once.
+        
+        The default implementation runs retrieve() for every query with at most
+        max_concurrency retrievals in flight. Backends that support native batching
+        can override this.
+        
+        Args:
+            queries: List of Query objects
+            k: Number of documents to retrieve per query
+            max_concurrency: Maximum number of concurrent retrievals
+            
+        Returns:
+            List of retrieval results, in the same order as queries
+        """
+        if max_concurrency <= 1 or len(queries) <= 1:
+            return [await self.retrieve(query, k=k) for query in queries]
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _retrieve(query: Query):
+            # retrieve() implementations move their blocking client calls to worker
+            # threads themselves, so the queries share the current event loop
+            async with semaphore:
+                return await self.retrieve(query, k=k)
+        
+        return await asyncio.gather(*[_retrieve(query) for query in queries])
+
 
 
 # ==================== CATEGORY 4: PASSAGE RERANK ====================
@@ -181,6 +220,22 @@ class PassageRerankComponent(ABC):
         """
         pass
 
+    async def rerank_passages_batch(self, documents_list: List[List[Document]], queries: List[Query]) -> List[Any]:
+        """
+        Rerank the retrieved passages of several queries at once.
+        
+        The default implementation reranks one query after the other. Rerankers
+        that can score all (query, passage) pairs in one pass can override this.
+        
+        Args:
+            documents_list: Retrieved documents of every query
+            queries: Queries, in the same order as documents_list
+            
+        Returns:
+            List of rerank results, in the same order as queries
+        """
+        return [await self.rerank_passages(documents, query) for documents, query in zip(documents_list, queries)]
+
 
 # ==================== CATEGORY 5: PASSAGE FILTER ====================
 
@@ -316,6 +371,29 @@ class GeneratorComponent(ABC):
         """
         pass
 
+    async def generate_batch(self, prompts: List[str], queries: List[Query], max_concurrency: int = 4) -> List[Any]:
+        """
+        Generate answers for several prompts at once.
+        
+        The default implementation runs generate() for every prompt with at most
+        max_concurrency generations in flight.
+        
+        Args:
+            prompts: Formatted prompts
+            queries: Queries, in the same order as prompts
+            max_concurrency: Maximum number of concurrent generations
+            
+        Returns:
+            List of generation results, in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def _generate(prompt: str, query: Query):
+            async with semaphore:
+                return await self.generate(prompt, query)
+        
+        return await asyncio.gather(*[_generate(prompt, query) for prompt, query in zip(prompts, queries)])
+
 
 # ==================== CATEGORY 10: POST-GENERATION ====================
 
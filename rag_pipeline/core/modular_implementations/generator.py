@@ -1,4 +1,5 @@
 
+import asyncio
 import logging
 from typing import Dict, Any, TypedDict
 
@@ -45,7 +46,7 @@ class LLMGenerator(GeneratorComponent):
         try:
             model = self.config.get("model", "gpt-3.5-turbo")
             if self.config.get("provider", "ollama").lower() == "ollama":
-                response = self.client.get_ollama_response(model, prompt)
+                response = await self.client.aget_ollama_response(model, prompt)
                 if isinstance(response, dict):
                     result = GeneratorResult(
                         text=response.get('response', ''),
@@ -61,7 +62,7 @@ class LLMGenerator(GeneratorComponent):
                     )
                     return result
             else:  # gemini
-                response = self.client.get_gemini_response(model, prompt)
+                response = await asyncio.to_thread(self.client.get_gemini_response, model, prompt)
                 if isinstance(response, dict):
                     result = GeneratorResult(
                         text=response.get('response', ''),
@@ -120,6 +121,13 @@ class MultiLLMGenerator(GeneratorComponent):
         models = self.config.get("models", ["gemma3:27b", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"])
         results = []
         llm_token_count = {}
+        # Draft the Ollama answers concurrently; they are independent of each other
+        ollama_models = [model for model in models if self.clients.get(model) is not None and not model.lower().startswith("gemini")]
+        ollama_responses = await asyncio.gather(
+            *[self.clients[model].aget_ollama_response(model, prompt) for model in ollama_models],
+            return_exceptions=True
+        )
+        ollama_responses = dict(zip(ollama_models, ollama_responses))
         for model in models:
             try:
                 client = self.clients.get(model)
@@ -130,7 +138,7 @@ class MultiLLMGenerator(GeneratorComponent):
                     continue
 
                 if model.lower().startswith("gemini"):
-                    response = client.get_gemini_response(model, prompt)
+                    response = await asyncio.to_thread(client.get_gemini_response, model, prompt)
                     if isinstance(response, dict):
                         generated_text = response.get('response', '')
                         prompt_tokens = float(len(prompt.split()))
@@ -141,7 +149,9 @@ class MultiLLMGenerator(GeneratorComponent):
                         llm_token_count[model] = {"in": float(len(prompt.split())), "out": 0.0}
                         results.append((str(response), 0.0, float(len(prompt.split())), 0.0, model))
                 else:  # ollama
-                    response = client.get_ollama_response(model, prompt)
+                    response = ollama_responses[model]
+                    if isinstance(response, Exception):
+                        raise response
                     if isinstance(response, dict):
                         generated_text = response.get('response', '')
                         prompt_tokens = float(response.get('prompt_tokens', len(prompt.split())))
@@ -196,9 +206,9 @@ You are a response synthesizer. Your task is to create one high-quality final an
         ensemble_prompt = ensemble_prompt.format(original_prompt_with_context=original_prompt_with_context)
         ensemble_llm_client = self.clients[self.config.get("ensemble_llm_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest")]
         if self.config.get("ensemble_llm_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest").lower().startswith("gemini"):
-            ensemble_llm_response = ensemble_llm_client.get_gemini_response(self.config.get("ensemble_llm_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), ensemble_prompt)
+            ensemble_llm_response = await asyncio.to_thread(ensemble_llm_client.get_gemini_response, self.config.get("ensemble_llm_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), ensemble_prompt)
         else:
-            ensemble_llm_response = ensemble_llm_client.get_ollama_response(self.config.get("ensemble_llm_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), ensemble_prompt)
+            ensemble_llm_response = await ensemble_llm_client.aget_ollama_response(self.config.get("ensemble_llm_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), ensemble_prompt)
         logger.debug(f"Ensemble LLM prompt: {ensemble_prompt}")
         logger.debug(f"Ensemble LLM response: {ensemble_llm_response}")
         ensemble_model = self.config.get("ensemble_llm_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest")
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, TypedDict, Dict, Any
 import re
@@ -268,7 +269,8 @@ class RelevantSegmentExtractor(PassageAugmentComponent):
         best_segments = []
         logger.info(f"Article IDs: {article_ids}")
         for article_id in article_ids:
-            best_segments_in_article = self.get_best_segments_in_an_article(documents, article_id, query)
+            # Scoring the chunks embeds them through a blocking client
+            best_segments_in_article = await asyncio.to_thread(self.get_best_segments_in_an_article, documents, article_id, query)
             if best_segments_in_article is not None and len(best_segments_in_article) > 0:
                 best_segments.extend(best_segments_in_article)
         best_segments = self.merge_segments_if_possible(best_segments)
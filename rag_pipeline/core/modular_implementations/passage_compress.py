@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, Dict, Any, TypedDict, Tuple
 
@@ -45,9 +46,9 @@ class TreeSummarize(PassageCompressComponent):
             raise ValueError(f"Unsupported provider: {provider}")
     
 
-    def summarize_chunk(self, text: str) -> Tuple[str, int, int]:
+    async def summarize_chunk(self, text: str) -> Tuple[str, int, int]:
         prompt = self.config.get("tree_summarize_prompt", "")
-        response = self.client.get_ollama_response(self.config.get("tree_summarize_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), prompt.format(context_str=text))
+        response = await self.client.aget_ollama_response(self.config.get("tree_summarize_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), prompt.format(context_str=text))
         if isinstance(response, dict):
             return response.get('response', '').strip(), response.get('prompt_tokens', 0), response.get('eval_count', 0)
         else:
@@ -77,11 +78,13 @@ class TreeSummarize(PassageCompressComponent):
         while len(current_level) > 1:
             next_level = []
             next_metadatas = []
-            for i in range(0, len(current_level), self.config.get("max_fan_in", 3)):
-                group = current_level[i:i+self.config.get("max_fan_in", 3)]
-                group_metadata = current_metadatas[i:i+self.config.get("max_fan_in", 3)]
-                combined = "\n\n".join(group)
-                summary, prompt_tokens, eval_count = self.summarize_chunk(combined)
+            max_fan_in = self.config.get("max_fan_in", 3)
+            group_starts = range(0, len(current_level), max_fan_in)
+            # Groups of the same level are independent, so summarize them concurrently
+            combined_groups = ["\n\n".join(current_level[i:i+max_fan_in]) for i in group_starts]
+            summaries = await asyncio.gather(*[self.summarize_chunk(combined) for combined in combined_groups])
+            for i, combined, (summary, prompt_tokens, eval_count) in zip(group_starts, combined_groups, summaries):
+                group_metadata = current_metadatas[i:i+max_fan_in]
                 total_prompt_tokens += prompt_tokens if prompt_tokens > 0 else estimate_tokens(combined)
                 total_eval_count += eval_count if eval_count > 0 else estimate_tokens(summary)
                 next_level.append(summary)
@@ -140,9 +143,11 @@ class LLMSummarizeEachChunk(PassageCompressComponent):
         total_prompt_tokens = 0
         total_eval_count = 0
         
-        for doc in documents:
-            prompt = self.config.get("llm_summarize_prompt", "")
-            response = self.client.get_ollama_response(model, prompt.format(document=doc.content))
+        prompt = self.config.get("llm_summarize_prompt", "")
+        responses = await asyncio.gather(*[
+            self.client.aget_ollama_response(model, prompt.format(document=doc.content)) for doc in documents
+        ])
+        for doc, response in zip(documents, responses):
             if isinstance(response, dict):
                 total_prompt_tokens += float(response.get('prompt_tokens', len(prompt.split())))
                 total_eval_count += float(response.get('eval_count', 0))
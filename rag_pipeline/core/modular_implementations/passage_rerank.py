@@ -1,4 +1,5 @@
 
+import asyncio
 import logging
 from typing import List, TypedDict, Dict
 
@@ -29,46 +30,57 @@ class NonePassageRerank(PassageRerankComponent):
 class CrossEncoderRerank(PassageRerankComponent):
     """✅ CURRENTLY IMPLEMENTED - Cross-encoder based reranking"""
     
+    def _get_reranker(self):
+        """Get the shared reranker for the configured model"""
+        from rag_pipeline.util.rerank.reranker import get_reranker
+        
+        # Get reranker configuration
+        model_name = self.config.get("cross_encoder_model", "BAAI/bge-reranker-v2-m3")
+        cache_dir = self.config.get("cross_encoder_cache_dir")
+        force_cpu = self.config.get("cross_encoder_force_cpu", False)
+        
+        return get_reranker(model_name, cache_dir=cache_dir, force_cpu=force_cpu)
+    
+    @staticmethod
+    def _docs_for_rerank(documents: List[Document]) -> List[Dict]:
+        """Convert documents to format expected by existing reranker"""
+        return [{
+            "doc_id": doc.doc_id,
+            "content": doc.content,
+            "score": doc.score or 0.0,
+            "metadata": doc.metadata or {}
+        } for doc in documents]
+    
+    @staticmethod
+    def _rerank_result(reranked_docs: List[Dict], docs_for_rerank: List[Dict]) -> PassageRerankResult:
+        """Build the rerank result of one query"""
+        # Embedding token count: sum of tokens in all input docs
+        embedding_token_count = sum(len(doc["content"].split()) for doc in docs_for_rerank)
+        return PassageRerankResult(
+            documents=[Document(
+            doc_id=doc_data.get("doc_id", ""),
+            content=doc_data.get("content", ""),
+            score=doc_data.get("score", 0.0),
+            metadata=doc_data.get("metadata", {})
+            ) for doc_data in reranked_docs],
+            embedding_token_count=float(embedding_token_count),
+            llm_token_count={}
+        )
+    
     async def rerank_passages(self, documents: List[Document], query: Query) -> PassageRerankResult:
         """Rerank documents using cross-encoder model"""
         try:
-            from rag_pipeline.util.rerank.reranker import get_reranker
-            
-            # Get reranker configuration
-            model_name = self.config.get("cross_encoder_model", "BAAI/bge-reranker-v2-m3")
+            reranker = self._get_reranker()
             top_k = self.config.get("cross_encoder_top_k", 5)
-            cache_dir = self.config.get("cross_encoder_cache_dir")
-            force_cpu = self.config.get("cross_encoder_force_cpu", False)
             
-            # Initialize reranker
-            reranker = get_reranker(model_name, cache_dir=cache_dir, force_cpu=force_cpu)
-            
-            # Convert documents to format expected by existing reranker
-            docs_for_rerank = []
-            for doc in documents:
-                docs_for_rerank.append({
-                    "doc_id": doc.doc_id,
-                    "content": doc.content,
-                    "score": doc.score or 0.0,
-                    "metadata": doc.metadata or {}
-                })
+            docs_for_rerank = self._docs_for_rerank(documents)
             
             # Perform reranking
-            reranked_docs = reranker.rerank_documents(query.processed_text, docs_for_rerank, top_k=top_k)
-            
-            # Embedding token count: sum of tokens in all input docs
-            embedding_token_count = sum(len(doc["content"].split()) for doc in docs_for_rerank)
-            result = PassageRerankResult(
-                documents=[Document(
-                doc_id=doc_data.get("doc_id", ""),
-                content=doc_data.get("content", ""),
-                score=doc_data.get("score", 0.0),
-                metadata=doc_data.get("metadata", {})
-                ) for doc_data in reranked_docs],
-                embedding_token_count=float(embedding_token_count),
-                llm_token_count={}
+            reranked_docs = await asyncio.to_thread(
+                reranker.rerank_documents, query.processed_text, docs_for_rerank, top_k=top_k
             )
-            return result
+            
+            return self._rerank_result(reranked_docs, docs_for_rerank)
             
         except Exception as e:
             logger.error(f"Cross-encoder reranking failed: {e}")
@@ -78,6 +90,34 @@ class CrossEncoderRerank(PassageRerankComponent):
                 llm_token_count={}
             )
             return result
+    
+    async def rerank_passages_batch(self, documents_list: List[List[Document]], queries: List[Query]) -> List[PassageRerankResult]:
+        """Rerank the documents of several queries with one cross-encoder predict call"""
+        try:
+            reranker = self._get_reranker()
+            top_k = self.config.get("cross_encoder_top_k", 5)
+            
+            docs_for_rerank_list = [self._docs_for_rerank(documents) for documents in documents_list]
+            reranked_list = await asyncio.to_thread(
+                reranker.rerank_documents_batch,
+                [query.processed_text for query in queries], docs_for_rerank_list, top_k=top_k
+            )
+            
+            return [
+                self._rerank_result(reranked_docs, docs_for_rerank)
+                for reranked_docs, docs_for_rerank in zip(reranked_list, docs_for_rerank_list)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Batch cross-encoder reranking failed: {e}")
+            return [
+                PassageRerankResult(
+                    documents=documents,
+                    embedding_token_count=0.0,
+                    llm_token_count={}
+                )
+                for documents in documents_list
+            ]
 
 
 class LLMRerank(PassageRerankComponent):    
@@ -112,7 +152,7 @@ class LLMRerank(PassageRerankComponent):
                 })
             
             # Perform reranking
-            reranked_docs = llm_reranker.rerank_documents(query.processed_text, docs_for_rerank, top_k=top_k)
+            reranked_docs = await llm_reranker.arerank_documents(query.processed_text, docs_for_rerank, top_k=top_k)
             llm_input_token_count = len(query.processed_text.split()) + sum(len(doc["content"].split()) for doc in docs_for_rerank)
             llm_output_token_count = len(str(reranked_docs).split())
             result = PassageRerankResult(
@@ -180,7 +220,9 @@ class CELLM_ParallelRerank(PassageRerankComponent):
                 })
 
 
-            reranked_docs, _ = reranker.rerank_documents(query.processed_text, docs_for_rerank, top_k=top_k)
+            reranked_docs, _ = await asyncio.to_thread(
+                reranker.rerank_documents, query.processed_text, docs_for_rerank, top_k=top_k
+            )
             ce_embedding_token_count = len(query.processed_text.split()) + sum(len(doc["content"].split()) for doc in docs_for_rerank)
             llm_input_token_count = len(query.processed_text.split()) + sum(len(doc["content"].split()) for doc in docs_for_rerank)
             llm_output_token_count = len(str(reranked_docs).split())
@@ -45,7 +45,7 @@ class ReflectionRevising(PostGenerationComponent):
         else:
             raise ValueError(f"Unsupported provider: {provider}")
     
-    def _get_reflection_response(self, query_text: str, current_answer: str) -> tuple[str, int, int]:
+    async def _get_reflection_response(self, query_text: str, current_answer: str) -> tuple[str, int, int]:
         """Get reflection evaluation from LLM"""
         reflection_prompt = f"""
         Evaluate the following question and answer pair:
@@ -69,7 +69,7 @@ class ReflectionRevising(PostGenerationComponent):
         Improvement Suggestions: [List specific areas for improvement]
         """
 
-        response = self.client.get_ollama_response(
+        response = await self.client.aget_ollama_response(
             self.config.get("reflection_revising_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), 
             reflection_prompt
         )
@@ -79,7 +79,7 @@ class ReflectionRevising(PostGenerationComponent):
         else:
             return response.strip(), 0, 0
     
-    def _get_improved_answer(self, query_text: str, current_answer: str, reflection_feedback: str) -> tuple[str, int, int]:
+    async def _get_improved_answer(self, query_text: str, current_answer: str, reflection_feedback: str) -> tuple[str, int, int]:
         """Get improved answer based on reflection feedback"""
         enhanced_prompt = f"""
         Previous Answer: {current_answer}
@@ -89,7 +89,7 @@ class ReflectionRevising(PostGenerationComponent):
         Please provide an improved answer addressing the feedback above.
         """
 
-        response = self.client.get_ollama_response(
+        response = await self.client.aget_ollama_response(
             self.config.get("reflection_revising_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), 
             enhanced_prompt
         )
@@ -110,7 +110,7 @@ class ReflectionRevising(PostGenerationComponent):
         
         while retry_count < max_retries:
             # Get reflection evaluation
-            reflection, prompt_tokens, eval_count = self._get_reflection_response(
+            reflection, prompt_tokens, eval_count = await self._get_reflection_response(
                 query.processed_text, current_answer
             )
             logger.debug(f"Reflection: {reflection}")
@@ -122,7 +122,7 @@ class ReflectionRevising(PostGenerationComponent):
                 retry_count += 1
                 if retry_count < max_retries:
                     # Get improved answer based on reflection feedback
-                    improved_answer, imp_prompt_tokens, imp_eval_count = self._get_improved_answer(
+                    improved_answer, imp_prompt_tokens, imp_eval_count = await self._get_improved_answer(
                         query.processed_text, current_answer, reflection
                     )
                     logger.debug(f"Improved Answer: {improved_answer}")
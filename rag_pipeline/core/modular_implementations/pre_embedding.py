@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import List, TypedDict, Dict, Any, Optional
 import re
@@ -95,7 +96,7 @@ class ContextualChunkHeaders(PreEmbeddingComponent):
         
         return header
     
-    def _generate_header(self, content: str) -> Optional[str]:
+    async def _generate_header(self, content: str) -> Optional[str]:
         """Generate a header for the given content using configuration settings"""
         try:
             logger.info(f"ContextualChunkHeaders: Generating header for content: {content[:100]}...")
@@ -109,10 +110,10 @@ class ContextualChunkHeaders(PreEmbeddingComponent):
             
             if provider.lower() == "ollama":
                 logger.info("ContextualChunkHeaders: Calling Ollama client...")
-                response = self.client.get_ollama_response(model, prompt)
+                response = await self.client.aget_ollama_response(model, prompt)
             elif provider.lower() == "gemini":
                 logger.info("ContextualChunkHeaders: Calling Gemini client...")
-                response = self.client.get_gemini_response(model, prompt)
+                response = await asyncio.to_thread(self.client.get_gemini_response, model, prompt)
             else:
                 raise ValueError(f"Unsupported provider: {provider}")
             
@@ -170,12 +171,19 @@ class ContextualChunkHeaders(PreEmbeddingComponent):
         total_prompt_tokens = 0.0
         total_output_tokens = 0.0
         
+        # Headers are independent per document, so request them concurrently
+        headers = await asyncio.gather(
+            *[self._generate_header(doc.content) for doc in documents],
+            return_exceptions=True
+        )
+        
         for i, doc in enumerate(documents):
             try:
                 logger.info(f"ContextualChunkHeaders: Processing document {i+1}/{len(documents)}: {doc.doc_id}")
                 
-                # Generate header for the document
-                header = self._generate_header(doc.content)
+                header = headers[i]
+                if isinstance(header, Exception):
+                    raise header
                 logger.info(f"ContextualChunkHeaders: Generated header for {doc.doc_id}: '{header}'")
                 
                 # Format document with header
@@ -242,14 +250,24 @@ class HyPE(PreEmbeddingComponent):
         documents_to_embed = []
         total_prompt_tokens = 0
         total_eval_count = 0
-        for doc in documents:
-            prompt = self.config.get("hype_prompt", "").format(num_hype_questions=self.config.get("num_hype_questions", 3), document=doc.content)
-            if self.config.get("provider", "ollama").lower() == "ollama":
-                response = self.client.get_ollama_response(self.config.get("hype_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), prompt)
-            elif self.config.get("provider", "ollama").lower() == "gemini":
-                response = self.client.get_gemini_response(self.config.get("hype_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), prompt)
-            else:
-                raise ValueError(f"Unsupported provider: {self.config.get('provider', 'ollama')}")
+        prompts = [
+            self.config.get("hype_prompt", "").format(num_hype_questions=self.config.get("num_hype_questions", 3), document=doc.content)
+            for doc in documents
+        ]
+        if self.config.get("provider", "ollama").lower() == "ollama":
+            # Question generation is independent per document, so request it concurrently
+            responses = await asyncio.gather(*[
+                self.client.aget_ollama_response(self.config.get("hype_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), prompt)
+                for prompt in prompts
+            ])
+        elif self.config.get("provider", "ollama").lower() == "gemini":
+            responses = [
+                await asyncio.to_thread(self.client.get_gemini_response, self.config.get("hype_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest"), prompt)
+                for prompt in prompts
+            ]
+        else:
+            raise ValueError(f"Unsupported provider: {self.config.get('provider', 'ollama')}")
+        for doc, prompt, response in zip(documents, prompts, responses):
             logger.info(f"HyPE response: {response}")
             if isinstance(response, dict):
                 hype_questions = response.get('response', '').split("\n")
@@ -1,4 +1,5 @@
 
+import asyncio
 import logging
 from typing import List, Dict, Any, TypedDict
 from rag_pipeline.core.modular_framework import (
@@ -66,7 +67,7 @@ class SimpleMultiQuery(QueryExpansionComponent):
         model = self.config.get("model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest")
         
         prompt = self.config.get("prompt", "")
-        response = self.client.get_ollama_response(model, prompt.format(query=query, num_expanded_queries=num_expanded_queries))
+        response = await self.client.aget_ollama_response(model, prompt.format(query=query, num_expanded_queries=num_expanded_queries))
         if isinstance(response, dict):
             prompt_tokens = float(response.get('prompt_tokens', len(prompt.split())))
             output_tokens = float(response.get('eval_count', 0))
@@ -188,7 +189,7 @@ class HyDE(SimpleMultiQuery):
         num_expanded_queries = self.config.get("num_expanded_queries", 3)
         
         prompt = self.config.get("prompt", "")
-        response = self.client.get_ollama_response(model, prompt.format(query=query, num_expanded_queries=num_expanded_queries))
+        response = await self.client.aget_ollama_response(model, prompt.format(query=query, num_expanded_queries=num_expanded_queries))
         
         if isinstance(response, dict):
             total_prompt_tokens += float(response.get('prompt_tokens', len(prompt.split())))
@@ -300,14 +301,14 @@ class SimpleQueryRefinement(QueryExpansionComponent):
         try:
             # Generate refined query using the correct method
             if self.config.get("provider", "ollama").lower() == "ollama":
-                response = self.client.get_ollama_response(model, prompt)
+                response = await self.client.aget_ollama_response(model, prompt)
                 if response and isinstance(response, dict):
                     refined_query = response.get("response", "").strip()
                 else:
                     logger.warning("Invalid response from Ollama, using original query")
                     refined_query = query
             elif self.config.get("provider", "ollama").lower() == "gemini":
-                response = self.client.get_gemini_response(model, prompt)
+                response = await asyncio.to_thread(self.client.get_gemini_response, model, prompt)
                 if response and isinstance(response, dict):
                     refined_query = response.get("response", "").strip()
                 else:
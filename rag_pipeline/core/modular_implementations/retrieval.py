@@ -1,14 +1,20 @@
-import time, os, sys
+import time, os, sys, asyncio
 import logging, requests, json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, TypedDict
 from abc import ABC, abstractmethod
-from neo4j import GraphDatabase
 import pandas as pd
 
 from rag_pipeline.core.modular_framework import (
     RetrievalComponent, Document, Query
 )
 from rag_pipeline.util.retrieval_utils.combination_utils import HybridUtils
+from rag_pipeline.util.cache.embedding_cache import get_embedding_cache
+from rag_pipeline.util.cache.extraction_cache import get_extraction_cache
+from rag_pipeline.util.graphstore import (
+    KnowledgeGraphStore, HyperGraphStore, EmbeddedKnowledgeGraphStore, EmbeddedHyperGraphStore
+)
 
 # Add parent directories to path for config_loader import
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -29,11 +35,186 @@ def get_default_dataset_path() -> str:
     # Fallback to hardcoded default
     return os.path.join("rag_pipeline", "default_datasets", "military_10")
 
+class OllamaQueryEmbedder:
+    """
+    Embeds texts exactly like OllamaEmbeddings.embed_query (including its query
+    instruction prefix) with one shared client and the shared embedding cache.
+    Batches go to Ollama's /api/embed endpoint in a single request.
+    """
+    
+    def __init__(self, embedding_model: str):
+        from langchain_community.embeddings import OllamaEmbeddings
+        
+        # Get the Ollama API URL from environment variable
+        ollama_api_url = os.getenv("OLLAMA_API_URL", "http://ollama-gpu-3:11435/api")
+        self.api_url = ollama_api_url.rstrip("/")
+        self.embedding_model = embedding_model
+        # Remove '/api' suffix for OllamaEmbeddings base_url
+        self.client = OllamaEmbeddings(model=embedding_model, base_url=ollama_api_url.replace("/api", ""))
+        self.instruction = getattr(self.client, "query_instruction", "") or ""
+        # Shared with SemanticComparison, which embeds through embed_query as well
+        self.cache_namespace = f"{embedding_model}|langchain_query"
+        self.session = requests.Session()
+    
+    def embed(self, text: str) -> List[float]:
+        """Embed a single text"""
+        return get_embedding_cache().embed(self.cache_namespace, text, self.client.embed_query)
+    
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts; texts that could not be embedded get an empty list"""
+        return get_embedding_cache().embed_many(self.cache_namespace, texts, self._request_many)
+    
+    def _request_many(self, texts: List[str], timeout: int = 120) -> List[List[float]]:
+        try:
+            response = self.session.post(
+                f"{self.api_url}/embed",
+                json={"model": self.embedding_model, "input": [f"{self.instruction}{text}" for text in texts]},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            embeddings = response.json().get("embeddings", [])
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings from API, got {len(embeddings)}")
+            return embeddings
+        except Exception as e:
+            logger.warning(f"Batch embedding of {len(texts)} texts failed, embedding one by one: {e}")
+        
+        embeddings = []
+        for text in texts:
+            try:
+                embeddings.append(self.client.embed_query(text))
+            except Exception as e:
+                logger.warning(f"Failed to embed text: {e}")
+                embeddings.append([])
+        return embeddings
+
+
+async def extract_chunks_with_cache(chunks: List[str], model: str, prompt_version: str,
+                                    extract_fn, max_concurrency: int = 8) -> List[List[Dict[str, Any]]]:
+    """
+    Run an LLM extraction over many chunks with at most `max_concurrency` calls in
+    flight, replaying results from the extraction cache where possible.
+    
+    Args:
+        chunks: Text chunks (of any number of documents)
+        model: Extraction model, part of the cache key
+        prompt_version: Version of the extraction prompt, part of the cache key
+        extract_fn: Async function returning the extraction of a chunk, or None on failure
+        max_concurrency: Maximum number of concurrent LLM calls
+        
+    Returns:
+        One extraction result per chunk, in the same order as chunks (failed chunks give [])
+    """
+    cache = get_extraction_cache()
+    results = cache.get_many(model, prompt_version, chunks)
+    
+    # Identical chunks are extracted once
+    missing = list(dict.fromkeys(chunk for chunk, result in zip(chunks, results) if result is None))
+    if missing:
+        logger.info(f"Extracting {len(missing)} chunks with {model} ({len(chunks) - len(missing)} cached)")
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def extract(chunk: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    result = await extract_fn(chunk)
+                except Exception as e:
+                    logger.error(f"Extraction failed: {e}")
+                    return []
+            # Failures are not cached so the next indexing run retries them
+            if result is None:
+                return []
+            cache.put(model, prompt_version, chunk, result)
+            return result
+        
+        extracted = dict(zip(missing, await asyncio.gather(*(extract(chunk) for chunk in missing))))
+        results = [result if result is not None else extracted[chunk] for chunk, result in zip(chunks, results)]
+    
+    return results
+
+
 class RetrievalResult(TypedDict):
     documents: List[Document]
     embedding_token_count: float
     llm_token_count: Dict[str, Dict[str, float]]  # {"model_name": {"in": float, "out": float}}
 
+
+# Blocking retrieval client calls (Qdrant, Neo4j, embedding requests, BM25 scoring) run on
+# this bounded pool. A call abandoned by a sub-retriever timeout keeps its thread until the
+# client returns, so orphaned calls can never occupy more than RETRIEVAL_MAX_THREADS threads.
+_RETRIEVAL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RETRIEVAL_MAX_THREADS", "16")), thread_name_prefix="retrieval"
+)
+
+
+async def run_retrieval_call(func, *args, **kwargs):
+    """Run a blocking retrieval client call on the shared retrieval thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_RETRIEVAL_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+def get_retriever_timeout(config: Dict[str, Any], method_name: str) -> Optional[float]:
+    """Timeout in seconds of a hybrid sub-retriever (retriever_timeouts overrides retriever_timeout)"""
+    timeouts = config.get("retriever_timeouts") or {}
+    timeout = timeouts.get(method_name, config.get("retriever_timeout", 30.0))
+    return timeout if timeout and timeout > 0 else None
+
+
+async def retrieve_concurrently(retrievers: List[tuple], query: Query, k: int,
+                                timeouts: Optional[List[Optional[float]]] = None) -> List[Optional[RetrievalResult]]:
+    """
+    Run several sub-retrievers for the same query at the same time.
+
+    The retrievers run as coroutines on the current event loop and their blocking
+    client calls go through run_retrieval_call, so the total latency is that of the
+    slowest retriever. A retriever that fails or exceeds its timeout is logged and
+    yields None so the caller can fuse the results of the others.
+
+    Args:
+        retrievers: (method name, retriever) pairs
+        query: Query to retrieve documents for
+        k: Number of documents to retrieve from every retriever
+        timeouts: Timeout in seconds per retriever (None: no limit)
+
+    Returns:
+        One retrieval result (or None) per retriever, in the same order as retrievers
+    """
+    timeouts = timeouts or [None] * len(retrievers)
+
+    async def _retrieve(name: str, retriever: RetrievalComponent, timeout: Optional[float]):
+        start_time = time.time()
+        try:
+            return await asyncio.wait_for(retriever.retrieve(query, k), timeout)
+        except asyncio.TimeoutError:
+            # The coroutine is cancelled; a client call already running finishes on the bounded
+            # retrieval pool and its result is discarded
+            logger.warning(f"{name} retriever timed out after {timeout}s, fusing the remaining results")
+        except Exception as e:
+            logger.warning(f"{name} retriever failed after {time.time() - start_time:.2f}s, fusing the remaining results: {e}")
+        return None
+
+    return await asyncio.gather(*(
+        _retrieve(name, retriever, timeout) for (name, retriever), timeout in zip(retrievers, timeouts)
+    ))
+
+
+def select_successful_results(method_names: List[str], retrieval_results: List[Optional[RetrievalResult]],
+                              weights: Optional[List[float]] = None):
+    """
+    Keep the sub-retrievers that returned a result, with their method names and weights.
+
+    Returns:
+        Tuple of (method names, retrieval results, weights or None) of the successful retrievers
+    """
+    indices = [i for i, result in enumerate(retrieval_results) if result is not None]
+    if weights is not None and len(weights) == len(method_names):
+        weights = [weights[i] for i in indices]
+    elif weights is not None:
+        logger.warning(f"Got {len(weights)} weights for {len(method_names)} retrievers, using equal weights")
+        weights = None
+    return [method_names[i] for i in indices], [retrieval_results[i] for i in indices], weights
+
+
 class SimpleVectorRAG(RetrievalComponent):
     """✅ CURRENTLY IMPLEMENTED - Simple vector-based retrieval with semantic scoring"""
     
@@ -92,7 +273,7 @@ class SimpleVectorRAG(RetrievalComponent):
             query_text = query.processed_text
             
             # Perform similarity search
-            results = self.vectorstore.similarity_search(query_text, k)
+            results = await run_retrieval_call(self.vectorstore.similarity_search, query_text, k)
             
             # Convert to Document objects
             documents = HybridUtils.convert_to_documents(results)
@@ -114,6 +295,34 @@ class SimpleVectorRAG(RetrievalComponent):
             )
             return result
     
+    async def retrieve_batch(self, queries: List[Query], k: Optional[int] = None, max_concurrency: int = 4) -> List[RetrievalResult]:
+        """Retrieve documents for several queries with one batched embedding call and one Qdrant batch search"""
+        k = k or self.config.get("top_k", 10)
+        
+        try:
+            query_texts = [query.processed_text for query in queries]
+            batch_results = await run_retrieval_call(self.vectorstore.similarity_search_batch, query_texts, k)
+            
+            return [
+                RetrievalResult(
+                    documents=HybridUtils.convert_to_documents(results),
+                    embedding_token_count=float(len(query_text.split())),
+                    llm_token_count={}
+                )
+                for query_text, results in zip(query_texts, batch_results)
+            ]
+            
+        except Exception as e:
+            logger.error(f"Batch retrieval failed: {e}")
+            return [
+                RetrievalResult(
+                    documents=[],
+                    embedding_token_count=0.0,
+                    llm_token_count={}
+                )
+                for _ in queries
+            ]
+    
     async def index_documents(self, documents: List[Document]) -> bool:
         """Index documents in the vector store"""
         try:
@@ -131,7 +340,11 @@ class SimpleVectorRAG(RetrievalComponent):
                 })
             
             docs_df = pd.DataFrame(docs_data)
-            return self.vectorstore.index_documents(docs_df)
+            return self.vectorstore.index_documents(
+                docs_df,
+                embedding_batch_size=self.config.get("embedding_batch_size"),
+                max_inflight_batches=self.config.get("embedding_max_inflight_batches")
+            )
             
         except Exception as e:
             logger.error(f"Failed to index documents: {e}")
@@ -209,7 +422,7 @@ class KeywordSearchBM25(RetrievalComponent):
         try:
             # Perform search using index manager
             query_text = query.processed_text
-            results = self.index_manager.search(query_text, k)
+            results = await run_retrieval_call(self.index_manager.search, query_text, k)
             
             # Convert to Document objects
             documents = HybridUtils.convert_to_documents(results)
@@ -231,6 +444,19 @@ class KeywordSearchBM25(RetrievalComponent):
                 llm_token_count={}
             )
     
+    async def retrieve_batch(self, queries: List[Query], k: Optional[int] = None, max_concurrency: int = 4) -> List[RetrievalResult]:
+        """Retrieve documents for several queries with one batched BM25 scoring pass"""
+        k = k or self.config.get("top_k", 10)
+        batch_results = await run_retrieval_call(self.index_manager.search_batch, [query.processed_text for query in queries], k)
+        return [
+            RetrievalResult(
+                documents=HybridUtils.convert_to_documents(results),
+                embedding_token_count=0.0,
+                llm_token_count={}
+            )
+            for results in batch_results
+        ]
+    
     async def index_documents(self, documents: List[Document]) -> bool:
         """Index documents for BM25 search"""
         try:
@@ -277,25 +503,33 @@ class HybridSearch(RetrievalComponent):
         try:
             excessive_k = self.config.get("excessive_k", k * 3)
 
-            # Perform vector search
-            vector_result = await self.vector_retriever.retrieve(query, excessive_k)
-            vector_results = HybridUtils.convert_documents_to_results(vector_result.get('documents', []))
-            
-            # Perform keyword search
-            keyword_result = await self.keyword_retriever.retrieve(query, excessive_k)
-            keyword_results = HybridUtils.convert_documents_to_results(keyword_result.get('documents', []))
+            # Run vector and keyword search concurrently
+            retrieval_results = await retrieve_concurrently(
+                [("vector", self.vector_retriever), ("keyword", self.keyword_retriever)],
+                query,
+                excessive_k,
+                timeouts=[get_retriever_timeout(self.config, "vector"), get_retriever_timeout(self.config, "keyword")]
+            )
+            method_names, retrieval_results, weights = select_successful_results(
+                ["vector", "keyword"], retrieval_results, self.config.get("weights", None)
+            )
+            if not retrieval_results:
+                raise RuntimeError("all hybrid sub-retrievers failed")
+            results_list = [
+                HybridUtils.convert_documents_to_results(r.get('documents', [])) for r in retrieval_results
+            ]
             
             # Combine results based on the configured method
             if self.combination_method == "convex_combination":
-                combined_results = self._combine_with_convex_combination([vector_results, keyword_results])
+                combined_results = self._combine_with_convex_combination(results_list, method_names, weights)
             elif self.combination_method == "reciprocal_rank_fusion":
-                combined_results = self._combine_with_rrf([vector_results, keyword_results])
+                combined_results = self._combine_with_rrf(results_list, method_names)
             elif self.combination_method == "borda_count":
-                combined_results = self._combine_with_borda_count([vector_results, keyword_results])
+                combined_results = self._combine_with_borda_count(results_list, method_names)
             elif self.combination_method == "simply":
                 combined_results = HybridUtils.combine_simply(
-                    results_list=[vector_results, keyword_results],
-                    method_names=["vector","keyword"],
+                    results_list=results_list,
+                    method_names=method_names,
                     normalization_method=self.config.get("normalization_method", "minmax")
                 )
             else:
@@ -307,11 +541,8 @@ class HybridSearch(RetrievalComponent):
             # Convert back to Document objects
             documents = HybridUtils.convert_to_documents(top_results)
             
-            # Calculate token counts (sum from both retrievers)
-            total_embedding_tokens = (
-                vector_result.get('embedding_token_count', 0.0) + 
-                keyword_result.get('embedding_token_count', 0.0)
-            )
+            # Calculate token counts (sum from the retrievers that answered)
+            total_embedding_tokens = sum(r.get('embedding_token_count', 0.0) for r in retrieval_results)
             
             # Create final result
             result = RetrievalResult(
@@ -322,7 +553,7 @@ class HybridSearch(RetrievalComponent):
             
             # Log combination statistics if debug mode is enabled
             if self.config.get("debug_mode", False):
-                overlap_stats = HybridUtils.calculate_result_overlap(vector_results, keyword_results)
+                overlap_stats = HybridUtils.calculate_multi_method_overlap(results_list, method_names)
                 logger.info(f"Hybrid search ({self.combination_method}) stats: {overlap_stats}")
             
             return result
@@ -337,15 +568,19 @@ class HybridSearch(RetrievalComponent):
     
     def _combine_with_convex_combination(
         self, 
-        results_list: List[List[Dict[str, Any]]]
+        results_list: List[List[Dict[str, Any]]],
+        method_names: Optional[List[str]] = None,
+        weights: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Combine results using convex combination"""
         try:
+            method_names = method_names or ["vector","keyword"]
             return HybridUtils.combine_with_convex_combination(
                 results_list=results_list,
-                method_names=["vector","keyword"],
-                weights=[1/len(self.retrieval_methods)] * len(self.retrieval_methods) if self.config.get("weights", None) is None else self.config.get("weights"), 
+                method_names=method_names,
+                weights=[1/len(method_names)] * len(method_names) if weights is None else weights, 
                 normalization_method=self.config.get("normalization_method", "minmax"),
+                include_diagnostics=self.config.get("debug_mode", None),
                 )
         except Exception as e:
             logger.error(f"Convex combination failed: {e}")
@@ -353,13 +588,15 @@ class HybridSearch(RetrievalComponent):
     
     def _combine_with_rrf(
         self, 
-        results_list: List[List[Dict[str, Any]]]
+        results_list: List[List[Dict[str, Any]]],
+        method_names: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Combine results using Reciprocal Rank Fusion"""
         try:
             return HybridUtils.combine_with_rrf(
                 results_list=results_list,
-                method_names=["vector","keyword"],
+                method_names=method_names or ["vector","keyword"],
+                include_diagnostics=self.config.get("debug_mode", None),
             )
             
         except Exception as e:
@@ -368,13 +605,15 @@ class HybridSearch(RetrievalComponent):
     
     def _combine_with_borda_count(
         self, 
-        results_list: List[List[Dict[str, Any]]]
+        results_list: List[List[Dict[str, Any]]],
+        method_names: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Combine results using Borda count"""
         try:
             return HybridUtils.combine_with_borda_count(
                 results_list=results_list,
-                method_names=["vector","keyword"],
+                method_names=method_names or ["vector","keyword"],
+                include_diagnostics=self.config.get("debug_mode", None),
             )
         except Exception as e:
             logger.error(f"Borda count combination failed: {e}")
@@ -448,8 +687,14 @@ class HybridSearch(RetrievalComponent):
             excessive_k = self.config.get("excessive_k", k * 3)
             
             # Get individual results
-            vector_result = await self.vector_retriever.retrieve(query, excessive_k)
-            keyword_result = await self.keyword_retriever.retrieve(query, excessive_k)
+            vector_result, keyword_result = await retrieve_concurrently(
+                [("vector", self.vector_retriever), ("keyword", self.keyword_retriever)],
+                query,
+                excessive_k,
+                timeouts=[get_retriever_timeout(self.config, "vector"), get_retriever_timeout(self.config, "keyword")]
+            )
+            vector_result = vector_result or {}
+            keyword_result = keyword_result or {}
             
             vector_results = [
                 {'doc_id': doc.doc_id, 'content': doc.content, 'score': doc.score, 'metadata': doc.metadata}
@@ -461,23 +706,23 @@ class HybridSearch(RetrievalComponent):
             ]
             
             # Calculate overlap
-            overlap_stats = HybridUtils.calculate_result_overlap(vector_results, keyword_results)
+            overlap_stats = HybridUtils.calculate_multi_method_overlap([vector_results, keyword_results], ["vector", "keyword"])
             
             # Get combined results
             if self.combination_method == "convex_combination":
-                combined_results = self._combine_with_convex_combination(vector_results, keyword_results)
+                combined_results = self._combine_with_convex_combination([vector_results, keyword_results])
                 method_params = {
                     'alpha': self.config.get("alpha", 0.5),
                     'normalization_method': self.config.get("normalization_method", "minmax"),
                     'excessive_k': excessive_k
                 }
             elif self.combination_method == "reciprocal_rank_fusion":
-                combined_results = self._combine_with_rrf(vector_results, keyword_results)
+                combined_results = self._combine_with_rrf([vector_results, keyword_results])
                 method_params = {
                     'excessive_k': excessive_k
                 }
             elif self.combination_method == "borda_count":
-                combined_results = self._combine_with_borda_count(vector_results, keyword_results)
+                combined_results = self._combine_with_borda_count([vector_results, keyword_results])
                 method_params = {
                     'excessive_k': excessive_k
                 }
@@ -507,7 +752,7 @@ class HybridSearch(RetrievalComponent):
 
 
 class GraphRAG(RetrievalComponent):
-    """Graph-based RAG retrieval using Neo4j knowledge graph"""
+    """Graph-based RAG retrieval over a knowledge graph (Neo4j or the embedded graph store)"""
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -529,71 +774,47 @@ class GraphRAG(RetrievalComponent):
         # Vector index configuration
         self.vector_index_name = config.get("graph_rag_vector_index_name", "entity_embeddings")
         self.embedding_dimension = config.get("graph_rag_embedding_dimension", 1024)
+        self.vector_candidates = config.get("graph_rag_vector_candidates", 50)  # entities fetched from the vector index
+        self.write_batch_size = config.get("graph_rag_write_batch_size", 500)  # relations per write transaction
+        self.embedding_batch_size = config.get("graph_rag_embedding_batch_size", 64)  # entities per embedding request
+        self.extraction_concurrency = config.get("graph_rag_extraction_concurrency", 8)  # relation extraction calls in flight
+        self._embedder = None
         
-        # Initialize Neo4j driver
-        self.driver = None
-        self._setup_neo4j_connection()
-        self._initialize_vector_index()
+        # Graph store: "neo4j" or "embedded" (in-process, persisted under graph_rag_store_path)
+        self.store_backend = config.get("graph_rag_store", "neo4j")
+        self.store_path = config.get("graph_rag_store_path", os.path.join("rag_pipeline", "graph_store", "knowledge_graph"))
+        self.store: Optional[KnowledgeGraphStore] = None
+        self._setup_graph_store()
     
-    def _setup_neo4j_connection(self):
-        """Setup Neo4j database connection"""
-        try:
-            self.driver = GraphDatabase.driver(
-                self.neo4j_uri, 
-                auth=(self.neo4j_user, self.neo4j_password)
+    def _setup_graph_store(self):
+        """Open the configured graph store"""
+        if self.store_backend == "embedded":
+            self.store = EmbeddedKnowledgeGraphStore.open(self.store_path)
+        elif self.store_backend == "neo4j":
+            from rag_pipeline.util.graphstore.neo4j_store import Neo4jKnowledgeGraphStore
+            self.store = Neo4jKnowledgeGraphStore(
+                self.neo4j_uri,
+                self.neo4j_user,
+                self.neo4j_password,
+                vector_index_name=self.vector_index_name,
+                embedding_dimension=self.embedding_dimension,
+                write_batch_size=self.write_batch_size,
+                max_connection_pool_size=self.config.get("graph_rag_neo4j_max_pool_size")
             )
-            # Test connection
-            with self.driver.session() as session:
-                session.run("RETURN 1")
-            logger.info("Neo4j connection established successfully")
-        except Exception as e:
-            logger.error(f"Failed to connect to Neo4j: {e}")
-            raise
+        else:
+            raise ValueError(f"Unknown graph store: {self.store_backend}")
+    
+    @property
+    def embedder(self) -> OllamaQueryEmbedder:
+        """Shared embedding client (created on first use)"""
+        if self._embedder is None:
+            self._embedder = OllamaQueryEmbedder(getattr(self, "embedding_model", "mxbai-embed-large"))
+        return self._embedder
     
-    def _initialize_vector_index(self):
-        """Initialize vector index for entity embeddings"""
-        try:
-            with self.driver.session() as session:
-                # Check if index already exists
-                result = session.run("SHOW INDEXES")
-                existing_indexes = [record.get("name") for record in result]
-                
-                if self.vector_index_name not in existing_indexes:
-                    # Create vector index
-                    session.run(f"""
-                    CREATE VECTOR INDEX {self.vector_index_name} 
-                    FOR (n:Entity) 
-                    ON (n.embedding) 
-                    OPTIONS {{
-                        indexConfig: {{
-                            `vector.dimensions`: {self.embedding_dimension},
-                            `vector.similarity_function`: 'cosine'
-                        }}
-                    }}
-                    """)
-                    logger.info(f"Created vector index: {self.vector_index_name}")
-                else:
-                    logger.info(f"Vector index {self.vector_index_name} already exists")
-        except Exception as e:
-            logger.warning(f"Could not initialize vector index: {e}")
-
     def _embed_text_with_ollama(self, text: str) -> List[float]:
         """Generate embeddings using OllamaEmbeddings (langchain_community)"""
         try:
-            from langchain_community.embeddings import OllamaEmbeddings
-            import os
-
-            # Get the Ollama API URL from environment variable or config
-            ollama_api_url = os.getenv("OLLAMA_API_URL", "http://ollama-gpu-3:11435/api")
-            # Remove '/api' suffix for OllamaEmbeddings base_url
-            base_url = ollama_api_url.replace("/api", "")
-
-            embedding_model = getattr(self, "embedding_model", "mxbai-embed-large")
-            embedding = OllamaEmbeddings(
-                model=embedding_model,
-                base_url=base_url
-            )
-            result = embedding.embed_query(text)
+            result = self.embedder.embed(text)
             if not result or not isinstance(result, list):
                 raise ValueError("No embedding returned")
             return result
@@ -604,124 +825,14 @@ class GraphRAG(RetrievalComponent):
 
     def _retrieve_context_basic(self, query_embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
         """Basic retrieval using vector similarity"""
-        cypher_query = """
-        // Find similar entities using cosine similarity
-        MATCH (e:Entity)
-        WHERE e.embedding IS NOT NULL
-        WITH e, 
-             reduce(acc = 0.0, i IN range(0, size(e.embedding)-1) | 
-                    acc + e.embedding[i] * $query_embedding[i]) / 
-             (sqrt(reduce(acc = 0.0, i IN range(0, size(e.embedding)-1) | 
-                   acc + e.embedding[i] * e.embedding[i])) * 
-              sqrt(reduce(acc = 0.0, i IN range(0, size($query_embedding)-1) | 
-                   acc + $query_embedding[i] * $query_embedding[i]))) AS similarity
-        WHERE similarity >= $similarity_threshold
-        
-        // Get direct relations from similar entities with all metadata
-        MATCH (e)-[r:RELATION]->(target:Entity)
-        RETURN DISTINCT 
-            e.name AS subject, 
-            r.type AS relation, 
-            target.name AS object, 
-            r.source_doc AS source_doc,
-            r.doc_id AS doc_id,
-            r.sentence AS sentence,
-            r.created_at AS created_at,
-            r.chunk_id AS chunk_id,
-            similarity
-        ORDER BY similarity DESC
-        LIMIT $top_k
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(
-                cypher_query,
-                query_embedding=query_embedding,
-                similarity_threshold=self.similarity_threshold,
-                top_k=top_k
-            )
-            
-            relations = []
-            for record in result:
-                relations.append({
-                    'subject': record['subject'],
-                    'relation': record['relation'],
-                    'object': record['object'],
-                    'source_doc': record.get('source_doc'),
-                    'doc_id': record.get('doc_id'),
-                    'sentence': record.get('sentence'),
-                    'created_at': record.get('created_at'),
-                    'chunk_id': record.get('chunk_id'),
-                    'similarity': record['similarity']
-                })
-            
-            return relations
+        # Every candidate entity contributes at least one relation if it has any,
+        # so a few times top_k candidates is plenty
+        candidate_k = max(top_k, self.vector_candidates)
+        return self.store.retrieve_basic(query_embedding, top_k, self.similarity_threshold, candidate_k)
     
     def _retrieve_context_traversal(self, query_embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
         """Enhanced retrieval with graph traversal"""
-        cypher_query = """
-        // Step 1: Find similar entities
-        MATCH (e:Entity)
-        WHERE e.embedding IS NOT NULL
-        WITH e, 
-             reduce(acc = 0.0, i IN range(0, size(e.embedding)-1) | 
-                    acc + e.embedding[i] * $query_embedding[i]) / 
-             (sqrt(reduce(acc = 0.0, i IN range(0, size(e.embedding)-1) | 
-                   acc + e.embedding[i] * e.embedding[i])) * 
-              sqrt(reduce(acc = 0.0, i IN range(0, size($query_embedding)-1) | 
-                   acc + $query_embedding[i] * $query_embedding[i]))) AS similarity
-        WHERE similarity >= $similarity_threshold
-        ORDER BY similarity DESC
-        LIMIT 10
-        
-        // Step 2: Traverse graph to find connected entities
-        MATCH path = (e)-[*1..$max_depth]-(connected:Entity)
-        WITH e, connected, similarity, length(path) AS distance
-        
-        // Step 3: Get all relations involving these connected entities with metadata
-        MATCH (a:Entity)-[r:RELATION]->(b:Entity)
-        WHERE a.name IN [e.name, connected.name] OR b.name IN [e.name, connected.name]
-        
-        RETURN DISTINCT
-            a.name AS subject,
-            r.type AS relation,
-            b.name AS object,
-            r.source_doc AS source_doc,
-            r.doc_id AS doc_id,
-            r.sentence AS sentence,
-            r.created_at AS created_at,
-            r.chunk_id AS chunk_id,
-            similarity,
-            distance
-        ORDER BY similarity DESC, distance ASC
-        LIMIT $top_k
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(
-                cypher_query,
-                query_embedding=query_embedding,
-                similarity_threshold=self.similarity_threshold,
-                max_depth=self.max_depth,
-                top_k=top_k
-            )
-            
-            relations = []
-            for record in result:
-                relations.append({
-                    'subject': record['subject'],
-                    'relation': record['relation'],
-                    'object': record['object'],
-                    'source_doc': record.get('source_doc'),
-                    'doc_id': record.get('doc_id'),
-                    'sentence': record.get('sentence'),
-                    'created_at': record.get('created_at'),
-                    'chunk_id': record.get('chunk_id'),
-                    'similarity': record['similarity'],
-                    'distance': record.get('distance', 0)
-                })
-            
-            return relations
+        return self.store.retrieve_traversal(query_embedding, top_k, self.similarity_threshold, self.max_depth, candidate_k=10)
     
     def _relations_to_documents(self, relations: List[Dict[str, Any]]) -> List[Document]:
         """Convert graph relations to Document objects with rich metadata"""
@@ -785,7 +896,7 @@ class GraphRAG(RetrievalComponent):
         try:
             # Generate query embedding
             query_text = query.processed_text
-            query_embedding = self._embed_text_with_ollama(query_text)
+            query_embedding = await run_retrieval_call(self._embed_text_with_ollama, query_text)
             
             if not query_embedding or all(x == 0.0 for x in query_embedding):
                 logger.warning("Failed to generate valid query embedding")
@@ -797,9 +908,9 @@ class GraphRAG(RetrievalComponent):
             
             # Retrieve relations based on method
             if self.retrieval_method == "basic":
-                relations = self._retrieve_context_basic(query_embedding, k)
+                relations = await run_retrieval_call(self._retrieve_context_basic, query_embedding, k)
             elif self.retrieval_method == "traversal":
-                relations = self._retrieve_context_traversal(query_embedding, k)
+                relations = await run_retrieval_call(self._retrieve_context_traversal, query_embedding, k)
             else:
                 raise ValueError(f"Unknown retrieval method: {self.retrieval_method}")
             
@@ -841,44 +952,57 @@ class GraphRAG(RetrievalComponent):
         try:
             logger.info(f"Starting to index {len(documents)} documents in knowledge graph")
             
+            # Chunk every document that still needs processing
+            processed_doc_ids = self._processed_document_ids([doc.doc_id for doc in documents])
+            pending = []
             for doc in documents:
+                # Check if document already processed (optional optimization)
+                if doc.doc_id in processed_doc_ids:
+                    logger.info(f"Document {doc.doc_id} already processed, skipping")
+                    continue
+                pending.append((doc, self._chunk_text(doc.content, self.config.get("max_chunk_chars", 4000))))
+            
+            # Extract relations from all chunks of all documents concurrently
+            all_chunks = [chunk for _, chunks in pending for chunk in chunks]
+            extracted = await extract_chunks_with_cache(
+                all_chunks, self._relation_model(), self._RELATION_PROMPT_VERSION,
+                self._aextract_relations_llm_ollama, self.extraction_concurrency
+            )
+            
+            offset = 0
+            for doc, chunks in pending:
                 doc_id = doc.doc_id
                 source_doc = doc.metadata.get('source', doc_id) if doc.metadata else doc_id
                 
                 logger.info(f"Processing document: {doc_id}")
                 
-                # Check if document already processed (optional optimization)
-                if self._is_document_already_processed(doc_id):
-                    logger.info(f"Document {doc_id} already processed, skipping")
-                    continue
-                
-                # Extract relations from document content using LLM with chunking
                 all_relations = []
-                chunks = self._chunk_text(doc.content, self.config.get("max_chunk_chars", 4000))
+                relation_rows = []
+                chunk_relations = extracted[offset:offset + len(chunks)]
+                offset += len(chunks)
                 
-                for chunk_idx, chunk in enumerate(chunks):
-                    logger.debug(f"Processing chunk {chunk_idx + 1}/{len(chunks)} for doc {doc_id}")
-                    relations = self._extract_relations_llm_ollama(chunk)
-                    
+                for chunk_idx, relations in enumerate(chunk_relations):
                     if relations:
-                        # Add relations to Neo4j with chunk tracking
-                        self._add_relations_to_neo4j(
+                        # Collect relations with chunk tracking; written in bulk per document
+                        relation_rows.extend(self._relation_rows(
                             relations, 
                             source_doc=source_doc,
                             doc_id=doc_id, 
                             chunk_id=chunk_idx
-                        )
+                        ))
                         all_relations.extend(relations)
-                        logger.debug(f"Added {len(relations)} relations from chunk {chunk_idx}")
+                        logger.debug(f"Extracted {len(relations)} relations from chunk {chunk_idx}")
                 
                 if all_relations:
+                    self._write_relation_rows(relation_rows)
                     logger.info(f"Successfully indexed {len(all_relations)} relations from document {doc_id}")
-                    
-                    # Generate embeddings for new entities
-                    self._embed_new_entities()
                 else:
                     logger.warning(f"No relations extracted from document {doc_id}")
             
+            # Generate embeddings for all entities still missing one (including earlier runs)
+            self._embed_new_entities()
+            self.store.flush()
+            
             logger.info(f"Successfully completed indexing {len(documents)} documents")
             return True
             
@@ -886,19 +1010,17 @@ class GraphRAG(RetrievalComponent):
             logger.error(f"Failed to index documents: {e}")
             return False
     
-    def _is_document_already_processed(self, doc_id: str) -> bool:
-        """Check if a document has already been processed"""
+    def _processed_document_ids(self, doc_ids: List[str]) -> set:
+        """Get the subset of doc_ids that already have relations in the graph, with a single lookup"""
         try:
-            with self.driver.session() as session:
-                result = session.run(
-                    "MATCH ()-[r:RELATION {doc_id: $doc_id}]-() RETURN COUNT(r) AS count",
-                    doc_id=doc_id
-                )
-                count = result.single()["count"]
-                return count > 0
+            return self.store.processed_document_ids(doc_ids)
         except Exception as e:
-            logger.warning(f"Could not check if document {doc_id} was processed: {e}")
-            return False
+            logger.warning(f"Could not check which documents were processed: {e}")
+            return set()
+    
+    def _is_document_already_processed(self, doc_id: str) -> bool:
+        """Check if a document has already been processed"""
+        return doc_id in self._processed_document_ids([doc_id])
     
     def _extract_relations_with_ollama(self, text: str, doc_id: str) -> List[Dict[str, Any]]:
         """
@@ -925,13 +1047,14 @@ class GraphRAG(RetrievalComponent):
             start = end
         return chunks
     
-    def _extract_relations_llm_ollama(self, text: str) -> List[Dict[str, Any]]:
-        """Extract relations using Ollama LLM (via OllamaUtil)"""
-        from rag_pipeline.util.api.ollama_client import OllamaUtil
-
-        ollama_model = self.config.get("graph_rag_ollama_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest")
-        
-        prompt = f"""
+    # Bump whenever the prompt or the parsing changes so cached extractions are not replayed
+    _RELATION_PROMPT_VERSION = "relations-v1"
+    
+    def _relation_model(self) -> str:
+        return self.config.get("graph_rag_ollama_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest")
+    
+    def _relation_prompt(self, text: str) -> str:
+        return f"""
 You are an expert relation extraction system.
 
 Extract all meaningful factual relations as triples from the text below.
@@ -947,14 +1070,40 @@ If something is not a relation triple, DO NOT include it.
 Text:
 \"\"\"{text}\"\"\"
 """
+    
+    def _extract_relations_llm_ollama(self, text: str) -> List[Dict[str, Any]]:
+        """Extract relations using Ollama LLM (via OllamaUtil), replaying cached extractions"""
+        from rag_pipeline.util.api.ollama_client import OllamaUtil
 
-        try:
-            ollama_result = OllamaUtil.get_ollama_response(ollama_model, prompt)
-            if ollama_result is None:
-                logger.error("OllamaUtil.get_ollama_response returned None")
-                return []
-            text_out = ollama_result.get("response", "")
+        ollama_model = self._relation_model()
+        cache = get_extraction_cache()
+        cached = cache.get(ollama_model, self._RELATION_PROMPT_VERSION, text)
+        if cached is not None:
+            return cached
+
+        ollama_result = OllamaUtil.get_ollama_response(ollama_model, self._relation_prompt(text))
+        if ollama_result is None:
+            logger.error("OllamaUtil.get_ollama_response returned None")
+            return []
+        relations = self._parse_relations(ollama_result.get("response", ""), text)
+        if relations is None:
+            return []
+        cache.put(ollama_model, self._RELATION_PROMPT_VERSION, text, relations)
+        return relations
+    
+    async def _aextract_relations_llm_ollama(self, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Extract relations using Ollama LLM without blocking the event loop (None on failure)"""
+        from rag_pipeline.util.api.ollama_client import OllamaUtil
 
+        ollama_result = await OllamaUtil.aget_ollama_response(self._relation_model(), self._relation_prompt(text))
+        if ollama_result is None:
+            logger.error("OllamaUtil.aget_ollama_response returned None")
+            return None
+        return self._parse_relations(ollama_result.get("response", ""), text)
+    
+    def _parse_relations(self, text_out: str, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse and normalize the relation triples of an LLM response (None on failure)"""
+        try:
             # Parse JSON response
             import json
             import re
@@ -1003,119 +1152,57 @@ Text:
             
         except Exception as e:
             logger.error(f"LLM relation extraction failed: {e}")
-            return []
+            return None
     
-    def _add_relations_to_neo4j(self, relations: List[Dict[str, Any]], source_doc: str, doc_id: str = None, chunk_id: int = None):
-        """Add relations to Neo4j database with comprehensive metadata"""
+    def _relation_rows(self, relations: List[Dict[str, Any]], source_doc: str, doc_id: str = None, chunk_id: int = None) -> List[Dict[str, Any]]:
+        """Build the parameter rows for relations with comprehensive metadata"""
         import datetime
         
-        with self.driver.session() as session:
-            for i, rel in enumerate(relations):
-                # Create timestamp
-                created_at = datetime.datetime.now().isoformat()
-                
-                # Prepare relation properties with metadata
-                relation_props = {
-                    'type': rel["relation"],
-                    'source_doc': source_doc,
-                    'doc_id': doc_id or source_doc,
-                    'sentence': rel.get("sentence", ""),
-                    'created_at': created_at,
-                    'relation_id': f"{doc_id}_{chunk_id}_{i}" if doc_id and chunk_id is not None else f"{source_doc}_{i}"
-                }
-                
-                # Add chunk_id if provided
-                if chunk_id is not None:
-                    relation_props['chunk_id'] = chunk_id
-                
-                session.run(
-                    """
-                    MERGE (a:Entity {name: $subject})
-                    MERGE (b:Entity {name: $object})
-                    MERGE (a)-[r:RELATION {
-                        type: $type,
-                        source_doc: $source_doc,
-                        doc_id: $doc_id,
-                        relation_id: $relation_id
-                    }]->(b)
-                    SET r.sentence = $sentence,
-                        r.created_at = $created_at,
-                        r.chunk_id = $chunk_id
-                    """,
-                    subject=rel["subject"],
-                    object=rel["object"],
-                    **relation_props
-                )
+        # Create timestamp
+        created_at = datetime.datetime.now().isoformat()
+        rows = []
+        for i, rel in enumerate(relations):
+            # MERGE cannot match on null properties
+            if not rel.get("subject") or not rel.get("object") or not rel.get("relation"):
+                continue
+            rows.append({
+                'subject': rel["subject"],
+                'object': rel["object"],
+                'type': rel["relation"],
+                'source_doc': source_doc,
+                'doc_id': doc_id or source_doc,
+                'sentence': rel.get("sentence", ""),
+                'created_at': created_at,
+                'relation_id': f"{doc_id}_{chunk_id}_{i}" if doc_id and chunk_id is not None else f"{source_doc}_{i}",
+                'chunk_id': chunk_id
+            })
+        return rows
     
-    def _embed_new_entities(self):
-        """Generate embeddings for entities that don't have them"""
-        with self.driver.session() as session:
-            # Find entities without embeddings
-            result = session.run("MATCH (n:Entity) WHERE n.embedding IS NULL RETURN n.name AS name LIMIT 100")
-            entities_to_embed = [record["name"] for record in result]
-            
-            for entity_name in entities_to_embed:
-                try:
-                    embedding = self._embed_text_with_ollama(entity_name)
-                    if embedding and not all(x == 0.0 for x in embedding):
-                        session.run(
-                            "MATCH (n:Entity {name: $name}) SET n.embedding = $embedding",
-                            name=entity_name, embedding=embedding
-                        )
-                        logger.debug(f"Generated embedding for entity: {entity_name}")
-                except Exception as e:
-                    logger.warning(f"Failed to embed entity '{entity_name}': {e}")
+    def _write_relation_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """Write relation rows to the graph store (batched UNWIND transactions on Neo4j)"""
+        return self.store.write_relations(rows)
+    
+    def _add_relations_to_neo4j(self, relations: List[Dict[str, Any]], source_doc: str, doc_id: str = None, chunk_id: int = None):
+        """Add relations to Neo4j database with comprehensive metadata"""
+        self._write_relation_rows(self._relation_rows(relations, source_doc, doc_id, chunk_id))
+    
+    def _embed_new_entities(self) -> Dict[str, Any]:
+        """Generate embeddings for every entity that doesn't have one, in batches"""
+        try:
+            return self.store.embed_missing(self.embedder.embed_many, self.embedding_batch_size)
+        except Exception as e:
+            logger.error(f"Failed to embed entities: {e}")
+            return {"embedded": 0, "failed": 0, "seconds": 0.0, "per_second": 0.0}
     
     def get_graph_stats(self) -> Dict[str, Any]:
         """Get statistics about the knowledge graph with document-level breakdown"""
         try:
-            with self.driver.session() as session:
-                # Count entities
-                entity_count = session.run("MATCH (n:Entity) RETURN COUNT(n) AS count").single()["count"]
-                
-                # Count relations
-                relation_count = session.run("MATCH ()-[r:RELATION]->() RETURN COUNT(r) AS count").single()["count"]
-                
-                # Count entities with embeddings
-                embedded_count = session.run("MATCH (n:Entity) WHERE n.embedding IS NOT NULL RETURN COUNT(n) AS count").single()["count"]
-                
-                # Count unique documents
-                doc_count = session.run("MATCH ()-[r:RELATION]->() WHERE r.doc_id IS NOT NULL RETURN COUNT(DISTINCT r.doc_id) AS count").single()["count"]
-                
-                # Count unique source documents
-                source_doc_count = session.run("MATCH ()-[r:RELATION]->() WHERE r.source_doc IS NOT NULL RETURN COUNT(DISTINCT r.source_doc) AS count").single()["count"]
-                
-                # Get document-level statistics
-                doc_stats = session.run("""
-                    MATCH ()-[r:RELATION]->()
-                    WHERE r.doc_id IS NOT NULL
-                    RETURN r.doc_id AS doc_id, 
-                           r.source_doc AS source_doc,
-                           COUNT(r) AS relation_count
-                    ORDER BY relation_count DESC
-                    LIMIT 10
-                """)
-                
-                top_docs = []
-                for record in doc_stats:
-                    top_docs.append({
-                        'doc_id': record['doc_id'],
-                        'source_doc': record['source_doc'],
-                        'relation_count': record['relation_count']
-                    })
-                
-                return {
-                    'total_entities': entity_count,
-                    'total_relations': relation_count,
-                    'entities_with_embeddings': embedded_count,
-                    'embedding_coverage': embedded_count / entity_count if entity_count > 0 else 0,
-                    'unique_documents': doc_count,
-                    'unique_source_documents': source_doc_count,
-                    'avg_relations_per_doc': relation_count / doc_count if doc_count > 0 else 0,
-                    'top_documents_by_relations': top_docs,
-                    'retrieval_method': self.retrieval_method,
-                    'similarity_threshold': self.similarity_threshold
-                }
+            return {
+                **self.store.get_stats(),
+                'retrieval_method': self.retrieval_method,
+                'similarity_threshold': self.similarity_threshold,
+                'graph_store': self.store_backend
+            }
         except Exception as e:
             logger.error(f"Failed to get graph stats: {e}")
             return {}
@@ -1123,31 +1210,7 @@ Text:
     def get_document_relations(self, doc_id: str) -> List[Dict[str, Any]]:
         """Get all relations from a specific document"""
         try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (a:Entity)-[r:RELATION]->(b:Entity)
-                    WHERE r.doc_id = $doc_id
-                    RETURN a.name AS subject,
-                           r.type AS relation,
-                           b.name AS object,
-                           r.sentence AS sentence,
-                           r.chunk_id AS chunk_id,
-                           r.created_at AS created_at
-                    ORDER BY r.chunk_id, r.relation_id
-                """, doc_id=doc_id)
-                
-                relations = []
-                for record in result:
-                    relations.append({
-                        'subject': record['subject'],
-                        'relation': record['relation'],
-                        'object': record['object'],
-                        'sentence': record['sentence'],
-                        'chunk_id': record['chunk_id'],
-                        'created_at': record['created_at']
-                    })
-                
-                return relations
+            return self.store.get_document_relations(doc_id)
         except Exception as e:
             logger.error(f"Failed to get relations for document {doc_id}: {e}")
             return []
@@ -1155,25 +1218,7 @@ Text:
     def get_documents_containing_entity(self, entity_name: str) -> List[Dict[str, Any]]:
         """Get all documents that contain relations involving a specific entity"""
         try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (e:Entity {name: $entity_name})-[r:RELATION]-(other:Entity)
-                    RETURN DISTINCT r.doc_id AS doc_id,
-                                   r.source_doc AS source_doc,
-                                   COUNT(r) AS relation_count
-                    WHERE r.doc_id IS NOT NULL
-                    ORDER BY relation_count DESC
-                """, entity_name=entity_name)
-                
-                documents = []
-                for record in result:
-                    documents.append({
-                        'doc_id': record['doc_id'],
-                        'source_doc': record['source_doc'],
-                        'relation_count': record['relation_count']
-                    })
-                
-                return documents
+            return self.store.get_documents_containing_entity(entity_name)
         except Exception as e:
             logger.error(f"Failed to get documents for entity {entity_name}: {e}")
             return []
@@ -1181,28 +1226,22 @@ Text:
     def delete_document_relations(self, doc_id: str) -> bool:
         """Delete all relations from a specific document"""
         try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH ()-[r:RELATION {doc_id: $doc_id}]->()
-                    DELETE r
-                    RETURN COUNT(*) AS deleted_count
-                """, doc_id=doc_id)
-                
-                deleted_count = result.single()["deleted_count"]
-                logger.info(f"Deleted {deleted_count} relations from document {doc_id}")
-                return True
+            deleted_count = self.store.delete_document_relations(doc_id)
+            self.store.flush()
+            logger.info(f"Deleted {deleted_count} relations from document {doc_id}")
+            return True
         except Exception as e:
             logger.error(f"Failed to delete relations for document {doc_id}: {e}")
             return False
     
     def __del__(self):
-        """Close Neo4j driver connection"""
-        if self.driver:
-            self.driver.close()
+        """Close the graph store"""
+        if getattr(self, "store", None):
+            self.store.close()
 
 
 class HyperGraphRAG(RetrievalComponent):
-    """HyperGraph-based RAG retrieval using Neo4j hypergraph with multi-entity relationships"""
+    """HyperGraph-based RAG retrieval over a hypergraph with multi-entity relationships (Neo4j or the embedded graph store)"""
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -1224,44 +1263,44 @@ class HyperGraphRAG(RetrievalComponent):
         
         # Processing parameters
         self.chunk_size = config.get("hypergraph_chunk_size", 2000)
+        self.write_batch_size = config.get("hypergraph_write_batch_size", 500)  # hyperedges per write transaction
+        self.embedding_batch_size = config.get("hypergraph_embedding_batch_size", 64)  # hyperedges per embedding request
+        self.extraction_concurrency = config.get("hypergraph_extraction_concurrency", 8)  # hyperedge extraction calls in flight
+        self._embedder = None
         
-        # Initialize components
-        self.driver = None
-        self._setup_neo4j_connection()
-        self._initialize_vector_index()
+        # Hypergraph store: "neo4j" or "embedded" (in-process, persisted under hypergraph_store_path)
+        self.store_backend = config.get("hypergraph_store", "neo4j")
+        self.store_path = config.get("hypergraph_store_path", os.path.join("rag_pipeline", "graph_store", "hypergraph"))
+        self.store: Optional[HyperGraphStore] = None
+        self._setup_graph_store()
     
-    def _setup_neo4j_connection(self):
-        """Setup Neo4j database connection"""
-        try:
-            self.driver = GraphDatabase.driver(
-                self.neo4j_uri, 
-                auth=(self.neo4j_user, self.neo4j_password)
+    def _setup_graph_store(self):
+        """Open the configured hypergraph store"""
+        if self.store_backend == "embedded":
+            self.store = EmbeddedHyperGraphStore.open(self.store_path)
+        elif self.store_backend == "neo4j":
+            from rag_pipeline.util.graphstore.neo4j_store import Neo4jHyperGraphStore
+            self.store = Neo4jHyperGraphStore(
+                self.neo4j_uri,
+                self.neo4j_user,
+                self.neo4j_password,
+                write_batch_size=self.write_batch_size,
+                max_connection_pool_size=self.config.get("hypergraph_neo4j_max_pool_size")
             )
-            # Test connection
-            with self.driver.session() as session:
-                session.run("RETURN 1")
-            logger.info("Neo4j connection for HyperGraphRAG established successfully")
-        except Exception as e:
-            logger.error(f"Failed to connect to Neo4j for HyperGraphRAG: {e}")
-            raise
+        else:
+            raise ValueError(f"Unknown hypergraph store: {self.store_backend}")
+    
+    @property
+    def embedder(self) -> OllamaQueryEmbedder:
+        """Shared embedding client (created on first use)"""
+        if self._embedder is None:
+            self._embedder = OllamaQueryEmbedder(getattr(self, "embedding_model", "mxbai-embed-large"))
+        return self._embedder
     
     def _embed_text(self, text: str) -> List[float]:
         """Generate embeddings using OllamaEmbeddings (langchain_community)"""
         try:
-            from langchain_community.embeddings import OllamaEmbeddings
-            import os
-
-            # Get the Ollama API URL from environment variable or config
-            ollama_api_url = os.getenv("OLLAMA_API_URL", "http://ollama-gpu-3:11435/api")
-            # Remove '/api' suffix for OllamaEmbeddings base_url
-            base_url = ollama_api_url.replace("/api", "")
-
-            embedding_model = getattr(self, "embedding_model", "mxbai-embed-large")
-            embedding = OllamaEmbeddings(
-                model=embedding_model,
-                base_url=base_url
-            )
-            result = embedding.embed_query(text)
+            result = self.embedder.embed(text)
             if not result or not isinstance(result, list):
                 raise ValueError("No embedding returned")
             return result
@@ -1270,26 +1309,18 @@ class HyperGraphRAG(RetrievalComponent):
             # Return zero vector as fallback
             return [0.0] * self.embedding_dimension
     
-    def _initialize_vector_index(self):
-        """Initialize vector index for hyperedge embeddings"""
-        try:
-            with self.driver.session() as session:
-                # Create indexes for better performance
-                session.run("CREATE INDEX hyperedge_type_idx IF NOT EXISTS FOR (he:HyperEdge) ON (he.type)")
-                session.run("CREATE INDEX entity_name_idx IF NOT EXISTS FOR (e:HyperEntity) ON (e.name)")
-                session.run("CREATE INDEX hyperedge_doc_idx IF NOT EXISTS FOR (he:HyperEdge) ON (he.source_document)")
-                
-                logger.info("HyperGraphRAG indexes created successfully")
-        except Exception as e:
-            logger.warning(f"Could not initialize indexes: {e}")
+    # Bump whenever the prompt or the parsing changes so cached extractions are not replayed
+    _HYPEREDGE_PROMPT_VERSION = "hyperedges-v1"
     
-    def _extract_hyperedges_with_llm(self, text: str) -> List[Dict[str, Any]]:
-        """Extract hyperedge relations using LLM (via OllamaUtil)"""
-        from rag_pipeline.util.api.ollama_client import OllamaUtil
-
-        ollama_model = self.config.get("hypergraph_ollama_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest")
-        
-        prompt = f"""
+    def _hyperedge_model(self) -> str:
+        return self.config.get("hypergraph_ollama_model", "alibayram/Qwen3-30B-A3B-Instruct-2507:latest")
+    
+    def _hyperedge_prompt_version(self) -> str:
+        # The prompt and the validation depend on the minimum number of entities
+        return f"{self._HYPEREDGE_PROMPT_VERSION}-min{self.min_hyperedge_entities}"
+    
+    def _hyperedge_prompt(self, text: str) -> str:
+        return f"""
 You are an advanced hypergraph relation extraction system.
 
 Your task is to extract all meaningful hyperedges from the text below. A hyperedge represents a relationship, or group that connects {self.min_hyperedge_entities} to 10 entities in a single, coherent context.
@@ -1322,13 +1353,40 @@ Examples:
 Text:
 \"\"\"{text}\"\"\"
 """
+    
+    def _extract_hyperedges_with_llm(self, text: str) -> List[Dict[str, Any]]:
+        """Extract hyperedge relations using LLM (via OllamaUtil), replaying cached extractions"""
+        from rag_pipeline.util.api.ollama_client import OllamaUtil
+
+        ollama_model = self._hyperedge_model()
+        cache = get_extraction_cache()
+        cached = cache.get(ollama_model, self._hyperedge_prompt_version(), text)
+        if cached is not None:
+            return cached
+
+        ollama_result = OllamaUtil.get_ollama_response(ollama_model, self._hyperedge_prompt(text))
+        if ollama_result is None:
+            logger.error("OllamaUtil.get_ollama_response returned None")
+            return []
+        hyperedges = self._parse_hyperedges(ollama_result.get("response", ""))
+        if hyperedges is None:
+            return []
+        cache.put(ollama_model, self._hyperedge_prompt_version(), text, hyperedges)
+        return hyperedges
+    
+    async def _aextract_hyperedges_with_llm(self, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Extract hyperedge relations using LLM without blocking the event loop (None on failure)"""
+        from rag_pipeline.util.api.ollama_client import OllamaUtil
 
+        ollama_result = await OllamaUtil.aget_ollama_response(self._hyperedge_model(), self._hyperedge_prompt(text))
+        if ollama_result is None:
+            logger.error("OllamaUtil.aget_ollama_response returned None")
+            return None
+        return self._parse_hyperedges(ollama_result.get("response", ""))
+    
+    def _parse_hyperedges(self, text_out: str) -> Optional[List[Dict[str, Any]]]:
+        """Parse and validate the hyperedges of an LLM response (None on failure)"""
         try:
-            ollama_result = OllamaUtil.get_ollama_response(ollama_model, prompt)
-            if ollama_result is None:
-                logger.error("OllamaUtil.get_ollama_response returned None")
-                return []
-            text_out = ollama_result.get("response", "")
             # Parse JSON response
             import json
             import re
@@ -1358,7 +1416,7 @@ Text:
                     parsed_hyperedges = parsed_data
                 else:
                     logger.error("Parsed JSON is not a list")
-                    return []
+                    return None
             except Exception as e:
                 logger.error(f"Failed to parse as direct JSON: {e}")
                 # Try with more aggressive cleaning
@@ -1372,10 +1430,10 @@ Text:
                         parsed_hyperedges = parsed_data
                     else:
                         logger.error("Parsed JSON is still not a list after aggressive cleaning")
-                        return []
+                        return None
                 except Exception as e2:
                     logger.error(f"Failed to parse even with aggressive cleaning: {e2}")
-                    return []
+                    return None
 
             # Validate and filter hyperedges
             validated_hyperedges = []
@@ -1392,7 +1450,7 @@ Text:
             
         except Exception as e:
             logger.error(f"LLM hyperedge extraction failed: {e}")
-            return []
+            return None
     
     def _validate_hyperedge(self, hyperedge: Dict[str, Any]) -> bool:
         """Validate extracted hyperedge"""
@@ -1423,165 +1481,54 @@ Text:
             start = end
         return chunks
     
-    def _store_hyperedge(self, session, hyperedge_data: Dict[str, Any], source_doc: str):
-        """Store hyperedge and its entities in Neo4j"""
-        try:
-            # Create hyperedge node
-            embedding = self._embed_text(hyperedge_data["description"])
-            
-            session.run("""
-                MERGE (he:HyperEdge {
-                    type: $type,
-                    description: $description,
-                    source_document: $source_document
+    def _store_hyperedges(self, hyperedges: List[Dict[str, Any]], source_doc: str) -> int:
+        """
+        Store hyperedges and their entities in the hypergraph store (batched UNWIND
+        transactions on Neo4j). Embeddings are added afterwards by _embed_new_hyperedges.
+        """
+        rows = []
+        for hyperedge_data in hyperedges:
+            try:
+                rows.append({
+                    'type': hyperedge_data["hyperedge_type"],
+                    'description': hyperedge_data["description"],
+                    'source_document': source_doc,
+                    'entity_count': len(hyperedge_data["entities"]),
+                    'source_sentence': hyperedge_data["source_sentence"],
+                    'entities': [name for name in hyperedge_data["entities"] if name]
                 })
-                SET he.entity_count = $entity_count,
-                    he.source_sentence = $source_sentence,
-                    he.embedding = $embedding,
-                    he.created_at = datetime()
-                """,
-                type=hyperedge_data["hyperedge_type"],
-                description=hyperedge_data["description"],
-                source_document=source_doc,
-                entity_count=len(hyperedge_data["entities"]),
-                source_sentence=hyperedge_data["source_sentence"],
-                embedding=embedding
-            )
-            
-            # Connect entities to hyperedge
-            for entity_name in hyperedge_data["entities"]:
-                session.run("""
-                    MERGE (e:HyperEntity {name: $entity_name})
-                    WITH e
-                    MATCH (he:HyperEdge {type: $type, description: $description, source_document: $source_document})
-                    MERGE (e)-[:MEMBER_OF]->(he)
-                    """,
-                    entity_name=entity_name,
-                    type=hyperedge_data["hyperedge_type"],
-                    description=hyperedge_data["description"],
-                    source_document=source_doc
-                )
-                
+            except Exception as e:
+                logger.error(f"Failed to prepare hyperedge: {e}")
+        
+        try:
+            return self.store.write_hyperedges(rows)
         except Exception as e:
-            logger.error(f"Failed to store hyperedge: {e}")
+            logger.error(f"Failed to store hyperedges: {e}")
+            return 0
+    
+    def _embed_new_hyperedges(self) -> Dict[str, Any]:
+        """Generate embeddings for every hyperedge that doesn't have one, in batches"""
+        try:
+            return self.store.embed_missing(self.embedder.embed_many, self.embedding_batch_size)
+        except Exception as e:
+            logger.error(f"Failed to embed hyperedges: {e}")
+            return {"embedded": 0, "failed": 0, "seconds": 0.0, "per_second": 0.0}
     
     def _retrieve_basic_hypergraph(self, query_embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
         """Basic hypergraph retrieval using vector similarity"""
-        cypher_query = """
-        MATCH (he:HyperEdge)
-        WHERE he.embedding IS NOT NULL
-        WITH he, 
-             reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) | 
-                    acc + he.embedding[i] * $query_embedding[i]) / 
-             (sqrt(reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) | 
-                   acc + he.embedding[i] * he.embedding[i])) * 
-              sqrt(reduce(acc = 0.0, i IN range(0, size($query_embedding)-1) | 
-                   acc + $query_embedding[i] * $query_embedding[i]))) AS similarity
-        WHERE similarity >= $similarity_threshold
-        
-        MATCH (e:HyperEntity)-[:MEMBER_OF]->(he)
-        RETURN DISTINCT 
-            he.type AS hyperedge_type,
-            he.description AS hyperedge_description,
-            collect(e.name) AS entities,
-            he.source_sentence AS source_sentence,
-            he.source_document AS source_document,
-            similarity
-        ORDER BY similarity DESC
-        LIMIT $top_k
-        """
-        
-        with self.driver.session() as session:
-            try:
-                result = session.run(
-                    cypher_query,
-                    query_embedding=query_embedding,
-                    similarity_threshold=self.similarity_threshold,
-                    top_k=top_k
-                )
-                
-                hyperedges = []
-                for record in result:
-                    hyperedges.append({
-                        'hyperedge_type': record['hyperedge_type'],
-                        'description': record['hyperedge_description'],
-                        'entities': record['entities'],
-                        'source_sentence': record['source_sentence'],
-                        'source_document': record['source_document'],
-                        'similarity': record['similarity']
-                    })
-                
-                return hyperedges
-                
-            except Exception as e:
-                logger.error(f"Basic hypergraph retrieval failed: {e}")
-                return []
+        try:
+            return self.store.retrieve_basic(query_embedding, top_k, self.similarity_threshold)
+        except Exception as e:
+            logger.error(f"Basic hypergraph retrieval failed: {e}")
+            return []
     
     def _retrieve_expansion_hypergraph(self, query_embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
         """Enhanced hypergraph retrieval with expansion"""
-        cypher_query = """
-        // Step 1: Find similar hyperedges
-        MATCH (he:HyperEdge)
-        WHERE he.embedding IS NOT NULL
-        WITH he, 
-             reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) | 
-                    acc + he.embedding[i] * $query_embedding[i]) / 
-             (sqrt(reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) | 
-                   acc + he.embedding[i] * he.embedding[i])) * 
-              sqrt(reduce(acc = 0.0, i IN range(0, size($query_embedding)-1) | 
-                   acc + $query_embedding[i] * $query_embedding[i]))) AS similarity
-        WHERE similarity >= $similarity_threshold
-        ORDER BY similarity DESC
-        LIMIT 5
-        
-        // Step 2: Find entities in these hyperedges
-        MATCH (e:HyperEntity)-[:MEMBER_OF]->(he)
-        WITH e, he, similarity
-        
-        // Step 3: Find other hyperedges these entities belong to
-        MATCH (e)-[:MEMBER_OF]->(other_he:HyperEdge)
-        WHERE other_he <> he
-        
-        MATCH (other_e:HyperEntity)-[:MEMBER_OF]->(other_he)
-        
-        RETURN DISTINCT
-            he.type AS original_type,
-            he.description AS original_description,
-            other_he.type AS connected_type,
-            other_he.description AS connected_description,
-            collect(other_e.name) AS connected_entities,
-            similarity,
-            1 AS distance
-        ORDER BY similarity DESC, distance ASC
-        LIMIT $top_k
-        """
-        
-        with self.driver.session() as session:
-            try:
-                result = session.run(
-                    cypher_query,
-                    query_embedding=query_embedding,
-                    similarity_threshold=self.similarity_threshold,
-                    top_k=top_k
-                )
-                
-                expansions = []
-                for record in result:
-                    expansions.append({
-                        'original_type': record['original_type'],
-                        'original_description': record['original_description'],
-                        'connected_type': record['connected_type'],
-                        'connected_description': record['connected_description'],
-                        'connected_entities': record['connected_entities'],
-                        'similarity': record['similarity'],
-                        'distance': record['distance']
-                    })
-                
-                return expansions
-                
-            except Exception as e:
-                logger.error(f"Expansion hypergraph retrieval failed: {e}")
-                return []
+        try:
+            return self.store.retrieve_expansion(query_embedding, top_k, self.similarity_threshold, seed_k=5)
+        except Exception as e:
+            logger.error(f"Expansion hypergraph retrieval failed: {e}")
+            return []
     
     def _hyperedges_to_documents(self, hyperedges: List[Dict[str, Any]], query_text: str) -> List[Document]:
         """Convert hyperedges to Document objects"""
@@ -1657,7 +1604,7 @@ Text:
         
         try:
             query_text = query.processed_text
-            query_embedding = self._embed_text(query_text)
+            query_embedding = await run_retrieval_call(self._embed_text, query_text)
             
             if not query_embedding or all(x == 0.0 for x in query_embedding):
                 logger.warning("Failed to generate valid query embedding")
@@ -1669,9 +1616,9 @@ Text:
             
             # Retrieve hyperedges based on method
             if self.retrieval_method == "basic":
-                hyperedges = self._retrieve_basic_hypergraph(query_embedding, k)
+                hyperedges = await run_retrieval_call(self._retrieve_basic_hypergraph, query_embedding, k)
             elif self.retrieval_method == "expansion":
-                hyperedges = self._retrieve_expansion_hypergraph(query_embedding, k)
+                hyperedges = await run_retrieval_call(self._retrieve_expansion_hypergraph, query_embedding, k)
             else:
                 raise ValueError(f"Unknown retrieval method: {self.retrieval_method}")
             
@@ -1705,36 +1652,42 @@ Text:
         try:
             logger.info(f"Starting to index {len(documents)} documents in hypergraph")
             
-            with self.driver.session() as session:
-                for doc in documents:
-                    doc_id = doc.doc_id
-                    source_doc = doc.metadata.get('source', doc_id) if doc.metadata else doc_id
-                    
-                    logger.debug(f"Processing document: {doc_id}")
-                    
-                    # Check if already processed
-                    if self._is_document_processed(session, source_doc):
-                        logger.debug(f"Document {source_doc} already processed, skipping")
-                        continue
-                    
-                    # Process chunks
-                    chunks = self._chunk_text(doc.content)
-                    total_hyperedges = 0
-                    
-                    for chunk_idx, chunk in enumerate(chunks):
-                        try:
-                            hyperedges = self._extract_hyperedges_with_llm(chunk)
-                            logger.info(f"Extracted {len(hyperedges)} hyperedges from chunk {chunk_idx}")
-                            
-                            for hyperedge in hyperedges:
-                                self._store_hyperedge(session, hyperedge, source_doc)
-                                total_hyperedges += 1
-                                
-                        except Exception as e:
-                            logger.error(f"Error processing chunk {chunk_idx}: {e}")
-                            continue
-                    
-                    logger.info(f"Stored {total_hyperedges} hyperedges from document {doc_id}")
+            # Chunk every document that still needs processing
+            source_docs = [doc.metadata.get('source', doc.doc_id) if doc.metadata else doc.doc_id for doc in documents]
+            processed_sources = self._processed_source_documents(source_docs)
+            
+            pending = []
+            for doc, source_doc in zip(documents, source_docs):
+                # Check if already processed
+                if source_doc in processed_sources:
+                    logger.debug(f"Document {source_doc} already processed, skipping")
+                    continue
+                pending.append((doc, source_doc, self._chunk_text(doc.content)))
+            
+            # Extract hyperedges from all chunks of all documents concurrently
+            all_chunks = [chunk for _, _, chunks in pending for chunk in chunks]
+            extracted = await extract_chunks_with_cache(
+                all_chunks, self._hyperedge_model(), self._hyperedge_prompt_version(),
+                self._aextract_hyperedges_with_llm, self.extraction_concurrency
+            )
+            
+            offset = 0
+            for doc, source_doc, chunks in pending:
+                logger.debug(f"Processing document: {doc.doc_id}")
+                
+                # Hyperedges are written in bulk per document
+                document_hyperedges = []
+                for chunk_idx, hyperedges in enumerate(extracted[offset:offset + len(chunks)]):
+                    logger.info(f"Extracted {len(hyperedges)} hyperedges from chunk {chunk_idx}")
+                    document_hyperedges.extend(hyperedges)
+                offset += len(chunks)
+                
+                total_hyperedges = self._store_hyperedges(document_hyperedges, source_doc)
+                logger.info(f"Stored {total_hyperedges} hyperedges from document {doc.doc_id}")
+            
+            # Embed all hyperedges still missing an embedding (including earlier runs)
+            self._embed_new_hyperedges()
+            self.store.flush()
             
             logger.info(f"Successfully indexed {len(documents)} documents in hypergraph")
             return True
@@ -1743,47 +1696,28 @@ Text:
             logger.error(f"Failed to index documents: {e}")
             return False
     
-    def _is_document_processed(self, session, source_doc: str) -> bool:
-        """Check if document has been processed"""
+    def _processed_source_documents(self, source_docs: List[str]) -> set:
+        """Get the subset of source documents that already have hyperedges, with a single lookup"""
         try:
-            result = session.run(
-                "MATCH (he:HyperEdge {source_document: $source_doc}) RETURN COUNT(he) AS count",
-                source_doc=source_doc
-            )
-            return result.single()["count"] > 0
+            return self.store.processed_source_documents(source_docs)
         except Exception:
-            return False
+            return set()
+    
+    def _is_document_processed(self, source_doc: str) -> bool:
+        """Check if document has been processed"""
+        return source_doc in self._processed_source_documents([source_doc])
     
     def get_hypergraph_stats(self) -> Dict[str, Any]:
         """Get hypergraph statistics"""
         try:
-            with self.driver.session() as session:
-                # Count hyperedges
-                result = session.run("MATCH (he:HyperEdge) RETURN COUNT(he) AS count")
-                hyperedge_count = result.single()["count"]
-                
-                # Count entities
-                result = session.run("MATCH (e:HyperEntity) RETURN COUNT(e) AS count")
-                entity_count = result.single()["count"]
-                
-                # Average entities per hyperedge
-                result = session.run("MATCH (he:HyperEdge) RETURN AVG(he.entity_count) AS avg")
-                avg_entities = result.single()["avg"] or 0
-                
-                # Count unique documents
-                result = session.run("MATCH (he:HyperEdge) RETURN COUNT(DISTINCT he.source_document) AS count")
-                doc_count = result.single()["count"]
-                
-                return {
-                    'hyperedge_count': hyperedge_count,
-                    'entity_count': entity_count,
-                    'avg_entities_per_hyperedge': avg_entities,
-                    'unique_documents': doc_count,
-                    'retrieval_method': self.retrieval_method,
-                    'similarity_threshold': self.similarity_threshold,
-                    'max_depth': self.max_depth,
-                    'min_hyperedge_entities': self.min_hyperedge_entities
-                }
+            return {
+                **self.store.get_stats(),
+                'retrieval_method': self.retrieval_method,
+                'similarity_threshold': self.similarity_threshold,
+                'max_depth': self.max_depth,
+                'min_hyperedge_entities': self.min_hyperedge_entities,
+                'graph_store': self.store_backend
+            }
         except Exception as e:
             logger.error(f"Failed to get hypergraph stats: {e}")
             return {}
@@ -1791,35 +1725,15 @@ Text:
     def get_sample_hyperedges(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get sample hyperedges"""
         try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (e:HyperEntity)-[:MEMBER_OF]->(he:HyperEdge)
-                    RETURN he.type AS type, 
-                           he.description AS description,
-                           collect(e.name) AS entities,
-                           he.entity_count AS entity_count
-                    ORDER BY he.entity_count DESC
-                    LIMIT $limit
-                    """, limit=limit)
-                
-                hyperedges = []
-                for record in result:
-                    hyperedges.append({
-                        'type': record['type'],
-                        'description': record['description'],
-                        'entities': record['entities'],
-                        'entity_count': record['entity_count']
-                    })
-                
-                return hyperedges
+            return self.store.get_sample_hyperedges(limit)
         except Exception as e:
             logger.error(f"Failed to get sample hyperedges: {e}")
             return []
     
     def __del__(self):
-        """Close Neo4j driver connection"""
-        if self.driver:
-            self.driver.close()
+        """Close the hypergraph store"""
+        if getattr(self, "store", None):
+            self.store.close()
 
 
 class CompleteHybrid(RetrievalComponent):
@@ -1835,6 +1749,7 @@ class CompleteHybrid(RetrievalComponent):
     def _setup_retrievers(self):
         """Setup retrievers"""
         self.retrievers = []
+        self.retriever_names = []
         for retrieval_method in self.retrieval_methods:
             if retrieval_method == "vector":
                 self.retrievers.append(SimpleVectorRAG(self.config))
@@ -1844,27 +1759,39 @@ class CompleteHybrid(RetrievalComponent):
                 self.retrievers.append(GraphRAG(self.config))
             elif retrieval_method == "hypergraph":
                 self.retrievers.append(HyperGraphRAG(self.config))
+            else:
+                logger.warning(f"Unknown retrieval method: {retrieval_method}")
+                continue
+            self.retriever_names.append(retrieval_method)
 
     async def retrieve(self, query: Query, k: Optional[int] = None) -> RetrievalResult:
         """Retrieve documents using complete hybrid retrieval"""
         k = k or self.config.get("top_k", 10)
-        results_with_tokens = []
-        results = []
-        for retriever in self.retrievers:
-            r = await retriever.retrieve(query, k)
-            results_with_tokens.append(r)
-            results.append(HybridUtils.convert_documents_to_results(r.get("documents",[])))
+        # All sub-retrievers run at once; slow or failing ones are left out of the fusion
+        results_with_tokens = await retrieve_concurrently(
+            list(zip(self.retriever_names, self.retrievers)),
+            query,
+            k,
+            timeouts=[get_retriever_timeout(self.config, name) for name in self.retriever_names]
+        )
+        method_names, results_with_tokens, weights = select_successful_results(
+            self.retriever_names, results_with_tokens, self.config.get("weights", None)
+        )
+        if not results_with_tokens:
+            logger.error("Complete hybrid retrieval failed: all sub-retrievers failed")
+            return RetrievalResult(documents=[], embedding_token_count=0.0, llm_token_count={})
+        results = [HybridUtils.convert_documents_to_results(r.get("documents",[])) for r in results_with_tokens]
         # Combine results based on the configured method
         if self.combination_method == "convex_combination":
-            combined_results = self._combine_with_convex_combination(results)
+            combined_results = self._combine_with_convex_combination(results, method_names, weights)
         elif self.combination_method == "reciprocal_rank_fusion":
-            combined_results = self._combine_with_rrf(results)
+            combined_results = self._combine_with_rrf(results, method_names)
         elif self.combination_method == "borda_count":
-            combined_results = self._combine_with_borda_count(results)
+            combined_results = self._combine_with_borda_count(results, method_names)
         elif self.combination_method == "simply":
             combined_results = HybridUtils.combine_simply(
                 results_list=results,
-                method_names=self.retrieval_methods,
+                method_names=method_names,
                 normalization_method=self.normalization_method
             )
         else:
@@ -1874,7 +1801,7 @@ class CompleteHybrid(RetrievalComponent):
         return RetrievalResult(
             documents=final_results,
             embedding_token_count=sum(result.get("embedding_token_count", 0) for result in results_with_tokens),
-            llm_token_count={model_name: {"total": sum(sum(result.get("llm_token_count", {}).values()) if result.get("llm_token_count") else 0 for result in results_with_tokens)} for model_name in self.retrieval_methods}
+            llm_token_count={model_name: {"total": sum(sum(result.get("llm_token_count", {}).values()) if result.get("llm_token_count") else 0 for result in results_with_tokens)} for model_name in method_names}
         )
     
     async def index_documents(self, documents: List[Document]) -> bool:
@@ -1887,15 +1814,19 @@ class CompleteHybrid(RetrievalComponent):
 
     def _combine_with_convex_combination(
         self, 
-        results_list: List[List[Dict[str, Any]]]
+        results_list: List[List[Dict[str, Any]]],
+        method_names: Optional[List[str]] = None,
+        weights: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Combine results using convex combination"""
         try:
+            method_names = method_names or self.retriever_names
             return HybridUtils.combine_with_convex_combination(
                 results_list=results_list,
-                method_names=self.retrieval_methods,
-                weights=[1/len(self.retrieval_methods)] * len(self.retrieval_methods) if self.config.get("weights", None) is None else self.config.get("weights"), 
+                method_names=method_names,
+                weights=[1/len(method_names)] * len(method_names) if weights is None else weights, 
                 normalization_method=self.config.get("normalization_method", "minmax"),
+                include_diagnostics=self.config.get("debug_mode", None),
                 )
         except Exception as e:
             logger.error(f"Convex combination failed: {e}")
@@ -1903,13 +1834,15 @@ class CompleteHybrid(RetrievalComponent):
     
     def _combine_with_rrf(
         self, 
-        results_list: List[List[Dict[str, Any]]]
+        results_list: List[List[Dict[str, Any]]],
+        method_names: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Combine results using Reciprocal Rank Fusion"""
         try:
             return HybridUtils.combine_with_rrf(
                 results_list=results_list,
-                method_names=self.retrieval_methods,
+                method_names=method_names or self.retriever_names,
+                include_diagnostics=self.config.get("debug_mode", None),
             )
             
         except Exception as e:
@@ -1918,13 +1851,15 @@ class CompleteHybrid(RetrievalComponent):
     
     def _combine_with_borda_count(
         self, 
-        results_list: List[List[Dict[str, Any]]]
+        results_list: List[List[Dict[str, Any]]],
+        method_names: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Combine results using Borda count"""
         try:
             return HybridUtils.combine_with_borda_count(
                 results_list=results_list,
-                method_names=self.retrieval_methods,
+                method_names=method_names or self.retriever_names,
+                include_diagnostics=self.config.get("debug_mode", None),
             )
         except Exception as e:
             logger.error(f"Borda count combination failed: {e}")
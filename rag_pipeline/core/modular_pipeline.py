@@ -8,7 +8,7 @@ and result aggregation.
 
 import asyncio
 import logging
-import time, os, json
+import time, os, json, hashlib
 from typing import List, Dict, Any, Optional, Type, Tuple
 from dataclasses import asdict
 from copy import deepcopy
@@ -17,7 +17,7 @@ from .modular_framework import (
     PreEmbeddingComponent, QueryExpansionComponent, RetrievalComponent,
     PassageAugmentComponent, PassageRerankComponent, PassageFilterComponent,
     PassageCompressComponent, PromptMakerComponent, GeneratorComponent,
-    PostGenerationComponent, Document, Query, Context, RAGExecutionResult
+    PostGenerationComponent, Document, Query, Context, RAGExecutionResult, IndexHandle
 )
 from .modular_configs import ModularRAGConfig
 from .modular_implementations import COMPONENT_REGISTRY
@@ -34,10 +34,15 @@ from rag_pipeline.core.modular_implementations.generator import GeneratorResult
 from rag_pipeline.core.modular_implementations.post_generation import PostGenerationResult
 from .dataset import RAGDataset
 from .evaluator import RAGEvaluator
+from rag_pipeline.util.cache.stage_cache import StageCache, get_stage_cache
 from rag_pipeline.core.models import RetrievalResult, GenerationResult, RAGMetrics
 
 logger = logging.getLogger(__name__)
 
+# Prepared retrieval indexes shared by every pipeline in the process,
+# keyed by (dataset hash, retrieval config fingerprint)
+_INDEX_HANDLES: Dict[Tuple[str, str], IndexHandle] = {}
+
 
 class ModularComponentFactory:
     """Factory for creating modular RAG components"""
@@ -102,6 +107,11 @@ class ModularRAGPipeline:
         # self.evaluator = RAGEvaluator(global_config if global_config else config_dict)  # REMOVE THIS LINE
         # Initialize components
         self.components = {}
+        self.index_handle: Optional[IndexHandle] = None
+        self.stage_cache: Optional[StageCache] = None
+        if global_config and global_config.cache_enabled:
+            # Memory only unless a cache_dir opts into the persistent disk tier
+            self.stage_cache = get_stage_cache(global_config.cache_dir, global_config.stage_cache_max_entries)
         self._initialize_components()
         # Setup logging
         if global_config and global_config.enable_logging:
@@ -145,13 +155,207 @@ class ModularRAGPipeline:
                 extras[k] = result.get(k)
         return (main_output, extras) if extras else main_output
 
+    async def _run_stage(self, stage: str, upstream_key: str, query: str, compute) -> Tuple[Any, float, str]:
+        """
+        Run a single stage through the stage cache.
+        
+        Args:
+            stage: Category name of the stage in config_dict
+            upstream_key: Cache key of the previous stage (or the corpus hash for the first one)
+            query: Original query string
+            compute: Zero-argument callable returning the awaitable stage result
+            
+        Returns:
+            Tuple of (stage result, stage time, cache key of this stage)
+        """
+        stage_key = StageCache.make_key(stage, self._config_fingerprint(self.config_dict[stage]), upstream_key, query)
+        if self.stage_cache is not None:
+            cached = self.stage_cache.get(stage_key)
+            if cached is not None:
+                logger.debug(f"Stage cache hit for {stage}")
+                # Report the originally measured time so that cached combos keep comparable latencies
+                return cached["result"], cached["elapsed"], stage_key
+        
+        step_start = time.time()
+        result = await compute()
+        elapsed = time.time() - step_start
+        
+        if self.stage_cache is not None and self._is_cacheable(result):
+            self.stage_cache.put(stage_key, {"result": result, "elapsed": elapsed})
+        return result, elapsed, stage_key
+
+    @staticmethod
+    def _is_cacheable(result: Any) -> bool:
+        """Components swallow their errors and return empty outputs; never persist those"""
+        return isinstance(result, dict) and any(result.get(k) for k in ("documents", "query", "text"))
+
+    async def _run_stage_batch(self, stage: str, active: List[int], queries: List[str], upstream_keys: List[str],
+                               timing_infos: List[Dict[str, float]], timing_key: str, compute_batch) -> Dict[int, Any]:
+        """
+        Run a single stage for the active queries of a batch through the stage cache.
+        
+        Args:
+            stage: Category name of the stage in config_dict
+            active: Indices of the queries that go through this stage
+            queries: Original query strings of the whole batch
+            upstream_keys: Cache key of the previous stage per query, updated in place
+            timing_infos: Timing dict per query; timing_key is set for the active queries
+            timing_key: Timing entry of this stage
+            compute_batch: Callable taking the indices of the cache misses and returning an
+                awaitable list with one stage result per index
+            
+        Returns:
+            Dict mapping query index to its stage result
+        """
+        if not active:
+            return {}
+        
+        fingerprint = self._config_fingerprint(self.config_dict[stage])
+        stage_keys = {i: StageCache.make_key(stage, fingerprint, upstream_keys[i], queries[i]) for i in active}
+        results = {}
+        missing = []
+        for i in active:
+            cached = self.stage_cache.get(stage_keys[i]) if self.stage_cache is not None else None
+            if cached is not None:
+                results[i] = cached["result"]
+                timing_infos[i][timing_key] = cached["elapsed"]
+            else:
+                missing.append(i)
+        
+        if missing:
+            step_start = time.time()
+            computed = await compute_batch(missing)
+            # Every query of the batch is charged an equal share of the batch time
+            elapsed = (time.time() - step_start) / len(missing)
+            for i, result in zip(missing, computed):
+                results[i] = result
+                timing_infos[i][timing_key] = elapsed
+                if self.stage_cache is not None and self._is_cacheable(result):
+                    self.stage_cache.put(stage_keys[i], {"result": result, "elapsed": elapsed})
+        
+        for i in active:
+            upstream_keys[i] = stage_keys[i]
+        return results
+
+    @staticmethod
+    async def _gather_limited(coroutines: List[Any], max_concurrency: int) -> List[Any]:
+        """Await coroutines concurrently with at most max_concurrency in flight, keeping their order"""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def _bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+        
+        return await asyncio.gather(*[_bounded(coroutine) for coroutine in coroutines])
+
+    def _uses_expanded_retrieval(self, processed_query: Query) -> bool:
+        """Whether the query is retrieved through its expanded queries"""
+        return not (
+            "query_expansion" not in self.components
+            or self.config_dict["query_expansion"].technique == "none"
+            or processed_query.expanded_queries is None
+            or len(processed_query.expanded_queries) <= 1
+        )
+
+    async def _retrieve(self, processed_query: Query) -> RetrievalComponentResult:
+        """Retrieve documents for the query, fusing the results of expanded queries if there are any"""
+        if not self._uses_expanded_retrieval(processed_query):
+            return await self.components["retrieval"].retrieve(
+                processed_query, 
+                k=self.config_dict["retrieval"].top_k
+            )
+
+        retrieval_results: List[RetrievalComponentResult] = await self.components["retrieval"].retrieve_batch(
+            processed_query.expanded_queries,
+            k=self.config_dict["query_expansion"].excessive_k,
+            max_concurrency=self.config_dict["query_expansion"].retrieval_concurrency
+        )
+        return self._fuse_expanded_results(processed_query, retrieval_results)
+
+    async def _retrieve_batch(self, processed_queries: List[Query], max_concurrency: int) -> List[RetrievalComponentResult]:
+        """
+        Retrieve documents for several queries with one retrieve_batch call per retrieval mode.
+        
+        Queries without expansion are retrieved together; the expanded queries of all other
+        queries are flattened into a single batch and fused per query afterwards.
+        """
+        retrieval = self.components["retrieval"]
+        results: List[Optional[RetrievalComponentResult]] = [None] * len(processed_queries)
+        
+        plain = [i for i, query in enumerate(processed_queries) if not self._uses_expanded_retrieval(query)]
+        if plain:
+            plain_results = await retrieval.retrieve_batch(
+                [processed_queries[i] for i in plain],
+                k=self.config_dict["retrieval"].top_k,
+                max_concurrency=max_concurrency
+            )
+            for i, result in zip(plain, plain_results):
+                results[i] = result
+        
+        expanded = [i for i, query in enumerate(processed_queries) if self._uses_expanded_retrieval(query)]
+        if expanded:
+            flat_results = await retrieval.retrieve_batch(
+                [expanded_query for i in expanded for expanded_query in processed_queries[i].expanded_queries],
+                k=self.config_dict["query_expansion"].excessive_k,
+                max_concurrency=self.config_dict["query_expansion"].retrieval_concurrency
+            )
+            offset = 0
+            for i in expanded:
+                num_expanded = len(processed_queries[i].expanded_queries)
+                results[i] = self._fuse_expanded_results(processed_queries[i], flat_results[offset:offset + num_expanded])
+                offset += num_expanded
+        
+        return results
+
+    def _fuse_expanded_results(self, processed_query: Query, retrieval_results: List[RetrievalComponentResult]) -> RetrievalComponentResult:
+        """Fuse the retrieval results of the expanded queries of a query"""
+        from rag_pipeline.util.retrieval_utils.combination_utils import HybridUtils
+        results_list = []
+        embedding_token_count = 0.0
+        llm_token_count = {}
+        for retrieval_result in retrieval_results:
+            results_list.append(HybridUtils.convert_documents_to_results(retrieval_result.get('documents', [])))
+            embedding_token_count += retrieval_result.get('embedding_token_count', 0.0)
+            for model, counts in retrieval_result.get('llm_token_count', {}).items():
+                model_counts = llm_token_count.setdefault(model, {"in": 0.0, "out": 0.0})
+                model_counts["in"] += counts.get("in", 0.0)
+                model_counts["out"] += counts.get("out", 0.0)
+        combination_method = self.config_dict["query_expansion"].combination_method
+        method_names = [f"retrieval_query_{i}" for i in range(len(processed_query.expanded_queries))]
+        if combination_method == "convex_combination":
+            weights = [1/len(processed_query.expanded_queries) for _ in range(len(processed_query.expanded_queries))]
+            retrieved_documents = HybridUtils.combine_with_convex_combination(
+                results_list=results_list,
+                method_names=method_names,
+                weights=weights,
+                normalization_method=self.config_dict["query_expansion"].normalization_method
+            )
+        elif combination_method == "reciprocal_rank_fusion":
+            retrieved_documents = HybridUtils.combine_with_rrf(
+                results_list=results_list,
+                method_names=method_names
+            )
+        elif combination_method == "borda_count":
+            retrieved_documents = HybridUtils.combine_with_borda_count(
+                results_list=results_list,
+                method_names=method_names,
+            )
+        else:
+            raise ValueError(f"Invalid combination method: {combination_method}")
+        return RetrievalComponentResult(
+            documents=HybridUtils.convert_to_documents(retrieved_documents),
+            embedding_token_count=embedding_token_count,
+            llm_token_count=llm_token_count
+        )
+
     async def execute_pipeline(self, query: str, documents: Optional[List[Document]] = None, timing_info: Dict[str, float] = {}, token_counts: Dict[str, float] = {}) -> RAGExecutionResult:
         """
         Execute the full RAG pipeline for a single query.
         
         Args:
             query: Input query string
-            documents: Optional list of documents to index/search (if None, uses existing index)
+            documents: Optional list of documents to search; they are only indexed if
+                prepare_retrieval has not been run for this pipeline yet
             
         Returns:
             RAGExecutionResult with all intermediate and final results
@@ -160,15 +364,21 @@ class ModularRAGPipeline:
         try:
             embedding_token_counts = token_counts.get("embedding_token_counts", {})
             llm_token_counts = token_counts.get("llm_token_counts", {})
+            if documents and "retrieval" in self.components and self.index_handle is None:
+                await self.prepare_retrieval(documents)
+            # Stage outputs are memoized on the chain of upstream stage keys, rooted at the indexed corpus
+            upstream_key = self.index_handle.dataset_hash if self.index_handle else ""
             # Step 2: Query expansion/refinement
             if "query_expansion" in self.components:
-                step_start = time.time()
-                query_expansion_result: QueryExpansionResult = await self.components["query_expansion"].expand_query(query)
+                query_expansion_result: QueryExpansionResult
+                query_expansion_result, timing_info["query_expansion_time"], upstream_key = await self._run_stage(
+                    "query_expansion", upstream_key, query,
+                    lambda: self.components["query_expansion"].expand_query(query)
+                )
                 processed_query = self._parse_component_result(
                     query_expansion_result, "query_expansion", embedding_token_counts, llm_token_counts,
                     main_output_key='query'
                 )
-                timing_info["query_expansion_time"] = time.time() - step_start
                 logger.debug(f"Query expansion completed in {timing_info['query_expansion_time']:.3f}s")
             else:
                 processed_query = Query(original_text=query, processed_text=query)
@@ -177,56 +387,16 @@ class ModularRAGPipeline:
             # Step 3: Retrieval
             retrieved_documents = []
             if "retrieval" in self.components:
-                step_start = time.time()
-                if documents:
-                    await self.components["retrieval"].index_documents(documents)
-                if "query_expansion" not in self.components or self.config_dict["query_expansion"].technique == "none" or processed_query.expanded_queries is None or len(processed_query.expanded_queries) <= 1:
-                    retrieval_result: RetrievalComponentResult = await self.components["retrieval"].retrieve(
-                        processed_query, 
-                        k=self.config_dict["retrieval"].top_k
-                    )
-                    retrieved_documents = self._parse_component_result(
-                        retrieval_result, "retrieval", embedding_token_counts, llm_token_counts,
-                        main_output_key='documents'
-                    )
-                else:
-                    from rag_pipeline.util.retrieval_utils.combination_utils import HybridUtils
-                    results_list = []
-                    for expanded_query in processed_query.expanded_queries:
-                        retrieval_result: RetrievalComponentResult = await self.components["retrieval"].retrieve(
-                            expanded_query, 
-                            k=self.config_dict["query_expansion"].excessive_k
-                        )
-                        parsed_result = self._parse_component_result(
-                            retrieval_result, "retrieval", embedding_token_counts, llm_token_counts,
-                            main_output_key='documents'
-                        )
-                        results_list.append(HybridUtils.convert_documents_to_results(parsed_result))
-                    combination_method = self.config_dict["query_expansion"].combination_method
-                    if combination_method == "convex_combination":
-                        weights = [1/len(processed_query.expanded_queries) for _ in range(len(processed_query.expanded_queries))]
-                        retrieved_documents = HybridUtils.combine_with_convex_combination(
-                            results_list=results_list,
-                            method_names=[f"retrieval_query_{i}" for i in range(len(processed_query.expanded_queries))],
-                            weights=weights,
-                            normalization_method=self.config_dict["query_expansion"].normalization_method
-                        )
-                    elif combination_method == "reciprocal_rank_fusion":
-                        retrieved_documents = HybridUtils.combine_with_rrf(
-                            results_list=results_list,
-                            method_names=[f"retrieval_query_{i}" for i in range(len(processed_query.expanded_queries))]
-                        )
-                    elif combination_method == "borda_count":
-                        retrieved_documents = HybridUtils.combine_with_borda_count(
-                            results_list=results_list,
-                            method_names=[f"retrieval_query_{i}" for i in range(len(processed_query.expanded_queries))],
-                        )
-                    else:
-                        retrieved_documents = results_list[0]
-                        raise ValueError(f"Invalid combination method: {combination_method}")
-                    retrieved_documents = HybridUtils.convert_to_documents(retrieved_documents)
+                retrieval_result: RetrievalComponentResult
+                retrieval_result, timing_info["retrieval_time"], upstream_key = await self._run_stage(
+                    "retrieval", upstream_key, query,
+                    lambda: self._retrieve(processed_query)
+                )
+                retrieved_documents = self._parse_component_result(
+                    retrieval_result, "retrieval", embedding_token_counts, llm_token_counts,
+                    main_output_key='documents'
+                )
                 logger.debug(f"Retrieved documents: {retrieved_documents}")
-                timing_info["retrieval_time"] = time.time() - step_start
                 logger.debug(f"Retrieval completed in {timing_info['retrieval_time']:.3f}s, found {len(retrieved_documents)} documents")
             else:
                 timing_info["retrieval_time"] = 0.0
@@ -236,26 +406,30 @@ class ModularRAGPipeline:
                 logger.debug(f"Retrieved documents after conversion: {retrieved_documents[0]}")
             # Step 4: Passage reranking (can have multiple rerankers)
             if "passage_rerank" in self.components and retrieved_documents:
-                step_start = time.time()
-                passage_rerank_result: PassageRerankResult = await self.components["passage_rerank"].rerank_passages(retrieved_documents, processed_query)
+                passage_rerank_result: PassageRerankResult
+                passage_rerank_result, timing_info["passage_rerank_time"], upstream_key = await self._run_stage(
+                    "passage_rerank", upstream_key, query,
+                    lambda: self.components["passage_rerank"].rerank_passages(retrieved_documents, processed_query)
+                )
                 retrieved_documents = self._parse_component_result(
                     passage_rerank_result, "passage_rerank", embedding_token_counts, llm_token_counts,
                     main_output_key='documents'
                 )
-                timing_info["passage_rerank_time"] = time.time() - step_start
                 logger.debug(f"Passage reranking completed in {timing_info['passage_rerank_time']:.3f}s")
             else:
                 timing_info["passage_rerank_time"] = 0.0
             
             # Step 5: Passage filtering (can have multiple filters)
             if "passage_filter" in self.components and retrieved_documents:
-                step_start = time.time()
-                passage_filter_result: PassageFilterResult = await self.components["passage_filter"].filter_passages(retrieved_documents, processed_query)
+                passage_filter_result: PassageFilterResult
+                passage_filter_result, timing_info["passage_filter_time"], upstream_key = await self._run_stage(
+                    "passage_filter", upstream_key, query,
+                    lambda: self.components["passage_filter"].filter_passages(retrieved_documents, processed_query)
+                )
                 retrieved_documents = self._parse_component_result(
                     passage_filter_result, "passage_filter", embedding_token_counts, llm_token_counts,
                     main_output_key='documents'
                 )
-                timing_info["passage_filter_time"] = time.time() - step_start
                 logger.debug(f"Passage filtering completed in {timing_info['passage_filter_time']:.3f}s, kept {len(retrieved_documents)} documents")
             else:
                 timing_info["passage_filter_time"] = 0.0
@@ -264,15 +438,15 @@ class ModularRAGPipeline:
 
             final_documents = deepcopy(retrieved_documents)
             if "passage_augment" in self.components and final_documents:
-                step_start = time.time()
-                passage_augment_result: PassageAugmentResult = await self.components["passage_augment"].augment_passages(
-                    final_documents, processed_query
+                passage_augment_result: PassageAugmentResult
+                passage_augment_result, timing_info["passage_augment_time"], upstream_key = await self._run_stage(
+                    "passage_augment", upstream_key, query,
+                    lambda: self.components["passage_augment"].augment_passages(final_documents, processed_query)
                 )
                 final_documents = self._parse_component_result(
                     passage_augment_result, "passage_augment", embedding_token_counts, llm_token_counts,
                     main_output_key='documents'
                 )
-                timing_info["passage_augment_time"] = time.time() - step_start
                 logger.debug(f"Passage augmentation completed in {timing_info['passage_augment_time']:.3f}s")
             else:
                 timing_info["passage_augment_time"] = 0.0
@@ -280,15 +454,15 @@ class ModularRAGPipeline:
 
             # Step 7: Passage compression
             if "passage_compress" in self.components and final_documents:
-                step_start = time.time()
-                passage_compress_result: PassageCompressResult = await self.components["passage_compress"].compress_passages(
-                    final_documents, processed_query
+                passage_compress_result: PassageCompressResult
+                passage_compress_result, timing_info["passage_compress_time"], upstream_key = await self._run_stage(
+                    "passage_compress", upstream_key, query,
+                    lambda: self.components["passage_compress"].compress_passages(final_documents, processed_query)
                 )
                 final_documents = self._parse_component_result(
                     passage_compress_result, "passage_compress", embedding_token_counts, llm_token_counts,
                     main_output_key='documents'
                 )
-                timing_info["passage_compress_time"] = time.time() - step_start
                 logger.debug(f"Passage compression completed in {timing_info['passage_compress_time']:.3f}s")
             else:
                 timing_info["passage_compress_time"] = 0.0
@@ -296,33 +470,38 @@ class ModularRAGPipeline:
             # Step 8: Prompt making
             prompt = ""
             if "prompt_maker" in self.components:
-                step_start = time.time()
-                prompt_maker_result: PromptMakerResult = await self.components["prompt_maker"].make_prompt(processed_query, final_documents)
+                prompt_maker_result: PromptMakerResult
+                prompt_maker_result, timing_info["prompt_maker_time"], upstream_key = await self._run_stage(
+                    "prompt_maker", upstream_key, query,
+                    lambda: self.components["prompt_maker"].make_prompt(processed_query, final_documents)
+                )
                 prompt = self._parse_component_result(
                     prompt_maker_result, "prompt_maker", embedding_token_counts, llm_token_counts,
                     main_output_key='text'
                 )
-                timing_info["prompt_maker_time"] = time.time() - step_start
                 logger.debug(f"Prompt making completed in {timing_info['prompt_maker_time']:.3f}s")
             else:
                 timing_info["prompt_maker_time"] = 0.0
             
             # Step 9: Generation
             generated_answer = ""
-            step_start = time.time()
             if "generator" in self.components:
                 if prompt:
-                    gen_result: GeneratorResult = await self.components["generator"].generate(prompt, processed_query)
-                    if isinstance(gen_result, dict):
-                                            generated_answer = self._parse_component_result(
-                        gen_result, "generation", embedding_token_counts, llm_token_counts,
-                        main_output_key='text'
+                    gen_result: GeneratorResult
+                    gen_result, timing_info["generation_time"], upstream_key = await self._run_stage(
+                        "generator", upstream_key, query,
+                        lambda: self.components["generator"].generate(prompt, processed_query)
                     )
+                    if isinstance(gen_result, dict):
+                        generated_answer = self._parse_component_result(
+                            gen_result, "generation", embedding_token_counts, llm_token_counts,
+                            main_output_key='text'
+                        )
                     else:
                         generated_answer = gen_result if isinstance(gen_result, str) else ""
                 else:
                     logger.warning("Prompt is empty, skipping generation step.")
-                timing_info["generation_time"] = time.time() - step_start
+                    timing_info["generation_time"] = 0.0
                 logger.debug(f"Generation completed in {timing_info['generation_time']:.3f}s")
             else:
                 timing_info["generation_time"] = 0.0
@@ -330,16 +509,16 @@ class ModularRAGPipeline:
             # Step 10: Post-generation
             final_answer = generated_answer
             if "post_generation" in self.components and generated_answer:
-                step_start = time.time()
                 context = Context(documents=final_documents, formatted_text=prompt)
-                post_generation_result: PostGenerationResult = await self.components["post_generation"].post_process(
-                    generated_answer, processed_query, context
+                post_generation_result: PostGenerationResult
+                post_generation_result, timing_info["post_generation_time"], upstream_key = await self._run_stage(
+                    "post_generation", upstream_key, query,
+                    lambda: self.components["post_generation"].post_process(generated_answer, processed_query, context)
                 )
                 final_answer = self._parse_component_result(
                     post_generation_result, "post_generation", embedding_token_counts, llm_token_counts,
                     main_output_key='text'
                 )
-                timing_info["post_generation_time"] = time.time() - step_start
                 logger.debug(f"Post-generation completed in {timing_info['post_generation_time']:.3f}s")
             else:
                 timing_info["post_generation_time"] = 0.0
@@ -380,6 +559,225 @@ class ModularRAGPipeline:
             )
     
 
+    async def execute_pipeline_batch(self, queries: List[str], documents: Optional[List[Document]] = None,
+                                     timing_info: Optional[Dict[str, float]] = None, token_counts: Optional[Dict[str, Any]] = None,
+                                     max_concurrency: int = 4) -> List[RAGExecutionResult]:
+        """
+        Execute the full RAG pipeline for several queries, one stage at a time.
+        
+        Every stage processes the whole batch before the next one starts: retrieval
+        embeds all queries in one call and searches them with one Qdrant batch search
+        (or one BM25 pass), cross-encoder reranking scores all (query, passage) pairs in
+        one predict call and generation runs concurrently. Stages without a batch form
+        run their per-query calls concurrently. Each query gets the same result as from
+        execute_pipeline; its stage times are its share of the batch time.
+        
+        Args:
+            queries: Input query strings
+            documents: Optional list of documents to search; they are only indexed if
+                prepare_retrieval has not been run for this pipeline yet
+            timing_info: Initial timing info (e.g. pre-embedding), copied for every query
+            token_counts: Initial token counts (e.g. pre-embedding), copied for every query
+            max_concurrency: Maximum number of concurrent per-query calls
+            
+        Returns:
+            List of RAGExecutionResult, in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        try:
+            if documents and "retrieval" in self.components and self.index_handle is None:
+                await self.prepare_retrieval(documents)
+            
+            everyone = list(range(len(queries)))
+            timing_keys = [
+                "query_expansion_time", "retrieval_time", "passage_rerank_time", "passage_filter_time",
+                "passage_augment_time", "passage_compress_time", "prompt_maker_time", "generation_time",
+                "post_generation_time"
+            ]
+            timing_infos = [{**deepcopy(timing_info or {}), **{key: 0.0 for key in timing_keys}} for _ in queries]
+            embedding_token_counts = [deepcopy((token_counts or {}).get("embedding_token_counts", {})) for _ in queries]
+            llm_token_counts = [deepcopy((token_counts or {}).get("llm_token_counts", {})) for _ in queries]
+            # Stage outputs are memoized on the chain of upstream stage keys, rooted at the indexed corpus
+            upstream_keys = [self.index_handle.dataset_hash if self.index_handle else ""] * len(queries)
+            
+            def run_stage(stage: str, active: List[int], timing_key: str, compute_batch):
+                return self._run_stage_batch(stage, active, queries, upstream_keys, timing_infos, timing_key, compute_batch)
+            
+            def limited(coroutines: List[Any]):
+                return self._gather_limited(coroutines, max_concurrency)
+            
+            # Step 2: Query expansion/refinement
+            processed_queries = [Query(original_text=query, processed_text=query) for query in queries]
+            if "query_expansion" in self.components:
+                component = self.components["query_expansion"]
+                stage_results = await run_stage(
+                    "query_expansion", everyone, "query_expansion_time",
+                    lambda idx: limited([component.expand_query(queries[i]) for i in idx])
+                )
+                for i, stage_result in stage_results.items():
+                    processed_queries[i] = self._parse_component_result(
+                        stage_result, "query_expansion", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='query'
+                    )
+            
+            # Step 3: Retrieval
+            retrieved_documents: List[List[Document]] = [[] for _ in queries]
+            if "retrieval" in self.components:
+                stage_results = await run_stage(
+                    "retrieval", everyone, "retrieval_time",
+                    lambda idx: self._retrieve_batch([processed_queries[i] for i in idx], max_concurrency)
+                )
+                for i, stage_result in stage_results.items():
+                    retrieved_documents[i] = self._parse_component_result(
+                        stage_result, "retrieval", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='documents'
+                    )
+            for i in everyone:
+                docs = retrieved_documents[i]
+                if docs and (docs[0].metadata.get("hype_doc_id", None) or docs[0].metadata.get("pdr_doc_id", None)):
+                    retrieved_documents[i] = self.hyped_or_pdr_docs_to_docs(docs)
+            
+            # Step 4: Passage reranking
+            if "passage_rerank" in self.components:
+                component = self.components["passage_rerank"]
+                stage_results = await run_stage(
+                    "passage_rerank", [i for i in everyone if retrieved_documents[i]], "passage_rerank_time",
+                    lambda idx: component.rerank_passages_batch(
+                        [retrieved_documents[i] for i in idx], [processed_queries[i] for i in idx]
+                    )
+                )
+                for i, stage_result in stage_results.items():
+                    retrieved_documents[i] = self._parse_component_result(
+                        stage_result, "passage_rerank", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='documents'
+                    )
+            
+            # Step 5: Passage filtering
+            if "passage_filter" in self.components:
+                component = self.components["passage_filter"]
+                stage_results = await run_stage(
+                    "passage_filter", [i for i in everyone if retrieved_documents[i]], "passage_filter_time",
+                    lambda idx: limited([component.filter_passages(retrieved_documents[i], processed_queries[i]) for i in idx])
+                )
+                for i, stage_result in stage_results.items():
+                    retrieved_documents[i] = self._parse_component_result(
+                        stage_result, "passage_filter", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='documents'
+                    )
+            
+            # Step 6: Passage augmentation
+            final_documents = [deepcopy(docs) for docs in retrieved_documents]
+            if "passage_augment" in self.components:
+                component = self.components["passage_augment"]
+                stage_results = await run_stage(
+                    "passage_augment", [i for i in everyone if final_documents[i]], "passage_augment_time",
+                    lambda idx: limited([component.augment_passages(final_documents[i], processed_queries[i]) for i in idx])
+                )
+                for i, stage_result in stage_results.items():
+                    final_documents[i] = self._parse_component_result(
+                        stage_result, "passage_augment", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='documents'
+                    )
+            
+            # Step 7: Passage compression
+            if "passage_compress" in self.components:
+                component = self.components["passage_compress"]
+                stage_results = await run_stage(
+                    "passage_compress", [i for i in everyone if final_documents[i]], "passage_compress_time",
+                    lambda idx: limited([component.compress_passages(final_documents[i], processed_queries[i]) for i in idx])
+                )
+                for i, stage_result in stage_results.items():
+                    final_documents[i] = self._parse_component_result(
+                        stage_result, "passage_compress", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='documents'
+                    )
+            
+            # Step 8: Prompt making
+            prompts = ["" for _ in queries]
+            if "prompt_maker" in self.components:
+                component = self.components["prompt_maker"]
+                stage_results = await run_stage(
+                    "prompt_maker", everyone, "prompt_maker_time",
+                    lambda idx: limited([component.make_prompt(processed_queries[i], final_documents[i]) for i in idx])
+                )
+                for i, stage_result in stage_results.items():
+                    prompts[i] = self._parse_component_result(
+                        stage_result, "prompt_maker", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='text'
+                    )
+            
+            # Step 9: Generation
+            generated_answers = ["" for _ in queries]
+            if "generator" in self.components:
+                component = self.components["generator"]
+                with_prompt = [i for i in everyone if prompts[i]]
+                if len(with_prompt) < len(queries):
+                    logger.warning(f"Prompt is empty for {len(queries) - len(with_prompt)} queries, skipping their generation step.")
+                stage_results = await run_stage(
+                    "generator", with_prompt, "generation_time",
+                    lambda idx: component.generate_batch(
+                        [prompts[i] for i in idx], [processed_queries[i] for i in idx], max_concurrency=max_concurrency
+                    )
+                )
+                for i, gen_result in stage_results.items():
+                    if isinstance(gen_result, dict):
+                        generated_answers[i] = self._parse_component_result(
+                            gen_result, "generation", embedding_token_counts[i], llm_token_counts[i],
+                            main_output_key='text'
+                        )
+                    else:
+                        generated_answers[i] = gen_result if isinstance(gen_result, str) else ""
+            
+            # Step 10: Post-generation
+            final_answers = list(generated_answers)
+            if "post_generation" in self.components:
+                component = self.components["post_generation"]
+                stage_results = await run_stage(
+                    "post_generation", [i for i in everyone if generated_answers[i]], "post_generation_time",
+                    lambda idx: limited([
+                        component.post_process(
+                            generated_answers[i], processed_queries[i],
+                            Context(documents=final_documents[i], formatted_text=prompts[i])
+                        )
+                        for i in idx
+                    ])
+                )
+                for i, stage_result in stage_results.items():
+                    final_answers[i] = self._parse_component_result(
+                        stage_result, "post_generation", embedding_token_counts[i], llm_token_counts[i],
+                        main_output_key='text'
+                    )
+            
+            results = []
+            for i, query in enumerate(queries):
+                results.append(RAGExecutionResult(
+                    original_query=query,
+                    processed_query=processed_queries[i],
+                    retrieved_documents=retrieved_documents[i],
+                    final_documents=final_documents[i],
+                    prompt=prompts[i],
+                    generated_answer=generated_answers[i],
+                    final_answer=final_answers[i],
+                    # Latency of a query is the sum of its shares of the stage times
+                    total_time=sum(timing_infos[i][key] for key in timing_keys),
+                    **timing_infos[i],
+                    embedding_token_counts=embedding_token_counts[i],
+                    llm_token_counts=llm_token_counts[i]
+                ))
+            
+            logger.info(f"Batch pipeline execution of {len(queries)} queries completed")
+            return results
+            
+        except Exception as e:
+            # Fall back to the single-query path so that a failure stays confined to its query
+            logger.error(f"Batch pipeline execution failed, running the queries one by one: {e}")
+            return [
+                await self.execute_pipeline(query, documents, deepcopy(timing_info or {}), deepcopy(token_counts or {}))
+                for query in queries
+            ]
+
     async def save_documents(self, documents: List[Document], args: dict, path: str) -> bool:
         """Save documents as json files"""
         try:
@@ -422,13 +820,15 @@ class ModularRAGPipeline:
             save_path = os.path.join("rag_pipeline", "pre_embedding_data", f"pre_embedding-{self.config_dict['pre_embedding'].technique}")
             if os.path.exists(save_path):
                 documents, embedding_token_counts, llm_token_counts, timing_info = await self.load_documents(save_path)
+                index_handle = await self.prepare_retrieval(documents)
                 return {
                     "documents": documents,
                     "timing_info": timing_info,
                     "token_counts": {
                         "embedding_token_counts": embedding_token_counts,
                         "llm_token_counts": llm_token_counts
-                    }
+                    },
+                    "index_handle": index_handle
                 }
 
             step_start = time.time()
@@ -447,15 +847,73 @@ class ModularRAGPipeline:
             }, save_path)
         else:
             timing_info["pre_embedding_time"] = 0.0
+        index_handle = await self.prepare_retrieval(documents)
         return {
             "documents": documents,
             "timing_info": timing_info,
             "token_counts": {
                 "embedding_token_counts": embedding_token_counts,
                 "llm_token_counts": llm_token_counts
-            }
+            },
+            "index_handle": index_handle
         }
 
+    @staticmethod
+    def _documents_fingerprint(documents: List[Document]) -> str:
+        """Hash the ids and contents of a document list"""
+        hasher = hashlib.sha256()
+        for doc in documents:
+            hasher.update(str(doc.doc_id).encode("utf-8"))
+            hasher.update(b"\x00")
+            hasher.update((doc.content or "").encode("utf-8"))
+            hasher.update(b"\x01")
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _config_fingerprint(config: Any) -> str:
+        """Hash a stage config so that identical configs map to the same key"""
+        config_data = dict(config.dict() if hasattr(config, "dict") else config)
+        # The display name does not influence the stage output
+        config_data.pop("name", None)
+        payload = json.dumps(config_data, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def prepare_retrieval(self, documents: Optional[List[Document]]) -> Optional[IndexHandle]:
+        """
+        Build (or reuse) the retrieval index for the given corpus.
+
+        The indexed component is cached by dataset hash and retrieval config, so every
+        pipeline sharing the same retrieval settings reuses one index and the per-query
+        path never has to index again.
+        """
+        if not documents or "retrieval" not in self.components:
+            return None
+
+        dataset_hash = self._documents_fingerprint(documents)
+        config_fingerprint = self._config_fingerprint(self.config_dict["retrieval"])
+        key = (dataset_hash, config_fingerprint)
+
+        index_handle = _INDEX_HANDLES.get(key)
+        if index_handle is None or not index_handle.indexed:
+            component = index_handle.component if index_handle else self.components["retrieval"]
+            step_start = time.time()
+            indexed = await component.index_documents(documents)
+            logger.info(f"Prepared retrieval index {dataset_hash[:8]}/{config_fingerprint[:8]} in {time.time() - step_start:.3f}s")
+            index_handle = IndexHandle(
+                dataset_hash=dataset_hash,
+                config_fingerprint=config_fingerprint,
+                component=component,
+                indexed=bool(indexed)
+            )
+            if index_handle.indexed:
+                _INDEX_HANDLES[key] = index_handle
+        else:
+            logger.debug(f"Reusing retrieval index {dataset_hash[:8]}/{config_fingerprint[:8]}")
+
+        self.components["retrieval"] = index_handle.component
+        self.index_handle = index_handle
+        return index_handle
+
     def hyped_or_pdr_docs_to_docs(self, old_documents: List[Document]) -> List[Document]:
         """Convert hyped or pdr documents to documents"""
         new_docs = []
@@ -491,7 +949,9 @@ class ModularRAGPipeline:
 
         # Load dataset and test cases
         dataset = RAGDataset(global_config.dataset_path)
-        test_cases = dataset.get_test_cases(global_config.max_test_cases, global_config.test_case_offset)
+        test_cases = dataset.get_test_cases(
+            global_config.max_test_cases, global_config.test_case_offset, global_config.test_case_seed
+        )
         documents = dataset.get_documents()
         validation_result = dataset.validate_dataset()
         if not validation_result["valid"]:
@@ -506,6 +966,7 @@ class ModularRAGPipeline:
             logger.debug(f"  - {combo}")
 
         all_results = []
+        race_info = {}
         logger.debug(f"Technique combos: {technique_combos}")
         for combo in technique_combos:
             combo_name = ModularRAGPipeline.build_combo_name(combo)
@@ -518,92 +979,176 @@ class ModularRAGPipeline:
             timing_info = pre_embedding_result["timing_info"]
             token_counts = pre_embedding_result["token_counts"]
 
-            for i in range(0, len(test_cases), batch_size):
-                batch = test_cases[i:i + batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1} of {len(test_cases)//batch_size}")
-                for test_case in batch:
-                    try:
-                        exec_result = await pipeline.execute_pipeline(test_case.query, documents, timing_info, token_counts)
-                        retrieved_docs = [
-                            {"doc_id": doc.doc_id, "content": doc.content, "score": getattr(doc, 'score', None), "metadata": doc.metadata}
-                            for doc in exec_result.retrieved_documents
-                        ]
-                        retrieval_result = RetrievalResult(
+            # Ground truths are embedded once per dataset, generated answers once per batch
+            await asyncio.to_thread(evaluator.prepare_ground_truths, test_cases)
+
+            async def _execute_test_case(test_case, exec_result: Optional[RAGExecutionResult] = None):
+                # Each case works on its own copy of the counters so that concurrent
+                # executions do not overwrite each other's timings/token counts.
+                try:
+                    if exec_result is None:
+                        exec_result = await pipeline.execute_pipeline(
+                            test_case.query, documents, deepcopy(timing_info), deepcopy(token_counts)
+                        )
+                    retrieved_docs = [
+                        {"doc_id": doc.doc_id, "content": doc.content, "score": getattr(doc, 'score', None), "metadata": doc.metadata}
+                        for doc in exec_result.retrieved_documents
+                    ]
+                    retrieval_result = RetrievalResult(
+                        query=test_case.query,
+                        retrieved_docs=retrieved_docs,
+                        embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
+                        query_expansion_time=getattr(exec_result, 'query_expansion_time', 0.0),
+                        retrieval_time=getattr(exec_result, 'retrieval_time', 0.0),
+                        passage_augment_time=getattr(exec_result, 'passage_augment_time', 0.0),
+                        passage_rerank_time=getattr(exec_result, 'passage_rerank_time', 0.0),
+                        passage_filter_time=getattr(exec_result, 'passage_filter_time', 0.0),
+                        passage_compress_time=getattr(exec_result, 'passage_compress_time', 0.0),
+                        prompt_maker_time=getattr(exec_result, 'prompt_maker_time', 0.0),
+                        generation_time=getattr(exec_result, 'generation_time', 0.0),
+                        post_generation_time=getattr(exec_result, 'post_generation_time', 0.0),
+                        embedding_token_counts=getattr(exec_result, 'embedding_token_counts', {}),
+                        llm_token_counts=getattr(exec_result, 'llm_token_counts', {}),
+                        error=None
+                    )
+                    generation_result = GenerationResult(
+                        query=test_case.query,
+                        context=exec_result.prompt,
+                        generated_answer=exec_result.generated_answer,
+                        combo_name=combo_name,
+                        llm_model=getattr(combo["generator"], 'model', 'unknown'),
+                        embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
+                        query_expansion_time=getattr(exec_result, 'query_expansion_time', 0.0),
+                        retrieval_time=getattr(exec_result, 'retrieval_time', 0.0),
+                        passage_augment_time=getattr(exec_result, 'passage_augment_time', 0.0),
+                        passage_rerank_time=getattr(exec_result, 'passage_rerank_time', 0.0),
+                        passage_filter_time=getattr(exec_result, 'passage_filter_time', 0.0),
+                        passage_compress_time=getattr(exec_result, 'passage_compress_time', 0.0),
+                        prompt_maker_time=getattr(exec_result, 'prompt_maker_time', 0.0),
+                        generation_time=getattr(exec_result, 'generation_time', 0.0),
+                        post_generation_time=getattr(exec_result, 'post_generation_time', 0.0),
+                        embedding_token_counts=getattr(exec_result, 'embedding_token_counts', {}),
+                        llm_token_counts=getattr(exec_result, 'llm_token_counts', {}),
+                        error=None
+                    )
+                    return retrieval_result, generation_result
+                except Exception as e:
+                    logger.error(f"Failed to process test case {test_case.id} for combo {combo}: {e}")
+                    return e
+
+            async def _evaluate_test_case(test_case, execution, semantic_score: Optional[float] = None,
+                                          llm_score: Optional[float] = None):
+                try:
+                    if isinstance(execution, Exception):
+                        raise execution
+                    retrieval_result, generation_result = execution
+                    eval_result = await evaluator.evaluate_single_case(
+                        test_case, retrieval_result, generation_result, semantic_score, llm_score
+                    )
+                    # Attach combo_name to the result for aggregation
+                    eval_result.combo_name = combo_name
+                    return eval_result
+                except Exception as e:
+                    if not isinstance(execution, Exception):
+                        logger.error(f"Failed to process test case {test_case.id} for combo {combo}: {e}")
+                    error_result = RAGEvaluationResult(
+                        embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
+                        llm_model=getattr(combo["generator"], 'model', 'unknown'),
+                        test_case_id=test_case.id,
+                        retrieval_result=RetrievalResult(
                             query=test_case.query,
-                            retrieved_docs=retrieved_docs,
+                            retrieved_docs=[],
                             embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
-                            query_expansion_time=getattr(exec_result, 'query_expansion_time', 0.0),
-                            retrieval_time=getattr(exec_result, 'retrieval_time', 0.0),
-                            passage_augment_time=getattr(exec_result, 'passage_augment_time', 0.0),
-                            passage_rerank_time=getattr(exec_result, 'passage_rerank_time', 0.0),
-                            passage_filter_time=getattr(exec_result, 'passage_filter_time', 0.0),
-                            passage_compress_time=getattr(exec_result, 'passage_compress_time', 0.0),
-                            prompt_maker_time=getattr(exec_result, 'prompt_maker_time', 0.0),
-                            generation_time=getattr(exec_result, 'generation_time', 0.0),
-                            post_generation_time=getattr(exec_result, 'post_generation_time', 0.0),
-                            embedding_token_counts=getattr(exec_result, 'embedding_token_counts', {}),
-                            llm_token_counts=getattr(exec_result, 'llm_token_counts', {}),
-                            error=None
-                        )
-                        generation_result = GenerationResult(
+                            retrieval_time=0.0
+                        ),
+                        generation_result=GenerationResult(
                             query=test_case.query,
-                            context=exec_result.prompt,
-                            generated_answer=exec_result.generated_answer,
+                            context="",
+                            generated_answer="",
                             combo_name=combo_name,
                             llm_model=getattr(combo["generator"], 'model', 'unknown'),
                             embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
-                            query_expansion_time=getattr(exec_result, 'query_expansion_time', 0.0),
-                            retrieval_time=getattr(exec_result, 'retrieval_time', 0.0),
-                            passage_augment_time=getattr(exec_result, 'passage_augment_time', 0.0),
-                            passage_rerank_time=getattr(exec_result, 'passage_rerank_time', 0.0),
-                            passage_filter_time=getattr(exec_result, 'passage_filter_time', 0.0),
-                            passage_compress_time=getattr(exec_result, 'passage_compress_time', 0.0),
-                            prompt_maker_time=getattr(exec_result, 'prompt_maker_time', 0.0),
-                            generation_time=getattr(exec_result, 'generation_time', 0.0),
-                            post_generation_time=getattr(exec_result, 'post_generation_time', 0.0),
-                            embedding_token_counts=getattr(exec_result, 'embedding_token_counts', {}),
-                            llm_token_counts=getattr(exec_result, 'llm_token_counts', {}),
-                            error=None
-                        )
-                        eval_result = await evaluator.evaluate_single_case(
-                            test_case, retrieval_result, generation_result
-                        )
-                        # Attach combo_name to the result for aggregation
-                        eval_result.combo_name = combo_name
-                        all_results.append(eval_result)
-                    except Exception as e:
-                        logger.error(f"Failed to process test case {test_case.id} for combo {combo}: {e}")
-                        error_result = RAGEvaluationResult(
-                            embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
-                            llm_model=getattr(combo["generator"], 'model', 'unknown'),
-                            test_case_id=test_case.id,
-                            retrieval_result=RetrievalResult(
-                                query=test_case.query,
-                                retrieved_docs=[],
-                                embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
-                                retrieval_time=0.0
-                            ),
-                            generation_result=GenerationResult(
-                                query=test_case.query,
-                                context="",
-                                generated_answer="",
-                                combo_name=combo_name,
-                                llm_model=getattr(combo["generator"], 'model', 'unknown'),
-                                embedding_model=getattr(combo["retrieval"], 'embedding_model', 'unknown'),
-                                generation_time=0.0
-                            ),
-                            metrics=RAGMetrics(
-                                recall_at_k=0.0, map_score=0.0, ndcg_at_k=0.0, mrr=0.0, eval_k=0,
-                                llm_score=0.0, semantic_similarity=0.0,
-                                retrieval_score=0.0, generation_score=0.0, overall_score=0.0
-                            ),
-                            retrieval_eval_time=0.0,
-                            generation_eval_time=0.0,
-                            total_eval_time=0.0,
-                            error=str(e)
-                        )
-                        error_result.combo_name = combo_name
-                        all_results.append(error_result)
+                            generation_time=0.0
+                        ),
+                        metrics=RAGMetrics(
+                            recall_at_k=0.0, map_score=0.0, ndcg_at_k=0.0, mrr=0.0, eval_k=0,
+                            llm_score=0.0, semantic_similarity=0.0,
+                            retrieval_score=0.0, generation_score=0.0, overall_score=0.0
+                        ),
+                        retrieval_eval_time=0.0,
+                        generation_eval_time=0.0,
+                        total_eval_time=0.0,
+                        error=str(e)
+                    )
+                    error_result.combo_name = combo_name
+                    return error_result
+
+            async def _run_bounded(case_fn, *args):
+                # Cases share the caller's event loop; components move their blocking
+                # client calls (Qdrant, Neo4j, cross-encoders, Gemini) to worker threads.
+                async with semaphore:
+                    return await case_fn(*args)
+
+            async def _run_cases(case_fn, *arg_lists):
+                if run_parallel and len(arg_lists[0]) > 1:
+                    # gather preserves input order, so results stay deterministic
+                    return await asyncio.gather(*[_run_bounded(case_fn, *args) for args in zip(*arg_lists)])
+                return [await case_fn(*args) for args in zip(*arg_lists)]
+
+            run_parallel = global_config.parallel_execution and global_config.max_workers > 1
+            semaphore = asyncio.Semaphore(max(1, global_config.max_workers))
+
+            # Racing: after each stage the combination is dropped if even the upper confidence
+            # bound of its overall_score is below the threshold (e.g. the current GA best)
+            combo_results = []
+            next_stage = max(1, global_config.early_stop_min_cases)
+            race_info[combo_name] = {"truncated": False, "score_upper_bound": None}
+
+            for i in range(0, len(test_cases), batch_size):
+                batch = test_cases[i:i + batch_size]
+                logger.info(f"Processing batch {i//batch_size + 1} of {len(test_cases)//batch_size}")
+                if global_config.batch_execution:
+                    # Push the whole batch through the pipeline stage by stage; what is left
+                    # per case only builds the result objects, so it runs inline
+                    exec_results = await pipeline.execute_pipeline_batch(
+                        [tc.query for tc in batch], documents, timing_info, token_counts,
+                        max_concurrency=global_config.max_workers
+                    )
+                    executions = [
+                        await _execute_test_case(test_case, exec_result)
+                        for test_case, exec_result in zip(batch, exec_results)
+                    ]
+                else:
+                    executions = await _run_cases(_execute_test_case, batch, [None] * len(batch))
+                # Score the whole batch with one embedding call and concurrent (cached) judge calls
+                generated_answers = [
+                    "" if isinstance(execution, Exception) else execution[1].generated_answer for execution in executions
+                ]
+                ground_truth_answers = [tc.ground_truth_answer for tc in batch]
+                semantic_scores = await asyncio.to_thread(
+                    evaluator.compute_semantic_scores, generated_answers, ground_truth_answers
+                )
+                llm_scores = await evaluator.compute_llm_scores(generated_answers, ground_truth_answers)
+                batch_results = await _run_cases(_evaluate_test_case, batch, executions, semantic_scores, llm_scores)
+                all_results.extend(batch_results)
+                combo_results.extend(batch_results)
+
+                if (global_config.early_stop_threshold is not None and next_stage <= len(combo_results) < len(test_cases)):
+                    while next_stage <= len(combo_results):
+                        next_stage = max(next_stage + 1, int(next_stage * global_config.early_stop_growth))
+                    upper_bound = evaluator.overall_score_upper_bound(
+                        combo_results, len(test_cases), global_config.early_stop_confidence
+                    )
+                    if upper_bound is not None:
+                        race_info[combo_name]["score_upper_bound"] = upper_bound
+                        if upper_bound < global_config.early_stop_threshold:
+                            logger.info(
+                                f"Stopping {combo_name} after {len(combo_results)}/{len(test_cases)} test cases: "
+                                f"score upper bound {upper_bound:.4f} < threshold {global_config.early_stop_threshold:.4f}"
+                            )
+                            race_info[combo_name]["truncated"] = True
+                            break
+            race_info[combo_name]["evaluated_cases"] = len(combo_results)
         # Aggregate results by combo_name
         from collections import defaultdict
         results_by_combo = defaultdict(list)
@@ -613,6 +1158,8 @@ class ModularRAGPipeline:
         aggregated_metrics = {}
         for combo_name, results in results_by_combo.items():
             aggregated_metrics[combo_name] = await evaluator.aggregate_results(results)
+            if combo_name in race_info:
+                aggregated_metrics[combo_name].update(race_info[combo_name])
         # Find best performing combinations (reuse logic from previous pipeline)
         def _find_best_combinations(aggregated_metrics):
             if not aggregated_metrics:
@@ -661,7 +1208,8 @@ class ModularRAGPipeline:
             total_generation_evaluation_time=total_generation_evaluation_time,
             best_retrieval_combo=best_combos.get('retrieval'),
             best_generation_combo=best_combos.get('generation'),
-            best_overall_combo=best_combos.get('overall')
+            best_overall_combo=best_combos.get('overall'),
+            truncated=any(info["truncated"] for info in race_info.values())
         )
         logger.info(f"Modular RAG evaluation completed in {total_runtime:.2f}s")
         logger.info(f"Success rate: {len(successful_results)}/{len(all_results)} ({len(successful_results)/len(all_results)*100:.1f}%)")
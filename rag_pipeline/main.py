@@ -17,6 +17,7 @@ import logging
 import time
 import sys
 import os
+from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 
 from fastapi import FastAPI, HTTPException
@@ -25,6 +26,8 @@ import uvicorn
 
 from rag_pipeline.core import ModularRAGPipeline, ModularRAGConfig
 from rag_pipeline.util.misc.config_map import CONFIG_MAP
+from rag_pipeline.util.api.async_ollama_client import AsyncOllamaClient
+from rag_pipeline.util.graphstore.neo4j_store import close_neo4j_drivers
 
 # Add parent directory to path for config_loader import
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -56,8 +59,16 @@ def load_yaml_config():
         logger.warning(f"⚠️ Could not load YAML config: {e}. Using defaults.")
         return None
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release the process-wide clients when the server shuts down"""
+    yield
+    close_neo4j_drivers()
+    await AsyncOllamaClient.get_instance().aclose()
+
+
 # FastAPI app
-app = FastAPI(title="RAG Evaluation API", version="1.0.0")
+app = FastAPI(title="RAG Evaluation API", version="1.0.0", lifespan=lifespan)
 
 
 class EvaluationRequest(BaseModel):
@@ -67,7 +78,15 @@ class EvaluationRequest(BaseModel):
 async def evaluate_endpoint(request: EvaluationRequest) -> Dict[str, Any]:
     """
     Accept GA evaluation_request with pipeline_config, run ModularRAG evaluation,
-    and return {"evaluation": {"final_score": <0..1>}}.
+    and return {"evaluation": {"final_score": <0..1>, "truncated": <bool>, "partial_score": <0..1 or null>, ...}}.
+
+    max_test_cases, test_case_offset and test_case_seed override the evaluated test cases
+    (e.g. a small seeded subset for a low-fidelity evaluation).
+
+    An optional early_stop_threshold (e.g. the GA's current best score) enables racing:
+    test cases are scored in growing stages and the evaluation stops once the upper
+    confidence bound of the score falls below the threshold. final_score is then the
+    partial score over the evaluated cases and truncated is true.
     """
     payload = request.evaluation_request or {}
     pipeline_config = payload.get("pipeline_config", {})
@@ -78,6 +97,10 @@ async def evaluate_endpoint(request: EvaluationRequest) -> Dict[str, Any]:
     logger.info("Received evaluation request with pipeline_config: %s", pipeline_config)
 
     config = parse_config(pipeline_config)
+    for key in ("max_test_cases", "test_case_offset", "test_case_seed",
+                "early_stop_threshold", "early_stop_min_cases", "early_stop_growth", "early_stop_confidence"):
+        if payload.get(key) is not None:
+            setattr(config, key, payload[key])
 
     try:
         logger.info("Starting Modular RAG evaluation for genetic algorithm...")
@@ -91,18 +114,15 @@ async def evaluate_endpoint(request: EvaluationRequest) -> Dict[str, Any]:
         await save_markdown_results(results)
         
         # Extract overall score safely
+        combo_metrics = {}
         if hasattr(results, 'aggregated_metrics') and results.aggregated_metrics:
             if isinstance(results.aggregated_metrics, dict):
                 if "overall_score" in results.aggregated_metrics:
-                    final_score = float(results.aggregated_metrics["overall_score"])
+                    combo_metrics = results.aggregated_metrics
                 else:
-                    # Get first combination's overall score
-                    first_combo_metrics = next(iter(results.aggregated_metrics.values()))
-                    final_score = float(first_combo_metrics.get("overall_score", 0.0))
-            else:
-                final_score = 0.0
-        else:
-            final_score = 0.0
+                    # Get first combination's metrics
+                    combo_metrics = next(iter(results.aggregated_metrics.values()))
+        final_score = float(combo_metrics.get("overall_score", 0.0))
             
         logger.info(f"Evaluation completed in {time.time() - start_time:.2f}s")
         
@@ -110,8 +130,15 @@ async def evaluate_endpoint(request: EvaluationRequest) -> Dict[str, Any]:
         # Clamp to [0, 1] range
         final_score = max(0.0, min(1.0, final_score))
         
-        logger.info(f"Final score: {final_score}")
-        return {"evaluation": {"final_score": final_score}}
+        truncated = bool(combo_metrics.get("truncated", False))
+        logger.info(f"Final score: {final_score}" + (" (truncated)" if truncated else ""))
+        return {"evaluation": {
+            "final_score": final_score,
+            "partial_score": final_score if truncated else None,
+            "truncated": truncated,
+            "evaluated_cases": combo_metrics.get("evaluated_cases", combo_metrics.get("test_count", 0)),
+            "score_upper_bound": combo_metrics.get("score_upper_bound")
+        }}
 
     except Exception as e:
         logger.error(f"Evaluation failed: {e}")
@@ -181,7 +208,7 @@ def parse_config(config_dict: Dict[str, str] = None):
         qdrant_collection_hash=None,
         max_test_cases=100,
         test_case_offset=0,
-        eval_batch_size=1,
+        eval_batch_size=10,
         parallel_execution=True,
         max_workers=4,
         cache_enabled=True,
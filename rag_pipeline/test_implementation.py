@@ -0,0 +1,575 @@
+"""
+RAG Pipeline Test Implementation Script
+
+This script checks pipeline building blocks against reference behaviour:
+- Stage cache keys chained through the pipeline stages
+- BM25Index scores and rankings against the BM25Okapi formula of rank_bm25
+- Incremental BM25Index updates (sync_documents, deletions, segment merges)
+- Batched pipeline execution against the single-query path
+- The brute-force candidate fallback of the Neo4j knowledge graph store
+
+Run from the repository root:
+    python -m rag_pipeline.test_implementation
+"""
+
+import math
+import random
+import re
+import asyncio
+import shutil
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+from rag_pipeline.util.retrieval_utils.bm25_index import BM25Index
+from rag_pipeline.util.cache.stage_cache import StageCache
+from rag_pipeline.util.graphstore.neo4j_store import Neo4jKnowledgeGraphStore
+
+
+# ----- mocked pipeline -----
+
+MOCK_CORPUS = {
+    "d1": "the cat sat on the mat",
+    "d2": "dogs chase the cat around the garden",
+    "d3": "a bird sang in the garden at dawn",
+    "d4": "the stock market fell sharply today",
+    "d5": "cats and dogs can live together peacefully",
+}
+
+DEFAULT_MOCK_CONFIGS = {
+    "retrieval": {"technique": "mock", "top_k": 3},
+    "passage_rerank": {"technique": "mock"},
+    "prompt_maker": {"technique": "mock"},
+    "generator": {"model": "mock-llm", "temperature": 0.0},
+}
+
+
+class StageConfig(dict):
+    """Stage config with attribute access, standing in for the pydantic configs of config_dict"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class MockRetrieval:
+    """Word-overlap retrieval over MOCK_CORPUS"""
+
+    def __init__(self, calls: Counter):
+        self.calls = calls
+
+    def _search(self, query, k: int) -> Dict[str, Any]:
+        from rag_pipeline.core.modular_framework import Document
+        words = set(query.processed_text.lower().split())
+        scored = [(len(words & set(content.split())), doc_id) for doc_id, content in MOCK_CORPUS.items()]
+        hits = sorted((item for item in scored if item[0] > 0), key=lambda item: (-item[0], item[1]))[:k]
+        return {
+            "documents": [Document(doc_id=doc_id, content=MOCK_CORPUS[doc_id], metadata={}, score=float(score))
+                          for score, doc_id in hits],
+            "embedding_token_count": float(len(words)),
+            "llm_token_count": {}
+        }
+
+    async def retrieve(self, query, k: int = 5) -> Dict[str, Any]:
+        self.calls["retrieval"] += 1
+        return self._search(query, k)
+
+    async def retrieve_batch(self, queries, k: int = 5, max_concurrency: int = 4) -> List[Dict[str, Any]]:
+        self.calls["retrieval"] += len(queries)
+        return [self._search(query, k) for query in queries]
+
+
+class MockRerank:
+    """Orders passages by length"""
+
+    def __init__(self, calls: Counter):
+        self.calls = calls
+
+    async def rerank_passages(self, documents, query) -> Dict[str, Any]:
+        self.calls["passage_rerank"] += 1
+        ordered = sorted(documents, key=lambda doc: (len(doc.content), doc.doc_id))
+        return {"documents": ordered, "embedding_token_count": 0.0, "llm_token_count": {}}
+
+    async def rerank_passages_batch(self, documents_list, queries) -> List[Dict[str, Any]]:
+        return [await self.rerank_passages(documents, query) for documents, query in zip(documents_list, queries)]
+
+
+class MockPromptMaker:
+    """Lists the passages under the question"""
+
+    def __init__(self, calls: Counter):
+        self.calls = calls
+
+    async def make_prompt(self, query, documents) -> Dict[str, Any]:
+        self.calls["prompt_maker"] += 1
+        passages = "\n".join(doc.content for doc in documents)
+        return {"text": f"Question: {query.processed_text}\nPassages:\n{passages}",
+                "embedding_token_count": 0.0, "llm_token_count": {}}
+
+
+class MockGenerator:
+    """Answers with a summary of the prompt and reports token counts"""
+
+    def __init__(self, calls: Counter):
+        self.calls = calls
+
+    async def generate(self, prompt: str, query) -> Dict[str, Any]:
+        self.calls["generator"] += 1
+        return {"text": f"Answer to '{query.processed_text}' from {prompt.count(chr(10)) - 1} passages",
+                "embedding_token_count": 0.0,
+                "llm_token_count": {"mock-llm": {"in": float(len(prompt.split())), "out": 6.0}}}
+
+    async def generate_batch(self, prompts: List[str], queries, max_concurrency: int = 4) -> List[Dict[str, Any]]:
+        return list(await asyncio.gather(*[self.generate(prompt, query) for prompt, query in zip(prompts, queries)]))
+
+
+def mock_pipeline(calls: Counter, stage_cache: StageCache = None, **config_overrides):
+    """ModularRAGPipeline over the mock components; config_overrides update single stage configs"""
+    # Needs the full pipeline dependencies (pydantic, langchain, ...)
+    from rag_pipeline.core.modular_pipeline import ModularRAGPipeline
+
+    configs = {stage: StageConfig({**config, **config_overrides.get(stage, {})})
+               for stage, config in DEFAULT_MOCK_CONFIGS.items()}
+    # Bypass __init__: no component factory and no dataset loading
+    pipeline = ModularRAGPipeline.__new__(ModularRAGPipeline)
+    pipeline.config_dict = configs
+    pipeline.global_config = None
+    pipeline.components = {
+        "retrieval": MockRetrieval(calls),
+        "passage_rerank": MockRerank(calls),
+        "prompt_maker": MockPromptMaker(calls),
+        "generator": MockGenerator(calls),
+    }
+    pipeline.index_handle = None
+    pipeline.stage_cache = stage_cache
+    return pipeline
+
+
+def run_queries(pipeline, queries: List[str]) -> list:
+    """Run the queries one by one through execute_pipeline"""
+    async def run():
+        return [await pipeline.execute_pipeline(query, timing_info={}, token_counts={}) for query in queries]
+    return asyncio.run(run())
+
+
+def execution_outputs(result) -> Dict[str, Any]:
+    """Everything of a RAGExecutionResult except its timings"""
+    return {
+        "original_query": result.original_query,
+        "processed_query": result.processed_query,
+        "retrieved_documents": result.retrieved_documents,
+        "final_documents": result.final_documents,
+        "prompt": result.prompt,
+        "generated_answer": result.generated_answer,
+        "final_answer": result.final_answer,
+        "embedding_token_counts": result.embedding_token_counts,
+        "llm_token_counts": result.llm_token_counts,
+    }
+
+
+# ----- reference BM25 -----
+
+def okapi_scores(corpus: Dict[str, List[str]], query: List[str],
+                 k1: float, b: float, epsilon: float) -> Dict[str, float]:
+    """Raw BM25Okapi scores per doc_id, computed the way rank_bm25 did"""
+    num_docs = len(corpus)
+    avg_doc_length = sum(len(tokens) for tokens in corpus.values()) / num_docs
+    doc_freqs = Counter(term for tokens in corpus.values() for term in set(tokens))
+
+    idf = {term: math.log(num_docs - freq + 0.5) - math.log(freq + 0.5) for term, freq in doc_freqs.items()}
+    floor = epsilon * sum(idf.values()) / len(idf)
+    idf = {term: floor if value < 0 else value for term, value in idf.items()}
+
+    scores = {}
+    for doc_id, tokens in corpus.items():
+        tfs = Counter(tokens)
+        length_norm = k1 * (1 - b + b * len(tokens) / avg_doc_length)
+        scores[doc_id] = sum(idf.get(term, 0.0) * tfs[term] * (k1 + 1) / (tfs[term] + length_norm) for term in query)
+    return scores
+
+
+def normalized_okapi_scores(corpus: Dict[str, List[str]], query: List[str],
+                            k1: float, b: float, epsilon: float) -> Dict[str, float]:
+    """Min-max normalized BM25Okapi scores, as returned by the old BM25IndexManager.search"""
+    scores = okapi_scores(corpus, query, k1, b, epsilon)
+    low, high = min(scores.values()), max(scores.values())
+    if high == low:
+        return {doc_id: 1.0 for doc_id in scores}
+    return {doc_id: (score - low) / (high - low) for doc_id, score in scores.items()}
+
+
+def random_corpus(rng: random.Random, num_docs: int, prefix: str = "doc") -> Dict[str, List[str]]:
+    """Random tokenized corpus mixing very common terms (negative IDF) with rare ones"""
+    common = [f"common{i}" for i in range(5)]
+    rare = [f"term{i}" for i in range(60)]
+    corpus = {}
+    for i in range(num_docs):
+        length = rng.randint(3, 25)
+        corpus[f"{prefix}{i}"] = [rng.choice(common) if rng.random() < 0.5 else rng.choice(rare) for _ in range(length)]
+    return corpus
+
+
+def documents_data(corpus: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """Document records in the format stored by BM25Index"""
+    return [{"doc_id": doc_id, "content": " ".join(tokens), "metadata": {"source": "test"}}
+            for doc_id, tokens in corpus.items()]
+
+
+def assert_matches_okapi(index: BM25Index, corpus: Dict[str, List[str]], queries: List[List[str]]):
+    """Check every query's scores over the whole corpus and its top-k ranking against BM25Okapi"""
+    assert index.num_docs == len(corpus), f"Index holds {index.num_docs} documents, expected {len(corpus)}"
+    for query in queries:
+        expected = normalized_okapi_scores(corpus, query, index.k1, index.b, index.epsilon)
+
+        results = index.search(query, k=len(corpus))
+        got = {result["doc_id"]: result["score"] for result in results}
+        assert set(got) == set(expected), f"Query {query} returned other documents than the corpus"
+        for doc_id, score in expected.items():
+            assert math.isclose(got[doc_id], score, rel_tol=1e-6, abs_tol=1e-9), \
+                f"Query {query}, {doc_id}: score {got[doc_id]} != BM25Okapi {score}"
+
+        top_scores = [result["score"] for result in index.search(query, k=5)]
+        expected_top = sorted(expected.values(), reverse=True)[:5]
+        assert all(math.isclose(a, e, rel_tol=1e-6, abs_tol=1e-9) for a, e in zip(top_scores, expected_top)), \
+            f"Query {query}: top-5 {top_scores} != BM25Okapi {expected_top}"
+
+    batch = index.search_batch(queries, k=5)
+    assert batch == [index.search(query, k=5) for query in queries], "search_batch should match search"
+
+
+def test_stage_cache_key_chaining():
+    """Test 1: Stage cache keys chain through the stages, so upstream changes invalidate downstream outputs."""
+    print("\n" + "=" * 70)
+    print("TEST 1: Stage Cache Key Chaining")
+    print("=" * 70)
+
+    # Every key part matters, and a changed upstream key changes every key after it
+    parts = ("retrieval", "config-a", "corpus-hash", "what is bm25?")
+    key = StageCache.make_key(*parts)
+    assert key == StageCache.make_key(*parts), "Keys must be deterministic"
+    for i in range(len(parts)):
+        changed = list(parts)
+        changed[i] += "!"
+        assert StageCache.make_key(*changed) != key, f"Key part {i} is ignored"
+
+    def chain(upstream: str, configs: List[str]) -> List[str]:
+        keys = []
+        for stage, config in zip(["retrieval", "passage_rerank", "generator"], configs):
+            upstream = StageCache.make_key(stage, config, upstream, "query")
+            keys.append(upstream)
+        return keys
+
+    base = chain("corpus", ["r1", "p1", "g1"])
+    assert chain("corpus", ["r1", "p1", "g2"])[:2] == base[:2], "A generator change must keep upstream keys"
+    assert all(a != b for a, b in zip(chain("corpus", ["r2", "p1", "g1"]), base)), \
+        "A retrieval change must invalidate every downstream key"
+    assert all(a != b for a, b in zip(chain("corpus2", ["r1", "p1", "g1"]), base)), \
+        "A corpus change must invalidate every key"
+    print("✅ Keys chain through the stages")
+
+    # Hits are independent copies; the memory tier is an LRU
+    cache = StageCache(max_memory_entries=2)
+    cache.put("a", {"result": {"documents": ["x"]}, "elapsed": 1.0})
+    hit = cache.get("a")
+    hit["result"]["documents"].append("mutated")
+    assert cache.get("a")["result"]["documents"] == ["x"], "Cache hits must not share state"
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert cache.get("a") is None and cache.get("c") == 3, "The least recently used entry should be evicted"
+
+    # The disk tier is opt-in and survives a new cache instance
+    cache_dir = tempfile.mkdtemp(prefix="stage_cache_test_")
+    try:
+        StageCache(cache_dir).put(key, {"result": "persisted", "elapsed": 0.5})
+        reopened = StageCache(cache_dir)
+        assert reopened.get(key) == {"result": "persisted", "elapsed": 0.5}
+        assert reopened.stats["disk_hits"] == 1
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    print("✅ Memory LRU and opt-in disk tier")
+
+    # Through the pipeline: only the changed stage and the stages after it run again
+    queries = ["where is the cat", "what do dogs chase", "a bird in the garden"]
+    calls = Counter()
+    cache = StageCache()
+    first = run_queries(mock_pipeline(calls, cache), queries)
+    assert not any(result.final_answer.startswith("Error") for result in first), "The mocked pipeline failed"
+    assert calls == Counter({"retrieval": 3, "passage_rerank": 3, "prompt_maker": 3, "generator": 3}), f"Unexpected calls: {calls}"
+
+    calls.clear()
+    again = run_queries(mock_pipeline(calls, cache), queries)
+    assert not calls, f"A repeated run should be answered from the cache, but ran {dict(calls)}"
+    assert [r.final_answer for r in again] == [r.final_answer for r in first]
+
+    run_queries(mock_pipeline(calls, cache, generator={"temperature": 0.7}), queries)
+    assert calls == Counter({"generator": 3}), f"A generator change should only rerun generation, but ran {dict(calls)}"
+
+    calls.clear()
+    run_queries(mock_pipeline(calls, cache, retrieval={"top_k": 2}), queries)
+    assert calls == Counter({"retrieval": 3, "passage_rerank": 3, "prompt_maker": 3, "generator": 3}), \
+        f"A retrieval change should rerun every later stage, but ran {dict(calls)}"
+    print("✅ Pipeline reruns only the changed stage and everything downstream")
+
+    return {'stage_cache': cache.get_stats()}
+
+
+def test_bm25_matches_okapi():
+    """Test 2: BM25Index reproduces the BM25Okapi scores of rank_bm25."""
+    print("\n" + "=" * 70)
+    print("TEST 2: BM25Index vs BM25Okapi")
+    print("=" * 70)
+
+    rng = random.Random(42)
+    corpus = random_corpus(rng, 80)
+    queries = [
+        ["term1", "term2"],
+        ["common0", "term7", "term7"],  # repeated query terms count once per occurrence
+        ["common1", "common2"],  # only negative-IDF terms (floored to epsilon * average IDF)
+        ["unknown"],  # no document matches: every score ties
+        [rng.choice(corpus["doc3"]) for _ in range(4)]
+    ]
+
+    index_dir = tempfile.mkdtemp(prefix="bm25_test_")
+    try:
+        for k1, b in [(1.2, 0.75), (1.5, 0.3)]:
+            index = BM25Index(index_dir, k1=k1, b=b)
+            index.create(list(corpus.values()), documents_data(corpus))
+            assert_matches_okapi(index, corpus, queries)
+            print(f"✅ k1={k1}, b={b}: {len(queries)} queries match over {len(corpus)} documents")
+
+        reopened = BM25Index(index_dir, k1=1.5, b=0.3)
+        assert reopened.load(), "The index should load from disk"
+        assert_matches_okapi(reopened, corpus, queries)
+        print("✅ Reopened index matches")
+    finally:
+        shutil.rmtree(index_dir, ignore_errors=True)
+
+    return {'documents': len(corpus), 'queries': len(queries)}
+
+
+def test_bm25_sync_documents():
+    """Test 3: Scores stay exact while sync_documents adds, changes and deletes documents."""
+    print("\n" + "=" * 70)
+    print("TEST 3: BM25Index Incremental Updates")
+    print("=" * 70)
+
+    rng = random.Random(7)
+    corpus = random_corpus(rng, 60)
+    queries = [["term3", "term4"], ["common0", "term10"], ["common3"]]
+
+    index_dir = tempfile.mkdtemp(prefix="bm25_test_")
+    try:
+        # No background merges, so every intermediate segment layout gets checked
+        index = BM25Index(index_dir, max_segments=100, max_deleted_ratio=1.0)
+        index.create(list(corpus.values()), documents_data(corpus))
+
+        # Unchanged documents are kept in place
+        stats = index.sync_documents(documents_data(corpus), str.split)
+        assert stats == {"deleted": 0, "added": 0, "unchanged": 60}, f"Unexpected sync of an unchanged corpus: {stats}"
+        assert index.get_stats()["segments"] == 1
+
+        # Add documents: a second segment, with global statistics over both
+        corpus.update(random_corpus(rng, 15, prefix="new"))
+        stats = index.sync_documents(documents_data(corpus), str.split)
+        assert stats == {"deleted": 0, "added": 15, "unchanged": 60}, f"Unexpected sync after adding: {stats}"
+        assert index.get_stats()["segments"] == 2
+        assert_matches_okapi(index, corpus, queries)
+        print("✅ Added documents: scores match")
+
+        # Delete and change documents: tombstones plus a segment with the new contents
+        for doc_id in ["doc0", "doc1", "new0"]:
+            del corpus[doc_id]
+        for doc_id in ["doc2", "new1"]:
+            corpus[doc_id] = corpus[doc_id] + ["term3", "changed"]
+        stats = index.sync_documents(documents_data(corpus), str.split)
+        assert stats == {"deleted": 5, "added": 2, "unchanged": 70}, f"Unexpected sync after deleting: {stats}"
+        assert index.get_stats()["deleted_documents"] == 5
+        assert_matches_okapi(index, corpus, queries)
+        print("✅ Deleted and changed documents: scores match")
+
+        assert index.delete_documents(["doc3"]) == 1
+        del corpus["doc3"]
+        assert_matches_okapi(index, corpus, queries)
+
+        # Merge into one segment without the deleted documents
+        index.merge()
+        stats = index.get_stats()
+        assert stats["segments"] == 1 and stats["deleted_documents"] == 0, f"Unexpected stats after merging: {stats}"
+        assert_matches_okapi(index, corpus, queries)
+        reopened = BM25Index(index_dir)
+        assert reopened.load(), "The merged index should load from disk"
+        assert_matches_okapi(reopened, corpus, queries)
+        print("✅ Merged segments: scores match")
+    finally:
+        shutil.rmtree(index_dir, ignore_errors=True)
+
+    return {'documents': len(corpus)}
+
+
+def test_pipeline_batch_execution():
+    """Test 4: execute_pipeline_batch gives every query the result of execute_pipeline."""
+    print("\n" + "=" * 70)
+    print("TEST 4: Batched Pipeline Execution")
+    print("=" * 70)
+
+    queries = [
+        "where is the cat",
+        "what do dogs chase in the garden",
+        "quantum chromodynamics",  # retrieves nothing: rerank is skipped for this query only
+        "where is the cat",  # duplicate query in the same batch
+    ]
+
+    single_calls, batch_calls = Counter(), Counter()
+    single = run_queries(mock_pipeline(single_calls), queries)
+
+    async def no_fallback(*args, **kwargs):
+        raise AssertionError("execute_pipeline_batch fell back to the single-query path")
+
+    batch_pipeline = mock_pipeline(batch_calls)
+    # A failing batch path falls back to execute_pipeline, which would make the comparison trivial
+    batch_pipeline.execute_pipeline = no_fallback
+    batch = asyncio.run(batch_pipeline.execute_pipeline_batch(queries, max_concurrency=2))
+
+    assert not any(result.final_answer.startswith("Error") for result in single + batch), "The mocked pipeline failed"
+    assert len(batch) == len(queries)
+    for query, single_result, batch_result in zip(queries, single, batch):
+        assert execution_outputs(batch_result) == execution_outputs(single_result), \
+            f"Batch result differs from execute_pipeline for '{query}'"
+        assert batch_result.total_time >= 0.0
+    assert batch_calls == single_calls, f"Batch ran {dict(batch_calls)}, single-query path ran {dict(single_calls)}"
+    print(f"✅ {len(queries)} queries: batch results match execute_pipeline")
+
+    # Both paths share the stage key chain, so the batch is answered from the single-query cache
+    cache = StageCache()
+    cached_calls = Counter()
+    run_queries(mock_pipeline(cached_calls, cache), queries[:2])
+    cached_calls.clear()
+    cached = asyncio.run(mock_pipeline(cached_calls, cache).execute_pipeline_batch(queries[:2]))
+    assert not cached_calls, f"Cached stages should not run again, but ran {dict(cached_calls)}"
+    assert [execution_outputs(r) for r in cached] == [execution_outputs(r) for r in single[:2]]
+    print("✅ Batch execution reuses stage outputs cached by execute_pipeline")
+
+    return {'queries': len(queries)}
+
+
+# ----- fake Neo4j driver -----
+
+FAKE_RELATION = {
+    'subject': 'cat', 'relation': 'sits_on', 'object': 'mat', 'source_doc': 'd1', 'doc_id': 'd1',
+    'sentence': 'the cat sat on the mat', 'created_at': None, 'chunk_id': 'd1_0',
+    'similarity': 0.9, 'distance': 1
+}
+
+
+class FakeNeo4jSession:
+    """Session that rejects vector index queries and, like Neo4j, queries with missing parameters"""
+
+    def __init__(self, queries: List[Dict[str, Any]]):
+        self.queries = queries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query: str, **params):
+        from neo4j.exceptions import ClientError
+        self.queries.append({'query': query, 'params': params})
+        if "db.index.vector.queryNodes" in query:
+            raise ClientError("There is no procedure with the name `db.index.vector.queryNodes` registered")
+        missing = set(re.findall(r"\$(\w+)", query)) - set(params)
+        if missing:
+            raise ClientError(f"Expected parameter(s): {', '.join(sorted(missing))}")
+        return [dict(FAKE_RELATION)]
+
+
+class FakeNeo4jDriver:
+    def __init__(self):
+        self.queries: List[Dict[str, Any]] = []
+
+    def session(self):
+        return FakeNeo4jSession(self.queries)
+
+
+def fake_knowledge_graph_store() -> Neo4jKnowledgeGraphStore:
+    """Knowledge graph store on a fake driver, without connecting or creating indexes"""
+    store = Neo4jKnowledgeGraphStore.__new__(Neo4jKnowledgeGraphStore)
+    store.vector_index_name = "entity_embeddings"
+    store.embedding_dimension = 3
+    store.write_batch_size = 500
+    store._vector_index_available = True
+    store.driver = FakeNeo4jDriver()
+    return store
+
+
+def test_neo4j_brute_force_fallback():
+    """Test 5: Retrieval falls back to the brute-force scan with every query parameter bound."""
+    print("\n" + "=" * 70)
+    print("TEST 5: Neo4j Brute-Force Candidate Fallback")
+    print("=" * 70)
+
+    query_embedding = [0.1, 0.2, 0.3]
+    for method in ("basic", "traversal"):
+        store = fake_knowledge_graph_store()
+        if method == "basic":
+            relations = store.retrieve_basic(query_embedding, top_k=5, similarity_threshold=0.5, candidate_k=7)
+        else:
+            relations = store.retrieve_traversal(query_embedding, top_k=5, similarity_threshold=0.5,
+                                                 max_depth=2, candidate_k=7)
+
+        queries = store.driver.queries
+        assert len(queries) == 2, f"{method}: expected a vector index query and a fallback, got {len(queries)}"
+        assert "db.index.vector.queryNodes" in queries[0]['query']
+        fallback = queries[1]
+        assert fallback['query'].startswith(Neo4jKnowledgeGraphStore._BRUTE_FORCE_CANDIDATES)
+        assert fallback['params']['candidate_k'] == 7, f"{method}: fallback lost candidate_k"
+        assert [r['subject'] for r in relations] == ['cat'], f"{method}: fallback returned {relations}"
+        assert not store._vector_index_available, "A ClientError should disable the vector index"
+
+        # Once disabled, later queries go straight to the brute-force scan
+        store.driver.queries.clear()
+        store.retrieve_basic(query_embedding, top_k=5, similarity_threshold=0.5, candidate_k=7)
+        assert len(store.driver.queries) == 1 and "queryNodes" not in store.driver.queries[0]['query']
+        print(f"✅ {method}: brute-force fallback binds candidate_k and returns the relations")
+
+    return {'methods': 2}
+
+
+def run_tests():
+    """Run all tests and report a summary."""
+    print("🧪 RAG PIPELINE TESTS")
+    print("=" * 80)
+
+    tests = [
+        test_stage_cache_key_chaining,
+        test_bm25_matches_okapi,
+        test_bm25_sync_documents,
+        test_pipeline_batch_execution,
+        test_neo4j_brute_force_fallback,
+    ]
+
+    start_time = time.time()
+    failures = []
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            print(f"\n❌ {test.__name__} failed: {e}")
+            import traceback
+            traceback.print_exc()
+            failures.append(test.__name__)
+
+    print("\n" + "=" * 80)
+    print(f"{len(tests) - len(failures)}/{len(tests)} tests passed in {time.time() - start_time:.2f} seconds")
+    if failures:
+        print(f"Failed: {', '.join(failures)}")
+    return not failures
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if run_tests() else 1)
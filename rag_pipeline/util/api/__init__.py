@@ -3,12 +3,14 @@ API client utilities.
 
 Provides utilities for:
 - Ollama API communication
+- Async Ollama API communication with multi-endpoint routing
 - Gemini API communication
 - Model interaction
 - Connection management
 """
 
 from .ollama_client import OllamaUtil
+from .async_ollama_client import AsyncOllamaClient
 from .gemini_client import GeminiUtil
 
-__all__ = ['OllamaUtil', 'GeminiUtil'] 
\ No newline at end of file
+__all__ = ['OllamaUtil', 'AsyncOllamaClient', 'GeminiUtil'] 
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""
+Async Ollama API client.
+
+Provides utilities for:
+- Non-blocking generate/embed calls that components can await
+- A single pooled keep-alive HTTP client shared by every event loop in the process
+- Per-endpoint concurrency limits
+- Round-robin or least-loaded routing across several Ollama servers
+"""
+
+import os
+import asyncio
+import logging
+import threading
+from typing import List, Dict, Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYSTEM_PROMPT = "ANSWER ONLY THE QUESTION YOU ARE ASKED AS CONCISE AS POSSIBLE."
+
+
+def _urls_from_env(list_var: str, single_var: str, default: str) -> List[str]:
+    """Read a comma separated list of Ollama API URLs, falling back to the single URL variable"""
+    urls = os.getenv(list_var, "")
+    if urls.strip():
+        return [url.strip().rstrip("/") for url in urls.split(",") if url.strip()]
+    return [os.getenv(single_var, default).rstrip("/")]
+
+
+class _Endpoint:
+    """Bookkeeping for a single Ollama server"""
+
+    def __init__(self, api_url: str, max_concurrency: int):
+        self.api_url = api_url
+        self.max_concurrency = max_concurrency
+        self.semaphore: Optional[asyncio.Semaphore] = None  # created on the client loop
+        self.in_flight = 0
+        self.total_requests = 0
+        self.failures = 0
+
+    def load(self) -> float:
+        return self.in_flight / self.max_concurrency
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "api_url": self.api_url,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "total_requests": self.total_requests,
+            "failures": self.failures
+        }
+
+
+class AsyncOllamaClient:
+    """
+    Asyncio Ollama client shared by all components.
+
+    The underlying httpx client lives on a dedicated background event loop, so one
+    connection pool and one set of per-endpoint limits is shared by every caller,
+    including the per-thread event loops used for concurrent test cases. Callers on
+    any loop simply await generate()/embed().
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self,
+                 base_urls: Optional[List[str]] = None,
+                 eval_base_urls: Optional[List[str]] = None,
+                 max_concurrency_per_endpoint: Optional[int] = None,
+                 routing: Optional[str] = None,
+                 keep_alive: Optional[str] = None,
+                 timeout: float = 900.0):
+        """
+        Initialize the client
+
+        Args:
+            base_urls: Ollama API URLs (".../api") used for pipeline calls
+            eval_base_urls: Ollama API URLs used for evaluation (judge) calls
+            max_concurrency_per_endpoint: Maximum number of requests in flight per server
+            routing: "least_loaded" or "round_robin"
+            keep_alive: How long Ollama should keep models loaded (e.g. "30m", "-1")
+            timeout: Request timeout in seconds
+        """
+        base_urls = base_urls or _urls_from_env("OLLAMA_API_URLS", "OLLAMA_API_URL", "http://rag-pipeline-ollama-gpu:11434/api")
+        eval_base_urls = eval_base_urls or _urls_from_env("OLLAMA_EVAL_API_URLS", "OLLAMA_API_URL2", "http://rag-pipeline-ollama-gpu-2:11434/api")
+        max_concurrency = max_concurrency_per_endpoint or int(os.getenv("OLLAMA_MAX_CONCURRENCY_PER_ENDPOINT", "4"))
+
+        self.routing = routing or os.getenv("OLLAMA_ROUTING", "least_loaded")
+        if self.routing not in ("least_loaded", "round_robin"):
+            raise ValueError(f"Unsupported routing strategy: {self.routing}")
+        self.keep_alive = keep_alive if keep_alive is not None else os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        self.timeout = timeout
+
+        self.pools: Dict[str, List[_Endpoint]] = {
+            "default": [_Endpoint(url, max(1, max_concurrency)) for url in base_urls],
+            "eval": [_Endpoint(url, max(1, max_concurrency)) for url in eval_base_urls]
+        }
+        self._round_robin = {name: 0 for name in self.pools}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._start_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'AsyncOllamaClient':
+        """Get or create the process-wide client"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _ensure_started(self):
+        """Start the background event loop that owns the HTTP client"""
+        if self._loop is not None:
+            return
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="async-ollama-client", daemon=True)
+            thread.start()
+            self._thread = thread
+            self._loop = loop
+
+    async def _run(self, coro):
+        """Run a coroutine on the client loop and await its result from the caller's loop"""
+        self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return await asyncio.wrap_future(future)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client (must be called on the client loop)"""
+        if self._client is None:
+            total_slots = sum(e.max_concurrency for pool in self.pools.values() for e in pool)
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
+                limits=httpx.Limits(max_connections=total_slots, max_keepalive_connections=total_slots)
+            )
+        return self._client
+
+    def _select_endpoint(self, pool_name: str, exclude: Optional[set] = None) -> _Endpoint:
+        """Pick an endpoint from a pool according to the routing strategy"""
+        endpoints = [e for e in self.pools[pool_name] if not exclude or e.api_url not in exclude]
+        if not endpoints:
+            endpoints = self.pools[pool_name]
+
+        start = self._round_robin[pool_name]
+        self._round_robin[pool_name] = start + 1
+        rotated = endpoints[start % len(endpoints):] + endpoints[:start % len(endpoints)]
+
+        if self.routing == "round_robin":
+            return rotated[0]
+        # Least loaded; ties are broken by the round-robin order
+        return min(rotated, key=lambda e: e.load())
+
+    async def _post(self, path: str, payload: Dict[str, Any], pool_name: str) -> Dict[str, Any]:
+        """POST to the selected endpoint, failing over to the other endpoints of the pool on transport errors"""
+        client = self._get_http_client()
+        tried = set()
+        last_error = None
+        for _ in range(len(self.pools[pool_name])):
+            endpoint = self._select_endpoint(pool_name, exclude=tried)
+            tried.add(endpoint.api_url)
+            if endpoint.semaphore is None:
+                endpoint.semaphore = asyncio.Semaphore(endpoint.max_concurrency)
+
+            endpoint.in_flight += 1
+            try:
+                async with endpoint.semaphore:
+                    endpoint.total_requests += 1
+                    response = await client.post(f"{endpoint.api_url}/{path}", json=payload)
+                    response.raise_for_status()
+                    return response.json()
+            except httpx.TransportError as e:
+                endpoint.failures += 1
+                last_error = e
+                logger.warning(f"Ollama endpoint {endpoint.api_url} failed, trying next endpoint: {e}")
+            except Exception:
+                endpoint.failures += 1
+                raise
+            finally:
+                endpoint.in_flight -= 1
+        raise last_error
+
+    async def generate(self, model: str, prompt: str, is_eval: bool = False,
+                       system_prompt: str = DEFAULT_SYSTEM_PROMPT, keep_alive: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get response from Ollama model.
+        Returns a dict with keys: response, prompt_tokens, eval_count, tps (or None on error)
+        """
+        from rag_pipeline.util.api.ollama_client import OllamaUtil
+
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "verbose": True,
+            "system": system_prompt,
+            "stream": False,
+            "keep_alive": keep_alive if keep_alive is not None else self.keep_alive
+        }
+        if is_eval:
+            payload["think"] = "low"
+
+        try:
+            data = await self._run(self._post("generate", payload, "eval" if is_eval else "default"))
+            return OllamaUtil.parse_generate_response(data, model, prompt, is_eval)
+        except httpx.HTTPError as e:
+            logger.error(f"Error connecting to Ollama server: {e}")
+            logger.error(f"Please ensure Ollama is running and the model: {model} is pulled.")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting Ollama response: {e}")
+            return None
+
+    async def embed(self, model: str, texts: List[str], keep_alive: Optional[str] = None) -> List[List[float]]:
+        """
+        Embed a list of texts with a single /api/embed call.
+
+        Raises:
+            RuntimeError: If the API call fails or returns an unexpected number of embeddings
+        """
+        payload = {
+            "model": model,
+            "input": texts,
+            "keep_alive": keep_alive if keep_alive is not None else self.keep_alive
+        }
+        try:
+            data = await self._run(self._post("embed", payload, "default"))
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Embedding API call failed: {e}")
+
+        embeddings = data.get("embeddings", [])
+        if len(embeddings) != len(texts):
+            raise RuntimeError(f"Expected {len(texts)} embeddings from API, got {len(embeddings)}")
+        return embeddings
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get routing statistics for every endpoint"""
+        return {
+            "routing": self.routing,
+            "keep_alive": self.keep_alive,
+            "pools": {name: [e.to_dict() for e in pool] for name, pool in self.pools.items()}
+        }
+
+    async def aclose(self):
+        """Close the pooled HTTP client and stop the background loop"""
+        if self._loop is None:
+            return
+        if self._client is not None:
+            await self._run(self._client.aclose())
+            self._client = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        # Semaphores were bound to the stopped loop
+        for pool in self.pools.values():
+            for endpoint in pool:
+                endpoint.semaphore = None
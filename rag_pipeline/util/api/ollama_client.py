@@ -76,47 +76,65 @@ class OllamaUtil:
             response = session.post(url, data=json.dumps(payload), headers=headers, timeout=900)
             response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
             data = response.json()
-            
-            # Calculate TPS with error handling
-            tps = None
-            prompt_tokens = data.get("prompt_eval_count")
-            eval_count = data.get("eval_count")
-            eval_duration = data.get("eval_duration")
-            
-            logger.info(f"eval_count: {eval_count}, eval_duration: {eval_duration}")
-            
-            if eval_count is not None and eval_duration is not None and eval_duration > 0:
-                # Convert nanoseconds to seconds and calculate TPS
-                duration_seconds = eval_duration / 1_000_000_000
-                tps = eval_count / duration_seconds
-                logger.debug(f"Model: {model}, Prompt: {prompt[:50]}...,\n Calculated TPS: {tps:.2f} tokens/second")
-            else:
-                logger.warning(f"Cannot calculate TPS - eval_count: {eval_count}, eval_duration: {eval_duration}")
-            
-            response_text = data.get("response")
-            if is_eval: logger.info(f"Response text: {response_text}")
-            # Remove <think>...</think> sections from the response, if present
-            import re
-            if response_text:
-                # Remove all occurrences of <think>...</think> (non-greedy, multiline)
-                response_text = re.sub(r"<think>.*?</think>", "", response_text, flags=re.DOTALL)
-                # Optionally, strip leading/trailing whitespace
-                response_text = response_text.strip()
-            # Fallback: estimate tokens if not present
-            if prompt_tokens is None:
-                prompt_tokens = len(prompt.split())
-            if eval_count is None and response_text:
-                eval_count = len(response_text.split())
-            return {
-                "response": response_text,
-                "prompt_tokens": prompt_tokens,
-                "eval_count": eval_count,
-                "tps": tps
-            }
+            return OllamaUtil.parse_generate_response(data, model, prompt, is_eval)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error connecting to Ollama server: {e}")
             logger.error(f"Please ensure Ollama is running and the model: {model} is pulled.")
             return None 
         except Exception as e:
             logger.error(f"Error getting Ollama response: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def parse_generate_response(data, model, prompt, is_eval=False):
+        """
+        Convert a raw /api/generate response body into the dict returned by get_ollama_response.
+        Returns a dict with keys: response, prompt_tokens, eval_count, tps
+        """
+        # Calculate TPS with error handling
+        tps = None
+        prompt_tokens = data.get("prompt_eval_count")
+        eval_count = data.get("eval_count")
+        eval_duration = data.get("eval_duration")
+        
+        logger.info(f"eval_count: {eval_count}, eval_duration: {eval_duration}")
+        
+        if eval_count is not None and eval_duration is not None and eval_duration > 0:
+            # Convert nanoseconds to seconds and calculate TPS
+            duration_seconds = eval_duration / 1_000_000_000
+            tps = eval_count / duration_seconds
+            logger.debug(f"Model: {model}, Prompt: {prompt[:50]}...,\n Calculated TPS: {tps:.2f} tokens/second")
+        else:
+            logger.warning(f"Cannot calculate TPS - eval_count: {eval_count}, eval_duration: {eval_duration}")
+        
+        response_text = data.get("response")
+        if is_eval: logger.info(f"Response text: {response_text}")
+        # Remove <think>...</think> sections from the response, if present
+        import re
+        if response_text:
+            # Remove all occurrences of <think>...</think> (non-greedy, multiline)
+            response_text = re.sub(r"<think>.*?</think>", "", response_text, flags=re.DOTALL)
+            # Optionally, strip leading/trailing whitespace
+            response_text = response_text.strip()
+        # Fallback: estimate tokens if not present
+        if prompt_tokens is None:
+            prompt_tokens = len(prompt.split())
+        if eval_count is None and response_text:
+            eval_count = len(response_text.split())
+        return {
+            "response": response_text,
+            "prompt_tokens": prompt_tokens,
+            "eval_count": eval_count,
+            "tps": tps
+        }
+
+    @staticmethod
+    async def aget_ollama_response(model, prompt, is_eval=False, system_prompt="ANSWER ONLY THE QUESTION YOU ARE ASKED AS CONCISE AS POSSIBLE.", keep_alive=None):
+        """
+        Awaitable version of get_ollama_response that goes through the shared AsyncOllamaClient.
+        Returns a dict with keys: response, prompt_tokens, eval_count, tps (or None on error)
+        """
+        from rag_pipeline.util.api.async_ollama_client import AsyncOllamaClient
+        return await AsyncOllamaClient.get_instance().generate(
+            model, prompt, is_eval=is_eval, system_prompt=system_prompt, keep_alive=keep_alive
+        )
@@ -0,0 +1,24 @@
+"""
+Caching utilities.
+
+Provides utilities for:
+- Shared SQLite plumbing of the content-addressed caches
+- Memoizing pipeline stage outputs across configuration combinations
+- Content-addressed embedding storage shared by all embedding call sites
+- Replaying LLM graph extraction results per text chunk
+- Reusing LLM-as-judge verdicts per (answer, ground truth) pair
+"""
+
+from .sqlite_cache import SQLiteCache, get_shared_cache
+from .stage_cache import StageCache, get_stage_cache, DEFAULT_STAGE_CACHE_DIR, STAGE_CACHE_VERSION
+from .embedding_cache import EmbeddingCache, get_embedding_cache, DEFAULT_EMBEDDING_CACHE_PATH
+from .extraction_cache import ExtractionCache, get_extraction_cache, DEFAULT_EXTRACTION_CACHE_PATH
+from .judge_cache import JudgeCache, get_judge_cache, DEFAULT_JUDGE_CACHE_PATH
+
+__all__ = [
+    'SQLiteCache', 'get_shared_cache',
+    'StageCache', 'get_stage_cache', 'DEFAULT_STAGE_CACHE_DIR', 'STAGE_CACHE_VERSION',
+    'EmbeddingCache', 'get_embedding_cache', 'DEFAULT_EMBEDDING_CACHE_PATH',
+    'ExtractionCache', 'get_extraction_cache', 'DEFAULT_EXTRACTION_CACHE_PATH',
+    'JudgeCache', 'get_judge_cache', 'DEFAULT_JUDGE_CACHE_PATH'
+]
@@ -0,0 +1,131 @@
+"""
+Content-addressed embedding cache.
+
+Ground-truth answers, repeated queries and repeated chunks are embedded over and
+over across configuration combinations. This cache stores every embedding keyed by
+(model, sha256(text)) so each distinct text is embedded once per model. Vectors
+are kept as float32 arrays in an LRU memory tier and as float32 blobs in SQLite;
+embed_many looks up a whole batch and only embeds the misses.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from .sqlite_cache import SQLiteCache, get_shared_cache
+
+DEFAULT_EMBEDDING_CACHE_PATH = os.path.join("rag_pipeline", "embedding_cache", "embeddings.sqlite")
+
+
+class EmbeddingCache(SQLiteCache):
+    """Two-tier (memory LRU + SQLite) cache for text embeddings"""
+
+    name = "embedding"
+    table = "embeddings"
+    namespace_columns = ("model",)
+    hash_columns = ("text_hash",)
+    value_column = "vector"
+    value_type = "BLOB"
+
+    def __init__(self, db_path: Optional[str] = None, max_memory_entries: int = 20000):
+        """
+        Initialize the embedding cache
+
+        Args:
+            db_path: Path of the SQLite database (None disables the persistent tier)
+            max_memory_entries: Maximum number of embeddings kept in memory
+        """
+        super().__init__(db_path)
+        self.max_memory_entries = max(1, max_memory_entries)
+        self._memory: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+    def _encode(self, vector: np.ndarray) -> bytes:
+        return vector.tobytes()
+
+    def _decode(self, blob: bytes) -> np.ndarray:
+        return np.frombuffer(blob, dtype=np.float32)
+
+    def _load(self, vector: np.ndarray) -> List[float]:
+        return vector.tolist()
+
+    def _recall(self, key: tuple) -> Optional[np.ndarray]:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+        return vector
+
+    def _remember(self, key: tuple, vector: np.ndarray):
+        """Insert into the memory tier, evicting the least recently used entries (lock must be held)"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up the embeddings of several texts
+
+        Returns:
+            One embedding (or None on a miss) per text, in the same order as texts
+        """
+        return self._get_many((model,), [(self.text_hash(text),) for text in texts])
+
+    def put_many(self, model: str, texts: Sequence[str], embeddings: Sequence[Sequence[float]]):
+        """Store the embeddings of several texts in both tiers"""
+        # Never cache failed (empty) embeddings
+        self._put_many((model,), [
+            ((self.text_hash(text),), np.asarray(embedding, dtype=np.float32))
+            for text, embedding in zip(texts, embeddings)
+            if embedding is not None and len(embedding) > 0
+        ])
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Look up the embedding of a single text"""
+        return self.get_many(model, [text])[0]
+
+    def put(self, model: str, text: str, embedding: Sequence[float]):
+        """Store the embedding of a single text"""
+        self.put_many(model, [text], [embedding])
+
+    def embed_many(self, model: str, texts: Sequence[str],
+                   embed_fn: Callable[[List[str]], List[List[float]]]) -> List[List[float]]:
+        """
+        Get embeddings for several texts, calling embed_fn only for the distinct cache misses
+
+        Args:
+            model: Cache namespace of the embeddings (usually the embedding model name)
+            texts: Texts to embed
+            embed_fn: Function embedding a list of texts, in order
+
+        Returns:
+            One embedding per text, in the same order as texts
+        """
+        texts = list(texts)
+        results = self.get_many(model, texts)
+
+        # Deduplicate misses so a text repeated inside one batch is embedded once
+        missing = list(dict.fromkeys(text for text, result in zip(texts, results) if result is None))
+        if missing:
+            embeddings = embed_fn(missing)
+            self.put_many(model, missing, embeddings)
+            computed = dict(zip(missing, embeddings))
+            results = [result if result is not None else computed[text] for text, result in zip(texts, results)]
+
+        return results
+
+    def embed(self, model: str, text: str, embed_fn: Callable[[str], List[float]]) -> List[float]:
+        """Get the embedding of a single text, calling embed_fn only on a cache miss"""
+        return self.embed_many(model, [text], lambda missing: [embed_fn(missing[0])])[0]
+
+
+def get_embedding_cache(db_path: Optional[str] = None) -> EmbeddingCache:
+    """
+    Get the process-wide embedding cache (EMBEDDING_CACHE_ENABLED / EMBEDDING_CACHE_PATH).
+
+    EMBEDDING_CACHE_MAX_MEMORY_ENTRIES bounds the memory tier of a newly created cache.
+    """
+    max_entries = int(os.getenv("EMBEDDING_CACHE_MAX_MEMORY_ENTRIES", "20000"))
+    return get_shared_cache(EmbeddingCache, "EMBEDDING_CACHE", DEFAULT_EMBEDDING_CACHE_PATH, db_path,
+                            max_memory_entries=max_entries)
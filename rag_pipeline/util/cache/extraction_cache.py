@@ -0,0 +1,62 @@
+"""
+Content-addressed cache for LLM graph extraction results.
+
+Building a knowledge graph or hypergraph means one LLM call per text chunk. This cache
+stores the parsed extraction of every chunk keyed by
+(model, prompt version, sha256(chunk)) so rebuilding a graph (a wiped database, a
+different Neo4j instance, another retriever config) replays the stored results
+instead of calling the LLM again.
+"""
+
+import os
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from .sqlite_cache import SQLiteCache, get_shared_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTRACTION_CACHE_PATH = os.path.join("rag_pipeline", "extraction_cache", "extractions.sqlite")
+
+
+class ExtractionCache(SQLiteCache):
+    """SQLite-backed cache for per-chunk extraction results"""
+
+    name = "extraction"
+    table = "extractions"
+    namespace_columns = ("model", "prompt_version")
+    hash_columns = ("chunk_hash",)
+    value_column = "result"
+    value_type = "TEXT"
+
+    def _load(self, value: str) -> List[Dict[str, Any]]:
+        # Entries are kept as JSON and decoded per lookup so callers never share mutable results
+        return json.loads(value)
+
+    def get_many(self, model: str, prompt_version: str, chunks: Sequence[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Look up the extraction results of several chunks
+
+        Returns:
+            One result (or None on a miss) per chunk, in the same order as chunks
+        """
+        return self._get_many((model, prompt_version), [(self.text_hash(chunk),) for chunk in chunks])
+
+    def get(self, model: str, prompt_version: str, chunk: str) -> Optional[List[Dict[str, Any]]]:
+        """Look up the extraction result of a single chunk"""
+        return self.get_many(model, prompt_version, [chunk])[0]
+
+    def put(self, model: str, prompt_version: str, chunk: str, result: List[Dict[str, Any]]):
+        """Store the extraction result of a chunk"""
+        try:
+            payload = json.dumps(result)
+        except Exception as e:
+            logger.warning(f"Extraction result is not cacheable: {e}")
+            return
+        self._put_many((model, prompt_version), [((self.text_hash(chunk),), payload)])
+
+
+def get_extraction_cache(db_path: Optional[str] = None) -> ExtractionCache:
+    """Get the process-wide extraction cache (EXTRACTION_CACHE_ENABLED / EXTRACTION_CACHE_PATH)"""
+    return get_shared_cache(ExtractionCache, "EXTRACTION_CACHE", DEFAULT_EXTRACTION_CACHE_PATH, db_path)
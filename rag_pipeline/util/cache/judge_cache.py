@@ -0,0 +1,59 @@
+"""
+Content-addressed cache for LLM-as-judge verdicts.
+
+Different configuration combinations often produce byte-identical answers (e.g. when
+only the reranker changes and the top passages stay the same). This cache stores the
+judge score of every answer keyed by
+(judge model, prompt version, sha256(answer), sha256(ground truth)) so an answer is
+judged once per judge model and prompt template.
+"""
+
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from .sqlite_cache import SQLiteCache, get_shared_cache
+
+DEFAULT_JUDGE_CACHE_PATH = os.path.join("rag_pipeline", "judge_cache", "verdicts.sqlite")
+
+
+class JudgeCache(SQLiteCache):
+    """SQLite-backed cache for judge scores of (answer, ground truth) pairs"""
+
+    name = "judge"
+    table = "verdicts"
+    namespace_columns = ("model", "prompt_version")
+    hash_columns = ("answer_hash", "ground_truth_hash")
+    value_column = "score"
+    value_type = "REAL"
+
+    def _pair_hashes(self, pairs: Sequence[Tuple[str, str]]) -> List[tuple]:
+        return [(self.text_hash(answer), self.text_hash(ground_truth)) for answer, ground_truth in pairs]
+
+    def get_many(self, model: str, prompt_version: str,
+                 pairs: Sequence[Tuple[str, str]]) -> List[Optional[float]]:
+        """
+        Look up the verdicts of several (answer, ground truth) pairs
+
+        Returns:
+            One score (or None on a miss) per pair, in the same order as pairs
+        """
+        return self._get_many((model, prompt_version), self._pair_hashes(pairs))
+
+    def put_many(self, model: str, prompt_version: str,
+                 pairs: Sequence[Tuple[str, str]], scores: Sequence[float]):
+        """Store the verdicts of several (answer, ground truth) pairs"""
+        self._put_many((model, prompt_version),
+                       [(h, float(score)) for h, score in zip(self._pair_hashes(pairs), scores)])
+
+    def get(self, model: str, prompt_version: str, answer: str, ground_truth: str) -> Optional[float]:
+        """Look up the verdict of a single pair"""
+        return self.get_many(model, prompt_version, [(answer, ground_truth)])[0]
+
+    def put(self, model: str, prompt_version: str, answer: str, ground_truth: str, score: float):
+        """Store the verdict of a single pair"""
+        self.put_many(model, prompt_version, [(answer, ground_truth)], [score])
+
+
+def get_judge_cache(db_path: Optional[str] = None) -> JudgeCache:
+    """Get the process-wide judge cache (JUDGE_CACHE_ENABLED / JUDGE_CACHE_PATH)"""
+    return get_shared_cache(JudgeCache, "JUDGE_CACHE", DEFAULT_JUDGE_CACHE_PATH, db_path)
@@ -0,0 +1,217 @@
+"""
+Shared plumbing of the content-addressed SQLite caches.
+
+The embedding, extraction and judge caches all store values keyed by
+(namespace columns..., content hash columns...), e.g. (model, sha256(text)):
+- an in-process memory tier of decoded values
+- a persistent SQLite tier (WAL mode) shared between processes
+- batched lookups reading the memory misses with one statement per _SQLITE_BATCH_SIZE keys
+- a process-wide registry per database path, configured through *_CACHE_ENABLED and
+  *_CACHE_PATH environment variables
+
+Subclasses only describe their table and how values are encoded.
+"""
+
+import os
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of host parameters per statement (up to two per key)
+_SQLITE_BATCH_SIZE = 400
+
+
+class SQLiteCache:
+    """Base class of the two-tier (memory + SQLite) content-addressed caches"""
+
+    # Human readable name used in log messages
+    name = "cache"
+    # Table layout: the namespace columns are shared by every key of a lookup, the hash
+    # columns identify the entry inside the namespace
+    table = ""
+    namespace_columns: Tuple[str, ...] = ()
+    hash_columns: Tuple[str, ...] = ()
+    value_column = "value"
+    value_type = "BLOB"
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the cache
+
+        Args:
+            db_path: Path of the SQLite database (None keeps the entries in memory only)
+        """
+        self.db_path = db_path
+        self._memory: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+        if self.db_path:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                key_columns = self.namespace_columns + self.hash_columns
+                columns = ", ".join(f"{column} TEXT NOT NULL" for column in key_columns)
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                    f"{columns}, {self.value_column} {self.value_type} NOT NULL, "
+                    f"PRIMARY KEY ({', '.join(key_columns)})) WITHOUT ROWID"
+                )
+                self._conn.commit()
+            except Exception as e:
+                logger.warning(f"Could not open {self.name} cache at {self.db_path}, using memory only: {e}")
+                self._conn = None
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Content hash used in the cache keys"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _encode(self, value: Any) -> Any:
+        """Convert a memory tier value into its SQLite column value"""
+        return value
+
+    def _decode(self, stored: Any) -> Any:
+        """Convert a SQLite column value into its memory tier value"""
+        return stored
+
+    def _load(self, value: Any) -> Any:
+        """Convert a memory tier value into the result handed to callers"""
+        return value
+
+    def _recall(self, key: tuple) -> Any:
+        """Look up the memory tier (lock must be held)"""
+        return self._memory.get(key)
+
+    def _remember(self, key: tuple, value: Any):
+        """Insert into the memory tier (lock must be held)"""
+        self._memory[key] = value
+
+    def _read_disk(self, namespace: tuple, hashes: List[tuple]) -> List[tuple]:
+        """Read the (hashes..., value) rows of several keys of one namespace (lock must be held)"""
+        rows = []
+        for start in range(0, len(hashes), _SQLITE_BATCH_SIZE):
+            chunk = hashes[start:start + _SQLITE_BATCH_SIZE]
+            if len(self.hash_columns) == 1:
+                condition = f"{self.hash_columns[0]} IN ({','.join('?' * len(chunk))})"
+            else:
+                condition = " OR ".join(
+                    ["(" + " AND ".join(f"{column} = ?" for column in self.hash_columns) + ")"] * len(chunk)
+                )
+            namespace_condition = "".join(f"{column} = ? AND " for column in self.namespace_columns)
+            try:
+                rows.extend(self._conn.execute(
+                    f"SELECT {', '.join(self.hash_columns)}, {self.value_column} FROM {self.table} "
+                    f"WHERE {namespace_condition}({condition})",
+                    [*namespace, *[h for key in chunk for h in key]]
+                ).fetchall())
+            except Exception as e:
+                logger.warning(f"Failed to read {self.name} cache: {e}")
+                break
+        return rows
+
+    def _get_many(self, namespace: tuple, hashes: Sequence[tuple]) -> List[Optional[Any]]:
+        """
+        Look up several entries of one namespace
+
+        Args:
+            namespace: Values of the namespace columns
+            hashes: Values of the hash columns, one tuple per entry
+
+        Returns:
+            One result (or None on a miss) per entry, in the same order as hashes
+        """
+        values: Dict[tuple, Any] = {}
+        memory_hits = set()
+
+        with self._lock:
+            for h in hashes:
+                value = self._recall(namespace + h)
+                if value is not None:
+                    values[h] = value
+                    memory_hits.add(h)
+
+            missing = [h for h in dict.fromkeys(hashes) if h not in values]
+            if missing and self._conn is not None:
+                for row in self._read_disk(namespace, missing):
+                    h = tuple(row[:-1])
+                    try:
+                        value = self._decode(row[-1])
+                    except Exception as e:
+                        logger.warning(f"Failed to decode {self.name} cache entry {h}: {e}")
+                        continue
+                    self._remember(namespace + h, value)
+                    values[h] = value
+
+            results = []
+            for h in hashes:
+                result = None
+                if h in values:
+                    try:
+                        result = self._load(values[h])
+                    except Exception as e:
+                        logger.warning(f"Failed to decode {self.name} cache entry {h}: {e}")
+                if result is None:
+                    self.stats["misses"] += 1
+                else:
+                    self.stats["memory_hits" if h in memory_hits else "disk_hits"] += 1
+                results.append(result)
+        return results
+
+    def _put_many(self, namespace: tuple, entries: Sequence[Tuple[tuple, Any]]):
+        """Store several (hashes, value) entries of one namespace in both tiers"""
+        if not entries:
+            return
+
+        with self._lock:
+            rows = []
+            for h, value in entries:
+                self._remember(namespace + h, value)
+                rows.append((*namespace, *h, self._encode(value)))
+            self.stats["writes"] += len(rows)
+
+            if self._conn is not None:
+                columns = self.namespace_columns + self.hash_columns + (self.value_column,)
+                try:
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO {self.table} ({', '.join(columns)}) "
+                        f"VALUES ({', '.join('?' * len(columns))})", rows
+                    )
+                    self._conn.commit()
+                except Exception as e:
+                    logger.warning(f"Failed to write {self.name} cache: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics of the cache"""
+        with self._lock:
+            return {**self.stats, "memory_entries": len(self._memory), "db_path": self.db_path}
+
+
+_CACHES: Dict[Tuple[type, Optional[str]], SQLiteCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_shared_cache(cache_class: Type[SQLiteCache], env_prefix: str, default_path: str,
+                     db_path: Optional[str] = None, **kwargs) -> SQLiteCache:
+    """
+    Get the process-wide cache of a class.
+
+    Without an explicit path the <env_prefix>_PATH environment variable is used
+    (default default_path); setting <env_prefix>_ENABLED=false keeps the cache in
+    memory only. Extra keyword arguments are passed to the constructor when the
+    cache is first created.
+    """
+    if db_path is None and os.getenv(f"{env_prefix}_ENABLED", "true").lower() != "false":
+        db_path = os.getenv(f"{env_prefix}_PATH", default_path)
+    with _CACHES_LOCK:
+        key = (cache_class, db_path)
+        if key not in _CACHES:
+            _CACHES[key] = cache_class(db_path, **kwargs)
+        return _CACHES[key]
@@ -0,0 +1,150 @@
+"""
+Stage output cache for the modular RAG pipeline.
+
+Combinations produced by ModularRAGConfig.create_config_combinations often share
+the same leading stages (pre-embedding, query expansion, retrieval, rerank, ...).
+This cache stores the raw result of each stage keyed by:
+- STAGE_CACHE_VERSION (the version of prompts and component code)
+- the stage's config fingerprint
+- the fingerprint of everything upstream of it (dataset + earlier stage keys)
+- the query
+
+so a sweep over e.g. several generators only runs retrieval/rerank once per query.
+Entries live in an in-memory LRU tier; an on-disk pickle tier that survives
+restarts is opt-in (a cache_dir such as DEFAULT_STAGE_CACHE_DIR).
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGE_CACHE_DIR = os.path.join("rag_pipeline", "stage_cache")
+
+# Bump whenever prompts (prompts.py) or component behaviour change so that persisted
+# stage outputs of the old code are not reused
+STAGE_CACHE_VERSION = "v1"
+
+
+class StageCache:
+    """Two-tier (memory LRU + disk) cache for pipeline stage outputs"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_entries: int = 4096):
+        """
+        Initialize the stage cache
+
+        Args:
+            cache_dir: Directory for the on-disk tier (None disables the disk tier)
+            max_memory_entries: Maximum number of entries kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max(1, max_memory_entries)
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(stage: str, config_fingerprint: str, upstream_fingerprint: str, query: str) -> str:
+        """Build the cache key for a stage output"""
+        hasher = hashlib.sha256()
+        for part in (STAGE_CACHE_VERSION, stage, config_fingerprint, upstream_fingerprint, query):
+            hasher.update(str(part).encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.pkl")
+
+    def _remember(self, key: str, payload: bytes):
+        """Insert into the memory tier, evicting the least recently used entries"""
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached stage output
+
+        Returns:
+            A fresh copy of the cached value, or None on a miss
+        """
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+
+        if payload is None and self.cache_dir:
+            path = self._disk_path(key)
+            if os.path.exists(path):
+                try:
+                    with open(path, "rb") as f:
+                        payload = f.read()
+                    self._remember(key, payload)
+                    self.stats["disk_hits"] += 1
+                except Exception as e:
+                    logger.warning(f"Failed to read stage cache entry {key}: {e}")
+                    payload = None
+
+        if payload is None:
+            self.stats["misses"] += 1
+            return None
+
+        try:
+            # Values are stored pickled so every hit gets its own copy
+            return pickle.loads(payload)
+        except Exception as e:
+            logger.warning(f"Failed to decode stage cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, value: Any):
+        """Store a stage output in both tiers"""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Stage output for {key} is not cacheable: {e}")
+            return
+
+        self._remember(key, payload)
+        self.stats["writes"] += 1
+
+        if self.cache_dir:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Write to a temp file first so concurrent readers never see partial entries
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"Failed to write stage cache entry {key}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics of the cache"""
+        with self._lock:
+            memory_entries = len(self._memory)
+        return {**self.stats, "memory_entries": memory_entries, "cache_dir": self.cache_dir}
+
+
+_STAGE_CACHES: Dict[Tuple[Optional[str], int], StageCache] = {}
+_STAGE_CACHES_LOCK = threading.Lock()
+
+
+def get_stage_cache(cache_dir: Optional[str] = None, max_memory_entries: int = 4096) -> StageCache:
+    """Get the process-wide stage cache for a cache directory"""
+    key = (cache_dir, max_memory_entries)
+    with _STAGE_CACHES_LOCK:
+        if key not in _STAGE_CACHES:
+            _STAGE_CACHES[key] = StageCache(cache_dir, max_memory_entries)
+        return _STAGE_CACHES[key]
@@ -3,51 +3,139 @@ Semantic text comparison utilities using embeddings.
 
 Provides semantic similarity measurement using:
 - Embedding models (via Ollama)
-- Cosine similarity calculation
+- Cosine similarity calculation, batched as one NumPy matrix operation
+- Cached embeddings, so repeated texts (e.g. ground truths) are embedded once
 """
 
 import os
+import hashlib
+import logging
+import threading
+from typing import List, Sequence
+
 import numpy as np
 from langchain_community.embeddings import OllamaEmbeddings
 
+from rag_pipeline.util.api.ollama_client import OllamaUtil
+from rag_pipeline.util.cache.embedding_cache import get_embedding_cache
+
+logger = logging.getLogger(__name__)
+
 
 class SemanticComparison:
     """Semantic text comparison using embedding models"""
-    
+
+    # Hashes of the reference sets (cache namespace + texts) already embedded in this process
+    _prepared_references = set()
+    _prepared_references_lock = threading.Lock()
+
     def __init__(self, embedding_model):
         """
         Initialize semantic comparison with embedding model.
-        
+
         Args:
             embedding_model: Name of the embedding model to use
         """
         # Get the Ollama API URL from environment variable
-        ollama_api_url = os.getenv("OLLAMA_API_URL", "http://localhost:11435/api")
+        self.ollama_api_url = os.getenv("OLLAMA_API_URL", "http://localhost:11435/api")
         # Extract the base URL without the '/api' suffix for OllamaEmbeddings
-        base_url = ollama_api_url.replace("/api", "")
-        
+        base_url = self.ollama_api_url.replace("/api", "")
+
+        self.embedding_model = embedding_model
         self.embedding = OllamaEmbeddings(
             model=embedding_model,
             base_url=base_url
         )
-    
+        # OllamaEmbeddings.embed_query prepends a query instruction, so these vectors
+        # are kept apart from raw API embeddings of the same text
+        self.cache_namespace = f"{embedding_model}|langchain_query"
+        self.embedding_cache = get_embedding_cache()
+
     def get_similarity_score(self, pred: str, gt: str) -> float:
         """
         Calculate semantic similarity score between prediction and ground truth.
-        
+
         Args:
             pred: Predicted text
             gt: Ground truth text
-            
+
         Returns:
             Cosine similarity score between embeddings
         """
-        embedding1 = self.embedding.embed_query(pred)
-        embedding2 = self.embedding.embed_query(gt)
-        return self.__cosine_similarity(embedding1, embedding2)
+        return self.get_similarity_scores([pred], [gt])[0]
+
+    def get_similarity_scores(self, preds: Sequence[str], gts: Sequence[str]) -> List[float]:
+        """
+        Calculate the semantic similarity of several prediction/ground truth pairs.
+
+        All texts missing from the embedding cache are embedded with one batched call.
+
+        Args:
+            preds: Predicted texts
+            gts: Ground truth texts, one per prediction
+
+        Returns:
+            Cosine similarity score of each pair, in order
+        """
+        if len(preds) != len(gts):
+            raise ValueError(f"Got {len(preds)} predictions for {len(gts)} ground truths")
+        if not preds:
+            return []
+
+        embeddings = self.embed_texts(list(preds) + list(gts))
+        pred_matrix = np.asarray(embeddings[:len(preds)], dtype=np.float64)
+        gt_matrix = np.asarray(embeddings[len(preds):], dtype=np.float64)
+        return self.__row_cosine_similarity(pred_matrix, gt_matrix).tolist()
+
+    def embed_texts(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed texts as queries, requesting only the cache misses in one batched call"""
+        return self.embedding_cache.embed_many(self.cache_namespace, texts, self._request_embeddings)
+
+    def prepare_references(self, texts: Sequence[str]) -> str:
+        """
+        Embed a set of reference texts (e.g. the ground truths of a dataset) ahead of scoring.
+
+        The embeddings are persisted by the embedding cache, and a reference set is only
+        looked up once per process.
+
+        Returns:
+            Hash identifying the reference set
+        """
+        texts = list(dict.fromkeys(text for text in texts if text))
+        reference_hash = hashlib.sha256(
+            "\n".join([self.cache_namespace] + sorted(self.embedding_cache.text_hash(text) for text in texts)).encode("utf-8")
+        ).hexdigest()
+        with self._prepared_references_lock:
+            if reference_hash in self._prepared_references:
+                return reference_hash
+
+        self.embed_texts(texts)
+        with self._prepared_references_lock:
+            self._prepared_references.add(reference_hash)
+        logger.info(f"Prepared {len(texts)} reference embeddings for {self.embedding_model} (set {reference_hash[:12]})")
+        return reference_hash
+
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with one call to Ollama's /api/embed endpoint, one request per text on failure"""
+        instruction = getattr(self.embedding, "query_instruction", None) or ""
+        try:
+            response = OllamaUtil.get_session().post(
+                f"{self.ollama_api_url}/embed",
+                json={"model": self.embedding_model, "input": [f"{instruction}{text}" for text in texts]},
+                timeout=120
+            )
+            response.raise_for_status()
+            embeddings = response.json().get("embeddings", [])
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings from API, got {len(embeddings)}")
+            return embeddings
+        except Exception as e:
+            logger.warning(f"Batched embedding of {len(texts)} texts failed, embedding one by one: {e}")
+            return [self.embedding.embed_query(text) for text in texts]
 
-    def __cosine_similarity(self, vec1, vec2) -> float:
-        """Calculate cosine similarity between two vectors"""
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
-        return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2)) 
\ No newline at end of file
+    @staticmethod
+    def __row_cosine_similarity(matrix1: np.ndarray, matrix2: np.ndarray) -> np.ndarray:
+        """Calculate the cosine similarity of each pair of rows (0.0 for zero vectors)"""
+        norms = np.linalg.norm(matrix1, axis=1) * np.linalg.norm(matrix2, axis=1)
+        dots = np.einsum("ij,ij->i", matrix1, matrix2)
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
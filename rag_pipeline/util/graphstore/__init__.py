@@ -0,0 +1,18 @@
+"""
+Graph store utilities for graph-based retrieval.
+
+Provides utilities for:
+- Storage interfaces shared by GraphRAG and HyperGraphRAG
+- Embedded in-process graph stores (CSR adjacency, NumPy embeddings, on-disk persistence)
+- Neo4j graph stores (rag_pipeline.util.graphstore.neo4j_store, imported on demand)
+"""
+
+from .graph_store import KnowledgeGraphStore, HyperGraphStore
+from .embedded_store import EmbeddedKnowledgeGraphStore, EmbeddedHyperGraphStore
+
+__all__ = [
+    'KnowledgeGraphStore',
+    'HyperGraphStore',
+    'EmbeddedKnowledgeGraphStore',
+    'EmbeddedHyperGraphStore'
+]
@@ -0,0 +1,717 @@
+"""
+Embedded in-process graph stores for GraphRAG and HyperGraphRAG.
+
+The whole graph lives in the retrieval process, so queries cost no network round-trip
+or query planning and graph retrievers can be benchmarked without a Neo4j server:
+- nodes are numbered densely and looked up through a name -> id dict
+- relations / memberships are edge lists with CSR adjacency (indptr + edge ids)
+  built lazily after writes
+- node embeddings form one float32 NumPy matrix, so candidate search is a single
+  matrix-vector product
+- the graph is persisted to a directory of .npy arrays and JSON attribute files,
+  written to a temporary directory first and swapped in on flush()
+"""
+
+import os
+import json
+import time
+import shutil
+import logging
+import datetime
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from rag_pipeline.util.graphstore.graph_store import KnowledgeGraphStore, HyperGraphStore, EmbedManyFn
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+
+def _csr(rows: np.ndarray, num_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Group item ids by row: items of row i are item_ids[indptr[i]:indptr[i + 1]], in insertion order"""
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    if len(rows):
+        np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+    item_ids = np.argsort(rows, kind="stable").astype(np.int64)
+    return indptr, item_ids
+
+
+class _EmbeddingMatrix:
+    """Row-aligned node embeddings; rows of nodes without an embedding stay zero"""
+
+    def __init__(self, vectors: Optional[np.ndarray] = None, present: Optional[np.ndarray] = None):
+        self.vectors = vectors if vectors is not None and vectors.size else None
+        self.present = present if present is not None else np.zeros(0, dtype=bool)
+        self._normalized: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+    def grow(self, count: int):
+        """Make room for `count` nodes"""
+        if count > len(self.present):
+            self.present = np.concatenate([self.present, np.zeros(count - len(self.present), dtype=bool)])
+
+    def assign(self, ids: List[int], embeddings: List[List[float]]):
+        """Set the embeddings of some nodes"""
+        if not ids:
+            return
+        block = np.asarray(embeddings, dtype=np.float32)
+        if self.vectors is None:
+            self.vectors = np.zeros((len(self.present), block.shape[1]), dtype=np.float32)
+        elif block.shape[1] != self.vectors.shape[1]:
+            raise ValueError(f"Embedding dimension {block.shape[1]} does not match the stored dimension {self.vectors.shape[1]}")
+        if len(self.vectors) < len(self.present):
+            padding = np.zeros((len(self.present) - len(self.vectors), self.vectors.shape[1]), dtype=np.float32)
+            self.vectors = np.concatenate([self.vectors, padding])
+        self.vectors[ids] = block
+        self.present[ids] = True
+        self._normalized = None
+
+    def missing(self) -> np.ndarray:
+        """Ids of the nodes without an embedding"""
+        return np.flatnonzero(~self.present)
+
+    @property
+    def dimension(self) -> int:
+        return self.vectors.shape[1] if self.vectors is not None else 0
+
+    def search(self, query_embedding: List[float], similarity_threshold: float,
+               k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cosine search over the nodes with an embedding
+
+        Returns:
+            (ids, similarities) of at most k nodes with similarity >= similarity_threshold,
+            most similar first (ties broken by id)
+        """
+        if self.vectors is None or not self.present.any():
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        # Nodes added after the last assign() have no row yet
+        count = min(len(self.vectors), len(self.present))
+        if self._normalized is None or len(self._normalized) != count:
+            vectors = self.vectors[:count]
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            self._normalized = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        similarities = self._normalized @ (query / query_norm)
+
+        candidates = np.flatnonzero(self.present[:count] & (similarities >= similarity_threshold))
+        order = np.argsort(-similarities[candidates], kind="stable")
+        if k is not None:
+            order = order[:k]
+        ids = candidates[order]
+        return ids, similarities[ids]
+
+
+class _EmbeddedStore(ABC):
+    """Shared plumbing of the embedded stores: process-wide instances, locking and persistence"""
+
+    _KIND = ""
+    _instances: Dict[Tuple[type, str], "_EmbeddedStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._dirty = False
+
+    @classmethod
+    def open(cls, path: str):
+        """Get the process-wide store persisted at path, loading it on first use"""
+        key = (cls, os.path.abspath(path))
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls(key[1])
+                store.load()
+                cls._instances[key] = store
+            return store
+
+    def load(self):
+        """Load the persisted graph, if there is one"""
+        old_path = f"{self.path}.old"
+        if not os.path.exists(self.path) and os.path.exists(old_path):
+            # A previous flush stopped between its two renames
+            os.rename(old_path, self.path)
+
+        manifest_path = os.path.join(self.path, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != FORMAT_VERSION or manifest.get("kind") != self._KIND:
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} {self._KIND} store")
+
+        with self._lock:
+            self._load_files(manifest)
+        logger.info(f"Loaded embedded {self._KIND} store from {self.path}")
+
+    def flush(self):
+        """Persist the graph if it changed since the last flush"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.path}.tmp"
+            old_path = f"{self.path}.old"
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            os.makedirs(tmp_path)
+
+            manifest = {"format_version": FORMAT_VERSION, "kind": self._KIND, **self._write_files(tmp_path)}
+            with open(os.path.join(tmp_path, "manifest.json"), "w") as f:
+                json.dump(manifest, f)
+
+            shutil.rmtree(old_path, ignore_errors=True)
+            if os.path.exists(self.path):
+                os.rename(self.path, old_path)
+            os.rename(tmp_path, self.path)
+            shutil.rmtree(old_path, ignore_errors=True)
+            self._dirty = False
+
+    def close(self):
+        """Persist pending changes; the instance stays open for other users in the process"""
+        self.flush()
+
+    @abstractmethod
+    def _load_files(self, manifest: Dict[str, Any]):
+        """Load the graph from the files of the store directory"""
+        pass
+
+    @abstractmethod
+    def _write_files(self, path: str) -> Dict[str, Any]:
+        """Write the graph files into path and return the extra manifest entries"""
+        pass
+
+    @staticmethod
+    def _save_embeddings(path: str, prefix: str, matrix: _EmbeddingMatrix):
+        vectors = matrix.vectors if matrix.vectors is not None else np.zeros((0, 0), dtype=np.float32)
+        np.save(os.path.join(path, f"{prefix}_embeddings.npy"), vectors)
+        np.save(os.path.join(path, f"{prefix}_has_embedding.npy"), matrix.present)
+
+    @staticmethod
+    def _load_embeddings(path: str, prefix: str) -> _EmbeddingMatrix:
+        vectors = np.load(os.path.join(path, f"{prefix}_embeddings.npy"))
+        present = np.load(os.path.join(path, f"{prefix}_has_embedding.npy"))
+        return _EmbeddingMatrix(vectors, present)
+
+    def _embed_rows(self, matrix: _EmbeddingMatrix, ids: List[int], texts: List[str],
+                    embed_many: EmbedManyFn, batch_size: int, label: str) -> Dict[str, Any]:
+        """Embed texts in batches and store the vectors of their nodes"""
+        start_time = time.time()
+        embedded = 0
+        failed = 0
+        batch_size = max(1, batch_size)
+
+        for start in range(0, len(ids), batch_size):
+            batch_ids = ids[start:start + batch_size]
+            embeddings = embed_many(texts[start:start + batch_size])
+            ok_ids, ok_embeddings = [], []
+            for node_id, embedding in zip(batch_ids, embeddings):
+                if embedding and not all(x == 0.0 for x in embedding):
+                    ok_ids.append(node_id)
+                    ok_embeddings.append(embedding)
+                else:
+                    failed += 1
+            with self._lock:
+                matrix.assign(ok_ids, ok_embeddings)
+                self._dirty = True
+            embedded += len(ok_ids)
+
+        elapsed = time.time() - start_time
+        per_second = embedded / elapsed if elapsed > 0 else 0.0
+        if embedded or failed:
+            logger.info(f"Embedded {embedded} {label} nodes in {elapsed:.1f}s ({per_second:.1f} nodes/s), {failed} failed")
+        return {"embedded": embedded, "failed": failed, "seconds": elapsed, "per_second": per_second}
+
+
+class EmbeddedKnowledgeGraphStore(_EmbeddedStore, KnowledgeGraphStore):
+    """In-process knowledge graph with CSR adjacency and a NumPy entity embedding matrix"""
+
+    _KIND = "knowledge_graph"
+
+    # Properties a relation is merged on, like the MERGE of the Neo4j store
+    _RELATION_KEY = ("type", "source_doc", "doc_id", "relation_id")
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.entity_names: List[str] = []
+        self.entity_ids: Dict[str, int] = {}
+        self.entity_embeddings = _EmbeddingMatrix()
+        self.relation_sources: List[int] = []
+        self.relation_targets: List[int] = []
+        self.relations: List[Dict[str, Any]] = []
+        self._relation_index: Dict[tuple, int] = {}
+        self._adjacency = None
+
+    # ------------------------------------------------------------------ persistence
+
+    def _load_files(self, manifest: Dict[str, Any]):
+        with open(os.path.join(self.path, "entities.json")) as f:
+            self.entity_names = json.load(f)
+        self.entity_ids = {name: i for i, name in enumerate(self.entity_names)}
+        self.entity_embeddings = self._load_embeddings(self.path, "entity")
+
+        endpoints = np.load(os.path.join(self.path, "relation_endpoints.npy"))
+        self.relation_sources = endpoints[:, 0].tolist() if len(endpoints) else []
+        self.relation_targets = endpoints[:, 1].tolist() if len(endpoints) else []
+        with open(os.path.join(self.path, "relations.json")) as f:
+            self.relations = json.load(f)
+        self._reindex_relations()
+
+    def _write_files(self, path: str) -> Dict[str, Any]:
+        with open(os.path.join(path, "entities.json"), "w") as f:
+            json.dump(self.entity_names, f)
+        self._save_embeddings(path, "entity", self.entity_embeddings)
+        endpoints = np.array([self.relation_sources, self.relation_targets], dtype=np.int32).T.reshape(-1, 2)
+        np.save(os.path.join(path, "relation_endpoints.npy"), endpoints)
+        with open(os.path.join(path, "relations.json"), "w") as f:
+            json.dump(self.relations, f)
+        return {
+            "num_entities": len(self.entity_names),
+            "num_relations": len(self.relations),
+            "embedding_dimension": self.entity_embeddings.dimension
+        }
+
+    # ------------------------------------------------------------------ internals
+
+    def _reindex_relations(self):
+        self._relation_index = {
+            (source, target, *(attrs[key] for key in self._RELATION_KEY)): i
+            for i, (source, target, attrs) in enumerate(zip(self.relation_sources, self.relation_targets, self.relations))
+        }
+        self._adjacency = None
+
+    def _entity_id(self, name: str) -> int:
+        entity_id = self.entity_ids.get(name)
+        if entity_id is None:
+            entity_id = len(self.entity_names)
+            self.entity_names.append(name)
+            self.entity_ids[name] = entity_id
+        return entity_id
+
+    def _get_adjacency(self):
+        """CSR adjacency: (sources, targets, out_indptr, out_edges, in_indptr, in_edges)"""
+        if self._adjacency is None:
+            sources = np.asarray(self.relation_sources, dtype=np.int64)
+            targets = np.asarray(self.relation_targets, dtype=np.int64)
+            num_entities = len(self.entity_names)
+            self._adjacency = (sources, targets, *_csr(sources, num_entities), *_csr(targets, num_entities))
+        return self._adjacency
+
+    def _incident_edges(self, entity_id: int) -> np.ndarray:
+        _, _, out_indptr, out_edges, in_indptr, in_edges = self._get_adjacency()
+        return np.concatenate([
+            out_edges[out_indptr[entity_id]:out_indptr[entity_id + 1]],
+            in_edges[in_indptr[entity_id]:in_indptr[entity_id + 1]]
+        ])
+
+    def _hop_distances(self, start: int, max_depth: int) -> Dict[int, int]:
+        """Shortest hop distance (1..max_depth, ignoring direction) of the entities around start"""
+        sources, targets, out_indptr, out_edges, in_indptr, in_edges = self._get_adjacency()
+        distances = {start: 0}
+        frontier = [start]
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for node in frontier:
+                neighbours = np.concatenate([
+                    targets[out_edges[out_indptr[node]:out_indptr[node + 1]]],
+                    sources[in_edges[in_indptr[node]:in_indptr[node + 1]]]
+                ])
+                for neighbour in neighbours.tolist():
+                    if neighbour not in distances:
+                        distances[neighbour] = depth
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+            if not frontier:
+                break
+        del distances[start]
+        return distances
+
+    def _relation_record(self, edge: int, similarity: float) -> Dict[str, Any]:
+        attrs = self.relations[edge]
+        return {
+            'subject': self.entity_names[self.relation_sources[edge]],
+            'relation': attrs['type'],
+            'object': self.entity_names[self.relation_targets[edge]],
+            'source_doc': attrs.get('source_doc'),
+            'doc_id': attrs.get('doc_id'),
+            'sentence': attrs.get('sentence'),
+            'created_at': attrs.get('created_at'),
+            'chunk_id': attrs.get('chunk_id'),
+            'similarity': float(similarity)
+        }
+
+    # ------------------------------------------------------------------ KnowledgeGraphStore
+
+    def processed_document_ids(self, doc_ids: List[str]) -> Set[str]:
+        with self._lock:
+            stored = {attrs.get('doc_id') for attrs in self.relations}
+        return {doc_id for doc_id in doc_ids if doc_id in stored}
+
+    def write_relations(self, rows: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            for row in rows:
+                source = self._entity_id(row['subject'])
+                target = self._entity_id(row['object'])
+                attrs = {
+                    'type': row['type'],
+                    'source_doc': row.get('source_doc'),
+                    'doc_id': row.get('doc_id'),
+                    'relation_id': row.get('relation_id'),
+                    'sentence': row.get('sentence'),
+                    'created_at': row.get('created_at'),
+                    'chunk_id': row.get('chunk_id')
+                }
+                key = (source, target, *(attrs[k] for k in self._RELATION_KEY))
+                existing = self._relation_index.get(key)
+                if existing is not None:
+                    self.relations[existing] = attrs
+                    continue
+                self._relation_index[key] = len(self.relations)
+                self.relation_sources.append(source)
+                self.relation_targets.append(target)
+                self.relations.append(attrs)
+            self.entity_embeddings.grow(len(self.entity_names))
+            self._adjacency = None
+            self._dirty = True
+        return len(rows)
+
+    def embed_missing(self, embed_many: EmbedManyFn, batch_size: int = 64) -> Dict[str, Any]:
+        with self._lock:
+            ids = self.entity_embeddings.missing().tolist()
+            texts = [self.entity_names[i] for i in ids]
+        return self._embed_rows(self.entity_embeddings, ids, texts, embed_many, batch_size, "Entity")
+
+    def retrieve_basic(self, query_embedding: List[float], top_k: int,
+                       similarity_threshold: float, candidate_k: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids, similarities = self.entity_embeddings.search(query_embedding, similarity_threshold, candidate_k)
+            _, _, out_indptr, out_edges, _, _ = self._get_adjacency()
+
+            relations = []
+            seen = set()
+            for entity_id, similarity in zip(ids.tolist(), similarities.tolist()):
+                for edge in out_edges[out_indptr[entity_id]:out_indptr[entity_id + 1]].tolist():
+                    record = self._relation_record(edge, similarity)
+                    key = tuple(record.values())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    relations.append(record)
+                    if len(relations) >= top_k:
+                        return relations
+            return relations
+
+    def retrieve_traversal(self, query_embedding: List[float], top_k: int, similarity_threshold: float,
+                           max_depth: int, candidate_k: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids, similarities = self.entity_embeddings.search(query_embedding, similarity_threshold, candidate_k)
+
+            relations = []
+            seen = set()
+            for entity_id, similarity in zip(ids.tolist(), similarities.tolist()):
+                distances = self._hop_distances(entity_id, int(max_depth))
+                if not distances:
+                    continue
+
+                # Every relation touching the entity or a connected entity, with the
+                # distance of the closest (entity, connected) pair it belongs to
+                edge_distances: Dict[int, int] = {}
+                for edge in self._incident_edges(entity_id).tolist():
+                    edge_distances[edge] = min(distances.values())
+                for connected, distance in distances.items():
+                    for edge in self._incident_edges(connected).tolist():
+                        if distance < edge_distances.get(edge, max_depth + 1):
+                            edge_distances[edge] = distance
+
+                for edge, distance in edge_distances.items():
+                    record = self._relation_record(edge, similarity)
+                    record['distance'] = distance
+                    key = tuple(record.values())
+                    if key not in seen:
+                        seen.add(key)
+                        relations.append(record)
+
+        relations.sort(key=lambda r: (-r['similarity'], r['distance']))
+        return relations[:top_k]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entity_count = len(self.entity_names)
+            relation_count = len(self.relations)
+            embedded_count = int(self.entity_embeddings.present.sum())
+            doc_ids = {attrs['doc_id'] for attrs in self.relations if attrs.get('doc_id') is not None}
+            source_docs = {attrs['source_doc'] for attrs in self.relations if attrs.get('source_doc') is not None}
+            doc_counts = Counter(
+                (attrs['doc_id'], attrs.get('source_doc')) for attrs in self.relations if attrs.get('doc_id') is not None
+            )
+
+        doc_count = len(doc_ids)
+        return {
+            'total_entities': entity_count,
+            'total_relations': relation_count,
+            'entities_with_embeddings': embedded_count,
+            'embedding_coverage': embedded_count / entity_count if entity_count > 0 else 0,
+            'unique_documents': doc_count,
+            'unique_source_documents': len(source_docs),
+            'avg_relations_per_doc': relation_count / doc_count if doc_count > 0 else 0,
+            'top_documents_by_relations': [
+                {'doc_id': doc_id, 'source_doc': source_doc, 'relation_count': count}
+                for (doc_id, source_doc), count in doc_counts.most_common(10)
+            ]
+        }
+
+    def get_document_relations(self, doc_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            edges = [i for i, attrs in enumerate(self.relations) if attrs.get('doc_id') == doc_id]
+            edges.sort(key=lambda i: (self.relations[i].get('chunk_id') is None, self.relations[i].get('chunk_id') or 0,
+                                      str(self.relations[i].get('relation_id'))))
+            return [
+                {
+                    'subject': self.entity_names[self.relation_sources[i]],
+                    'relation': self.relations[i]['type'],
+                    'object': self.entity_names[self.relation_targets[i]],
+                    'sentence': self.relations[i].get('sentence'),
+                    'chunk_id': self.relations[i].get('chunk_id'),
+                    'created_at': self.relations[i].get('created_at')
+                }
+                for i in edges
+            ]
+
+    def get_documents_containing_entity(self, entity_name: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            entity_id = self.entity_ids.get(entity_name)
+            if entity_id is None:
+                return []
+            doc_counts = Counter()
+            for edge in self._incident_edges(entity_id).tolist():
+                attrs = self.relations[edge]
+                if attrs.get('doc_id') is not None:
+                    doc_counts[(attrs['doc_id'], attrs.get('source_doc'))] += 1
+
+        return [
+            {'doc_id': doc_id, 'source_doc': source_doc, 'relation_count': count}
+            for (doc_id, source_doc), count in doc_counts.most_common()
+        ]
+
+    def delete_document_relations(self, doc_id: str) -> int:
+        with self._lock:
+            keep = [i for i, attrs in enumerate(self.relations) if attrs.get('doc_id') != doc_id]
+            deleted = len(self.relations) - len(keep)
+            if deleted:
+                self.relation_sources = [self.relation_sources[i] for i in keep]
+                self.relation_targets = [self.relation_targets[i] for i in keep]
+                self.relations = [self.relations[i] for i in keep]
+                self._reindex_relations()
+                self._dirty = True
+            return deleted
+
+
+class EmbeddedHyperGraphStore(_EmbeddedStore, HyperGraphStore):
+    """In-process hypergraph with CSR membership lists and a NumPy hyperedge embedding matrix"""
+
+    _KIND = "hypergraph"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.entity_names: List[str] = []
+        self.entity_ids: Dict[str, int] = {}
+        self.hyperedges: List[Dict[str, Any]] = []
+        self._hyperedge_index: Dict[tuple, int] = {}
+        self.hyperedge_embeddings = _EmbeddingMatrix()
+        self.member_hyperedges: List[int] = []
+        self.member_entities: List[int] = []
+        self._memberships: Set[Tuple[int, int]] = set()
+        self._adjacency = None
+
+    # ------------------------------------------------------------------ persistence
+
+    def _load_files(self, manifest: Dict[str, Any]):
+        with open(os.path.join(self.path, "entities.json")) as f:
+            self.entity_names = json.load(f)
+        self.entity_ids = {name: i for i, name in enumerate(self.entity_names)}
+        with open(os.path.join(self.path, "hyperedges.json")) as f:
+            self.hyperedges = json.load(f)
+        self._hyperedge_index = {
+            (he['type'], he['description'], he['source_document']): i for i, he in enumerate(self.hyperedges)
+        }
+        self.hyperedge_embeddings = self._load_embeddings(self.path, "hyperedge")
+
+        memberships = np.load(os.path.join(self.path, "memberships.npy"))
+        self.member_hyperedges = memberships[:, 0].tolist() if len(memberships) else []
+        self.member_entities = memberships[:, 1].tolist() if len(memberships) else []
+        self._memberships = set(zip(self.member_hyperedges, self.member_entities))
+        self._adjacency = None
+
+    def _write_files(self, path: str) -> Dict[str, Any]:
+        with open(os.path.join(path, "entities.json"), "w") as f:
+            json.dump(self.entity_names, f)
+        with open(os.path.join(path, "hyperedges.json"), "w") as f:
+            json.dump(self.hyperedges, f)
+        self._save_embeddings(path, "hyperedge", self.hyperedge_embeddings)
+        memberships = np.array([self.member_hyperedges, self.member_entities], dtype=np.int32).T.reshape(-1, 2)
+        np.save(os.path.join(path, "memberships.npy"), memberships)
+        return {
+            "num_entities": len(self.entity_names),
+            "num_hyperedges": len(self.hyperedges),
+            "num_memberships": len(self.member_hyperedges),
+            "embedding_dimension": self.hyperedge_embeddings.dimension
+        }
+
+    # ------------------------------------------------------------------ internals
+
+    def _get_adjacency(self):
+        """CSR membership lists: (member_entities, member_hyperedges, he_indptr, he_members, entity_indptr, entity_members)"""
+        if self._adjacency is None:
+            hyperedges = np.asarray(self.member_hyperedges, dtype=np.int64)
+            entities = np.asarray(self.member_entities, dtype=np.int64)
+            self._adjacency = (
+                entities, hyperedges,
+                *_csr(hyperedges, len(self.hyperedges)),
+                *_csr(entities, len(self.entity_names))
+            )
+        return self._adjacency
+
+    def _members(self, hyperedge_id: int) -> List[int]:
+        entities, _, he_indptr, he_members, _, _ = self._get_adjacency()
+        return entities[he_members[he_indptr[hyperedge_id]:he_indptr[hyperedge_id + 1]]].tolist()
+
+    def _hyperedges_of(self, entity_id: int) -> List[int]:
+        _, hyperedges, _, _, entity_indptr, entity_members = self._get_adjacency()
+        return hyperedges[entity_members[entity_indptr[entity_id]:entity_indptr[entity_id + 1]]].tolist()
+
+    # ------------------------------------------------------------------ HyperGraphStore
+
+    def processed_source_documents(self, source_docs: List[str]) -> Set[str]:
+        with self._lock:
+            stored = {he['source_document'] for he in self.hyperedges}
+        return {source_doc for source_doc in source_docs if source_doc in stored}
+
+    def write_hyperedges(self, rows: List[Dict[str, Any]]) -> int:
+        created_at = datetime.datetime.now().isoformat()
+        with self._lock:
+            for row in rows:
+                key = (row['type'], row['description'], row['source_document'])
+                hyperedge_id = self._hyperedge_index.get(key)
+                if hyperedge_id is None:
+                    hyperedge_id = len(self.hyperedges)
+                    self._hyperedge_index[key] = hyperedge_id
+                    self.hyperedges.append({
+                        'type': row['type'],
+                        'description': row['description'],
+                        'source_document': row['source_document']
+                    })
+                self.hyperedges[hyperedge_id].update({
+                    'entity_count': row['entity_count'],
+                    'source_sentence': row['source_sentence'],
+                    'created_at': created_at
+                })
+
+                for name in row['entities']:
+                    entity_id = self.entity_ids.get(name)
+                    if entity_id is None:
+                        entity_id = len(self.entity_names)
+                        self.entity_names.append(name)
+                        self.entity_ids[name] = entity_id
+                    if (hyperedge_id, entity_id) not in self._memberships:
+                        self._memberships.add((hyperedge_id, entity_id))
+                        self.member_hyperedges.append(hyperedge_id)
+                        self.member_entities.append(entity_id)
+
+            self.hyperedge_embeddings.grow(len(self.hyperedges))
+            self._adjacency = None
+            self._dirty = True
+        return len(rows)
+
+    def embed_missing(self, embed_many: EmbedManyFn, batch_size: int = 64) -> Dict[str, Any]:
+        with self._lock:
+            ids = [i for i in self.hyperedge_embeddings.missing().tolist() if self.hyperedges[i].get('description')]
+            texts = [self.hyperedges[i]['description'] for i in ids]
+        return self._embed_rows(self.hyperedge_embeddings, ids, texts, embed_many, batch_size, "HyperEdge")
+
+    def retrieve_basic(self, query_embedding: List[float], top_k: int,
+                       similarity_threshold: float) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids, similarities = self.hyperedge_embeddings.search(query_embedding, similarity_threshold)
+
+            hyperedges = []
+            for hyperedge_id, similarity in zip(ids.tolist(), similarities.tolist()):
+                members = self._members(hyperedge_id)
+                if not members:
+                    continue
+                he = self.hyperedges[hyperedge_id]
+                hyperedges.append({
+                    'hyperedge_type': he['type'],
+                    'description': he['description'],
+                    'entities': [self.entity_names[i] for i in members],
+                    'source_sentence': he.get('source_sentence'),
+                    'source_document': he.get('source_document'),
+                    'similarity': float(similarity)
+                })
+                if len(hyperedges) >= top_k:
+                    break
+            return hyperedges
+
+    def retrieve_expansion(self, query_embedding: List[float], top_k: int, similarity_threshold: float,
+                           seed_k: int = 5) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids, similarities = self.hyperedge_embeddings.search(query_embedding, similarity_threshold, seed_k)
+
+            expansions = []
+            for hyperedge_id, similarity in zip(ids.tolist(), similarities.tolist()):
+                he = self.hyperedges[hyperedge_id]
+                # Hyperedges sharing at least one entity with the seed, in membership order
+                connected_ids = []
+                for entity_id in self._members(hyperedge_id):
+                    for other_id in self._hyperedges_of(entity_id):
+                        if other_id != hyperedge_id and other_id not in connected_ids:
+                            connected_ids.append(other_id)
+
+                for other_id in connected_ids:
+                    other = self.hyperedges[other_id]
+                    expansions.append({
+                        'original_type': he['type'],
+                        'original_description': he['description'],
+                        'connected_type': other['type'],
+                        'connected_description': other['description'],
+                        'connected_entities': [self.entity_names[i] for i in self._members(other_id)],
+                        'similarity': float(similarity),
+                        'distance': 1
+                    })
+                    if len(expansions) >= top_k:
+                        return expansions
+            return expansions
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entity_counts = [he.get('entity_count') for he in self.hyperedges if he.get('entity_count') is not None]
+            return {
+                'hyperedge_count': len(self.hyperedges),
+                'entity_count': len(self.entity_names),
+                'avg_entities_per_hyperedge': sum(entity_counts) / len(entity_counts) if entity_counts else 0,
+                'unique_documents': len({he['source_document'] for he in self.hyperedges})
+            }
+
+    def get_sample_hyperedges(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids = [i for i in range(len(self.hyperedges)) if self._members(i)]
+            ids.sort(key=lambda i: -(self.hyperedges[i].get('entity_count') or 0))
+            return [
+                {
+                    'type': self.hyperedges[i]['type'],
+                    'description': self.hyperedges[i]['description'],
+                    'entities': [self.entity_names[e] for e in self._members(i)],
+                    'entity_count': self.hyperedges[i].get('entity_count')
+                }
+                for i in ids[:limit]
+            ]
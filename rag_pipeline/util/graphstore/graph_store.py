@@ -0,0 +1,141 @@
+"""
+Graph store interfaces used by GraphRAG and HyperGraphRAG.
+
+The retrievers only talk to these interfaces, so the same basic/traversal and
+basic/expansion retrieval modes run against a Neo4j server or against the embedded
+in-process store.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Set
+
+# Embeds a list of texts, in order; texts that could not be embedded get an empty list
+EmbedManyFn = Callable[[List[str]], List[List[float]]]
+
+
+class KnowledgeGraphStore(ABC):
+    """Storage backend of GraphRAG: entities connected by typed, document-tagged relations"""
+
+    @abstractmethod
+    def processed_document_ids(self, doc_ids: List[str]) -> Set[str]:
+        """Get the subset of doc_ids that already have relations in the graph"""
+        pass
+
+    @abstractmethod
+    def write_relations(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Merge relation rows into the graph
+
+        Each row has subject, object, type, source_doc, doc_id, relation_id, sentence,
+        created_at and chunk_id. Returns the number of rows written.
+        """
+        pass
+
+    @abstractmethod
+    def embed_missing(self, embed_many: EmbedManyFn, batch_size: int = 64) -> Dict[str, Any]:
+        """
+        Embed the name of every entity without an embedding
+
+        Returns:
+            Dict with the number of embedded/failed entities, elapsed seconds and entities per second
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_basic(self, query_embedding: List[float], top_k: int,
+                       similarity_threshold: float, candidate_k: int) -> List[Dict[str, Any]]:
+        """Outgoing relations of the entities most similar to the query, most similar first"""
+        pass
+
+    @abstractmethod
+    def retrieve_traversal(self, query_embedding: List[float], top_k: int, similarity_threshold: float,
+                           max_depth: int, candidate_k: int = 10) -> List[Dict[str, Any]]:
+        """Relations around the entities most similar to the query, up to max_depth hops away"""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the graph with a document-level breakdown"""
+        pass
+
+    @abstractmethod
+    def get_document_relations(self, doc_id: str) -> List[Dict[str, Any]]:
+        """Get all relations extracted from a document"""
+        pass
+
+    @abstractmethod
+    def get_documents_containing_entity(self, entity_name: str) -> List[Dict[str, Any]]:
+        """Get all documents with relations involving an entity"""
+        pass
+
+    @abstractmethod
+    def delete_document_relations(self, doc_id: str) -> int:
+        """Delete all relations extracted from a document and return how many were deleted"""
+        pass
+
+    def flush(self):
+        """Persist pending changes (no-op for stores that write through)"""
+        pass
+
+    def close(self):
+        """Release the resources held by the store"""
+        pass
+
+
+class HyperGraphStore(ABC):
+    """Storage backend of HyperGraphRAG: hyperedges grouping several entities"""
+
+    @abstractmethod
+    def processed_source_documents(self, source_docs: List[str]) -> Set[str]:
+        """Get the subset of source documents that already have hyperedges"""
+        pass
+
+    @abstractmethod
+    def write_hyperedges(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Merge hyperedge rows into the hypergraph
+
+        Each row has type, description, source_document, entity_count, source_sentence
+        and entities. Returns the number of rows written.
+        """
+        pass
+
+    @abstractmethod
+    def embed_missing(self, embed_many: EmbedManyFn, batch_size: int = 64) -> Dict[str, Any]:
+        """
+        Embed the description of every hyperedge without an embedding
+
+        Returns:
+            Dict with the number of embedded/failed hyperedges, elapsed seconds and hyperedges per second
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_basic(self, query_embedding: List[float], top_k: int,
+                       similarity_threshold: float) -> List[Dict[str, Any]]:
+        """Hyperedges most similar to the query with their member entities"""
+        pass
+
+    @abstractmethod
+    def retrieve_expansion(self, query_embedding: List[float], top_k: int, similarity_threshold: float,
+                           seed_k: int = 5) -> List[Dict[str, Any]]:
+        """Hyperedges sharing an entity with the seed_k hyperedges most similar to the query"""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hypergraph statistics"""
+        pass
+
+    @abstractmethod
+    def get_sample_hyperedges(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get the hyperedges with the most entities"""
+        pass
+
+    def flush(self):
+        """Persist pending changes (no-op for stores that write through)"""
+        pass
+
+    def close(self):
+        """Release the resources held by the store"""
+        pass
@@ -0,0 +1,749 @@
+"""
+Neo4j graph stores for GraphRAG and HyperGraphRAG.
+
+Provides utilities for:
+- A process-wide driver (connection pool) per (uri, user), with one-time index setup
+- Batched UNWIND writes of relations and hyperedges
+- Candidate entity search through the native vector index (with a brute-force fallback)
+- Bulk embedding of nodes that are still missing an embedding
+- Graph statistics and document-level lookups
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from neo4j import GraphDatabase
+
+from rag_pipeline.util.graphstore.graph_store import KnowledgeGraphStore, HyperGraphStore, EmbedManyFn
+
+logger = logging.getLogger(__name__)
+
+
+def write_rows_in_batches(driver, cypher_query: str, rows: List[Dict[str, Any]], batch_size: int = 500) -> int:
+    """
+    Write rows to Neo4j with an `UNWIND $rows AS row ...` query, one explicit
+    transaction per batch of rows. Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+    batch_size = max(1, batch_size)
+    with driver.session() as session:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            session.execute_write(lambda tx: tx.run(cypher_query, rows=batch).consume())
+    return len(rows)
+
+
+def embed_nodes_without_embeddings(driver, embed_many: EmbedManyFn, label: str, text_property: str,
+                                   batch_size: int = 64, write_batch_size: int = 500) -> Dict[str, Any]:
+    """
+    Stream every `label` node whose embedding is missing, embed `text_property` in
+    batches and write the vectors back with UNWIND, until the backlog is empty.
+
+    Returns:
+        Dict with the number of embedded/failed nodes, elapsed seconds and nodes per second
+    """
+    start_time = time.time()
+    embedded = 0
+    failed_ids: List[str] = []
+    batch_size = max(1, batch_size)
+
+    while True:
+        with driver.session() as session:
+            records = list(session.run(
+                f"MATCH (n:{label}) WHERE n.embedding IS NULL AND n.{text_property} IS NOT NULL "
+                f"AND NOT elementId(n) IN $failed_ids "
+                f"RETURN elementId(n) AS id, n.{text_property} AS text LIMIT $limit",
+                failed_ids=failed_ids,
+                limit=batch_size
+            ))
+        if not records:
+            break
+
+        embeddings = embed_many([record["text"] for record in records])
+        rows = []
+        for record, embedding in zip(records, embeddings):
+            if embedding and not all(x == 0.0 for x in embedding):
+                rows.append({"id": record["id"], "embedding": embedding})
+            else:
+                # Remember failures so the loop does not fetch them again
+                failed_ids.append(record["id"])
+
+        embedded += write_rows_in_batches(
+            driver,
+            "UNWIND $rows AS row MATCH (n) WHERE elementId(n) = row.id SET n.embedding = row.embedding",
+            rows,
+            write_batch_size
+        )
+
+    elapsed = time.time() - start_time
+    per_second = embedded / elapsed if elapsed > 0 else 0.0
+    if embedded or failed_ids:
+        logger.info(f"Embedded {embedded} {label} nodes in {elapsed:.1f}s ({per_second:.1f} nodes/s), {len(failed_ids)} failed")
+    return {"embedded": embedded, "failed": len(failed_ids), "seconds": elapsed, "per_second": per_second}
+
+
+_DRIVERS: Dict[Tuple[str, str], Any] = {}
+_DRIVERS_LOCK = threading.Lock()
+_INITIALIZED: Set[tuple] = set()
+_INITIALIZED_LOCK = threading.Lock()
+
+
+def get_neo4j_driver(uri: str, user: str, password: str, max_connection_pool_size: Optional[int] = None):
+    """
+    Get the process-wide Neo4j driver for (uri, user), creating it on first use.
+
+    Every graph store of the process shares this driver and its connection pool. The
+    pool size is taken from max_connection_pool_size or the NEO4J_MAX_CONNECTION_POOL_SIZE
+    environment variable (default 50) when the driver is created.
+    """
+    key = (uri, user)
+    with _DRIVERS_LOCK:
+        driver = _DRIVERS.get(key)
+        if driver is None:
+            pool_size = max_connection_pool_size or int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "50"))
+            driver = GraphDatabase.driver(uri, auth=(user, password), max_connection_pool_size=pool_size)
+            try:
+                # Test connection
+                with driver.session() as session:
+                    session.run("RETURN 1")
+            except Exception:
+                driver.close()
+                raise
+            _DRIVERS[key] = driver
+            logger.info(f"Neo4j driver for {uri} created (pool size {pool_size})")
+        return driver
+
+
+def _initialize_once(key: tuple, initialize: Callable[[], None]):
+    """Run a schema initialization once per process"""
+    with _INITIALIZED_LOCK:
+        if key in _INITIALIZED:
+            return
+        initialize()
+        _INITIALIZED.add(key)
+
+
+def close_neo4j_drivers():
+    """Close every shared Neo4j driver (called on application shutdown)"""
+    with _DRIVERS_LOCK:
+        drivers = list(_DRIVERS.values())
+        _DRIVERS.clear()
+    with _INITIALIZED_LOCK:
+        _INITIALIZED.clear()
+    for driver in drivers:
+        try:
+            driver.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Neo4j driver: {e}")
+    if drivers:
+        logger.info(f"Closed {len(drivers)} Neo4j driver(s)")
+
+
+class Neo4jKnowledgeGraphStore(KnowledgeGraphStore):
+    """Knowledge graph of (:Entity)-[:RELATION]->(:Entity) stored in Neo4j"""
+
+    def __init__(self, uri: str, user: str, password: str, vector_index_name: str = "entity_embeddings",
+                 embedding_dimension: int = 1024, write_batch_size: int = 500,
+                 max_connection_pool_size: Optional[int] = None):
+        """
+        Initialize the Neo4j knowledge graph store
+
+        Args:
+            uri: Bolt URI of the Neo4j server
+            user: Neo4j user
+            password: Neo4j password
+            vector_index_name: Name of the vector index over Entity.embedding
+            embedding_dimension: Dimension of the entity embeddings
+            write_batch_size: Rows written per transaction
+            max_connection_pool_size: Pool size of the shared driver, if this store creates it
+        """
+        self.vector_index_name = vector_index_name
+        self.embedding_dimension = embedding_dimension
+        self.write_batch_size = write_batch_size
+        self._vector_index_available = True
+
+        try:
+            self.driver = get_neo4j_driver(uri, user, password, max_connection_pool_size)
+        except Exception as e:
+            logger.error(f"Failed to connect to Neo4j: {e}")
+            raise
+        _initialize_once(("knowledge_graph", uri, vector_index_name, embedding_dimension), self._initialize_indexes)
+
+    def _initialize_indexes(self):
+        """Initialize the vector index for entity embeddings and the lookup indexes"""
+        try:
+            with self.driver.session() as session:
+                # Check if index already exists
+                result = session.run("SHOW INDEXES")
+                existing_indexes = [record.get("name") for record in result]
+
+                if self.vector_index_name not in existing_indexes:
+                    # Create vector index
+                    session.run(f"""
+                    CREATE VECTOR INDEX {self.vector_index_name}
+                    FOR (n:Entity)
+                    ON (n.embedding)
+                    OPTIONS {{
+                        indexConfig: {{
+                            `vector.dimensions`: {self.embedding_dimension},
+                            `vector.similarity_function`: 'cosine'
+                        }}
+                    }}
+                    """)
+                    logger.info(f"Created vector index: {self.vector_index_name}")
+                else:
+                    logger.info(f"Vector index {self.vector_index_name} already exists")
+        except Exception as e:
+            logger.warning(f"Could not initialize vector index: {e}")
+
+        try:
+            with self.driver.session() as session:
+                # Backs every MERGE (:Entity {name}) with a unique index
+                session.run("CREATE CONSTRAINT entity_name_unique IF NOT EXISTS FOR (e:Entity) REQUIRE e.name IS UNIQUE")
+        except Exception as e:
+            logger.warning(f"Could not create uniqueness constraint on Entity.name: {e}")
+
+        try:
+            with self.driver.session() as session:
+                # Backs the "already processed" lookup of index_documents
+                session.run("CREATE INDEX relation_doc_id_idx IF NOT EXISTS FOR ()-[r:RELATION]-() ON (r.doc_id)")
+        except Exception as e:
+            logger.warning(f"Could not create index on RELATION.doc_id: {e}")
+
+    # Candidate entities from the native vector index. Neo4j reports cosine scores as
+    # (1 + cosine) / 2, so they are mapped back to cosine before the threshold is applied.
+    _VECTOR_INDEX_CANDIDATES = """
+        CALL db.index.vector.queryNodes($index_name, $candidate_k, $query_embedding)
+        YIELD node AS e, score
+        WITH e, 2 * score - 1 AS similarity
+        WHERE similarity >= $similarity_threshold
+    """
+
+    # Fallback: full scan computing cosine similarity for every entity
+    _BRUTE_FORCE_CANDIDATES = """
+        MATCH (e:Entity)
+        WHERE e.embedding IS NOT NULL
+        WITH e,
+             reduce(acc = 0.0, i IN range(0, size(e.embedding)-1) |
+                    acc + e.embedding[i] * $query_embedding[i]) /
+             (sqrt(reduce(acc = 0.0, i IN range(0, size(e.embedding)-1) |
+                   acc + e.embedding[i] * e.embedding[i])) *
+              sqrt(reduce(acc = 0.0, i IN range(0, size($query_embedding)-1) |
+                   acc + $query_embedding[i] * $query_embedding[i]))) AS similarity
+        WHERE similarity >= $similarity_threshold
+    """
+
+    def _run_candidate_query(self, query_tail: str, candidate_k: int, **params) -> List[Any]:
+        """
+        Run a retrieval query whose candidate entities come from the vector index,
+        falling back to the brute-force scan if the index cannot be used
+        """
+        if self._vector_index_available:
+            try:
+                with self.driver.session() as session:
+                    return list(session.run(
+                        self._VECTOR_INDEX_CANDIDATES + query_tail,
+                        index_name=self.vector_index_name,
+                        candidate_k=candidate_k,
+                        **params
+                    ))
+            except Exception as e:
+                logger.warning(f"Vector index query on {self.vector_index_name} failed, falling back to brute-force similarity: {e}")
+                # Missing procedure/index or a dimension mismatch will not fix itself
+                from neo4j.exceptions import ClientError
+                if isinstance(e, ClientError):
+                    self._vector_index_available = False
+
+        with self.driver.session() as session:
+            return list(session.run(self._BRUTE_FORCE_CANDIDATES + query_tail, candidate_k=candidate_k, **params))
+
+    def retrieve_basic(self, query_embedding: List[float], top_k: int,
+                       similarity_threshold: float, candidate_k: int) -> List[Dict[str, Any]]:
+        query_tail = """
+        // Get direct relations from similar entities with all metadata
+        MATCH (e)-[r:RELATION]->(target:Entity)
+        RETURN DISTINCT
+            e.name AS subject,
+            r.type AS relation,
+            target.name AS object,
+            r.source_doc AS source_doc,
+            r.doc_id AS doc_id,
+            r.sentence AS sentence,
+            r.created_at AS created_at,
+            r.chunk_id AS chunk_id,
+            similarity
+        ORDER BY similarity DESC
+        LIMIT $top_k
+        """
+
+        result = self._run_candidate_query(
+            query_tail,
+            candidate_k,
+            query_embedding=query_embedding,
+            similarity_threshold=similarity_threshold,
+            top_k=top_k
+        )
+
+        relations = []
+        for record in result:
+            relations.append({
+                'subject': record['subject'],
+                'relation': record['relation'],
+                'object': record['object'],
+                'source_doc': record.get('source_doc'),
+                'doc_id': record.get('doc_id'),
+                'sentence': record.get('sentence'),
+                'created_at': record.get('created_at'),
+                'chunk_id': record.get('chunk_id'),
+                'similarity': record['similarity']
+            })
+
+        return relations
+
+    def retrieve_traversal(self, query_embedding: List[float], top_k: int, similarity_threshold: float,
+                           max_depth: int, candidate_k: int = 10) -> List[Dict[str, Any]]:
+        # Variable-length bounds cannot be query parameters
+        query_tail = f"""
+        // Step 1: Keep the most similar entities
+        WITH e, similarity
+        ORDER BY similarity DESC
+        LIMIT $candidate_k
+
+        // Step 2: Traverse graph to find connected entities
+        MATCH path = (e)-[*1..{int(max_depth)}]-(connected:Entity)
+        WITH e, connected, similarity, length(path) AS distance
+
+        // Step 3: Get all relations involving these connected entities with metadata
+        MATCH (a:Entity)-[r:RELATION]->(b:Entity)
+        WHERE a.name IN [e.name, connected.name] OR b.name IN [e.name, connected.name]
+
+        RETURN DISTINCT
+            a.name AS subject,
+            r.type AS relation,
+            b.name AS object,
+            r.source_doc AS source_doc,
+            r.doc_id AS doc_id,
+            r.sentence AS sentence,
+            r.created_at AS created_at,
+            r.chunk_id AS chunk_id,
+            similarity,
+            distance
+        ORDER BY similarity DESC, distance ASC
+        LIMIT $top_k
+        """
+
+        result = self._run_candidate_query(
+            query_tail,
+            candidate_k,
+            query_embedding=query_embedding,
+            similarity_threshold=similarity_threshold,
+            top_k=top_k
+        )
+
+        relations = []
+        for record in result:
+            relations.append({
+                'subject': record['subject'],
+                'relation': record['relation'],
+                'object': record['object'],
+                'source_doc': record.get('source_doc'),
+                'doc_id': record.get('doc_id'),
+                'sentence': record.get('sentence'),
+                'created_at': record.get('created_at'),
+                'chunk_id': record.get('chunk_id'),
+                'similarity': record['similarity'],
+                'distance': record.get('distance', 0)
+            })
+
+        return relations
+
+    def processed_document_ids(self, doc_ids: List[str]) -> Set[str]:
+        if not doc_ids:
+            return set()
+        with self.driver.session() as session:
+            result = session.run(
+                "MATCH ()-[r:RELATION]->() WHERE r.doc_id IN $doc_ids RETURN DISTINCT r.doc_id AS doc_id",
+                doc_ids=list(set(doc_ids))
+            )
+            return {record["doc_id"] for record in result}
+
+    _RELATION_WRITE_QUERY = """
+    UNWIND $rows AS row
+    MERGE (a:Entity {name: row.subject})
+    MERGE (b:Entity {name: row.object})
+    MERGE (a)-[r:RELATION {
+        type: row.type,
+        source_doc: row.source_doc,
+        doc_id: row.doc_id,
+        relation_id: row.relation_id
+    }]->(b)
+    SET r.sentence = row.sentence,
+        r.created_at = row.created_at,
+        r.chunk_id = row.chunk_id
+    """
+
+    def write_relations(self, rows: List[Dict[str, Any]]) -> int:
+        return write_rows_in_batches(self.driver, self._RELATION_WRITE_QUERY, rows, self.write_batch_size)
+
+    def embed_missing(self, embed_many: EmbedManyFn, batch_size: int = 64) -> Dict[str, Any]:
+        return embed_nodes_without_embeddings(
+            self.driver, embed_many, "Entity", "name",
+            batch_size=batch_size,
+            write_batch_size=self.write_batch_size
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.driver.session() as session:
+            # Count entities
+            entity_count = session.run("MATCH (n:Entity) RETURN COUNT(n) AS count").single()["count"]
+
+            # Count relations
+            relation_count = session.run("MATCH ()-[r:RELATION]->() RETURN COUNT(r) AS count").single()["count"]
+
+            # Count entities with embeddings
+            embedded_count = session.run("MATCH (n:Entity) WHERE n.embedding IS NOT NULL RETURN COUNT(n) AS count").single()["count"]
+
+            # Count unique documents
+            doc_count = session.run("MATCH ()-[r:RELATION]->() WHERE r.doc_id IS NOT NULL RETURN COUNT(DISTINCT r.doc_id) AS count").single()["count"]
+
+            # Count unique source documents
+            source_doc_count = session.run("MATCH ()-[r:RELATION]->() WHERE r.source_doc IS NOT NULL RETURN COUNT(DISTINCT r.source_doc) AS count").single()["count"]
+
+            # Get document-level statistics
+            doc_stats = session.run("""
+                MATCH ()-[r:RELATION]->()
+                WHERE r.doc_id IS NOT NULL
+                RETURN r.doc_id AS doc_id,
+                       r.source_doc AS source_doc,
+                       COUNT(r) AS relation_count
+                ORDER BY relation_count DESC
+                LIMIT 10
+            """)
+
+            top_docs = []
+            for record in doc_stats:
+                top_docs.append({
+                    'doc_id': record['doc_id'],
+                    'source_doc': record['source_doc'],
+                    'relation_count': record['relation_count']
+                })
+
+        return {
+            'total_entities': entity_count,
+            'total_relations': relation_count,
+            'entities_with_embeddings': embedded_count,
+            'embedding_coverage': embedded_count / entity_count if entity_count > 0 else 0,
+            'unique_documents': doc_count,
+            'unique_source_documents': source_doc_count,
+            'avg_relations_per_doc': relation_count / doc_count if doc_count > 0 else 0,
+            'top_documents_by_relations': top_docs
+        }
+
+    def get_document_relations(self, doc_id: str) -> List[Dict[str, Any]]:
+        with self.driver.session() as session:
+            result = session.run("""
+                MATCH (a:Entity)-[r:RELATION]->(b:Entity)
+                WHERE r.doc_id = $doc_id
+                RETURN a.name AS subject,
+                       r.type AS relation,
+                       b.name AS object,
+                       r.sentence AS sentence,
+                       r.chunk_id AS chunk_id,
+                       r.created_at AS created_at
+                ORDER BY r.chunk_id, r.relation_id
+            """, doc_id=doc_id)
+
+            relations = []
+            for record in result:
+                relations.append({
+                    'subject': record['subject'],
+                    'relation': record['relation'],
+                    'object': record['object'],
+                    'sentence': record['sentence'],
+                    'chunk_id': record['chunk_id'],
+                    'created_at': record['created_at']
+                })
+
+            return relations
+
+    def get_documents_containing_entity(self, entity_name: str) -> List[Dict[str, Any]]:
+        with self.driver.session() as session:
+            result = session.run("""
+                MATCH (e:Entity {name: $entity_name})-[r:RELATION]-(other:Entity)
+                WHERE r.doc_id IS NOT NULL
+                RETURN r.doc_id AS doc_id,
+                       r.source_doc AS source_doc,
+                       COUNT(r) AS relation_count
+                ORDER BY relation_count DESC
+            """, entity_name=entity_name)
+
+            documents = []
+            for record in result:
+                documents.append({
+                    'doc_id': record['doc_id'],
+                    'source_doc': record['source_doc'],
+                    'relation_count': record['relation_count']
+                })
+
+            return documents
+
+    def delete_document_relations(self, doc_id: str) -> int:
+        with self.driver.session() as session:
+            result = session.run("""
+                MATCH ()-[r:RELATION {doc_id: $doc_id}]->()
+                DELETE r
+                RETURN COUNT(*) AS deleted_count
+            """, doc_id=doc_id)
+            return result.single()["deleted_count"]
+
+    def close(self):
+        """The driver is shared by the whole process and closed by close_neo4j_drivers()"""
+        self.driver = None
+
+
+class Neo4jHyperGraphStore(HyperGraphStore):
+    """Hypergraph of (:HyperEntity)-[:MEMBER_OF]->(:HyperEdge) stored in Neo4j"""
+
+    def __init__(self, uri: str, user: str, password: str, write_batch_size: int = 500,
+                 max_connection_pool_size: Optional[int] = None):
+        """
+        Initialize the Neo4j hypergraph store
+
+        Args:
+            uri: Bolt URI of the Neo4j server
+            user: Neo4j user
+            password: Neo4j password
+            write_batch_size: Rows written per transaction
+            max_connection_pool_size: Pool size of the shared driver, if this store creates it
+        """
+        self.write_batch_size = write_batch_size
+
+        try:
+            self.driver = get_neo4j_driver(uri, user, password, max_connection_pool_size)
+        except Exception as e:
+            logger.error(f"Failed to connect to Neo4j for HyperGraphRAG: {e}")
+            raise
+        _initialize_once(("hypergraph", uri), self._initialize_indexes)
+
+    def _initialize_indexes(self):
+        """Initialize the hyperedge lookup indexes"""
+        try:
+            with self.driver.session() as session:
+                # Create indexes for better performance
+                session.run("CREATE INDEX hyperedge_type_idx IF NOT EXISTS FOR (he:HyperEdge) ON (he.type)")
+                session.run("CREATE INDEX hyperedge_doc_idx IF NOT EXISTS FOR (he:HyperEdge) ON (he.source_document)")
+
+                logger.info("HyperGraphRAG indexes created successfully")
+        except Exception as e:
+            logger.warning(f"Could not initialize indexes: {e}")
+
+        try:
+            with self.driver.session() as session:
+                # The uniqueness constraint brings its own index on HyperEntity.name, which
+                # cannot coexist with the plain index older versions created
+                session.run("DROP INDEX entity_name_idx IF EXISTS")
+                session.run("CREATE CONSTRAINT hyperentity_name_unique IF NOT EXISTS FOR (e:HyperEntity) REQUIRE e.name IS UNIQUE")
+        except Exception as e:
+            logger.warning(f"Could not create uniqueness constraint on HyperEntity.name: {e}")
+
+    def processed_source_documents(self, source_docs: List[str]) -> Set[str]:
+        if not source_docs:
+            return set()
+        with self.driver.session() as session:
+            result = session.run(
+                "MATCH (he:HyperEdge) WHERE he.source_document IN $source_docs "
+                "RETURN DISTINCT he.source_document AS source_document",
+                source_docs=list(set(source_docs))
+            )
+            return {record["source_document"] for record in result}
+
+    _HYPEREDGE_WRITE_QUERY = """
+    UNWIND $rows AS row
+    MERGE (he:HyperEdge {
+        type: row.type,
+        description: row.description,
+        source_document: row.source_document
+    })
+    SET he.entity_count = row.entity_count,
+        he.source_sentence = row.source_sentence,
+        he.created_at = datetime()
+    WITH he, row
+    UNWIND row.entities AS entity_name
+    MERGE (e:HyperEntity {name: entity_name})
+    MERGE (e)-[:MEMBER_OF]->(he)
+    """
+
+    def write_hyperedges(self, rows: List[Dict[str, Any]]) -> int:
+        return write_rows_in_batches(self.driver, self._HYPEREDGE_WRITE_QUERY, rows, self.write_batch_size)
+
+    def embed_missing(self, embed_many: EmbedManyFn, batch_size: int = 64) -> Dict[str, Any]:
+        return embed_nodes_without_embeddings(
+            self.driver, embed_many, "HyperEdge", "description",
+            batch_size=batch_size,
+            write_batch_size=self.write_batch_size
+        )
+
+    def retrieve_basic(self, query_embedding: List[float], top_k: int,
+                       similarity_threshold: float) -> List[Dict[str, Any]]:
+        cypher_query = """
+        MATCH (he:HyperEdge)
+        WHERE he.embedding IS NOT NULL
+        WITH he,
+             reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) |
+                    acc + he.embedding[i] * $query_embedding[i]) /
+             (sqrt(reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) |
+                   acc + he.embedding[i] * he.embedding[i])) *
+              sqrt(reduce(acc = 0.0, i IN range(0, size($query_embedding)-1) |
+                   acc + $query_embedding[i] * $query_embedding[i]))) AS similarity
+        WHERE similarity >= $similarity_threshold
+
+        MATCH (e:HyperEntity)-[:MEMBER_OF]->(he)
+        RETURN DISTINCT
+            he.type AS hyperedge_type,
+            he.description AS hyperedge_description,
+            collect(e.name) AS entities,
+            he.source_sentence AS source_sentence,
+            he.source_document AS source_document,
+            similarity
+        ORDER BY similarity DESC
+        LIMIT $top_k
+        """
+
+        with self.driver.session() as session:
+            result = session.run(
+                cypher_query,
+                query_embedding=query_embedding,
+                similarity_threshold=similarity_threshold,
+                top_k=top_k
+            )
+
+            hyperedges = []
+            for record in result:
+                hyperedges.append({
+                    'hyperedge_type': record['hyperedge_type'],
+                    'description': record['hyperedge_description'],
+                    'entities': record['entities'],
+                    'source_sentence': record['source_sentence'],
+                    'source_document': record['source_document'],
+                    'similarity': record['similarity']
+                })
+
+            return hyperedges
+
+    def retrieve_expansion(self, query_embedding: List[float], top_k: int, similarity_threshold: float,
+                           seed_k: int = 5) -> List[Dict[str, Any]]:
+        cypher_query = """
+        // Step 1: Find similar hyperedges
+        MATCH (he:HyperEdge)
+        WHERE he.embedding IS NOT NULL
+        WITH he,
+             reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) |
+                    acc + he.embedding[i] * $query_embedding[i]) /
+             (sqrt(reduce(acc = 0.0, i IN range(0, size(he.embedding)-1) |
+                   acc + he.embedding[i] * he.embedding[i])) *
+              sqrt(reduce(acc = 0.0, i IN range(0, size($query_embedding)-1) |
+                   acc + $query_embedding[i] * $query_embedding[i]))) AS similarity
+        WHERE similarity >= $similarity_threshold
+        ORDER BY similarity DESC
+        LIMIT $seed_k
+
+        // Step 2: Find entities in these hyperedges
+        MATCH (e:HyperEntity)-[:MEMBER_OF]->(he)
+        WITH e, he, similarity
+
+        // Step 3: Find other hyperedges these entities belong to
+        MATCH (e)-[:MEMBER_OF]->(other_he:HyperEdge)
+        WHERE other_he <> he
+
+        MATCH (other_e:HyperEntity)-[:MEMBER_OF]->(other_he)
+
+        RETURN DISTINCT
+            he.type AS original_type,
+            he.description AS original_description,
+            other_he.type AS connected_type,
+            other_he.description AS connected_description,
+            collect(other_e.name) AS connected_entities,
+            similarity,
+            1 AS distance
+        ORDER BY similarity DESC, distance ASC
+        LIMIT $top_k
+        """
+
+        with self.driver.session() as session:
+            result = session.run(
+                cypher_query,
+                query_embedding=query_embedding,
+                similarity_threshold=similarity_threshold,
+                seed_k=seed_k,
+                top_k=top_k
+            )
+
+            expansions = []
+            for record in result:
+                expansions.append({
+                    'original_type': record['original_type'],
+                    'original_description': record['original_description'],
+                    'connected_type': record['connected_type'],
+                    'connected_description': record['connected_description'],
+                    'connected_entities': record['connected_entities'],
+                    'similarity': record['similarity'],
+                    'distance': record['distance']
+                })
+
+            return expansions
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.driver.session() as session:
+            # Count hyperedges
+            result = session.run("MATCH (he:HyperEdge) RETURN COUNT(he) AS count")
+            hyperedge_count = result.single()["count"]
+
+            # Count entities
+            result = session.run("MATCH (e:HyperEntity) RETURN COUNT(e) AS count")
+            entity_count = result.single()["count"]
+
+            # Average entities per hyperedge
+            result = session.run("MATCH (he:HyperEdge) RETURN AVG(he.entity_count) AS avg")
+            avg_entities = result.single()["avg"] or 0
+
+            # Count unique documents
+            result = session.run("MATCH (he:HyperEdge) RETURN COUNT(DISTINCT he.source_document) AS count")
+            doc_count = result.single()["count"]
+
+        return {
+            'hyperedge_count': hyperedge_count,
+            'entity_count': entity_count,
+            'avg_entities_per_hyperedge': avg_entities,
+            'unique_documents': doc_count
+        }
+
+    def get_sample_hyperedges(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self.driver.session() as session:
+            result = session.run("""
+                MATCH (e:HyperEntity)-[:MEMBER_OF]->(he:HyperEdge)
+                RETURN he.type AS type,
+                       he.description AS description,
+                       collect(e.name) AS entities,
+                       he.entity_count AS entity_count
+                ORDER BY he.entity_count DESC
+                LIMIT $limit
+                """, limit=limit)
+
+            hyperedges = []
+            for record in result:
+                hyperedges.append({
+                    'type': record['type'],
+                    'description': record['description'],
+                    'entities': record['entities'],
+                    'entity_count': record['entity_count']
+                })
+
+            return hyperedges
+
+    def close(self):
+        """The driver is shared by the whole process and closed by close_neo4j_drivers()"""
+        self.driver = None
@@ -198,14 +198,8 @@ RANKING:"""
         Returns:
             List of reranked documents with added 'llm_rerank_score' field
         """
-        if not documents:
-            return documents
-        
-        if len(documents) == 1:
-            # Single document, just add score and return
-            reranked_doc = documents[0].copy()
-            reranked_doc['llm_rerank_score'] = 1.0
-            return [reranked_doc]
+        if len(documents) <= 1:
+            return self._rerank_trivial(documents)
         
         try:
             # Create reranking prompt
@@ -218,49 +212,102 @@ RANKING:"""
                 model=self.model_name,
                 prompt=prompt
             )
+            return self._apply_ranking(response, documents, top_k)
             
-            # Extract response text
-            if isinstance(response, dict):
-                response_text = response.get('response', '')
-            else:
-                response_text = str(response)
-            
-            # Parse the ranking response
-            ranking = self._parse_ranking_response(response_text, len(documents))
-            
-            # Apply ranking and add scores
-            reranked_docs = []
-            max_score = len(documents)
+        except Exception as e:
+            logger.error(f"LLM reranking failed: {e}")
+            return self._fallback_ranking(documents, top_k)
+    
+    async def arerank_documents(
+        self, 
+        query: str, 
+        documents: List[Dict[str, Any]], 
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Awaitable version of rerank_documents that uses the async Ollama client
+        
+        Args:
+            query: The search query
+            documents: List of documents with 'content' field
+            top_k: Number of top documents to return (if None, return all)
             
-            for rank_position, doc_index in enumerate(ranking):
-                # Convert to 0-based index
-                doc_idx = doc_index - 1
-                if 0 <= doc_idx < len(documents):
-                    reranked_doc = documents[doc_idx].copy()
-                    # Score decreases with rank position (first = highest score)
-                    reranked_doc['llm_rerank_score'] = (max_score - rank_position) / max_score
-                    reranked_docs.append(reranked_doc)
+        Returns:
+            List of reranked documents with added 'llm_rerank_score' field
+        """
+        if len(documents) <= 1:
+            return self._rerank_trivial(documents)
+        
+        try:
+            prompt = self._create_reranking_prompt(query, documents)
             
-            # Apply top_k filtering if specified
-            if top_k is not None:
-                reranked_docs = reranked_docs[:top_k]
+            logger.info(f"LLM reranking {len(documents)} documents with {self.model_name}")
             
-            logger.info(f"LLM reranking completed, returned {len(reranked_docs)} documents")
-            return reranked_docs
+            response = await self.ollama_client.aget_ollama_response(
+                model=self.model_name,
+                prompt=prompt
+            )
+            return self._apply_ranking(response, documents, top_k)
             
         except Exception as e:
             logger.error(f"LLM reranking failed: {e}")
-            # Return original documents with default scores
-            fallback_docs = []
-            for i, doc in enumerate(documents):
-                fallback_doc = doc.copy()
-                fallback_doc['llm_rerank_score'] = (len(documents) - i) / len(documents)
-                fallback_docs.append(fallback_doc)
-            
-            if top_k is not None:
-                fallback_docs = fallback_docs[:top_k]
-            
-            return fallback_docs
+            return self._fallback_ranking(documents, top_k)
+    
+    @staticmethod
+    def _rerank_trivial(documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Handle empty and single document inputs without calling the LLM"""
+        if not documents:
+            return documents
+        
+        # Single document, just add score and return
+        reranked_doc = documents[0].copy()
+        reranked_doc['llm_rerank_score'] = 1.0
+        return [reranked_doc]
+    
+    def _apply_ranking(self, response: Any, documents: List[Dict[str, Any]], top_k: Optional[int]) -> List[Dict[str, Any]]:
+        """Order documents according to the LLM ranking response and add scores"""
+        # Extract response text
+        if isinstance(response, dict):
+            response_text = response.get('response', '')
+        else:
+            response_text = str(response)
+        
+        # Parse the ranking response
+        ranking = self._parse_ranking_response(response_text, len(documents))
+        
+        # Apply ranking and add scores
+        reranked_docs = []
+        max_score = len(documents)
+        
+        for rank_position, doc_index in enumerate(ranking):
+            # Convert to 0-based index
+            doc_idx = doc_index - 1
+            if 0 <= doc_idx < len(documents):
+                reranked_doc = documents[doc_idx].copy()
+                # Score decreases with rank position (first = highest score)
+                reranked_doc['llm_rerank_score'] = (max_score - rank_position) / max_score
+                reranked_docs.append(reranked_doc)
+        
+        # Apply top_k filtering if specified
+        if top_k is not None:
+            reranked_docs = reranked_docs[:top_k]
+        
+        logger.info(f"LLM reranking completed, returned {len(reranked_docs)} documents")
+        return reranked_docs
+    
+    @staticmethod
+    def _fallback_ranking(documents: List[Dict[str, Any]], top_k: Optional[int]) -> List[Dict[str, Any]]:
+        """Return original documents with default scores"""
+        fallback_docs = []
+        for i, doc in enumerate(documents):
+            fallback_doc = doc.copy()
+            fallback_doc['llm_rerank_score'] = (len(documents) - i) / len(documents)
+            fallback_docs.append(fallback_doc)
+        
+        if top_k is not None:
+            fallback_docs = fallback_docs[:top_k]
+        
+        return fallback_docs
 
 
 # Global instance for efficient model reuse across the entire pipeline
@@ -154,6 +154,71 @@ class RerankerUtil:
             logger.error(f"Reranking failed: {e}")
             # Return original documents if reranking fails
             return documents
+    
+    def rerank_documents_batch(
+        self,
+        queries: List[str],
+        documents_list: List[List[Dict[str, Any]]],
+        top_k: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Rerank the documents of several queries with a single predict call
+        
+        All (query, document) pairs of the batch are scored together so the model
+        runs on full batches instead of one short batch per query.
+        
+        Args:
+            queries: The search queries
+            documents_list: Documents of every query, each with a 'content' field
+            top_k: Number of top documents to return per query (if None, return all)
+            
+        Returns:
+            One list of reranked documents per query, in the same order as queries
+        """
+        if not any(documents_list):
+            return documents_list
+        
+        # Load model if not already loaded
+        if self.model is None:
+            self._load_model()
+        
+        try:
+            sentence_pairs = [
+                [query, doc.get('content', '')]
+                for query, documents in zip(queries, documents_list)
+                for doc in documents
+            ]
+            
+            logger.info(f"Reranking {len(sentence_pairs)} documents of {len(queries)} queries with {self.model_name} on {self.device}")
+            
+            scores = self.model.predict(
+                sentence_pairs,
+                convert_to_tensor=True,
+                show_progress_bar=False
+            )
+            
+            reranked_list = []
+            offset = 0
+            for documents in documents_list:
+                reranked_docs = []
+                for i, doc in enumerate(documents):
+                    reranked_doc = doc.copy()
+                    reranked_doc['rerank_score'] = float(scores[offset + i].item())
+                    reranked_docs.append(reranked_doc)
+                offset += len(documents)
+                
+                # Sort by rerank score in descending order
+                reranked_docs.sort(key=lambda x: x['rerank_score'], reverse=True)
+                if top_k is not None:
+                    reranked_docs = reranked_docs[:top_k]
+                reranked_list.append(reranked_docs)
+            
+            return reranked_list
+            
+        except Exception as e:
+            logger.error(f"Batch reranking failed: {e}")
+            # Return original documents if reranking fails
+            return documents_list
 
 # Global instance for efficient model reuse across the entire pipeline
 _reranker_instance = None
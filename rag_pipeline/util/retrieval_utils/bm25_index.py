@@ -0,0 +1,726 @@
+"""
+Memory-mapped, segmented on-disk BM25 index.
+
+Layout of an index directory:
+    manifest.json                      format version, generation and live segments
+    seg_<id>/vocab.npy                 sorted UTF-8 terms (fixed-width bytes, binary searchable)
+    seg_<id>/indptr.npy                CSR row pointers: postings of term t are indptr[t]:indptr[t + 1]
+    seg_<id>/postings.npy              local document index of every posting
+    seg_<id>/tfs.npy                   term frequency of every posting
+    seg_<id>/doc_lengths.npy           token count of every document
+    seg_<id>/doc_keys.npy              doc_id of every document
+    seg_<id>/doc_hashes.npy            content hash of every document
+    seg_<id>/docs.bin, doc_offsets.npy JSON document records
+    seg_<id>/deleted_<gen>.npy         tombstones (only once documents were deleted)
+
+Every array is memory-mapped, so opening a large index is near-instant and worker
+processes share the same pages. Adding documents writes a new segment, deleting
+documents writes tombstones, and segments are merged in a background thread.
+Scoring follows BM25Okapi with global statistics over the live documents of all
+segments, so scores do not depend on how the index was built up.
+"""
+
+import os
+import json
+import uuid
+import shutil
+import hashlib
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+
+def content_hash(text: str) -> bytes:
+    """Hash identifying the content of a document"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest().encode("ascii")
+
+
+def _write_segment(path: str, vocab: np.ndarray, posting_terms: np.ndarray, postings: np.ndarray,
+                   tfs: np.ndarray, doc_lengths: np.ndarray, doc_keys: np.ndarray,
+                   doc_hashes: np.ndarray, records: List[bytes]):
+    """Write a segment directory; posting_terms must be sorted (by term, then document)"""
+    tmp_path = f"{path}.tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(posting_terms, minlength=len(vocab)), out=indptr[1:])
+    doc_offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(record) for record in records], out=doc_offsets[1:])
+
+    arrays = {
+        "vocab.npy": vocab,
+        "indptr.npy": indptr,
+        "postings.npy": postings.astype(np.int32),
+        "tfs.npy": tfs.astype(np.float32),
+        "doc_lengths.npy": doc_lengths.astype(np.float32),
+        "doc_keys.npy": doc_keys,
+        "doc_hashes.npy": doc_hashes,
+        "doc_offsets.npy": doc_offsets
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(tmp_path, name), array)
+    with open(os.path.join(tmp_path, "docs.bin"), "wb") as f:
+        f.write(b"".join(records))
+
+    os.rename(tmp_path, path)
+
+
+def build_segment(path: str, tokenized_docs: List[List[str]], documents_data: List[Dict[str, Any]]):
+    """Write a segment for tokenized documents and their {'doc_id', 'content', 'metadata'} records"""
+    counters = [Counter(tokens) for tokens in tokenized_docs]
+    terms = sorted({token for counter in counters for token in counter})
+    term_ids = {term: i for i, term in enumerate(terms)}
+
+    posting_terms, postings, tfs = [], [], []
+    for doc_idx, counter in enumerate(counters):
+        for token, freq in counter.items():
+            posting_terms.append(term_ids[token])
+            postings.append(doc_idx)
+            tfs.append(freq)
+    posting_terms = np.asarray(posting_terms, dtype=np.int64)
+    postings = np.asarray(postings, dtype=np.int32)
+    tfs = np.asarray(tfs, dtype=np.float32)
+    order = np.lexsort((postings, posting_terms))
+
+    # UTF-8 byte order matches code point order, so the vocabulary stays sorted
+    vocab = np.array([term.encode("utf-8") for term in terms], dtype=bytes) if terms else np.array([], dtype="S1")
+    _write_segment(
+        path,
+        vocab=vocab,
+        posting_terms=posting_terms[order],
+        postings=postings[order],
+        tfs=tfs[order],
+        doc_lengths=np.asarray([len(tokens) for tokens in tokenized_docs], dtype=np.float32),
+        doc_keys=np.array([str(doc["doc_id"]).encode("utf-8") for doc in documents_data], dtype=bytes),
+        doc_hashes=np.array([content_hash(doc["content"]) for doc in documents_data], dtype=bytes),
+        records=[json.dumps(doc, ensure_ascii=False, default=str).encode("utf-8") for doc in documents_data]
+    )
+
+
+class BM25Segment:
+    """A read-only, memory-mapped segment plus its (in-memory) tombstones"""
+
+    def __init__(self, path: str, deleted_file: Optional[str] = None):
+        self.path = path
+        self.name = os.path.basename(path)
+
+        def load(name):
+            return np.load(os.path.join(path, name), mmap_mode="r")
+
+        self.vocab = load("vocab.npy")
+        self.indptr = load("indptr.npy")
+        self.postings = load("postings.npy")
+        self.tfs = load("tfs.npy")
+        self.doc_lengths = load("doc_lengths.npy")
+        self.doc_keys = load("doc_keys.npy")
+        self.doc_hashes = load("doc_hashes.npy")
+        self.doc_offsets = load("doc_offsets.npy")
+        self._docs = np.memmap(os.path.join(path, "docs.bin"), dtype=np.uint8, mode="r")
+
+        self.deleted_file = deleted_file
+        if deleted_file:
+            self.deleted = np.load(os.path.join(path, deleted_file))
+        else:
+            self.deleted = np.zeros(len(self.doc_lengths), dtype=bool)
+        self.num_deleted = int(self.deleted.sum())
+
+    @property
+    def num_docs(self) -> int:
+        return len(self.doc_lengths)
+
+    @property
+    def num_live(self) -> int:
+        return self.num_docs - self.num_deleted
+
+    def term_id(self, term: bytes) -> int:
+        """Binary search the vocabulary; -1 if the term is unknown"""
+        i = int(np.searchsorted(self.vocab, term))
+        if i < len(self.vocab) and self.vocab[i] == term:
+            return i
+        return -1
+
+    def record(self, local_idx: int) -> bytes:
+        return bytes(self._docs[self.doc_offsets[local_idx]:self.doc_offsets[local_idx + 1]])
+
+    def document(self, local_idx: int) -> Dict[str, Any]:
+        return json.loads(self.record(local_idx).decode("utf-8"))
+
+
+@dataclass
+class _IndexState:
+    """Immutable snapshot searched by readers; swapped atomically by writers"""
+    generation: int
+    segments: List[BM25Segment]
+    idfs: List[np.ndarray]  # IDF aligned with every segment's vocabulary (global statistics)
+    bases: np.ndarray  # global index of the first document of every segment
+    num_live: int
+    avg_doc_length: float
+
+
+class BM25Index:
+    """Segmented on-disk BM25 index (see module docstring for the format)"""
+
+    def __init__(self, index_dir: str, k1: float = 1.2, b: float = 0.75, epsilon: float = 0.25,
+                 max_segments: int = 4, max_deleted_ratio: float = 0.2):
+        """
+        Open (or prepare) an index directory
+
+        Args:
+            index_dir: Directory holding the manifest and segments
+            k1, b, epsilon: BM25Okapi parameters (applied at query time, not stored)
+            max_segments: Merge once more segments than this exist
+            max_deleted_ratio: Merge once this fraction of documents is deleted
+        """
+        self.index_dir = index_dir
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.max_segments = max_segments
+        self.max_deleted_ratio = max_deleted_ratio
+        self._write_lock = threading.RLock()
+        self._merge_thread: Optional[threading.Thread] = None
+        self._state = _IndexState(0, [], [], np.zeros(0, dtype=np.int64), 0, 0.0)
+        os.makedirs(index_dir, exist_ok=True)
+
+    # ----- manifest -----
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.index_dir, MANIFEST_FILE)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        if manifest.get("format_version") != FORMAT_VERSION:
+            logger.info(f"BM25 index at {self.index_dir} has format {manifest.get('format_version')}, expected {FORMAT_VERSION}")
+            return None
+        return manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        manifest["format_version"] = FORMAT_VERSION
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    @contextmanager
+    def _file_lock(self):
+        """Cross-process lock serializing writers of the same index directory"""
+        with self._write_lock:
+            with open(os.path.join(self.index_dir, ".lock"), "w") as handle:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # ----- loading -----
+
+    def load(self) -> bool:
+        """Load the index described by the manifest; False if there is no usable index"""
+        manifest = self._read_manifest()
+        if manifest is None:
+            return False
+        try:
+            self._load_state(manifest)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to load BM25 index from {self.index_dir}: {e}")
+            return False
+
+    def refresh(self) -> bool:
+        """Pick up changes written by other processes"""
+        manifest = self._read_manifest()
+        if manifest is not None and manifest.get("generation", 0) != self._state.generation:
+            return self.load()
+        return False
+
+    def _load_state(self, manifest: Dict[str, Any]):
+        current = {(segment.name, segment.deleted_file): segment for segment in self._state.segments}
+        segments = []
+        for entry in manifest.get("segments", []):
+            segment = current.get((entry["name"], entry.get("deleted")))
+            if segment is None:
+                segment = BM25Segment(os.path.join(self.index_dir, entry["name"]), entry.get("deleted"))
+            segments.append(segment)
+        self._state = self._build_state(manifest.get("generation", 0), segments)
+
+    @staticmethod
+    def _live_doc_freqs(segment: BM25Segment) -> np.ndarray:
+        """Document frequency of every vocabulary term, ignoring deleted documents"""
+        doc_freqs = np.diff(segment.indptr)
+        if not segment.num_deleted:
+            return doc_freqs
+        posting_terms = np.repeat(np.arange(len(segment.vocab)), doc_freqs)
+        live = ~segment.deleted[np.asarray(segment.postings)]
+        return np.bincount(posting_terms[live], minlength=len(segment.vocab))
+
+    def _build_state(self, generation: int, segments: List[BM25Segment]) -> _IndexState:
+        """Compute global statistics and per-segment IDF over the live documents"""
+        num_docs = sum(segment.num_live for segment in segments)
+        total_length = sum(
+            float(np.sum(np.asarray(segment.doc_lengths)[~segment.deleted], dtype=np.float64))
+            if segment.num_deleted else float(np.sum(segment.doc_lengths, dtype=np.float64))
+            for segment in segments
+        )
+        avg_doc_length = total_length / num_docs if num_docs else 0.0
+
+        idfs = []
+        if len(segments) == 1:
+            idfs.append(self._idf(self._live_doc_freqs(segments[0]), num_docs))
+        elif segments:
+            all_terms = np.concatenate([np.asarray(segment.vocab) for segment in segments])
+            unique_terms, inverse = np.unique(all_terms, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            doc_freqs = np.zeros(len(unique_terms), dtype=np.int64)
+            offset = 0
+            slices = []
+            for segment in segments:
+                segment_slice = inverse[offset:offset + len(segment.vocab)]
+                # A term appears at most once per segment vocabulary
+                doc_freqs[segment_slice] += self._live_doc_freqs(segment)
+                slices.append(segment_slice)
+                offset += len(segment.vocab)
+            idf = self._idf(doc_freqs, num_docs)
+            idfs = [idf[segment_slice] for segment_slice in slices]
+
+        bases = np.zeros(len(segments), dtype=np.int64)
+        if segments:
+            np.cumsum([segment.num_docs for segment in segments[:-1]], out=bases[1:])
+        return _IndexState(
+            generation=generation,
+            segments=segments,
+            idfs=idfs,
+            bases=bases,
+            num_live=sum(segment.num_live for segment in segments),
+            avg_doc_length=avg_doc_length
+        )
+
+    def _idf(self, doc_freqs: np.ndarray, num_docs: int) -> np.ndarray:
+        """BM25Okapi IDF: negative values are floored to epsilon * average IDF"""
+        if len(doc_freqs) == 0:
+            return np.zeros(0, dtype=np.float64)
+        idf = np.log(num_docs - doc_freqs + 0.5) - np.log(doc_freqs + 0.5)
+        # Terms that only occur in deleted documents are not part of the vocabulary
+        known = doc_freqs > 0
+        average_idf = idf[known].sum() / max(int(known.sum()), 1)
+        idf[idf < 0] = self.epsilon * average_idf
+        return idf
+
+    # ----- searching -----
+
+    @property
+    def num_docs(self) -> int:
+        return self._state.num_live
+
+    def _postings(self, state: _IndexState, segment: BM25Segment, term: bytes):
+        """Term id, posting docs, term frequencies and BM25 denominators of a term in a segment"""
+        t = segment.term_id(term)
+        if t < 0:
+            return None
+        k1, b = self.k1, self.b
+        start, end = segment.indptr[t], segment.indptr[t + 1]
+        docs = np.asarray(segment.postings[start:end])
+        tfs = np.asarray(segment.tfs[start:end], dtype=np.float64)
+        length_norm = k1 * (1 - b + b * np.asarray(segment.doc_lengths[docs], dtype=np.float64) / state.avg_doc_length)
+        return t, docs, tfs, tfs + length_norm
+
+    def _score(self, state: _IndexState, tokenized_query: List[str],
+               postings_cache: Optional[Dict[Tuple[int, bytes], Any]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scores of the live documents containing a query term; returns (global indices, scores)
+
+        postings_cache lets queries of a batch share the posting lookups of common terms.
+        """
+        counts = Counter(tokenized_query)
+        query_terms = [(token.encode("utf-8"), count) for token, count in counts.items()]
+        index_parts, score_parts = [], []
+        k1 = self.k1
+
+        for seg_idx, (segment, idf, base) in enumerate(zip(state.segments, state.idfs, state.bases)):
+            docs_parts, weight_parts = [], []
+            for term, count in query_terms:
+                if postings_cache is None:
+                    postings = self._postings(state, segment, term)
+                else:
+                    key = (seg_idx, term)
+                    if key not in postings_cache:
+                        postings_cache[key] = self._postings(state, segment, term)
+                    postings = postings_cache[key]
+                if postings is None:
+                    continue
+                t, docs, tfs, denominator = postings
+                docs_parts.append(docs)
+                weight_parts.append(idf[t] * count * tfs * (k1 + 1) / denominator)
+            if not docs_parts:
+                continue
+
+            docs = np.concatenate(docs_parts)
+            weights = np.concatenate(weight_parts)
+            if segment.num_deleted:
+                live = ~segment.deleted[docs]
+                docs, weights = docs[live], weights[live]
+
+            if len(docs) * 8 >= segment.num_docs:
+                # Dense accumulator is cheaper once postings cover a sizeable part of the segment
+                dense = np.bincount(docs, weights=weights, minlength=segment.num_docs)
+                touched = np.flatnonzero(np.bincount(docs, minlength=segment.num_docs))
+                scores = dense[touched]
+            else:
+                touched, inverse = np.unique(docs, return_inverse=True)
+                scores = np.bincount(inverse.reshape(-1), weights=weights)
+            index_parts.append(touched.astype(np.int64) + base)
+            score_parts.append(scores)
+
+        if not index_parts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        return np.concatenate(index_parts), np.concatenate(score_parts)
+
+    @staticmethod
+    def _untouched_live(state: _IndexState, touched: np.ndarray, limit: int) -> np.ndarray:
+        """Up to limit live documents not in touched, highest global index first"""
+        picked = []
+        remaining = limit
+        for segment, base in zip(reversed(state.segments), reversed(state.bases)):
+            if remaining <= 0:
+                break
+            live = np.flatnonzero(~segment.deleted)[::-1] + base
+            live = live[np.isin(live, touched, invert=True)][:remaining]
+            picked.append(live)
+            remaining -= len(live)
+        return np.concatenate(picked) if picked else np.zeros(0, dtype=np.int64)
+
+    def top_k(self, tokenized_query: List[str], k: int) -> List[Tuple[int, float]]:
+        """
+        Get the k best documents as (global doc index, min-max normalized score) pairs.
+
+        Scores are normalized over all live documents (documents without any query term
+        score 0) and ties are broken towards the higher doc index, matching the original
+        full-array normalization + argsort behaviour.
+        """
+        return self._top_k(self._state, tokenized_query, k)
+
+    def _top_k(self, state: _IndexState, tokenized_query: List[str], k: int,
+               postings_cache: Optional[Dict[Tuple[int, bytes], Any]] = None) -> List[Tuple[int, float]]:
+        n = state.num_live
+        if n == 0 or k <= 0:
+            return []
+        k = min(k, n)
+
+        touched, scores = self._score(state, tokenized_query, postings_cache)
+        max_score = float(scores.max()) if len(scores) else 0.0
+        min_score = float(scores.min()) if len(scores) else 0.0
+        if len(touched) < n:
+            max_score, min_score = max(max_score, 0.0), min(min_score, 0.0)
+
+        if max_score == min_score:
+            # Every document has the same score
+            return [(int(idx), 1.0) for idx in self._untouched_live(state, np.zeros(0, dtype=np.int64), k)]
+
+        candidates, candidate_scores = touched, scores
+        if len(touched) < n and (len(touched) < k or min_score < 0):
+            # Zero-score documents can make the top k
+            padding = self._untouched_live(state, touched, k)
+            candidates = np.concatenate([touched, padding])
+            candidate_scores = np.concatenate([scores, np.zeros(len(padding))])
+
+        if len(candidates) > k:
+            part = np.argpartition(-candidate_scores, k - 1)[:k]
+            # argpartition may cut through a tie at the k-th score; include every tied doc
+            kth = candidate_scores[part].min()
+            part = np.flatnonzero(candidate_scores >= kth)
+            candidates, candidate_scores = candidates[part], candidate_scores[part]
+
+        order = np.lexsort((-candidates, -candidate_scores))[:k]
+        normalized = (candidate_scores[order] - min_score) / (max_score - min_score)
+        return [(int(idx), float(score)) for idx, score in zip(candidates[order], normalized)]
+
+    @staticmethod
+    def _document(state: _IndexState, global_idx: int) -> Dict[str, Any]:
+        seg_idx = int(np.searchsorted(state.bases, global_idx, side="right")) - 1
+        return state.segments[seg_idx].document(global_idx - int(state.bases[seg_idx]))
+
+    def search(self, tokenized_query: List[str], k: int) -> List[Dict[str, Any]]:
+        """Get the k best documents as dicts with doc_id, content, metadata and score"""
+        # Use one snapshot for scoring and lookups so a concurrent merge cannot shift indices
+        state = self._state
+        results = []
+        for global_idx, score in self._top_k(state, tokenized_query, k):
+            doc_data = self._document(state, global_idx)
+            doc_data['score'] = score
+            results.append(doc_data)
+        return results
+
+    def search_batch(self, tokenized_queries: List[List[str]], k: int) -> List[List[Dict[str, Any]]]:
+        """
+        Search several queries against one snapshot, reading the postings of every
+        distinct term once per batch. Results are identical to calling search() per query.
+        """
+        state = self._state
+        postings_cache: Dict[Tuple[int, bytes], Any] = {}
+        batch_results = []
+        for tokenized_query in tokenized_queries:
+            results = []
+            for global_idx, score in self._top_k(state, tokenized_query, k, postings_cache):
+                doc_data = self._document(state, global_idx)
+                doc_data['score'] = score
+                results.append(doc_data)
+            batch_results.append(results)
+        return batch_results
+
+    # ----- writing -----
+
+    def _new_segment_path(self) -> str:
+        return os.path.join(self.index_dir, f"seg_{uuid.uuid4().hex[:12]}")
+
+    def _cleanup(self, manifest: Dict[str, Any]):
+        """Remove segment directories and tombstone files no longer referenced by the manifest"""
+        live = {entry["name"]: entry.get("deleted") for entry in manifest.get("segments", [])}
+        for name in os.listdir(self.index_dir):
+            path = os.path.join(self.index_dir, name)
+            if not name.startswith("seg_") or name.endswith(".tmp"):
+                continue
+            if name not in live:
+                shutil.rmtree(path, ignore_errors=True)
+                continue
+            for file_name in os.listdir(path):
+                if file_name.startswith("deleted_") and file_name != live[name]:
+                    os.remove(os.path.join(path, file_name))
+
+    def create(self, tokenized_docs: List[List[str]], documents_data: List[Dict[str, Any]]):
+        """Replace the whole index with a single segment holding the given documents"""
+        with self._file_lock():
+            manifest = self._read_manifest() or {"generation": 0}
+            segments = []
+            if documents_data:
+                path = self._new_segment_path()
+                build_segment(path, tokenized_docs, documents_data)
+                segments.append({"name": os.path.basename(path), "deleted": None})
+            manifest = {"generation": manifest.get("generation", 0) + 1, "segments": segments}
+            self._write_manifest(manifest)
+            self._cleanup(manifest)
+            self._load_state(manifest)
+
+    def add_documents(self, tokenized_docs: List[List[str]], documents_data: List[Dict[str, Any]]):
+        """Add documents as a new segment"""
+        if not documents_data:
+            return
+        with self._file_lock():
+            manifest = self._read_manifest() or {"generation": 0, "segments": []}
+            path = self._new_segment_path()
+            build_segment(path, tokenized_docs, documents_data)
+            manifest["segments"].append({"name": os.path.basename(path), "deleted": None})
+            manifest["generation"] = manifest.get("generation", 0) + 1
+            self._write_manifest(manifest)
+            self._load_state(manifest)
+        self.maybe_merge_in_background()
+
+    def _delete_where(self, select: Callable[[BM25Segment], np.ndarray]) -> int:
+        """Tombstone the documents selected by a per-segment boolean mask function"""
+        deleted_count = 0
+        with self._file_lock():
+            manifest = self._read_manifest()
+            if manifest is None:
+                return 0
+            self._load_state(manifest)
+            generation = manifest.get("generation", 0) + 1
+            for entry, segment in zip(manifest["segments"], self._state.segments):
+                mask = select(segment) & ~segment.deleted
+                if not mask.any():
+                    continue
+                deleted_file = f"deleted_{generation}.npy"
+                np.save(os.path.join(segment.path, deleted_file), segment.deleted | mask)
+                entry["deleted"] = deleted_file
+                deleted_count += int(mask.sum())
+            if deleted_count:
+                manifest["generation"] = generation
+                self._write_manifest(manifest)
+                self._cleanup(manifest)
+                self._load_state(manifest)
+        if deleted_count:
+            self.maybe_merge_in_background()
+        return deleted_count
+
+    def delete_documents(self, doc_ids: List[str]) -> int:
+        """Delete every document with one of the given doc ids; returns the number deleted"""
+        keys = np.array([str(doc_id).encode("utf-8") for doc_id in doc_ids], dtype=bytes)
+        if len(keys) == 0:
+            return 0
+        return self._delete_where(lambda segment: np.isin(np.asarray(segment.doc_keys), keys))
+
+    def sync_documents(self, documents_data: List[Dict[str, Any]],
+                       tokenize: Callable[[str], List[str]]) -> Dict[str, int]:
+        """
+        Make the index hold exactly the given documents, touching only what changed.
+
+        Documents are matched by (doc_id, content hash); removed or changed documents
+        are deleted and new or changed ones are added as a segment.
+        """
+        wanted = Counter((str(doc["doc_id"]).encode("utf-8"), content_hash(doc["content"])) for doc in documents_data)
+        state = self._state
+
+        # Keep as many existing copies of every key as are wanted, delete the rest
+        kept = Counter()
+        delete_masks = {}
+        for segment in state.segments:
+            mask = np.zeros(segment.num_docs, dtype=bool)
+            for local_idx in np.flatnonzero(~segment.deleted):
+                key = (bytes(segment.doc_keys[local_idx]), bytes(segment.doc_hashes[local_idx]))
+                if kept[key] < wanted[key]:
+                    kept[key] += 1
+                else:
+                    mask[local_idx] = True
+            delete_masks[segment.name] = mask
+
+        to_add = []
+        for doc in documents_data:
+            key = (str(doc["doc_id"]).encode("utf-8"), content_hash(doc["content"]))
+            if kept[key] > 0:
+                kept[key] -= 1
+            else:
+                to_add.append(doc)
+
+        deleted = self._delete_where(
+            lambda segment: delete_masks.get(segment.name, np.zeros(segment.num_docs, dtype=bool))
+        )
+        self.add_documents([tokenize(doc["content"]) for doc in to_add], to_add)
+        return {"deleted": deleted, "added": len(to_add), "unchanged": len(documents_data) - len(to_add)}
+
+    # ----- merging -----
+
+    def needs_merge(self) -> bool:
+        state = self._state
+        total = sum(segment.num_docs for segment in state.segments)
+        deleted = sum(segment.num_deleted for segment in state.segments)
+        return len(state.segments) > self.max_segments or (total > 0 and deleted / total > self.max_deleted_ratio)
+
+    def maybe_merge_in_background(self):
+        """Start a background merge if there are too many segments or deletions"""
+        if not self.needs_merge():
+            return
+        if self._merge_thread is not None and self._merge_thread.is_alive():
+            return
+        self._merge_thread = threading.Thread(target=self.merge, name="bm25-merge", daemon=True)
+        self._merge_thread.start()
+
+    def wait_for_merge(self, timeout: Optional[float] = None):
+        if self._merge_thread is not None:
+            self._merge_thread.join(timeout)
+
+    def merge(self):
+        """Merge all segments into one, dropping deleted documents; searches continue on the old snapshot"""
+        try:
+            with self._file_lock():
+                manifest = self._read_manifest()
+                if manifest is None:
+                    return
+                self._load_state(manifest)
+                segments = self._state.segments
+                if len(segments) <= 1 and not any(segment.num_deleted for segment in segments):
+                    return
+
+                logger.info(f"Merging {len(segments)} BM25 segments in {self.index_dir}")
+                path = self._new_segment_path()
+                if self._merge_segments(segments, path):
+                    manifest["segments"] = [{"name": os.path.basename(path), "deleted": None}]
+                else:
+                    manifest["segments"] = []
+                manifest["generation"] = manifest.get("generation", 0) + 1
+                self._write_manifest(manifest)
+                self._load_state(manifest)
+                # Old segment files stay mapped by in-flight readers until they drop them
+                self._cleanup(manifest)
+        except Exception as e:
+            logger.error(f"BM25 segment merge failed: {e}")
+
+    @staticmethod
+    def _merge_segments(segments: List[BM25Segment], path: str) -> bool:
+        """Write the live documents of several segments as one segment; False if nothing is live"""
+        all_terms = np.concatenate([np.asarray(segment.vocab) for segment in segments])
+        unique_terms, inverse = np.unique(all_terms, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        term_parts, doc_parts, tf_parts = [], [], []
+        lengths, keys, hashes, records = [], [], [], []
+        term_offset, doc_base = 0, 0
+        for segment in segments:
+            live = ~segment.deleted
+            remap = np.cumsum(live) - 1 + doc_base
+            vocab_size = len(segment.vocab)
+            posting_terms = inverse[term_offset:term_offset + vocab_size][
+                np.repeat(np.arange(vocab_size), np.diff(segment.indptr))
+            ]
+            postings = np.asarray(segment.postings)
+            keep = live[postings]
+            term_parts.append(posting_terms[keep])
+            doc_parts.append(remap[postings[keep]])
+            tf_parts.append(np.asarray(segment.tfs)[keep])
+
+            live_idx = np.flatnonzero(live)
+            lengths.append(np.asarray(segment.doc_lengths)[live_idx])
+            keys.append(np.asarray(segment.doc_keys)[live_idx])
+            hashes.append(np.asarray(segment.doc_hashes)[live_idx])
+            records.extend(segment.record(int(i)) for i in live_idx)
+            term_offset += vocab_size
+            doc_base += len(live_idx)
+
+        if doc_base == 0:
+            return False
+
+        terms = np.concatenate(term_parts)
+        docs = np.concatenate(doc_parts)
+        tfs = np.concatenate(tf_parts)
+        # Drop terms that only occurred in deleted documents
+        used = np.zeros(len(unique_terms), dtype=bool)
+        used[terms] = True
+        terms = (np.cumsum(used) - 1)[terms]
+        order = np.lexsort((docs, terms))
+
+        _write_segment(
+            path,
+            vocab=unique_terms[used],
+            posting_terms=terms[order],
+            postings=docs[order],
+            tfs=tfs[order],
+            doc_lengths=np.concatenate(lengths),
+            doc_keys=np.concatenate(keys),
+            doc_hashes=np.concatenate(hashes),
+            records=records
+        )
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the index"""
+        state = self._state
+        return {
+            "format_version": FORMAT_VERSION,
+            "generation": state.generation,
+            "segments": len(state.segments),
+            "indexed_documents": state.num_live,
+            "deleted_documents": sum(segment.num_deleted for segment in state.segments),
+            "vocabulary_size": sum(len(segment.vocab) for segment in state.segments) if len(state.segments) <= 1
+            else len(np.unique(np.concatenate([np.asarray(segment.vocab) for segment in state.segments]))),
+            "postings": sum(len(segment.postings) for segment in state.segments),
+            "avg_doc_length": state.avg_doc_length
+        }
@@ -1,12 +1,12 @@
 import os
-import pickle
 import pandas as pd
 import re
 import numpy as np
 from typing import List, Dict, Any, Optional
-from rank_bm25 import BM25Okapi
 import logging
 
+from rag_pipeline.util.retrieval_utils.bm25_index import BM25Index
+
 logger = logging.getLogger(__name__)
 
 class BM25IndexManager:
@@ -14,98 +14,77 @@ class BM25IndexManager:
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.bm25 = None
-        self.documents_data = []
-        self.tokenized_corpus = []
-        self.index_path = None
-        self.documents_path = None
+        self.bm25: Optional[BM25Index] = None
+        self.index_dir = None
     
     def setup_index_paths(self, dataset_hash: str, dataset_path: str):
         """Setup index file paths based on dataset hash"""
-        index_dir = os.path.join(
+        self.index_dir = os.path.join(
             os.path.dirname(dataset_path),
             "bm25_indices",
             f"bm25_{dataset_hash}"
         )
-        os.makedirs(index_dir, exist_ok=True)
-        
-        self.index_path = os.path.join(index_dir, "bm25_index.pkl")
-        self.documents_path = os.path.join(index_dir, "documents.pkl")
+        os.makedirs(self.index_dir, exist_ok=True)
+    
+    def _open_index(self) -> BM25Index:
+        return BM25Index(
+            self.index_dir,
+            k1=self.config.get("bm25_k1", 1.2),
+            b=self.config.get("bm25_b", 0.75)
+        )
     
     def load_existing_index(self) -> bool:
-        """Load existing BM25 index if it exists"""
+        """Load existing BM25 index if it exists (arrays are memory-mapped, not read)"""
         try:
-            if os.path.exists(self.index_path) and os.path.exists(self.documents_path):
-                with open(self.index_path, 'rb') as f:
-                    index_data = pickle.load(f)
-                    self.bm25 = index_data['bm25']
-                    self.tokenized_corpus = index_data['tokenized_corpus']
-                
-                with open(self.documents_path, 'rb') as f:
-                    self.documents_data = pickle.load(f)
-                
-                return True
+            if self.index_dir:
+                index = self._open_index()
+                if index.load() and index.num_docs > 0:
+                    self.bm25 = index
+                    return True
         except Exception as e:
             logger.warning(f"Failed to load existing index: {e}")
         return False
     
-    def save_index(self):
-        """Save BM25 index and documents to disk"""
-        try:
-            if self.bm25 and self.index_path:
-                # Save BM25 index
-                index_data = {
-                    'bm25': self.bm25,
-                    'tokenized_corpus': self.tokenized_corpus
-                }
-                with open(self.index_path, 'wb') as f:
-                    pickle.dump(index_data, f)
-                
-                # Save documents data
-                with open(self.documents_path, 'wb') as f:
-                    pickle.dump(self.documents_data, f)
-                
-                logger.info(f"BM25 index saved to {self.index_path}")
-                
-        except Exception as e:
-            logger.error(f"Failed to save BM25 index: {e}")
-    
+    @staticmethod
+    def _documents_data(documents: List) -> List[Dict[str, Any]]:
+        return [
+            {
+                'doc_id': doc.doc_id,
+                'content': doc.content,
+                'metadata': doc.metadata or {}
+            }
+            for doc in documents
+        ]
   
     def index_documents(self, documents: List) -> bool:
-        """Index documents for BM25 search"""
+        """
+        Index documents for BM25 search.
+        
+        If an index already exists only the differences are applied: removed or
+        changed documents are deleted and new ones are added as a segment.
+        """
         try:
             if not documents:
                 logger.warning("No documents to index")
                 return False
             
-            # Store document data
-            self.documents_data = []
-            corpus_texts = []
-            
-            for doc in documents:
-                doc_data = {
-                    'doc_id': doc.doc_id,
-                    'content': doc.content,
-                    'metadata': doc.metadata or {}
-                }
-                self.documents_data.append(doc_data)
-                corpus_texts.append(doc.content)
-            
-            # Tokenize corpus
-            logger.info(f"Tokenizing {len(corpus_texts)} documents...")
+            documents_data = self._documents_data(documents)
             tokenizer = BM25Tokenizer(self.config)
-            self.tokenized_corpus = [tokenizer.tokenize(text) for text in corpus_texts]
             
-            # Get BM25 parameters from config
-            k1 = self.config.get("bm25_k1", 1.2)
-            b = self.config.get("bm25_b", 0.75)
-            
-            # Create BM25 index
-            logger.info("Creating BM25 index...")
-            self.bm25 = BM25Okapi(self.tokenized_corpus, k1=k1, b=b)
-            
-            # Save index to disk
-            self.save_index()
+            if self.bm25 is None and self.index_dir is None:
+                raise ValueError("BM25 index paths are not set up")
+            if self.bm25 is None:
+                self.bm25 = self._open_index()
+                self.bm25.load()
+            
+            if self.bm25.num_docs > 0:
+                changes = self.bm25.sync_documents(documents_data, tokenizer.tokenize)
+                logger.info(f"Updated BM25 index: {changes}")
+            else:
+                logger.info(f"Tokenizing {len(documents_data)} documents...")
+                tokenized_corpus = [tokenizer.tokenize(doc['content']) for doc in documents_data]
+                logger.info("Creating BM25 index...")
+                self.bm25.create(tokenized_corpus, documents_data)
             
             logger.info(f"Successfully indexed {len(documents)} documents")
             return True
@@ -114,10 +93,29 @@ class BM25IndexManager:
             logger.error(f"Failed to index documents for BM25: {e}")
             return False
     
+    def add_documents(self, documents: List) -> bool:
+        """Add documents to the existing index as a new segment"""
+        try:
+            documents_data = self._documents_data(documents)
+            tokenizer = BM25Tokenizer(self.config)
+            self.bm25.add_documents([tokenizer.tokenize(doc['content']) for doc in documents_data], documents_data)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add documents to BM25 index: {e}")
+            return False
+    
+    def delete_documents(self, doc_ids: List[str]) -> int:
+        """Delete documents from the index; returns the number of deleted documents"""
+        try:
+            return self.bm25.delete_documents(doc_ids)
+        except Exception as e:
+            logger.error(f"Failed to delete documents from BM25 index: {e}")
+            return 0
+    
     def search(self, query_text: str, k: int = 10) -> List[Dict[str, Any]]:
         """Perform BM25 search and return results"""
         try:
-            if not self.bm25 or not self.documents_data:
+            if not self.bm25 or self.bm25.num_docs == 0:
                 return []
             
             # Tokenize query
@@ -127,51 +125,41 @@ class BM25IndexManager:
             if not tokenized_query:
                 return []
             
-            # Get BM25 scores
-            scores = self.bm25.get_scores(tokenized_query)
-            normalized_scores = self._normalize_scores(scores)
-            
-            # Get top k results
-            top_indices = np.argsort(normalized_scores)[::-1][:k]
-            
-            # Return results
-            results = []
-            for idx in top_indices:
-                if idx < len(self.documents_data):
-                    doc_data = self.documents_data[idx].copy()
-                    doc_data['score'] = float(normalized_scores[idx])
-                    results.append(doc_data)
-            
-            return results
+            return self.bm25.search(tokenized_query, k)
             
         except Exception as e:
             logger.error(f"BM25 search failed: {e}")
             return []
     
-    def _normalize_scores(self, scores: np.ndarray) -> np.ndarray:
-        """Normalize BM25 scores to 0-1 range"""
-        if len(scores) == 0:
-            return scores
-        
-        if np.max(scores) == np.min(scores):
-            return np.ones_like(scores)
-        
-        normalized = (scores - np.min(scores)) / (np.max(scores) - np.min(scores))
-        return normalized
+    def search_batch(self, query_texts: List[str], k: int = 10) -> List[List[Dict[str, Any]]]:
+        """Perform BM25 search for several queries at once"""
+        try:
+            if not self.bm25 or self.bm25.num_docs == 0:
+                return [[] for _ in query_texts]
+            
+            tokenizer = BM25Tokenizer(self.config)
+            tokenized_queries = [tokenizer.tokenize(query_text) for query_text in query_texts]
+            nonempty = [i for i, tokenized_query in enumerate(tokenized_queries) if tokenized_query]
+            
+            # Score every non-empty query against one snapshot with shared posting lookups
+            batch_results = [[] for _ in query_texts]
+            for i, results in zip(nonempty, self.bm25.search_batch([tokenized_queries[i] for i in nonempty], k)):
+                batch_results[i] = results
+            return batch_results
+            
+        except Exception as e:
+            logger.error(f"BM25 batch search failed: {e}")
+            return [[] for _ in query_texts]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the BM25 index"""
-        if not self.bm25 or not self.documents_data:
+        if not self.bm25 or self.bm25.num_docs == 0:
             return {"indexed_documents": 0, "vocabulary_size": 0}
         
-        vocab_size = len(set(token for doc_tokens in self.tokenized_corpus for token in doc_tokens))
-        
         return {
-            "indexed_documents": len(self.documents_data),
-            "vocabulary_size": vocab_size,
-            "avg_doc_length": np.mean([len(doc_tokens) for doc_tokens in self.tokenized_corpus]),
-            "bm25_k1": getattr(self.bm25, 'k1', 'N/A'),
-            "bm25_b": getattr(self.bm25, 'b', 'N/A')
+            **self.bm25.get_stats(),
+            "bm25_k1": self.bm25.k1,
+            "bm25_b": self.bm25.b
         }
 
 
@@ -1,11 +1,160 @@
 import numpy as np
-from typing import List, Dict, Any, Tuple, Set, Union
+from typing import List, Dict, Any, Tuple, Set, Union, Callable
 from collections import defaultdict
 import logging
 from rag_pipeline.core.modular_framework import Document
 
 logger = logging.getLogger(__name__)
 
+def _normalize_score_rows(scores: np.ndarray, present: np.ndarray, method: str) -> np.ndarray:
+    """
+    Normalize every row of a score matrix over its present entries.
+
+    Args:
+        scores: (num_methods, num_slots) score matrix
+        present: Boolean mask of the entries that hold a score
+        method: Normalization method ("minmax", "zscore", "dbsf", "global_minmax")
+
+    Returns:
+        Normalized score matrix with 0.0 at absent entries
+    """
+    if scores.size == 0:
+        return scores.copy()
+    
+    if method == "global_minmax":
+        if not present.any():
+            return np.where(present, scores, 0.0)
+        global_min = scores[present].min()
+        global_max = scores[present].max()
+        if global_max == global_min:
+            # All scores are the same
+            return np.where(present, 1.0, 0.0)
+        return np.where(present, (scores - global_min) / (global_max - global_min), 0.0)
+
+    if method not in ("minmax", "zscore", "dbsf"):
+        logger.warning(f"Unknown normalization method: {method}")
+        return np.where(present, scores, 0.0)
+
+    counts = np.maximum(present.sum(axis=1, keepdims=True), 1)
+    masked = np.where(present, scores, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if method == "minmax":
+            row_min = np.where(present, scores, np.inf).min(axis=1, keepdims=True)
+            row_max = np.where(present, scores, -np.inf).max(axis=1, keepdims=True)
+            spread = row_max - row_min
+            normalized = np.where(spread > 0, (scores - row_min) / spread, 1.0)
+        else:
+            mean = masked.sum(axis=1, keepdims=True) / counts
+            std = np.sqrt(np.where(present, (scores - mean) ** 2, 0.0).sum(axis=1, keepdims=True) / counts)
+            if method == "zscore":
+                normalized = np.where(std > 0, (scores - mean) / std, 0.0)
+            else:
+                # DBSF: mean +/- 3*std as limits, clipped to [0, 1]
+                normalized = np.where(std > 0, np.clip((scores - (mean - 3 * std)) / (6 * std), 0.0, 1.0), 1.0)
+
+    return np.where(present, normalized, 0.0)
+
+
+class FusionMatrix:
+    """
+    Result lists of several methods laid out for vectorized fusion.
+
+    Every unique doc_id is mapped to an integer slot once (in order of first
+    appearance), and the per-method scores and 1-based ranks are held in dense
+    (num_methods, num_slots) arrays. A document listed twice by one method keeps
+    its last score and rank.
+    """
+
+    def __init__(self, results_list: List[List[Dict[str, Any]]]):
+        self.slots: Dict[str, int] = {}
+        self.base_results: List[Dict[str, Any]] = []
+        entries = []
+        for results in results_list:
+            method_entries = {}
+            for rank, result in enumerate(results, start=1):
+                doc_id = result['doc_id']
+                slot = self.slots.get(doc_id)
+                if slot is None:
+                    slot = self.slots[doc_id] = len(self.base_results)
+                    self.base_results.append(result)
+                method_entries[slot] = (result['score'], rank)
+            entries.append(method_entries)
+
+        self.num_methods = len(results_list)
+        self.num_docs = len(self.base_results)
+        self.list_lengths = np.array([len(results) for results in results_list], dtype=np.float64)
+        self.scores = np.zeros((self.num_methods, self.num_docs), dtype=np.float64)
+        self.ranks = np.zeros((self.num_methods, self.num_docs), dtype=np.float64)
+        self.present = np.zeros((self.num_methods, self.num_docs), dtype=bool)
+        for method_idx, method_entries in enumerate(entries):
+            if not method_entries:
+                continue
+            slots = np.fromiter(method_entries.keys(), dtype=np.int64, count=len(method_entries))
+            values = np.array(list(method_entries.values()), dtype=np.float64)
+            self.scores[method_idx, slots] = values[:, 0]
+            self.ranks[method_idx, slots] = values[:, 1]
+            self.present[method_idx, slots] = True
+
+    def normalized_scores(self, method: Union[str, None]) -> np.ndarray:
+        """Per-method scores normalized with the given method (None keeps the raw scores)"""
+        if method is None:
+            return np.where(self.present, self.scores, 0.0)
+        return _normalize_score_rows(self.scores, self.present, method)
+
+    def to_results(
+        self,
+        fused_scores: np.ndarray,
+        combination_method: str,
+        diagnostics_fn: Union[Callable[[int], Dict[str, Any]], None] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build result dicts sorted by fused score (ties keep first-appearance order).
+
+        Args:
+            fused_scores: One fused score per slot
+            combination_method: Name stored in the diagnostic metadata
+            diagnostics_fn: Builds the combination_info of a slot; None skips the diagnostics
+        """
+        order = np.argsort(-fused_scores, kind="stable")
+        scores = fused_scores[order].tolist()
+        combined_results = []
+        for slot, score in zip(order.tolist(), scores):
+            base = self.base_results[slot]
+            metadata = base.get('metadata') or {}
+            if diagnostics_fn is not None:
+                metadata = dict(metadata)
+                metadata['combination_info'] = {
+                    'method': combination_method,
+                    **diagnostics_fn(slot),
+                    'final_score': score
+                }
+            combined_results.append({
+                'doc_id': base['doc_id'],
+                'content': base['content'],
+                'score': score,
+                'metadata': metadata
+            })
+        return combined_results
+
+
+def _resolve_method_names(method_names: Union[List[str], None], num_methods: int) -> List[str]:
+    """Method names used in the diagnostics, defaulting to method_<i>"""
+    if method_names is None:
+        return [f"method_{i}" for i in range(num_methods)]
+    if len(method_names) != num_methods:
+        logger.warning("Method names length mismatch, using default names")
+        return [f"method_{i}" for i in range(num_methods)]
+    return method_names
+
+
+def _diagnostics_enabled(include_diagnostics: Union[bool, None]) -> bool:
+    """Diagnostic metadata is built on request, or by default when debug logging is on"""
+    if include_diagnostics is None:
+        return logger.isEnabledFor(logging.DEBUG)
+    return include_diagnostics
+
+
 class ScoreCombiner:
     """Utility class for combining scores from multiple result lists"""
     
@@ -14,6 +163,8 @@ class ScoreCombiner:
         results_list: List[List[Dict[str, Any]]], 
         weights: Union[List[float], None] = None,
         method_names: Union[List[str], None] = None,
+        normalization_method: Union[str, None] = None,
+        include_diagnostics: Union[bool, None] = None,
     ) -> List[Dict[str, Any]]:
         """
         Combine multiple result lists using convex combination of scores.
@@ -24,6 +175,8 @@ class ScoreCombiner:
             weights: List of weights for each method. If None, equal weights are used.
                     Must sum to 1.0 if provided.
             method_names: Optional names for each method (for metadata tracking)
+            normalization_method: Optional score normalization applied per method before combining
+            include_diagnostics: Add combination_info to the metadata (None: only with debug logging)
         Returns:
             Combined results sorted by combined score
         """
@@ -47,67 +200,27 @@ class ScoreCombiner:
                     logger.warning(f"Weights sum to {weight_sum}, normalizing to 1.0")
                     weights = [w / weight_sum for w in weights]
             
-            # Setup method names for tracking
-            if method_names is None:
-                method_names = [f"method_{i}" for i in range(num_methods)]
-            elif len(method_names) != num_methods:
-                logger.warning("Method names length mismatch, using default names")
-                method_names = [f"method_{i}" for i in range(num_methods)]
-            
-            # Create mappings for each method
-            method_mappings = []
-            for i, results in enumerate(results_list):
-                mapping = {result['doc_id']: result for result in results}
-                method_mappings.append(mapping)
-            
-            # Get all unique document IDs across all methods
-            all_doc_ids = set()
-            for mapping in method_mappings:
-                all_doc_ids.update(mapping.keys())
+            matrix = FusionMatrix(results_list)
+            weight_vector = np.asarray(weights, dtype=np.float64)
+            scores = matrix.normalized_scores(normalization_method)
+            contributions = scores * weight_vector[:, None]
+            fused_scores = contributions.sum(axis=0)
             
-            combined_results = []
-            
-            for doc_id in all_doc_ids:
-                combined_score = 0.0
-                doc_data = None
-                method_contributions = {}
+            diagnostics_fn = None
+            if _diagnostics_enabled(include_diagnostics):
+                method_names = _resolve_method_names(method_names, num_methods)
                 
-                # Calculate weighted combination of scores
-                for i, (mapping, weight, method_name) in enumerate(zip(method_mappings, weights, method_names)):
-                    if doc_id in mapping:
-                        result = mapping[doc_id]
-                        contribution = weight * result['score']
-                        combined_score += contribution
-                        method_contributions[method_name] = {
-                            'score': result['score'],
-                            'weight': weight,
-                            'contribution': contribution
+                def diagnostics_fn(slot: int) -> Dict[str, Any]:
+                    return {'method_contributions': {
+                        method_names[i]: {
+                            'score': float(scores[i, slot]),
+                            'weight': float(weight_vector[i]),
+                            'contribution': float(contributions[i, slot])
                         }
-                        
-                        # Use the first available result as base document data
-                        if doc_data is None:
-                            doc_data = result.copy()
-                
-                if doc_data is not None:
-                    # Create combined result
-                    combined_result = {
-                        'doc_id': doc_data['doc_id'],
-                        'content': doc_data['content'],
-                        'score': combined_score,
-                        'metadata': doc_data.get('metadata', {}).copy()
-                    }
-                    
-                    # Add combination metadata
-                    combined_result['metadata']['combination_info'] = {
-                        'method': 'convex_combination',
-                        'method_contributions': method_contributions,
-                        'final_score': combined_score
-                    }
-                    
-                    combined_results.append(combined_result)
+                        for i in np.flatnonzero(matrix.present[:, slot])
+                    }}
             
-            # Sort by combined score (descending)
-            combined_results.sort(key=lambda x: x['score'], reverse=True)
+            combined_results = matrix.to_results(fused_scores, 'convex_combination', diagnostics_fn)
             
             logger.info(f"Combined {len(combined_results)} unique documents from {num_methods} methods")
             return combined_results
@@ -123,7 +236,8 @@ class RankFusionCombiner:
     @staticmethod
     def reciprocal_rank_fusion(
         results_list: List[List[Dict[str, Any]]], 
-        method_names: Union[List[str], None] = None
+        method_names: Union[List[str], None] = None,
+        include_diagnostics: Union[bool, None] = None,
     ) -> List[Dict[str, Any]]:
         """
         Combine multiple result lists using Reciprocal Rank Fusion.
@@ -132,6 +246,7 @@ class RankFusionCombiner:
             results_list: List of result lists, each containing dicts with keys 
                          ['doc_id', 'content', 'score', 'metadata']
             method_names: Optional names for each method (for metadata tracking)
+            include_diagnostics: Add combination_info to the metadata (None: only with debug logging)
             
         Returns:
             Combined results sorted by RRF score
@@ -142,73 +257,28 @@ class RankFusionCombiner:
                 return []
             
             num_methods = len(results_list)
+            matrix = FusionMatrix(results_list)
+            contributions = np.where(matrix.present, 1.0 / (60 + matrix.ranks), 0.0)
+            fused_scores = contributions.sum(axis=0)
             
-            # Setup method names for tracking
-            if method_names is None:
-                method_names = [f"method_{i}" for i in range(num_methods)]
-            elif len(method_names) != num_methods:
-                logger.warning("Method names length mismatch, using default names")
-                method_names = [f"method_{i}" for i in range(num_methods)]
-            
-            # Create document registry to store all unique documents
-            doc_registry = {}
-            
-            # Process each method's results
-            for method_idx, (results, method_name) in enumerate(zip(results_list, method_names)):
-                for rank, result in enumerate(results):
-                    doc_id = result['doc_id']
-                    
-                    if doc_id not in doc_registry:
-                        doc_registry[doc_id] = {
-                            'doc_id': doc_id,
-                            'content': result['content'],
-                            'metadata': result['metadata'],
-                            'method_ranks': {},
-                            'rrf_score': 0.0
-                        }
-                    
-                    # Store rank for this method (1-indexed)
-                    doc_registry[doc_id]['method_ranks'][method_name] = rank + 1
-            
-            # Calculate RRF scores
-            for doc_id, doc_info in doc_registry.items():
-                rrf_score = 0.0
-                method_contributions = {}
+            diagnostics_fn = None
+            if _diagnostics_enabled(include_diagnostics):
+                method_names = _resolve_method_names(method_names, num_methods)
                 
-                # Add contribution from each method that found this document
-                for method_name, rank in doc_info['method_ranks'].items():
-                    contribution = 1.0 / (60 + rank)
-                    rrf_score += contribution
-                    method_contributions[method_name] = {
-                        'rank': rank,
-                        'contribution': contribution
+                def diagnostics_fn(slot: int) -> Dict[str, Any]:
+                    found_in = np.flatnonzero(matrix.present[:, slot])
+                    return {
+                        'method_contributions': {
+                            method_names[i]: {
+                                'rank': int(matrix.ranks[i, slot]),
+                                'contribution': float(contributions[i, slot])
+                            }
+                            for i in found_in
+                        },
+                        'methods_found_in': [method_names[i] for i in found_in]
                     }
-                
-                doc_info['rrf_score'] = rrf_score
-                doc_info['method_contributions'] = method_contributions
-            
-            # Convert to list and sort by RRF score
-            combined_results = []
-            for doc_info in doc_registry.values():
-                result = {
-                    'doc_id': doc_info['doc_id'],
-                    'content': doc_info['content'],
-                    'score': doc_info['rrf_score'],
-                    'metadata': doc_info['metadata'].copy() if doc_info['metadata'] else {}
-                }
-                
-                # Add RRF metadata
-                result['metadata']['combination_info'] = {
-                    'method': 'reciprocal_rank_fusion',
-                    'method_contributions': doc_info['method_contributions'],
-                    'methods_found_in': list(doc_info['method_ranks'].keys()),
-                    'final_score': doc_info['rrf_score']
-                }
-                
-                combined_results.append(result)
             
-            # Sort by RRF score (descending)
-            combined_results.sort(key=lambda x: x['score'], reverse=True)
+            combined_results = matrix.to_results(fused_scores, 'reciprocal_rank_fusion', diagnostics_fn)
             
             logger.info(f"RRF combined {len(combined_results)} unique documents from {num_methods} methods")
             return combined_results
@@ -220,7 +290,8 @@ class RankFusionCombiner:
     @staticmethod
     def borda_count_fusion(
         results_list: List[List[Dict[str, Any]]], 
-        method_names: Union[List[str], None] = None
+        method_names: Union[List[str], None] = None,
+        include_diagnostics: Union[bool, None] = None,
     ) -> List[Dict[str, Any]]:
         """
         Combine multiple result lists using Borda count method.
@@ -228,6 +299,7 @@ class RankFusionCombiner:
         Args:
             results_list: List of result lists
             method_names: Optional names for each method
+            include_diagnostics: Add combination_info to the metadata (None: only with debug logging)
         Returns:
             Combined results sorted by Borda count score
         """
@@ -236,57 +308,26 @@ class RankFusionCombiner:
                 return []
             
             num_methods = len(results_list)
+            matrix = FusionMatrix(results_list)
             
-            # Setup method names
-            if method_names is None:
-                method_names = [f"method_{i}" for i in range(num_methods)]
+            # Borda count: points = (total_docs - rank), with 0-based ranks
+            points = np.where(matrix.present, matrix.list_lengths[:, None] - matrix.ranks + 1, 0.0)
+            fused_scores = points.sum(axis=0)
             
-            # Create document registry
-            doc_registry = {}
-            
-            # Process each method's results
-            for method_idx, (results, method_name) in enumerate(zip(results_list, method_names)):
-                num_docs = len(results)
+            diagnostics_fn = None
+            if _diagnostics_enabled(include_diagnostics):
+                method_names = _resolve_method_names(method_names, num_methods)
                 
-                for rank, result in enumerate(results):
-                    doc_id = result['doc_id']
-                    
-                    if doc_id not in doc_registry:
-                        doc_registry[doc_id] = {
-                            'doc_id': doc_id,
-                            'content': result['content'],
-                            'metadata': result['metadata'],
-                            'borda_score': 0.0,
-                            'method_contributions': {}
+                def diagnostics_fn(slot: int) -> Dict[str, Any]:
+                    return {'method_contributions': {
+                        method_names[i]: {
+                            'rank': int(matrix.ranks[i, slot]),
+                            'points': int(points[i, slot])
                         }
-                    
-                    # Borda count: points = (total_docs - rank)
-                    points = num_docs - rank
-                    doc_registry[doc_id]['borda_score'] += points
-                    doc_registry[doc_id]['method_contributions'][method_name] = {
-                        'rank': rank + 1,
-                        'points': points
-                    }
-            
-            # Convert to list and sort by Borda score
-            combined_results = []
-            for doc_info in doc_registry.values():
-                result = {
-                    'doc_id': doc_info['doc_id'],
-                    'content': doc_info['content'],
-                    'score': doc_info['borda_score'],
-                    'metadata': doc_info['metadata'].copy() if doc_info['metadata'] else {}
-                }
-                
-                result['metadata']['combination_info'] = {
-                    'method': 'borda_count',
-                    'method_contributions': doc_info['method_contributions'],
-                    'final_score': doc_info['borda_score']
-                }
-                
-                combined_results.append(result)
+                        for i in np.flatnonzero(matrix.present[:, slot])
+                    }}
             
-            combined_results.sort(key=lambda x: x['score'], reverse=True)
+            combined_results = matrix.to_results(fused_scores, 'borda_count', diagnostics_fn)
             
             logger.info(f"Borda count combined {len(combined_results)} unique documents from {num_methods} methods")
             return combined_results
@@ -334,13 +375,16 @@ class HybridUtils:
         method_names: List[str],
         weights: Union[List[float], None] = None,
         normalization_method: str = "minmax",
+        include_diagnostics: Union[bool, None] = None,
     ) -> List[Dict[str, Any]]:
         """Combine results using convex combination"""
         try:
-            # Normalize scores before combination if requested
-            results_list = HybridUtils.normalize_results_list(results_list, normalization_method)
-            
-            return ScoreCombiner.convex_combination(results_list, weights, method_names)
+            # Scores are normalized on the fusion matrix before combination
+            return ScoreCombiner.convex_combination(
+                results_list, weights, method_names,
+                normalization_method=normalization_method,
+                include_diagnostics=include_diagnostics
+            )
             
         except Exception as e:
             logger.error(f"Convex combination failed: {e}")
@@ -350,10 +394,11 @@ class HybridUtils:
     def combine_with_rrf(
         results_list: List[List[Dict[str, Any]]], 
         method_names: List[str],
+        include_diagnostics: Union[bool, None] = None,
     ) -> List[Dict[str, Any]]:
         """Combine results using Reciprocal Rank Fusion"""
         try:
-            return RankFusionCombiner.reciprocal_rank_fusion(results_list, method_names)
+            return RankFusionCombiner.reciprocal_rank_fusion(results_list, method_names, include_diagnostics)
             
         except Exception as e:
             logger.error(f"RRF combination failed: {e}")
@@ -363,10 +408,11 @@ class HybridUtils:
     def combine_with_borda_count(
         results_list: List[List[Dict[str, Any]]], 
         method_names: List[str],
+        include_diagnostics: Union[bool, None] = None,
     ) -> List[Dict[str, Any]]:
         """Combine results using Borda Count"""
         try:
-            return RankFusionCombiner.borda_count_fusion(results_list, method_names)
+            return RankFusionCombiner.borda_count_fusion(results_list, method_names, include_diagnostics)
             
         except Exception as e:
             logger.error(f"Borda count combination failed: {e}")
@@ -382,7 +428,7 @@ class HybridUtils:
         
         Args:
             results_list: List of result lists to normalize
-            method: Normalization method ("minmax", "zscore", "global_minmax")
+            method: Normalization method ("minmax", "zscore", "dbsf", "global_minmax")
             
         Returns:
             List of normalized result lists
@@ -390,139 +436,49 @@ class HybridUtils:
         if not results_list:
             return results_list
         
-        if method == "global_minmax":
-            return HybridUtils._global_minmax_normalize(results_list)
-        else:
-            # Normalize each list independently
-            normalized_lists = []
-            for results in results_list:
-                if method == "minmax":
-                    normalized = HybridUtils.normalize_scores_minmax(results)
-                elif method == "zscore":
-                    normalized = HybridUtils.normalize_scores_zscore(results)
-                elif method == "dbsf":
-                    normalized = HybridUtils.normalize_scores_dbsf(results)
-                else:
-                    logger.warning(f"Unknown normalization method: {method}")
-                    normalized = results
-                normalized_lists.append(normalized)
-            return normalized_lists
-    
-    @staticmethod
-    def _global_minmax_normalize(results_list: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
-        """Normalize all scores using global min and max across all methods"""
-        # Collect all scores
-        all_scores = []
-        for results in results_list:
-            all_scores.extend([result['score'] for result in results])
-        
-        if not all_scores:
-            return results_list
-        
-        global_min = min(all_scores)
-        global_max = max(all_scores)
+        # Lay the lists out position by position so one array pass normalizes all of them
+        width = max(len(results) for results in results_list)
+        scores = np.zeros((len(results_list), width), dtype=np.float64)
+        present = np.zeros((len(results_list), width), dtype=bool)
+        for i, results in enumerate(results_list):
+            scores[i, :len(results)] = [result['score'] for result in results]
+            present[i, :len(results)] = True
         
-        if global_max == global_min:
-            # All scores are the same
-            normalized_lists = []
-            for results in results_list:
-                normalized = [r.copy() for r in results]
-                for r in normalized:
-                    r['score'] = 1.0
-                normalized_lists.append(normalized)
-            return normalized_lists
+        normalized = _normalize_score_rows(scores, present, method)
         
-        # Normalize using global min/max
         normalized_lists = []
-        for results in results_list:
-            normalized = []
-            for result in results:
-                normalized_result = result.copy()
-                normalized_result['score'] = (result['score'] - global_min) / (global_max - global_min)
-                normalized.append(normalized_result)
-            normalized_lists.append(normalized)
-        
+        for i, results in enumerate(results_list):
+            normalized_scores = normalized[i, :len(results)].tolist()
+            normalized_lists.append([
+                {**result, 'score': score} for result, score in zip(results, normalized_scores)
+            ])
         return normalized_lists
     
+    @staticmethod
+    def _global_minmax_normalize(results_list: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """Normalize all scores using global min and max across all methods"""
+        return HybridUtils.normalize_results_list(results_list, "global_minmax")
+    
     @staticmethod
     def normalize_scores_minmax(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Normalize scores using min-max normalization"""
         if not results:
             return results
-        
-        scores = [result['score'] for result in results]
-        min_score = min(scores)
-        max_score = max(scores)
-        
-        if max_score == min_score:
-            for result in results:
-                result['score'] = 1.0
-            return results
-        
-        normalized_results = []
-        for result in results:
-            normalized_result = result.copy()
-            normalized_result['score'] = (result['score'] - min_score) / (max_score - min_score)
-            normalized_results.append(normalized_result)
-        
-        return normalized_results
+        return HybridUtils.normalize_results_list([results], "minmax")[0]
     
     @staticmethod
     def normalize_scores_zscore(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Normalize scores using z-score normalization"""
         if not results:
             return results
-        
-        scores = np.array([result['score'] for result in results])
-        mean_score = np.mean(scores)
-        std_score = np.std(scores)
-        
-        if std_score == 0:
-            for result in results:
-                result['score'] = 0.0
-            return results
-        
-        normalized_results = []
-        for i, result in enumerate(results):
-            normalized_result = result.copy()
-            normalized_result['score'] = (scores[i] - mean_score) / std_score
-            normalized_results.append(normalized_result)
-        
-        return normalized_results
+        return HybridUtils.normalize_results_list([results], "zscore")[0]
     
     @staticmethod
     def normalize_scores_dbsf(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Normalize scores using DBSF method (mean +/- 3*std as limits)"""
         if not results:
             return results
-        
-        scores = np.array([result['score'] for result in results])
-        mean_value = np.mean(scores)
-        std_value = np.std(scores)
-        
-        # DBSF normalization bounds
-        min_value = mean_value - 3 * std_value
-        max_value = mean_value + 3 * std_value
-        
-        if max_value == min_value:
-            # All scores are the same or std is 0
-            normalized_results = []
-            for result in results:
-                normalized_result = result.copy()
-                normalized_result['score'] = 1.0
-                normalized_results.append(normalized_result)
-            return normalized_results
-        
-        # Normalize scores
-        normalized_results = []
-        for result in results:
-            normalized_result = result.copy()
-            normalized_score = (result['score'] - min_value) / (max_value - min_value)
-            # Clip to [0, 1] range
-            normalized_result['score'] = max(0.0, min(1.0, normalized_score))
-            normalized_results.append(normalized_result)
-        
-        return normalized_results
+        return HybridUtils.normalize_results_list([results], "dbsf")[0]
     
     @staticmethod
     def filter_top_k(results: List[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
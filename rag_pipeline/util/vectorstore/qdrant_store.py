@@ -16,12 +16,18 @@ import hashlib
 import uuid
 import time
 import os
+import queue
+import threading
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
 
+from rag_pipeline.util.cache.embedding_cache import get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +50,9 @@ class QdrantVectorStore:
         
         # Use a consistent UUID for metadata point based on collection name
         self.metadata_point_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"metadata_{self.collection_name}"))
+        # The dataset metadata point lives in its own tiny collection so that searches
+        # over the document collection need neither a payload filter nor an over-fetch
+        self.metadata_collection_name = f"{self.collection_name}__metadata"
         
         # Initialize Qdrant client
         qdrant_url = os.getenv("QDRANT_URL", "http://qdrant2:6333")
@@ -76,6 +85,9 @@ class QdrantVectorStore:
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
         
+        # Shared content-addressed embedding cache
+        self.embedding_cache = get_embedding_cache()
+        
         # Get embedding dimension
         self.embedding_dim = self._get_embedding_dimension()
         
@@ -83,6 +95,12 @@ class QdrantVectorStore:
                    f"collection {self.collection_name}, embedding dimension {self.embedding_dim}")
     
     def _get_embedding_api(self, text: str, timeout: int = 60) -> List[float]:
+        """Get embedding for a text, calling the Ollama API only on an embedding cache miss"""
+        return self.embedding_cache.embed(
+            self.embedding_model, text, lambda missing: self._request_embedding_api(missing, timeout=timeout)
+        )
+    
+    def _request_embedding_api(self, text: str, timeout: int = 60) -> List[float]:
         """Get embedding using direct Ollama API call with timeout"""
         url = f"{self.ollama_api_url}/embeddings"
         
@@ -110,13 +128,18 @@ class QdrantVectorStore:
     
     def _get_embeddings_batch_api(self, texts: List[str], timeout: int = 120) -> List[List[float]]:
         """Get embeddings for multiple texts using direct Ollama API calls with optional parallelization"""
+        return self.embedding_cache.embed_many(
+            self.embedding_model, texts, lambda missing: self._request_embeddings_batch_api(missing, timeout=timeout)
+        )
+    
+    def _request_embeddings_batch_api(self, texts: List[str], timeout: int = 120) -> List[List[float]]:
+        """Request embeddings for multiple texts one by one"""
         embeddings = []
         
-        # For now, process sequentially to avoid overwhelming the Ollama server
-        # Could be optimized with ThreadPoolExecutor if needed
+        # Sequential; used as a fallback when a batched /api/embed call fails
         for i, text in enumerate(texts):
             try:
-                embedding = self._get_embedding_api(text, timeout=timeout)
+                embedding = self._request_embedding_api(text, timeout=timeout)
                 embeddings.append(embedding)
                 logger.debug(f"Generated embedding {i+1}/{len(texts)}")
             except Exception as e:
@@ -125,6 +148,36 @@ class QdrantVectorStore:
             
         return embeddings
     
+    def _get_embeddings_multi_api(self, texts: List[str], timeout: int = 60) -> List[List[float]]:
+        """Get embeddings for multiple texts, sending only the embedding cache misses to Ollama's /api/embed endpoint"""
+        return self.embedding_cache.embed_many(
+            self.embedding_model, texts, lambda missing: self._request_embeddings_multi_api(missing, timeout=timeout)
+        )
+    
+    def _request_embeddings_multi_api(self, texts: List[str], timeout: int = 60) -> List[List[float]]:
+        """Get embeddings for multiple texts with a single call to Ollama's /api/embed endpoint"""
+        url = f"{self.ollama_api_url}/embed"
+        
+        payload = {
+            "model": self.embedding_model,
+            "input": texts
+        }
+        
+        try:
+            response = self.session.post(url, json=payload, timeout=timeout)
+            response.raise_for_status()
+            
+            embeddings = response.json().get("embeddings", [])
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings from API, got {len(embeddings)}")
+            
+            return embeddings
+            
+        except requests.exceptions.Timeout:
+            raise TimeoutError(f"Embedding API call timed out after {timeout} seconds")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Embedding API call failed: {e}")
+    
     def _get_embedding_dimension(self) -> int:
         """Get embedding dimension by testing with a sample text"""
         try:
@@ -162,6 +215,56 @@ class QdrantVectorStore:
             logger.error(f"Error creating collection: {e}")
             raise
     
+    def _collection_exists(self, collection_name: str) -> bool:
+        """Check whether a Qdrant collection exists"""
+        return collection_name in [col.name for col in self.client.get_collections().collections]
+    
+    def _write_dataset_metadata(self, payload: Dict[str, Any]):
+        """Store the dataset metadata point in the metadata collection"""
+        if not self._collection_exists(self.metadata_collection_name):
+            self.client.create_collection(
+                collection_name=self.metadata_collection_name,
+                vectors_config=VectorParams(size=1, distance=Distance.DOT)
+            )
+        self.client.upsert(
+            collection_name=self.metadata_collection_name,
+            points=[PointStruct(id=self.metadata_point_id, vector=[0.0], payload=payload)],
+            wait=True
+        )
+    
+    def _read_dataset_metadata(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the payload of the dataset metadata point (None if there is none)
+        
+        Collections indexed before the metadata collection existed keep the point next
+        to the documents; it is moved to the metadata collection on first read.
+        """
+        if self._collection_exists(self.metadata_collection_name):
+            metadata_point = self.client.retrieve(
+                collection_name=self.metadata_collection_name,
+                ids=[self.metadata_point_id]
+            )
+            if metadata_point:
+                return metadata_point[0].payload
+        
+        legacy_point = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=[self.metadata_point_id]
+        )
+        if not legacy_point:
+            return None
+        
+        payload = dict(legacy_point[0].payload)
+        payload.pop("is_metadata", None)
+        self._write_dataset_metadata(payload)
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=models.PointIdsList(points=[self.metadata_point_id]),
+            wait=True
+        )
+        logger.info(f"Moved dataset metadata of {self.collection_name} to {self.metadata_collection_name}")
+        return payload
+    
     @staticmethod
     def _generate_doc_hash(text: str, doc_id: str) -> str:
         """Generate a unique hash for a document"""
@@ -238,14 +341,12 @@ class QdrantVectorStore:
             dataset_hash = QdrantVectorStore._generate_dataset_hash(docs_df)
             # Try to get metadata point
             try:
-                metadata_point = self.client.retrieve(
-                    collection_name=self.collection_name,
-                    ids=[self.metadata_point_id]
-                )
-                
-                if metadata_point and len(metadata_point) > 0:
-                    stored_hash = metadata_point[0].payload.get("dataset_hash")
-                    stored_doc_count = metadata_point[0].payload.get("document_count", 0)
+                metadata = self._read_dataset_metadata()
+                if metadata is not None:
+                    # The legacy metadata point may just have been moved out of the collection
+                    current_points = self.client.get_collection(self.collection_name).points_count
+                    stored_hash = metadata.get("dataset_hash")
+                    stored_doc_count = metadata.get("document_count", 0)
                     
                     if stored_hash == dataset_hash:
                         # Same dataset, check completion
@@ -339,14 +440,6 @@ class QdrantVectorStore:
             while True:
                 result = self.client.scroll(
                     collection_name=self.collection_name,
-                    scroll_filter=models.Filter(
-                        must=[
-                            models.FieldCondition(
-                                key="is_metadata",
-                                match=models.MatchValue(value=False)  # Only get actual documents, not metadata
-                            )
-                        ]
-                    ),
                     limit=1000,
                     offset=next_page_offset,
                     with_payload=True,
@@ -410,14 +503,17 @@ class QdrantVectorStore:
             # If we can't determine missing docs, return all docs to be safe
             return docs_df
     
-    def index_documents(self, docs_df: pd.DataFrame, batch_size: int = 100, force_reindex: bool = False) -> bool:
+    def index_documents(self, docs_df: pd.DataFrame, batch_size: int = 100, force_reindex: bool = False,
+                        embedding_batch_size: Optional[int] = None, max_inflight_batches: Optional[int] = None) -> bool:
         """
         Index documents from retrieval_docs.csv into Qdrant
         
         Args:
             docs_df: DataFrame with 'text' and 'metadata' columns
-            batch_size: Number of documents to process in each batch
+            batch_size: Number of points sent to Qdrant in each upsert
             force_reindex: Force re-indexing even if documents already exist
+            embedding_batch_size: Number of texts per /api/embed call (default EMBEDDING_BATCH_SIZE or 64)
+            max_inflight_batches: Number of embedding calls in flight at once (default EMBEDDING_MAX_INFLIGHT_BATCHES or 4)
             
         Returns:
             True if successful, False otherwise
@@ -469,138 +565,96 @@ class QdrantVectorStore:
             
             # Add/update dataset metadata point (only if not resuming or if this is the first time)
             if not resume_indexing or status["status"] not in ["incomplete", "incomplete_no_metadata"]:
-                metadata_point = PointStruct(
-                    id=self.metadata_point_id,
-                    vector=[0.0] * self.embedding_dim,  # Dummy vector
-                    payload={
-                        "dataset_hash": dataset_hash,
-                        "document_count": len(docs_df),  # Total expected documents
-                        "indexed_at": time.time(),
-                        "embedding_model": self.embedding_model,
-                        "is_metadata": True
-                    }
-                )
-                points.append(metadata_point)
+                self._write_dataset_metadata({
+                    "dataset_hash": dataset_hash,
+                    "document_count": len(docs_df),  # Total expected documents
+                    "indexed_at": time.time(),
+                    "embedding_model": self.embedding_model
+                })
                 logger.info("Added/updated dataset metadata point")
             
-            # Process documents in batches for embedding
-            # Adaptive batch size based on dataset size
+            # Embed documents in micro-batches through /api/embed with several batches in
+            # flight, while a separate thread upserts finished points into Qdrant
             total_original_docs = len(docs_df)
             total_docs_to_index = len(docs_to_index)
             already_indexed = status.get("points_count", 0) if resume_indexing else 0
             
-            if total_original_docs > 10000:
-                embedding_batch_size = 50  # Larger batches for big datasets
-            elif total_original_docs > 1000:
-                embedding_batch_size = 30  # Medium batches
-            else:
-                embedding_batch_size = 20  # Small batches for small datasets
+            if embedding_batch_size is None:
+                embedding_batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+            if max_inflight_batches is None:
+                max_inflight_batches = int(os.getenv("EMBEDDING_MAX_INFLIGHT_BATCHES", "4"))
+            embedding_batch_size = max(1, embedding_batch_size)
+            max_inflight_batches = max(1, max_inflight_batches)
+            # Use longer timeouts for large datasets
+            batch_timeout = 180 if total_original_docs > 10000 else 120
+            individual_timeout = 90 if total_original_docs > 10000 else 60
             
             if resume_indexing:
                 logger.info(f"Resuming indexing: {already_indexed} already indexed, {total_docs_to_index} remaining to index")
             else:
                 logger.info(f"Starting fresh indexing: {total_docs_to_index} documents to index")
-            
-            for batch_start in range(0, total_docs_to_index, embedding_batch_size):
-                batch_end = min(batch_start + embedding_batch_size, total_docs_to_index)
-                batch_df = docs_to_index.iloc[batch_start:batch_end]
-                
-                # Prepare batch data
-                batch_texts = []
-                batch_metadata = []
-                batch_doc_ids = []
-                
-                for idx, row in batch_df.iterrows():
+            logger.info(f"Embedding in batches of {embedding_batch_size} with up to {max_inflight_batches} batches in flight")
+            
+            upsert_queue: "queue.Queue[Optional[List[PointStruct]]]" = queue.Queue(maxsize=max_inflight_batches * 2)
+            upsert_errors = []
+            
+            def _upsert_worker():
+                while True:
+                    chunk = upsert_queue.get()
+                    if chunk is None:
+                        return
+                    if upsert_errors:
+                        continue  # Drain the queue after a failure
                     try:
-                        text = row['text']
-                        metadata_str = row['metadata']
-                        if isinstance(metadata_str, str):
-                            
-                        # Parse metadata (it's stored as a string representation of a dict)
-                            try:
-                                metadata = ast.literal_eval(metadata_str)
-                            except:
-                                # If parsing fails, try json.loads
-                                try:
-                                    metadata = json.loads(metadata_str)
-                                except:
-                                    logger.warning(f"Failed to parse metadata for doc {idx}: {metadata_str}")
-                                    metadata = {"doc_id": str(idx)}
-                        elif isinstance(metadata_str, dict):
-                            metadata = metadata_str
-                        else:
-                            logger.warning(f"Invalid metadata type for doc {idx}: {type(metadata_str)}")
-                            metadata = {"doc_id": str(idx)}
-                        # Ensure doc_id is present
-                        if 'doc_id' not in metadata:
-                            if 'chunk_id' in metadata:
-                                metadata['doc_id'] = metadata['chunk_id']
-                            else:
-                                metadata['doc_id'] = str(idx)
-                        
-                        doc_id = metadata['doc_id']
-                        batch_texts.append(text)
-                        batch_metadata.append(metadata)
-                        batch_doc_ids.append(doc_id)
-                        
+                        self._upsert_points(chunk)
                     except Exception as e:
-                        logger.error(f"Error processing document {idx}: {e}")
-                        continue
-                
-                # Generate embeddings for the batch
-                try:
-                    # Use longer timeout for large datasets
-                    batch_timeout = 180 if total_original_docs > 10000 else 120
-                    batch_embeddings = self._get_embeddings_batch_api(batch_texts, timeout=batch_timeout)
+                        upsert_errors.append(e)
+            
+            upsert_thread = threading.Thread(target=_upsert_worker, name="qdrant-upsert", daemon=True)
+            upsert_thread.start()
+            
+            def _submit_points():
+                """Hand full chunks of points to the upsert thread"""
+                nonlocal points
+                while len(points) >= batch_size:
+                    upsert_queue.put(points[:batch_size])
+                    points = points[batch_size:]
+            
+            try:
+                with ThreadPoolExecutor(max_workers=max_inflight_batches) as executor:
+                    in_flight = deque()
+                    batch_starts = iter(range(0, total_docs_to_index, embedding_batch_size))
                     
-                    # Create points for the batch
-                    for i, (text, metadata, doc_id, embedding) in enumerate(zip(batch_texts, batch_metadata, batch_doc_ids, batch_embeddings)):
-                        point_id = self._generate_doc_hash(text, doc_id)
-                        point = PointStruct(
-                            id=point_id,
-                            vector=embedding,
-                            payload={
-                                "text": text,
-                                "doc_id": doc_id,
-                                "metadata": metadata,
-                                "is_metadata": False
-                            }
+                    def _submit_next() -> bool:
+                        batch_start = next(batch_starts, None)
+                        if batch_start is None:
+                            return False
+                        batch_end = min(batch_start + embedding_batch_size, total_docs_to_index)
+                        batch_docs = [
+                            self._prepare_document(idx, row)
+                            for idx, row in docs_to_index.iloc[batch_start:batch_end].iterrows()
+                        ]
+                        batch_docs = [doc for doc in batch_docs if doc is not None]
+                        future = executor.submit(
+                            self._embed_micro_batch, [text for text, _, _ in batch_docs], batch_timeout, individual_timeout
                         )
-                        points.append(point)
-                        
-                        # Process in batches for Qdrant
-                        if len(points) >= batch_size:
-                            self._upsert_points(points)
-                            points = []
-                    
-                    # Enhanced progress reporting with resumption context
-                    current_indexed = already_indexed + batch_end
-                    total_progress_pct = (current_indexed / total_original_docs) * 100
-                    batch_progress_pct = (batch_end / total_docs_to_index) * 100
+                        in_flight.append((batch_end, batch_docs, future))
+                        return True
                     
-                    if resume_indexing:
-                        logger.info(f"Resumption progress: {batch_end}/{total_docs_to_index} new documents ({batch_progress_pct:.1f}%) | Total: {current_indexed}/{total_original_docs} ({total_progress_pct:.1f}%)")
-                    else:
-                        logger.info(f"Indexed {batch_end}/{total_docs_to_index} documents ({batch_progress_pct:.1f}%)")
-                    
-                    # Add small delay between batches for large datasets to avoid overwhelming server
-                    if total_original_docs > 5000 and batch_end < total_docs_to_index:
-                        time.sleep(0.5)  # 500ms delay between batches
+                    while len(in_flight) < max_inflight_batches and _submit_next():
+                        pass
                     
-                except (TimeoutError, requests.exceptions.Timeout) as e:
-                    logger.warning(f"Batch embedding generation timed out for batch {batch_start}-{batch_end}, falling back to individual processing: {e}")
-                    # Fall back to individual processing for this batch
-                except Exception as e:
-                    logger.error(f"Error generating embeddings for batch {batch_start}-{batch_end}: {e}")
-                    # Fall back to individual processing for this batch
-                    for text, metadata, doc_id in zip(batch_texts, batch_metadata, batch_doc_ids):
-                        try:
-                            # Use longer timeout for individual fallback processing
-                            individual_timeout = 90 if total_original_docs > 10000 else 60
-                            embedding = self._get_embedding_api(text, timeout=individual_timeout)
-                            point_id = self._generate_doc_hash(text, doc_id)
-                            point = PointStruct(
-                                id=point_id,
+                    # Consume batches in submission order so progress stays monotonic
+                    while in_flight:
+                        batch_end, batch_docs, future = in_flight.popleft()
+                        _submit_next()
+                        batch_embeddings = future.result()
+                        
+                        for (text, metadata, doc_id), embedding in zip(batch_docs, batch_embeddings):
+                            if embedding is None:
+                                continue
+                            points.append(PointStruct(
+                                id=self._generate_doc_hash(text, doc_id),
                                 vector=embedding,
                                 payload={
                                     "text": text,
@@ -608,23 +662,32 @@ class QdrantVectorStore:
                                     "metadata": metadata,
                                     "is_metadata": False
                                 }
-                            )
-                            points.append(point)
-                            
-                            if len(points) >= batch_size:
-                                self._upsert_points(points)
-                                points = []
-                                
-                        except (TimeoutError, requests.exceptions.Timeout) as e:
-                            logger.warning(f"Individual embedding generation timed out, skipping document: {e}")
-                            continue
-                        except Exception as e:
-                            logger.error(f"Error processing individual document: {e}")
-                            continue
-            
-            # Process remaining points
-            if points:
-                self._upsert_points(points)
+                            ))
+                        _submit_points()
+                        
+                        if upsert_errors:
+                            raise upsert_errors[0]
+                        
+                        # Enhanced progress reporting with resumption context
+                        current_indexed = already_indexed + batch_end
+                        total_progress_pct = (current_indexed / total_original_docs) * 100
+                        batch_progress_pct = (batch_end / total_docs_to_index) * 100
+                        
+                        if resume_indexing:
+                            logger.info(f"Resumption progress: {batch_end}/{total_docs_to_index} new documents ({batch_progress_pct:.1f}%) | Total: {current_indexed}/{total_original_docs} ({total_progress_pct:.1f}%)")
+                        else:
+                            logger.info(f"Indexed {batch_end}/{total_docs_to_index} documents ({batch_progress_pct:.1f}%)")
+                
+                # Process remaining points
+                if points:
+                    upsert_queue.put(points)
+                    points = []
+            finally:
+                upsert_queue.put(None)
+                upsert_thread.join()
+            
+            if upsert_errors:
+                raise upsert_errors[0]
             
             # Final success logging with proper context
             if resume_indexing:
@@ -639,6 +702,66 @@ class QdrantVectorStore:
             logger.error(f"Error indexing documents: {e}")
             return False
     
+    @staticmethod
+    def _prepare_document(idx: Any, row: pd.Series) -> Optional[Tuple[str, Dict[str, Any], str]]:
+        """Extract (text, metadata, doc_id) from a retrieval_docs row, or None if the row is unusable"""
+        try:
+            text = row['text']
+            metadata_str = row['metadata']
+            if isinstance(metadata_str, str):
+                
+            # Parse metadata (it's stored as a string representation of a dict)
+                try:
+                    metadata = ast.literal_eval(metadata_str)
+                except:
+                    # If parsing fails, try json.loads
+                    try:
+                        metadata = json.loads(metadata_str)
+                    except:
+                        logger.warning(f"Failed to parse metadata for doc {idx}: {metadata_str}")
+                        metadata = {"doc_id": str(idx)}
+            elif isinstance(metadata_str, dict):
+                metadata = metadata_str
+            else:
+                logger.warning(f"Invalid metadata type for doc {idx}: {type(metadata_str)}")
+                metadata = {"doc_id": str(idx)}
+            # Ensure doc_id is present
+            if 'doc_id' not in metadata:
+                if 'chunk_id' in metadata:
+                    metadata['doc_id'] = metadata['chunk_id']
+                else:
+                    metadata['doc_id'] = str(idx)
+            
+            return text, metadata, metadata['doc_id']
+            
+        except Exception as e:
+            logger.error(f"Error processing document {idx}: {e}")
+            return None
+    
+    def _embed_micro_batch(self, texts: List[str], batch_timeout: int, individual_timeout: int) -> List[Optional[List[float]]]:
+        """
+        Embed a micro-batch with one /api/embed call, falling back to one request per text.
+        Texts whose embedding still fails get None and are skipped.
+        """
+        if not texts:
+            return []
+        try:
+            return self._get_embeddings_multi_api(texts, timeout=batch_timeout)
+        except Exception as e:
+            logger.warning(f"Batch embedding of {len(texts)} texts failed, falling back to individual processing: {e}")
+        
+        embeddings = []
+        for text in texts:
+            try:
+                embeddings.append(self._get_embedding_api(text, timeout=individual_timeout))
+            except (TimeoutError, requests.exceptions.Timeout) as e:
+                logger.warning(f"Individual embedding generation timed out, skipping document: {e}")
+                embeddings.append(None)
+            except Exception as e:
+                logger.error(f"Error processing individual document: {e}")
+                embeddings.append(None)
+        return embeddings
+    
     def _upsert_points(self, points: List[PointStruct]):
         """Upsert points to Qdrant with retry logic"""
         max_retries = 3
@@ -667,50 +790,26 @@ class QdrantVectorStore:
             List of search results with metadata
         """
         try:
-            # Debug: Log the search operation
-            logger.info(f"Similarity search in collection {self.collection_name} for query: '{query[:50]}...', k={k}")
+            logger.debug(f"Similarity search in collection {self.collection_name} for query: '{query[:50]}...', k={k}")
             
-            # Generate query embedding
+            # Generate query embedding (repeated queries are served by the embedding cache LRU)
             query_embedding = self._get_embedding_api(query, timeout=10)
             
-            # Search in Qdrant - request more results to account for metadata filtering
+            # The collection only holds documents, so exactly k results are requested
             search_results = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
-                limit=k + 10,  # Request extra to account for metadata filtering
-                with_payload=True,
-                query_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="is_metadata",
-                            match=models.MatchValue(value=False)
-                        )
-                    ]
-                )
+                limit=k,
+                with_payload=True
             )
             
-            # Format results and limit to k
-            results = []
-            for result in search_results[:k]:
-                # Extract metadata and ensure doc_id is accessible
-                metadata = result.payload.get('metadata', {})
-                doc_id = result.payload.get('doc_id')
-                if doc_id and 'doc_id' not in metadata:
-                    metadata['doc_id'] = doc_id
-                
-                results.append({
-                    'page_content': result.payload['text'],
-                    'metadata': metadata,
-                    'doc_id': doc_id,  # Make doc_id directly accessible
-                    'score': result.score
-                })
+            results = self._format_search_results(search_results, k)
             
-            # Debug: Log sample results
-            if results:
-                first_result = results[0]
-                logger.info(f"Search in {self.collection_name} returned {len(results)} results. First result: doc_id={first_result.get('doc_id')}, score={first_result.get('score'):.4f}, content='{first_result.get('page_content', '')[:100]}...'")
-            else:
+            if not results:
                 logger.warning(f"Search in {self.collection_name} returned no results for query: '{query[:50]}...'")
+            elif logger.isEnabledFor(logging.DEBUG):
+                first_result = results[0]
+                logger.debug(f"Search in {self.collection_name} returned {len(results)} results. First result: doc_id={first_result.get('doc_id')}, score={first_result.get('score'):.4f}, content='{first_result.get('page_content', '')[:100]}...'")
             
             return results
             
@@ -721,6 +820,72 @@ class QdrantVectorStore:
             logger.error(f"Error in similarity search: {e}")
             return []
     
+    def similarity_search_batch(self, queries: List[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Perform similarity search for several queries with one embedding call
+        and one Qdrant batch search
+        
+        Args:
+            queries: Search queries
+            k: Number of results to return per query
+            
+        Returns:
+            List of search result lists, in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        try:
+            logger.debug(f"Batch similarity search in collection {self.collection_name} for {len(queries)} queries, k={k}")
+            
+            # Generate all query embeddings in one request, falling back to one request per query
+            try:
+                query_embeddings = self._get_embeddings_multi_api(queries, timeout=30)
+            except Exception as e:
+                logger.warning(f"Batch query embedding failed, embedding queries one by one: {e}")
+                query_embeddings = self._get_embeddings_batch_api(queries, timeout=10)
+            
+            search_requests = [
+                models.SearchRequest(
+                    vector=query_embedding,
+                    limit=k,
+                    with_payload=True
+                )
+                for query_embedding in query_embeddings
+            ]
+            batch_results = self.client.search_batch(
+                collection_name=self.collection_name,
+                requests=search_requests
+            )
+            
+            return [self._format_search_results(search_results, k) for search_results in batch_results]
+            
+        except (TimeoutError, requests.exceptions.Timeout) as e:
+            logger.error(f"Batch similarity search timed out: {e}")
+            return [[] for _ in queries]
+        except Exception as e:
+            logger.error(f"Error in batch similarity search: {e}")
+            return [[] for _ in queries]
+    
+    @staticmethod
+    def _format_search_results(search_results: List[Any], k: int) -> List[Dict[str, Any]]:
+        """Convert Qdrant scored points into result dicts, limited to k"""
+        results = []
+        for result in search_results[:k]:
+            # Extract metadata and ensure doc_id is accessible
+            metadata = result.payload.get('metadata', {})
+            doc_id = result.payload.get('doc_id')
+            if doc_id and 'doc_id' not in metadata:
+                metadata['doc_id'] = doc_id
+            
+            results.append({
+                'page_content': result.payload['text'],
+                'metadata': metadata,
+                'doc_id': doc_id,  # Make doc_id directly accessible
+                'score': result.score
+            })
+        return results
+    
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection"""
         try:
@@ -728,14 +893,10 @@ class QdrantVectorStore:
             
             # Get metadata about the dataset
             try:
-                metadata_point = self.client.retrieve(
-                    collection_name=self.collection_name,
-                    ids=[self.metadata_point_id]
-                )
+                payload = self._read_dataset_metadata()
                 
                 dataset_info = {}
-                if metadata_point and len(metadata_point) > 0:
-                    payload = metadata_point[0].payload
+                if payload is not None:
                     dataset_info = {
                         "document_count": payload.get("document_count", 0),
                         "indexed_at": payload.get("indexed_at", 0),
@@ -761,6 +922,8 @@ class QdrantVectorStore:
         """Clear all documents from the collection (but keep the collection structure)"""
         try:
             self.client.delete_collection(self.collection_name)
+            if self._collection_exists(self.metadata_collection_name):
+                self.client.delete_collection(self.metadata_collection_name)
             self._create_collection_if_not_exists()
             logger.info(f"Cleared collection {self.collection_name}")
         except Exception as e:
@@ -770,6 +933,8 @@ class QdrantVectorStore:
         """Completely delete the collection without recreating it (for factory reset)"""
         try:
             self.client.delete_collection(self.collection_name)
+            if self._collection_exists(self.metadata_collection_name):
+                self.client.delete_collection(self.metadata_collection_name)
             logger.info(f"Completely deleted collection {self.collection_name}")
         except Exception as e:
             logger.error(f"Error completely deleting collection: {e}")